@@ -0,0 +1,34 @@
+"""add_assignment_drafts
+
+Revision ID: 3f6a8c1d4e27
+Revises: e7d31b5a0c92
+Create Date: 2026-10-19 19:14:22.684310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f6a8c1d4e27'
+down_revision: Union[str, None] = 'e7d31b5a0c92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'assignment_drafts',
+        sa.Column('meeting_id', sa.Integer(), nullable=False),
+        sa.Column('fingerprint', sa.String(length=40), nullable=False),
+        sa.Column('assignments', sa.JSON(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['meeting_id'], ['meetings.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('meeting_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('assignment_drafts')
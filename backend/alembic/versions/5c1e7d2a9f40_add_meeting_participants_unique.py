@@ -0,0 +1,49 @@
+"""add_meeting_participants_unique
+
+Revision ID: 5c1e7d2a9f40
+Revises: aaecafab3c0c
+Create Date: 2026-10-19 10:12:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e7d2a9f40'
+down_revision: Union[str, None] = 'aaecafab3c0c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Remove duplicate links left by the ORM-based membership edits (keep the oldest row)
+    op.execute(
+        sa.text(
+            """
+            DELETE FROM meeting_participants mp
+            USING meeting_participants dup
+            WHERE mp.meeting_id = dup.meeting_id
+              AND mp.participant_id = dup.participant_id
+              AND mp.id > dup.id
+            """
+        )
+    )
+    op.create_unique_constraint(
+        'unique_meeting_participant_link',
+        'meeting_participants',
+        ['meeting_id', 'participant_id']
+    )
+    op.create_index(
+        op.f('ix_meeting_participants_participant_id'),
+        'meeting_participants',
+        ['participant_id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_meeting_participants_participant_id'), table_name='meeting_participants')
+    op.drop_constraint('unique_meeting_participant_link', 'meeting_participants', type_='unique')
@@ -0,0 +1,26 @@
+"""add_meeting_stale_seq
+
+Revision ID: 5d8b3e1a7c64
+Revises: 9c2e4a7b1f53
+Create Date: 2026-10-19 21:40:12.804517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d8b3e1a7c64'
+down_revision: Union[str, None] = '9c2e4a7b1f53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('meetings', sa.Column('stale_seq', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('meetings', 'stale_seq')
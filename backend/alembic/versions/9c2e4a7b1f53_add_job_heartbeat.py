@@ -0,0 +1,29 @@
+"""add_job_heartbeat
+
+Revision ID: 9c2e4a7b1f53
+Revises: 3f6a8c1d4e27
+Create Date: 2026-10-19 21:02:47.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c2e4a7b1f53'
+down_revision: Union[str, None] = '3f6a8c1d4e27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'jobs',
+        sa.Column('heartbeat_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('jobs', 'heartbeat_at')
@@ -0,0 +1,26 @@
+"""add_team_data_version
+
+Revision ID: b7e2f4c9a013
+Revises: 5d8b3e1a7c64
+Create Date: 2026-10-19 22:15:36.271940
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2f4c9a013'
+down_revision: Union[str, None] = '5d8b3e1a7c64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('teams', sa.Column('data_version', sa.BigInteger(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('teams', 'data_version')
@@ -0,0 +1,44 @@
+"""add_algorithm_settings
+
+Revision ID: c4a9e2b7f158
+Revises: 8b3f0c6e1d27
+Create Date: 2026-10-19 16:41:05.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a9e2b7f158'
+down_revision: Union[str, None] = '8b3f0c6e1d27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'algorithm_settings',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('team_id', sa.Integer(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('role_requirements', sa.JSON(), nullable=False),
+        sa.Column('meeting_multipliers', sa.JSON(), nullable=False),
+        sa.Column('history_penalties', sa.JSON(), nullable=False),
+        sa.Column('created_by', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['team_id'], ['teams.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['created_by'], ['users.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('team_id', 'version', name='unique_team_settings_version')
+    )
+    op.create_index(op.f('ix_algorithm_settings_id'), 'algorithm_settings', ['id'], unique=False)
+    op.create_index(op.f('ix_algorithm_settings_team_id'), 'algorithm_settings', ['team_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_algorithm_settings_team_id'), table_name='algorithm_settings')
+    op.drop_index(op.f('ix_algorithm_settings_id'), table_name='algorithm_settings')
+    op.drop_table('algorithm_settings')
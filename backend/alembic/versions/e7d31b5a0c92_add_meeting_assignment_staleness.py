@@ -0,0 +1,36 @@
+"""add_meeting_assignment_staleness
+
+Revision ID: e7d31b5a0c92
+Revises: c4a9e2b7f158
+Create Date: 2026-10-19 18:02:47.530961
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7d31b5a0c92'
+down_revision: Union[str, None] = 'c4a9e2b7f158'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('meetings', sa.Column('assignment_fingerprint', sa.String(length=40), nullable=True))
+    op.add_column(
+        'meetings',
+        sa.Column('assignments_stale', sa.Boolean(), server_default=sa.false(), nullable=False)
+    )
+    op.create_index(
+        'ix_meetings_team_stale', 'meetings', ['team_id'], unique=False,
+        postgresql_where=sa.text('assignments_stale')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_meetings_team_stale', table_name='meetings')
+    op.drop_column('meetings', 'assignments_stale')
+    op.drop_column('meetings', 'assignment_fingerprint')
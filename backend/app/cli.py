@@ -0,0 +1,312 @@
+"""Offline maintenance CLI for role assignment.
+
+Runs the bulk batch paths directly against the database (no HTTP, no
+per-meeting ORM round trips), parallel across teams.
+
+Usage:
+    uv run python -m app.cli assign   [--team ID ...] [--start DATE] [--end DATE] [--dry-run]
+    uv run python -m app.cli reassign [--team ID ...] [--start DATE] [--end DATE] [--dry-run]
+    uv run python -m app.cli verify   [--team ID ...] [--start DATE] [--end DATE]
+    uv run python -m app.cli replay   --team ID --settings candidate.json [--start DATE] [--end DATE]
+    uv run python -m app.cli simulate --team ID [--trials N] [--meetings N] [--penalties 0,0,0.4,0.7]
+
+assign     Assign meetings that have no assignments yet
+reassign   Recompute assignments of all meetings in the range, chronologically
+verify     Recompute in memory and report meetings whose stored assignment differs
+replay     Compare current settings with candidate settings over a team's meetings
+simulate   Monte Carlo estimate of long-run role rotation (no database writes)
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+from app.schemas.settings import ScoringSettingsOverride
+from app.services.batch_assignment import BatchReport, TeamRunResult, isolated_session_factory, run_batch
+from app.services.compute_pool import available_cores
+from app.services.corpus import TeamCorpus, load_stored_assignments, load_team_corpus, load_team_profiles
+from app.services.fairness_simulation import config_from_params, report_to_dict, simulate
+from app.services.replay import replay_report
+from app.services.settings_store import TeamSettings, load_team_settings
+
+
+def parse_moment(value: str) -> datetime:
+    """ISO date or datetime; naive values are taken as UTC."""
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="Batch role assignment maintenance")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    for name, help_text in (
+        ("assign", "Assign meetings without assignments"),
+        ("reassign", "Recompute assignments of all meetings in the range"),
+        ("verify", "Check stored assignments against a fresh computation"),
+    ):
+        command = subcommands.add_parser(name, help=help_text)
+        command.add_argument("--team", type=int, action="append", dest="teams", help="Team ID (repeatable), default all")
+        command.add_argument("--start", type=parse_moment, help="Inclusive start of scheduled_time (ISO date/datetime)")
+        command.add_argument("--end", type=parse_moment, help="Exclusive end of scheduled_time (ISO date/datetime)")
+        command.add_argument("--workers", type=int, help="Worker processes, defaults to available cores")
+        if name != "verify":
+            command.add_argument("--dry-run", action="store_true", help="Compute without writing")
+
+    replay = subcommands.add_parser("replay", help="Replay a team's meetings under candidate settings")
+    replay.add_argument("--team", type=int, required=True, help="Team ID")
+    replay.add_argument(
+        "--settings", type=Path, required=True,
+        help="JSON file with role_requirements and/or meeting_multipliers overrides"
+    )
+    replay.add_argument("--start", type=parse_moment, help="Inclusive start of scheduled_time (ISO date/datetime)")
+    replay.add_argument("--end", type=parse_moment, help="Exclusive end of scheduled_time (ISO date/datetime)")
+    replay.add_argument("--max-diffs", type=int, default=20, help="Meeting diffs to print")
+
+    simulation = subcommands.add_parser("simulate", help="Simulate long-run role rotation for a team")
+    simulation.add_argument("--team", type=int, required=True, help="Team ID")
+    simulation.add_argument("--trials", type=int, default=100)
+    simulation.add_argument("--meetings", type=int, default=200, help="Meetings per trial")
+    simulation.add_argument("--attendance", type=float, default=1.0, help="Probability that a participant attends")
+    simulation.add_argument(
+        "--types", default="brainstorm=1,review=1,planning=1,status_update=1",
+        help="Meeting type mix as type=weight pairs"
+    )
+    simulation.add_argument("--hours", default="9,10,11,12,14,15,16,17", help="Candidate meeting hours (UTC)")
+    simulation.add_argument("--penalties", help="Validator 1 penalties by repeat count, e.g. 0,0,0.4,0.7")
+    simulation.add_argument("--seed", type=int, default=0)
+    simulation.add_argument("--workers", type=int, help="Worker processes, defaults to available cores")
+    simulation.add_argument("--json", action="store_true", help="Print the full report as JSON")
+    return parser
+
+
+def print_progress(result: TeamRunResult, done: int, total: int) -> None:
+    if result.error is not None:
+        print(f"  [{done}/{total}] team {result.team_id}: ✗ {result.error}", flush=True)
+        return
+    print(
+        f"  [{done}/{total}] team {result.team_id}: {result.meetings} meetings, "
+        f"{result.assignments} roles in {result.seconds:.2f}s",
+        flush=True
+    )
+
+
+def print_summary(report: BatchReport) -> None:
+    load = sum(team.load_seconds for team in report.teams)
+    compute = sum(team.compute_seconds for team in report.teams)
+    write = sum(team.write_seconds for team in report.teams)
+    print(f"\nTiming ({len(report.workers)} workers):")
+    print(f"  load     {load:8.2f}s")
+    print(f"  compute  {compute:8.2f}s")
+    print(f"  write    {write:8.2f}s{' (dry run)' if report.dry_run else ''}")
+    print(f"  wall     {report.wall_seconds:8.2f}s")
+    print(
+        f"\n✓ {len(report.teams) - len(report.failed)} teams, {report.meetings} meetings, {report.assignments} roles "
+        f"({report.meetings_per_second:.1f} meetings/s)"
+    )
+    if report.failed:
+        print(f"✗ {len(report.failed)} teams failed:", file=sys.stderr)
+        for team in report.failed:
+            print(f"  team {team.team_id}: {team.error}", file=sys.stderr)
+
+
+async def _load_stored(meeting_ids: list[int]) -> dict[int, list[dict]]:
+    engine, session_factory = isolated_session_factory()
+    try:
+        async with session_factory() as db:
+            return await load_stored_assignments(db, meeting_ids)
+    finally:
+        await engine.dispose()
+
+
+def _assignment_key(assignments: list[dict]) -> set[tuple[int, str]]:
+    return {(assignment["participant_id"], assignment["role"]) for assignment in assignments}
+
+
+def run_assign(args: argparse.Namespace, only_unassigned: bool) -> int:
+    mode = "Assigning unassigned" if only_unassigned else "Reassigning"
+    print(f"{mode} meetings{' (dry run)' if args.dry_run else ''}...", flush=True)
+    report = run_batch(
+        args.start, args.end, args.teams, args.workers,
+        dry_run=args.dry_run, only_unassigned=only_unassigned, on_team_done=print_progress
+    )
+    print_summary(report)
+    return 1 if report.failed else 0
+
+
+def run_verify(args: argparse.Namespace) -> int:
+    print("Verifying stored assignments...", flush=True)
+    report = run_batch(
+        args.start, args.end, args.teams, args.workers,
+        dry_run=True, keep_results=True, on_team_done=print_progress
+    )
+    expected = {
+        meeting_id: assignments
+        for team in report.teams
+        for meeting_id, assignments in team.results.items()
+    }
+    stored = asyncio.run(_load_stored(list(expected)))
+
+    mismatches = [
+        meeting_id for meeting_id in sorted(expected)
+        if _assignment_key(expected[meeting_id]) != _assignment_key(stored[meeting_id])
+    ]
+    if mismatches:
+        print(f"\n✗ {len(mismatches)} of {len(expected)} meetings differ from a fresh computation:")
+        for meeting_id in mismatches:
+            missing = _assignment_key(expected[meeting_id]) - _assignment_key(stored[meeting_id])
+            extra = _assignment_key(stored[meeting_id]) - _assignment_key(expected[meeting_id])
+            print(
+                f"  meeting {meeting_id}: "
+                f"expected {sorted(missing, key=lambda item: item[1])}, "
+                f"stored {sorted(extra, key=lambda item: item[1])}"
+            )
+    else:
+        print(f"\n✓ All {len(expected)} meetings match")
+    print_summary(report)
+    return 1 if mismatches or report.failed else 0
+
+
+async def _load_corpus(
+    team_id: int,
+    start: datetime | None,
+    end: datetime | None
+) -> tuple[TeamCorpus, TeamSettings]:
+    engine, session_factory = isolated_session_factory()
+    try:
+        async with session_factory() as db:
+            return await load_team_corpus(db, team_id, start, end), await load_team_settings(db, team_id)
+    finally:
+        await engine.dispose()
+
+
+def run_replay(args: argparse.Namespace) -> int:
+    override = ScoringSettingsOverride.model_validate(json.loads(args.settings.read_text()))
+
+    print(f"Loading team {args.team}...", flush=True)
+    corpus, team_settings = asyncio.run(_load_corpus(args.team, args.start, args.end))
+    print(
+        f"  {len(corpus.meetings)} meetings, {len(corpus.participants)} participants, "
+        f"settings version {team_settings.version}",
+        flush=True
+    )
+    report = replay_report(corpus, override.apply(team_settings.tables), team_settings.tables, args.max_diffs)
+
+    print(f"\nChanged: {report.meetings_changed} of {report.meetings} meetings, {report.roles_changed} roles")
+    print(f"Total fitness: {report.baseline_fitness:.2f} -> {report.candidate_fitness:.2f}")
+    for label, before, after in (
+        ("mean entropy", report.baseline_fairness.mean_entropy, report.candidate_fairness.mean_entropy),
+        ("min entropy", report.baseline_fairness.min_entropy, report.candidate_fairness.min_entropy),
+        ("assignment gini", report.baseline_fairness.assignment_gini, report.candidate_fairness.assignment_gini),
+        ("max streak", report.baseline_fairness.max_streak, report.candidate_fairness.max_streak),
+    ):
+        print(f"  {label:<16} {before:>8} -> {after}")
+
+    for diff in report.diffs:
+        changes = ", ".join(
+            f"{change.role}: {change.baseline_participant_id} -> {change.candidate_participant_id}"
+            for change in diff.changes
+        )
+        print(f"  meeting {diff.meeting_id}: {changes}")
+    print(f"\n✓ Replayed {report.meetings} meetings twice in {report.seconds:.2f}s "
+          f"({report.meetings_per_second:.0f} meetings/s)")
+    return 0
+
+
+async def _load_profiles(team_id: int) -> tuple:
+    engine, session_factory = isolated_session_factory()
+    try:
+        async with session_factory() as db:
+            profiles, history = await load_team_profiles(db, team_id)
+            return profiles, history, await load_team_settings(db, team_id)
+    finally:
+        await engine.dispose()
+
+
+def run_simulate(args: argparse.Namespace) -> int:
+    params = {
+        "trials": args.trials,
+        "meetings": args.meetings,
+        "attendance": args.attendance,
+        "type_weights": {
+            meeting_type: float(weight)
+            for meeting_type, weight in (pair.split("=", 1) for pair in args.types.split(",") if pair)
+        },
+        "hours": [int(hour) for hour in args.hours.split(",") if hour],
+        "seed": args.seed,
+    }
+    if args.penalties:
+        params["history_penalties"] = [float(value) for value in args.penalties.split(",")]
+    profiles, history, team_settings = asyncio.run(_load_profiles(args.team))
+    try:
+        config, tables = config_from_params(params, team_settings.tables)
+    except ValueError as e:
+        print(f"✗ {e}", file=sys.stderr)
+        return 2
+    if not profiles:
+        print(f"✗ Team {args.team} has no participants", file=sys.stderr)
+        return 1
+    print(
+        f"Simulating {config.trials} trials x {config.meetings} meetings for {len(profiles)} participants "
+        f"(penalties {list(tables.history_penalties)})...",
+        flush=True
+    )
+
+    def on_progress(done: int, total: int) -> None:
+        print(f"\r  {done}/{total} trials", end="", flush=True)
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=args.workers or available_cores(),
+        mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        report = simulate(profiles, history, config, tables, pool, on_progress)
+    seconds = time.perf_counter() - started
+    print()
+
+    if args.json:
+        print(json.dumps(report_to_dict(report), indent=2, ensure_ascii=False))
+        return 0
+
+    print("\nTeam (mean / p5 / p95 across trials):")
+    for label, distribution in (
+        ("mean entropy", report.mean_entropy),
+        ("min entropy", report.min_entropy),
+        ("assignment gini", report.assignment_gini),
+        ("max streak", report.max_streak),
+    ):
+        print(f"  {label:<16} {distribution.mean:>8} {distribution.p5:>8} {distribution.p95:>8}")
+    print("\nStreak lengths (average count per trial):")
+    for length, count in report.streak_histogram.items():
+        print(f"  {length:>3}: {count}")
+    print("\nParticipants (entropy, mean/max longest streak, roles per trial):")
+    for participant in report.participants:
+        print(
+            f"  {participant.name:<30} {participant.mean_entropy:>6} "
+            f"{participant.mean_longest_streak:>6} {participant.max_longest_streak:>3} {participant.mean_assignments:>8}"
+        )
+    print(f"\n✓ {config.trials * config.meetings} simulated meetings in {seconds:.2f}s")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.command == "simulate":
+        return run_simulate(args)
+    if args.command == "replay":
+        return run_replay(args)
+    if args.command == "verify":
+        return run_verify(args)
+    return run_assign(args, only_unassigned=args.command == "assign")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
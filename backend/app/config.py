@@ -13,6 +13,31 @@ class Settings(BaseSettings):
     ALGORITHM: str = Field(default="HS256")
     ACCESS_TOKEN_EXPIRE_HOURS: int = Field(default=24)
 
+    # Background jobs
+    JOB_CONCURRENCY: int = Field(default=2)
+    JOB_HEARTBEAT_SECONDS: float = Field(default=15.0)  # owning worker refreshes heartbeat_at of its jobs
+    JOB_ORPHAN_SECONDS: float = Field(default=60.0)  # active jobs without a heartbeat for this long are failed
+
+    # CPU offloading of the scoring core
+    ENGINE_OFFLOAD_THRESHOLD: int = Field(default=200)  # participants; smaller pools run inline
+    ENGINE_POOL_KIND: str = Field(default="process")  # 'process' or 'thread'
+    ENGINE_POOL_WORKERS: int | None = Field(default=None)  # defaults to available cores
+
+    # Per-team algorithm settings: seconds a cached version is used before revalidation
+    SETTINGS_CACHE_TTL_SECONDS: float = Field(default=5.0)
+
+    # Server-sent events
+    EVENT_QUEUE_SIZE: int = Field(default=100)  # buffered events per subscriber
+    EVENT_BUS_NOTIFY: bool = Field(default=False)  # fan out across workers with Postgres LISTEN/NOTIFY
+    EVENT_KEEPALIVE_SECONDS: float = Field(default=15.0)
+
+    # Per-worker cache of team-scoped GET responses
+    RESPONSE_CACHE_MAX_ENTRIES: int = Field(default=2048)
+    RESPONSE_CACHE_TTL_SECONDS: float = Field(default=60.0)  # bound for writes not seen through the event bus
+    # Stale-while-revalidate for assignment and statistics reads: seconds a stale
+    # response may still be served while it is refreshed (0 = always wait)
+    RESPONSE_CACHE_MAX_STALE_SECONDS: float = Field(default=10.0)
+
     model_config = SettingsConfigDict(
         env_file="backend/.env",
         case_sensitive=False
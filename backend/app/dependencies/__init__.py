@@ -1,5 +1,5 @@
 """Dependencies for dependency injection."""
 
-from app.dependencies.auth import get_current_user, get_current_team_id
+from app.dependencies.auth import get_current_user, get_current_team_id, get_optional_team_id, get_stream_team_id
 
-__all__ = ["get_current_user", "get_current_team_id"]
+__all__ = ["get_current_user", "get_current_team_id", "get_optional_team_id", "get_stream_team_id"]
@@ -1,16 +1,17 @@
 """Authentication dependencies for route protection."""
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import AsyncSessionLocal, get_db
 from app.services.auth_service import verify_token
 from app.services.user_service import get_user_by_email
 from app.schemas.user import UserWithTeam
 
 # HTTP Bearer token scheme
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
 
 async def get_current_user(
@@ -60,3 +61,41 @@ async def get_current_team_id(current_user: UserWithTeam = Depends(get_current_u
             pass
     """
     return current_user.team_id
+
+
+async def get_optional_team_id(
+    credentials: HTTPAuthorizationCredentials | None = Depends(optional_security),
+    db: AsyncSession = Depends(get_db)
+) -> int | None:
+    """
+    Dependency for public endpoints with team-specific answers: the caller's team_id, or None without a token.
+
+    A token that is sent must be valid (401 otherwise).
+    """
+    if credentials is None:
+        return None
+    current_user = await get_current_user(credentials, db)
+    return current_user.team_id
+
+
+async def get_stream_team_id(
+    token: str | None = Query(None, description="Access token, for clients that cannot send headers (EventSource)"),
+    credentials: HTTPAuthorizationCredentials | None = Depends(optional_security)
+) -> int:
+    """
+    Dependency for long-lived streaming endpoints: team_id from a Bearer header or ?token=.
+
+    Uses its own short session, so no database connection is held while the
+    response streams.
+    """
+    if credentials is None and token is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if credentials is None:
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    async with AsyncSessionLocal() as db:
+        current_user = await get_current_user(credentials, db)
+    return current_user.team_id
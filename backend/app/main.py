@@ -1,13 +1,33 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
-from app.routers import participants, meetings, assignments, settings as settings_router, auth, testing
+from app.routers import participants, meetings, assignments, settings as settings_router, auth, testing, jobs, events, cache
+from app.services.compute_pool import shutdown_executor
+from app.services.event_bus import event_bus
+from app.services.job_handlers import register_job_handlers
+from app.services.job_runner import job_runner
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background services with the application and stop them on shutdown."""
+    register_job_handlers(job_runner)
+    await event_bus.start()
+    await job_runner.start()
+    yield
+    await job_runner.stop()
+    await event_bus.stop()
+    shutdown_executor()
+
 
 app = FastAPI(
     title="Role Distribution API",
     description="API for agile team role assignment based on participant data",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -26,6 +46,9 @@ app.include_router(meetings.router, prefix="/api/meetings", tags=["meetings"])
 app.include_router(assignments.router, prefix="/api/assignments", tags=["assignments"])
 app.include_router(settings_router.router)
 app.include_router(testing.router, prefix="/api/testing", tags=["testing"])
+app.include_router(jobs.router, prefix="/api/jobs", tags=["jobs"])
+app.include_router(events.router, prefix="/api/events", tags=["events"])
+app.include_router(cache.router, prefix="/api/cache", tags=["cache"])
 
 
 @app.get("/")
@@ -5,5 +5,11 @@ from app.models.user import User
 from app.models.participant import Participant
 from app.models.meeting import Meeting, meeting_participants
 from app.models.role_assignment import RoleAssignment
+from app.models.job import Job
+from app.models.algorithm_settings import AlgorithmSettings
+from app.models.assignment_draft import AssignmentDraft
 
-__all__ = ["Team", "User", "Participant", "Meeting", "meeting_participants", "RoleAssignment"]
+__all__ = [
+    "Team", "User", "Participant", "Meeting", "meeting_participants", "RoleAssignment", "Job", "AlgorithmSettings",
+    "AssignmentDraft",
+]
@@ -0,0 +1,35 @@
+"""Algorithm settings model - versioned per-team scoring tables."""
+
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, JSON, UniqueConstraint
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class AlgorithmSettings(Base):
+    """
+    One version of a team's algorithm settings.
+
+    Versions are append-only: every change inserts version + 1, the highest
+    version is the active one. Teams without rows use the built-in defaults
+    (version 0).
+    """
+
+    __tablename__ = "algorithm_settings"
+
+    id = Column(Integer, primary_key=True, index=True)
+    team_id = Column(Integer, ForeignKey("teams.id", ondelete="CASCADE"), nullable=False, index=True)
+    version = Column(Integer, nullable=False)
+    role_requirements = Column(JSON, nullable=False)
+    meeting_multipliers = Column(JSON, nullable=False)
+    history_penalties = Column(JSON, nullable=False)
+    created_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Relationships
+    team = relationship("Team")
+
+    __table_args__ = (
+        UniqueConstraint("team_id", "version", name="unique_team_settings_version"),
+    )
@@ -0,0 +1,22 @@
+"""Assignment draft model - speculatively precomputed role assignment of a meeting."""
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class AssignmentDraft(Base):
+    """
+    Proposed assignment computed in the background when a meeting is created.
+
+    assign-roles confirms it without recomputing if the fingerprint of the
+    inputs (including role history) still matches; drafts are consumed on use.
+    """
+
+    __tablename__ = "assignment_drafts"
+
+    meeting_id = Column(Integer, ForeignKey("meetings.id", ondelete="CASCADE"), primary_key=True)
+    fingerprint = Column(String(40), nullable=False)
+    assignments = Column(JSON, nullable=False)  # [{participant_id, role, score}]
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,30 @@
+"""Job model for background recomputations."""
+
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class Job(Base):
+    """Background job persisted with its status and progress."""
+
+    __tablename__ = "jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    team_id = Column(Integer, ForeignKey("teams.id", ondelete="CASCADE"), nullable=False, index=True)
+    kind = Column(String(50), nullable=False)
+    status = Column(String(20), nullable=False, default="queued", index=True)  # 'queued', 'running', 'cancelling', 'succeeded', 'failed', 'cancelled'
+    progress = Column(Integer, nullable=False, default=0)
+    total = Column(Integer, nullable=True)
+    params = Column(JSON, nullable=False, default=dict)
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    heartbeat_at = Column(DateTime(timezone=True), server_default=func.now())  # refreshed by the owning worker
+
+    # Relationships
+    team = relationship("Team")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Table
+from sqlalchemy import Boolean, Column, Integer, String, DateTime, ForeignKey, Index, Table, UniqueConstraint, false
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -11,7 +11,8 @@ meeting_participants = Table(
     Base.metadata,
     Column("id", Integer, primary_key=True),
     Column("meeting_id", Integer, ForeignKey("meetings.id", ondelete="CASCADE"), nullable=False),
-    Column("participant_id", Integer, ForeignKey("participants.id", ondelete="CASCADE"), nullable=False),
+    Column("participant_id", Integer, ForeignKey("participants.id", ondelete="CASCADE"), nullable=False, index=True),
+    UniqueConstraint("meeting_id", "participant_id", name="unique_meeting_participant_link"),
 )
 
 
@@ -26,6 +27,11 @@ class Meeting(Base):
     scheduled_time = Column(DateTime(timezone=True), nullable=False, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    # Staleness tracking of the stored role assignments (see services.staleness)
+    assignment_fingerprint = Column(String(40), nullable=True)  # hash of the inputs at assignment time
+    assignments_stale = Column(Boolean, nullable=False, default=False, server_default=false())
+    stale_seq = Column(Integer, nullable=False, default=0, server_default="0")  # bumped by every stale-mark
+
     # Team association
     team_id = Column(Integer, ForeignKey("teams.id", ondelete="CASCADE"), nullable=False, index=True)
 
@@ -33,3 +39,7 @@ class Meeting(Base):
     team = relationship("Team", back_populates="meetings")
     participants = relationship("Participant", secondary=meeting_participants, backref="meetings")
     role_assignments = relationship("RoleAssignment", back_populates="meeting", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        Index("ix_meetings_team_stale", "team_id", postgresql_where=assignments_stale),
+    )
@@ -1,6 +1,6 @@
 """Team model."""
 
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import BigInteger, Column, Integer, String, DateTime
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -16,6 +16,7 @@ class Team(Base):
     name = Column(String(200), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    data_version = Column(BigInteger, nullable=False, default=0, server_default="0")  # see services.data_version
 
     # Relationships
     users = relationship("User", back_populates="team")
@@ -3,20 +3,26 @@
 from datetime import datetime, timedelta, timezone, date
 from collections import defaultdict
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException
+from pydantic import TypeAdapter
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.database import get_db
 from app.dependencies.auth import get_current_team_id
 from app.models.role_assignment import RoleAssignment
 from app.models.participant import Participant
 from app.models.meeting import Meeting
+from app.routers.cache import cached_json_response
 from app.schemas.role_assignment import RoleAssignment as RoleAssignmentSchema
 from app.schemas.statistics import ParticipantStatistics, DailyRoleBreakdown
+from app.services.response_cache import STATISTICS
 
 router = APIRouter()
 
+participant_statistics = TypeAdapter(ParticipantStatistics)
+
 
 @router.get("/participant/{participant_id}/history", response_model=list[RoleAssignmentSchema])
 async def get_participant_role_history(
@@ -67,10 +73,33 @@ async def get_participant_role_history(
 async def get_participant_statistics(
     participant_id: int,
     days: int = 7,
-    team_id: int = Depends(get_current_team_id),
-    db: AsyncSession = Depends(get_db)
+    if_none_match: str | None = Header(None),
+    team_id: int = Depends(get_current_team_id)
 ):
-    """Get role assignment statistics for a participant over the last N days (only from current team)."""
+    """
+    Get role assignment statistics for a participant over the last N days (only from current team).
+
+    Cached until the team's assignments, meetings or participants change (the
+    period ends when the entry was computed); a matching If-None-Match is
+    answered with 304. After a change the previous statistics are still
+    served (with their Age) for up to RESPONSE_CACHE_MAX_STALE_SECONDS while
+    they are recomputed in the background.
+    """
+    return await cached_json_response(
+        team_id, STATISTICS, (participant_id, days),
+        lambda session: _compute_participant_statistics(session, participant_id, days, team_id),
+        participant_statistics, if_none_match,
+        max_stale=settings.RESPONSE_CACHE_MAX_STALE_SECONDS,
+        etag_lifetime=settings.RESPONSE_CACHE_TTL_SECONDS  # the period moves with the clock
+    )
+
+
+async def _compute_participant_statistics(
+    db: AsyncSession,
+    participant_id: int,
+    days: int,
+    team_id: int
+) -> ParticipantStatistics:
     # Verify participant exists and belongs to team
     stmt_participant = select(Participant).where(
         Participant.id == participant_id,
@@ -0,0 +1,99 @@
+"""Response cache API router and conditional GET helpers for cached read endpoints."""
+
+import hashlib
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from fastapi import APIRouter, Depends, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import AsyncSessionLocal
+from app.dependencies.auth import get_current_user
+from app.schemas import cache as schemas
+from app.schemas.user import UserWithTeam
+from app.services.data_version import get_data_version
+from app.services.response_cache import response_cache
+
+router = APIRouter()
+
+# Browsers must revalidate (If-None-Match) before reusing a stored response
+CACHE_CONTROL = "private, no-cache"
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header names the ETag (weak comparison, '*' matches any)."""
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def data_etag(team_id: int, scope: str, key: Hashable, version: int, period: int | None = None) -> str:
+    """ETag of a cached read: its team, route arguments and the team's data version (no content hash)."""
+    arguments = hashlib.sha1(repr((key, period)).encode()).hexdigest()[:16]
+    return f'"{scope}-{team_id}-{version}-{arguments}"'
+
+
+async def cached_json_response(
+    team_id: int,
+    scope: str,
+    key: Hashable,
+    load: Callable[[AsyncSession], Awaitable[Any]],
+    adapter: TypeAdapter,
+    if_none_match: str | None,
+    max_stale: float = 0.0,
+    etag_lifetime: float | None = None
+) -> Response:
+    """
+    Serve a team-scoped read from the response cache with ETag revalidation.
+
+    The ETag is derived from the team's data version, read with one
+    primary-key query: a matching If-None-Match is answered with 304 before
+    the cache or load() is consulted, in any worker. Otherwise the cached
+    body is served if it was loaded under the current version; on a miss
+    load() runs once for all concurrent callers, in its own session, and its
+    result is serialized with adapter and cached. The Age header tells how
+    old the served body is.
+
+    Args:
+        team_id: Team the response belongs to
+        scope: Response cache scope (invalidated by the team's writes)
+        key: Route arguments distinguishing entries within the scope
+        load: Queries the response value (exceptions propagate, nothing is cached)
+        adapter: TypeAdapter of the endpoint's response model
+        if_none_match: The request's If-None-Match header
+        max_stale: Seconds a stale body may be served while it is refreshed
+            in the background (stale-while-revalidate; 0 = wait for a fresh body)
+        etag_lifetime: Seconds after which the ETag changes without writes,
+            for responses that depend on the current time (None = never)
+
+    Returns:
+        304 without a body, or the cached JSON body
+    """
+    async with AsyncSessionLocal() as session:
+        version = await get_data_version(session, team_id)
+    period = None if etag_lifetime is None else int(time.time() // etag_lifetime)
+    etag = data_etag(team_id, scope, key, version, period)
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        )
+
+    async def fill() -> bytes:
+        async with AsyncSessionLocal() as session:
+            return adapter.dump_json(await load(session))
+
+    content, age, loaded_version = await response_cache.get_or_load(team_id, scope, key, fill, max_stale, version)
+    if loaded_version != version:
+        # A stale body served while it is refreshed carries the ETag of its own version
+        etag = data_etag(team_id, scope, key, loaded_version, period)
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL, "Age": str(int(age))}
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+@router.get("/stats", response_model=schemas.ResponseCacheStats)
+async def get_cache_stats(current_user: UserWithTeam = Depends(get_current_user)):
+    """Hit/miss metrics of this worker's response cache (counters are per process)."""
+    return response_cache.metrics()
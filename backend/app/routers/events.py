@@ -0,0 +1,53 @@
+"""Server-sent events API router."""
+
+import asyncio
+import json
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+
+from app.config import settings
+from app.dependencies.auth import get_stream_team_id
+from app.services.event_bus import Event, event_bus
+
+router = APIRouter()
+
+
+def _format_event(event: Event) -> str:
+    """Encode an event in the text/event-stream format."""
+    return f"event: {event.type}\ndata: {json.dumps({**event.data, 'at': event.at})}\n\n"
+
+
+@router.get("/stream")
+async def stream_events(
+    request: Request,
+    team_id: int = Depends(get_stream_team_id)
+):
+    """
+    Stream the current team's events as server-sent events.
+
+    Event types: assignment-changed (meeting_ids), meeting-changed
+    (meeting_ids, action) and job-progress (job_id, status, progress, total).
+    Events carry IDs only; clients refetch what they display. A comment line
+    is sent every EVENT_KEEPALIVE_SECONDS to keep proxies from closing the
+    connection. Authenticate with the Bearer header or, for EventSource,
+    the token query parameter.
+    """
+    async def event_stream():
+        async with event_bus.subscribe(team_id) as queue:
+            yield "retry: 3000\n\n"
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=settings.EVENT_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": keep-alive\n\n"
+                    continue
+                yield _format_event(event)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
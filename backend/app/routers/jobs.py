@@ -0,0 +1,105 @@
+"""Background jobs API router."""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.dependencies.auth import get_current_team_id
+from app.models.job import Job
+from app.schemas import job as schemas
+from app.services.job_runner import job_runner
+
+router = APIRouter()
+
+
+async def submit_job(db: AsyncSession, team_id: int, kind: str, params: dict) -> schemas.JobAccepted:
+    """Submit a job and build the 202 response body (shared by routers moving work to the background)."""
+    try:
+        job = await job_runner.submit(db, team_id, kind, params)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=e.errors(include_url=False, include_context=False)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+    return schemas.JobAccepted(job_id=job.id, status=job.status, status_url=f"/api/jobs/{job.id}")
+
+
+async def _get_team_job(db: AsyncSession, job_id: int, team_id: int) -> Job:
+    result = await db.execute(
+        select(Job).where(
+            Job.id == job_id,
+            Job.team_id == team_id
+        )
+    )
+    job = result.scalar_one_or_none()
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job {job_id} not found in your team"
+        )
+    return job
+
+
+@router.post("/", response_model=schemas.JobAccepted, status_code=status.HTTP_202_ACCEPTED)
+async def create_job(
+    job_data: schemas.JobSubmit,
+    team_id: int = Depends(get_current_team_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """Submit a background job for the current team (params are validated per kind, 422 if invalid)."""
+    return await submit_job(db, team_id, job_data.kind, job_data.params)
+
+
+@router.get("/", response_model=list[schemas.Job])
+async def list_jobs(
+    limit: int = Query(20, ge=1, le=100),
+    team_id: int = Depends(get_current_team_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """List the most recent jobs of the current team."""
+    result = await db.execute(
+        select(Job)
+        .where(Job.team_id == team_id)
+        .order_by(Job.created_at.desc(), Job.id.desc())
+        .limit(limit)
+    )
+    return result.scalars().all()
+
+
+@router.get("/kinds", response_model=list[str])
+async def list_job_kinds():
+    """List the job kinds that can be submitted."""
+    return job_runner.kinds
+
+
+@router.get("/{job_id}", response_model=schemas.Job)
+async def get_job(
+    job_id: int,
+    team_id: int = Depends(get_current_team_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """Poll job status and progress (only from current team)."""
+    return await _get_team_job(db, job_id, team_id)
+
+
+@router.post("/{job_id}/cancel", response_model=schemas.Job, status_code=status.HTTP_202_ACCEPTED)
+async def cancel_job(
+    job_id: int,
+    team_id: int = Depends(get_current_team_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """Request cancellation of a queued or running job (only from current team)."""
+    job = await _get_team_job(db, job_id, team_id)
+    if not await job_runner.cancel(db, job):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job {job_id} has already finished"
+        )
+    await db.refresh(job)
+    return job
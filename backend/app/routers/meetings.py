@@ -1,43 +1,185 @@
 """Meetings API router."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Query, status
+from pydantic import TypeAdapter
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.database import get_db
+from app.config import settings
+from app.database import AsyncSessionLocal, get_db
 from app.dependencies.auth import get_current_team_id
-from app.models.meeting import Meeting
+from app.models.meeting import Meeting, meeting_participants
 from app.models.participant import Participant
 from app.models.role_assignment import RoleAssignment
+from app.routers.cache import cached_json_response
+from app.routers.jobs import submit_job
 from app.schemas import meeting as schemas
+from app.schemas.job import JobAccepted
 from app.schemas.role_assignment import RoleAssignment as RoleAssignmentSchema, RoleAssignmentResult
-from app.services.assignment_engine import assign_roles
+from app.services.assignment_engine import assign_roles, load_recent_roles, precompute_draft, repair_assignments
+from app.services.energy_calculator import calculate_energy
+from app.services.event_bus import ASSIGNMENT_CHANGED, MEETING_CHANGED, event_bus
+from app.services.compute_pool import run_cpu_bound
+from app.services.fitness import ParticipantProfile, current_streak
+from app.services.settings_store import get_team_tables
+from app.services.slot_finder import candidate_slots, find_best_slots
+from app.services.substitutes import top_k_per_role
+from app.services.team_recommender import recommend_participants
+from app.services.membership import add_members, find_foreign_participants, remove_members, replace_members
+from app.services.recurrence import expand_recurrence
+from app.services.response_cache import ASSIGNMENTS, MEETINGS
+from app.services.single_flight import SingleFlight
+from app.services.staleness import list_stale_meetings, mark_meetings_stale, resolve_stale
 
 router = APIRouter()
 
+meeting_list = TypeAdapter(list[schemas.Meeting])
+assignment_list = TypeAdapter(list[RoleAssignmentSchema])
+
+
+async def _ensure_team_meeting(db: AsyncSession, meeting_id: int, team_id: int) -> None:
+    """Raise 404 unless the meeting belongs to the team (selects the ID only)."""
+    result = await db.execute(
+        select(Meeting.id).where(
+            Meeting.id == meeting_id,
+            Meeting.team_id == team_id
+        )
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Meeting {meeting_id} not found in your team"
+        )
+
+
+async def _ensure_team_participants(db: AsyncSession, participant_ids: set[int], team_id: int) -> None:
+    """Raise 400 if any participant does not belong to the team."""
+    if await find_foreign_participants(db, team_id, participant_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Some participants do not belong to your team"
+        )
+
+
+def _assignment_schema(assignment: RoleAssignment, participant_name: str | None) -> RoleAssignmentSchema:
+    """Build the assignment response with the participant name resolved by the caller."""
+    return RoleAssignmentSchema(
+        id=assignment.id,
+        meeting_id=assignment.meeting_id,
+        participant_id=assignment.participant_id,
+        role=assignment.role,
+        fitness_score=assignment.fitness_score,
+        created_at=assignment.created_at,
+        participant_name=participant_name
+    )
+
+
+async def _publish_membership_change(team_id: int, meeting_id: int, reassigned: list[str] | None) -> None:
+    """Publish a participants change, and the assignment change if the repair moved roles."""
+    await event_bus.publish(team_id, MEETING_CHANGED, meeting_ids=[meeting_id], action="participants")
+    if reassigned:
+        await event_bus.publish(team_id, ASSIGNMENT_CHANGED, meeting_ids=[meeting_id])
+
 
 @router.get("/", response_model=list[schemas.Meeting])
 async def list_meetings(
+    if_none_match: str | None = Header(None),
+    team_id: int = Depends(get_current_team_id)
+):
+    """
+    List all meetings for the current team.
+
+    Cached until the team's meetings, assignments or participants change;
+    a matching If-None-Match is answered with 304.
+    """
+    async def load(session: AsyncSession):
+        result = await session.execute(
+            select(Meeting)
+            .where(Meeting.team_id == team_id)
+            .options(selectinload(Meeting.participants))
+        )
+        return [schemas.Meeting.model_validate(meeting) for meeting in result.scalars().all()]
+
+    return await cached_json_response(team_id, MEETINGS, "list", load, meeting_list, if_none_match)
+
+
+@router.get("/batch", response_model=dict[int, schemas.Meeting])
+async def get_meetings_batch(
+    ids: list[int] = Query(..., max_length=500, description="Meeting IDs (repeat the parameter)"),
     team_id: int = Depends(get_current_team_id),
     db: AsyncSession = Depends(get_db)
 ):
-    """List all meetings for the current team."""
+    """
+    Get several meetings by ID (only from current team).
+
+    Returns a mapping of meeting ID to meeting; IDs outside the team are omitted.
+    """
     result = await db.execute(
         select(Meeting)
-        .where(Meeting.team_id == team_id)
+        .where(
+            Meeting.id.in_(set(ids)),
+            Meeting.team_id == team_id
+        )
         .options(selectinload(Meeting.participants))
     )
-    return result.scalars().all()
+    return {meeting.id: meeting for meeting in result.scalars().all()}
+
+
+@router.get("/assignments", response_model=dict[int, list[RoleAssignmentSchema]])
+async def get_assignments_batch(
+    meeting_ids: list[int] = Query(..., max_length=500, description="Meeting IDs (repeat the parameter)"),
+    team_id: int = Depends(get_current_team_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get role assignments for several meetings with one query (only from current team).
+
+    Returns a mapping of meeting ID to its assignments (empty list if not yet assigned);
+    IDs outside the team are omitted. Meetings flagged stale are recomputed first.
+    """
+    result = await db.execute(
+        select(Meeting.id).where(
+            Meeting.id.in_(set(meeting_ids)),
+            Meeting.team_id == team_id,
+            Meeting.assignments_stale.is_(True)
+        )
+    )
+    await _refresh_stale(db, list(result.scalars().all()))
+
+    stmt = (
+        select(Meeting.id, RoleAssignment, Participant.name)
+        .outerjoin(RoleAssignment, RoleAssignment.meeting_id == Meeting.id)
+        .outerjoin(Participant, Participant.id == RoleAssignment.participant_id)
+        .where(
+            Meeting.id.in_(set(meeting_ids)),
+            Meeting.team_id == team_id
+        )
+        .order_by(Meeting.id, RoleAssignment.id)
+    )
+    result = await db.execute(stmt)
+
+    assignments_by_meeting = {}
+    for meeting_id, assignment, participant_name in result.all():
+        assignments = assignments_by_meeting.setdefault(meeting_id, [])
+        if assignment is not None:
+            assignments.append(_assignment_schema(assignment, participant_name))
+    return assignments_by_meeting
 
 
 @router.post("/", response_model=schemas.Meeting, status_code=status.HTTP_201_CREATED)
 async def create_meeting(
     meeting_data: schemas.MeetingCreate,
+    background_tasks: BackgroundTasks,
     team_id: int = Depends(get_current_team_id),
     db: AsyncSession = Depends(get_db)
 ):
-    """Create a new meeting with participants for the current team."""
+    """
+    Create a new meeting with participants for the current team.
+
+    A proposed assignment is computed after the response is sent and stored
+    as a draft, which assign-roles confirms if its inputs are unchanged.
+    """
     # Create meeting
     meeting = Meeting(
         title=meeting_data.title,
@@ -66,9 +208,233 @@ async def create_meeting(
     db.add(meeting)
     await db.commit()
     await db.refresh(meeting, ["participants"])
+    await event_bus.publish(team_id, MEETING_CHANGED, meeting_ids=[meeting.id], action="created")
+    if meeting.participants:
+        background_tasks.add_task(precompute_draft, meeting.id)
     return meeting
 
 
+@router.post("/series", response_model=schemas.MeetingSeriesResult, status_code=status.HTTP_201_CREATED)
+async def create_meeting_series(
+    series_data: schemas.MeetingSeriesCreate,
+    team_id: int = Depends(get_current_team_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Create a recurring meeting series for the current team.
+
+    Participants are validated once; all meetings and their participant links
+    are bulk-inserted in a single transaction.
+    """
+    rule = series_data.recurrence
+    try:
+        occurrences = expand_recurrence(
+            series_data.scheduled_time,
+            rule.frequency,
+            interval=rule.interval,
+            count=rule.count,
+            until=rule.until,
+            weekdays=rule.weekdays
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    if not occurrences:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Recurrence rule yields no meetings"
+        )
+
+    # Validate participants once (only from the same team)
+    participant_ids = set(series_data.participant_ids)
+    await _ensure_team_participants(db, participant_ids, team_id)
+
+    # Bulk insert meetings
+    result = await db.execute(
+        insert(Meeting)
+        .values([
+            {
+                "title": series_data.title,
+                "meeting_type": series_data.meeting_type,
+                "scheduled_time": scheduled_time,
+                "team_id": team_id,
+            }
+            for scheduled_time in occurrences
+        ])
+        .returning(Meeting.id, Meeting.scheduled_time, Meeting.created_at)
+    )
+    created = sorted(result.all(), key=lambda row: row.scheduled_time)
+
+    # Bulk insert participant links (executemany, batched by the driver)
+    if participant_ids:
+        await db.execute(
+            insert(meeting_participants),
+            [
+                {"meeting_id": row.id, "participant_id": participant_id}
+                for row in created
+                for participant_id in participant_ids
+            ]
+        )
+
+    await db.commit()
+    await event_bus.publish(team_id, MEETING_CHANGED, meeting_ids=[row.id for row in created], action="created")
+
+    return schemas.MeetingSeriesResult(
+        total_created=len(created),
+        meetings=[
+            schemas.MeetingList(
+                id=row.id,
+                title=series_data.title,
+                meeting_type=series_data.meeting_type,
+                scheduled_time=row.scheduled_time,
+                created_at=row.created_at,
+                participant_count=len(participant_ids)
+            )
+            for row in created
+        ]
+    )
+
+
+@router.post("/reassign", response_model=JobAccepted, status_code=status.HTTP_202_ACCEPTED)
+async def reassign_meetings(
+    request: schemas.MeetingReassignRequest,
+    team_id: int = Depends(get_current_team_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Re-run role assignment for the current team's meetings in the background.
+
+    Meetings are processed in chronological order; poll the returned job for progress.
+    """
+    return await submit_job(db, team_id, "reassign_meetings", {
+        "start": request.start.isoformat() if request.start else None,
+        "end": request.end.isoformat() if request.end else None,
+        "only_unassigned": request.only_unassigned,
+    })
+
+
+@router.post("/optimal-time", response_model=schemas.SlotSearchResult)
+async def find_optimal_time(
+    search: schemas.SlotSearchRequest,
+    team_id: int = Depends(get_current_team_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Find the best slots for a meeting within a time window (only participants from current team).
+
+    Every slot of the grid is scored by projected participant energy and the
+    total fitness of the role assignment the engine would produce at that time.
+    """
+    try:
+        slots = candidate_slots(search.window_start, search.window_end, search.slot_minutes)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    participant_ids = set(search.participant_ids)
+    result = await db.execute(
+        select(Participant).where(
+            Participant.id.in_(participant_ids),
+            Participant.team_id == team_id
+        )
+    )
+    participants = result.scalars().all()
+    if len(participants) != len(participant_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Some participants do not belong to your team"
+        )
+
+    history = await load_recent_roles(db, list(participant_ids))
+    tables = (await get_team_tables(db, team_id)).tables
+    profiles = [ParticipantProfile.from_model(participant) for participant in participants]
+    best = await run_cpu_bound(
+        find_best_slots, profiles, search.meeting_type, slots, history, search.top_k, tables,
+        size=len(profiles)
+    )
+
+    return schemas.SlotSearchResult(
+        meeting_type=search.meeting_type,
+        evaluated_slots=len(slots),
+        slots=[schemas.SlotScore(**vars(slot)) for slot in best]
+    )
+
+
+@router.post("/recommend-participants", response_model=schemas.TeamRecommendation)
+async def recommend_meeting_participants(
+    request: schemas.TeamRecommendationRequest,
+    team_id: int = Depends(get_current_team_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Recommend whom to invite from the current team to maximise assigned role fitness.
+
+    Searches the team for the subset (within the size limit) whose role
+    assignment has the highest total fitness at the planned time. The
+    returned roles are the greedy assignment assign-roles will make for the
+    invite list; search_fitness is the total of the search's best mapping.
+    """
+    result = await db.execute(
+        select(Participant).where(Participant.team_id == team_id)
+    )
+    participants = result.scalars().all()
+    if not participants:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Your team has no participants"
+        )
+
+    history = await load_recent_roles(db, [participant.id for participant in participants])
+    tables = (await get_team_tables(db, team_id)).tables
+    recommendation = await run_cpu_bound(
+        recommend_participants,
+        [ParticipantProfile.from_model(participant) for participant in participants],
+        request.meeting_type,
+        request.scheduled_time,
+        history,
+        request.max_participants,
+        tables,
+        size=len(participants)
+    )
+
+    names = {participant.id: participant.name for participant in participants}
+    return schemas.TeamRecommendation(
+        participant_ids=[assignment["participant_id"] for assignment in recommendation.assignments]
+        + recommendation.reserves,
+        assignments=[
+            schemas.RecommendedRole(
+                participant_id=assignment["participant_id"],
+                participant_name=names[assignment["participant_id"]],
+                role=assignment["role"],
+                fitness_score=assignment["score"]
+            )
+            for assignment in recommendation.assignments
+        ],
+        reserve_ids=recommendation.reserves,
+        total_fitness=recommendation.total_fitness,
+        search_fitness=recommendation.search_fitness,
+        optimal=recommendation.optimal
+    )
+
+
+@router.get("/stale", response_model=list[schemas.StaleMeeting])
+async def list_stale(
+    team_id: int = Depends(get_current_team_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    List the current team's meetings whose stored assignments are flagged stale.
+
+    They are recomputed on the next read of their assignments (or by the
+    recompute job scheduled by the change).
+    """
+    return await list_stale_meetings(db, team_id)
+
+
 @router.get("/{meeting_id}", response_model=schemas.Meeting)
 async def get_meeting(
     meeting_id: int,
@@ -90,6 +456,154 @@ async def get_meeting(
     return meeting
 
 
+@router.get("/{meeting_id}/detail", response_model=schemas.MeetingDetail)
+async def get_meeting_detail(
+    meeting_id: int,
+    team_id: int = Depends(get_current_team_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get everything the meeting detail page needs in one request (only from current team).
+
+    Returns the meeting, its participants with energy at meeting time and recent
+    role streak, and the current assignments. Uses a fixed number of queries
+    regardless of participant count: meeting, participants, assignments, history.
+    Stale assignments are recomputed first.
+    """
+    stmt = select(Meeting).options(selectinload(Meeting.participants)).where(
+        Meeting.id == meeting_id,
+        Meeting.team_id == team_id
+    )
+    result = await db.execute(stmt)
+    meeting = result.scalar_one_or_none()
+    if not meeting:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Meeting {meeting_id} not found in your team"
+        )
+    if meeting.assignments_stale:
+        await _refresh_stale(db, [meeting_id])
+
+    stmt_assignments = (
+        select(RoleAssignment, Participant.name)
+        .outerjoin(Participant, Participant.id == RoleAssignment.participant_id)
+        .where(RoleAssignment.meeting_id == meeting_id)
+        .order_by(RoleAssignment.id)
+    )
+    result_assignments = await db.execute(stmt_assignments)
+    assignments = [
+        _assignment_schema(assignment, participant_name)
+        for assignment, participant_name in result_assignments.all()
+    ]
+
+    history = await load_recent_roles(db, [participant.id for participant in meeting.participants])
+
+    participants = []
+    for participant in meeting.participants:
+        streak_role, streak_length = current_streak(history[participant.id])
+        participants.append(
+            schemas.MeetingDetailParticipant(
+                **schemas.Participant.model_validate(participant).model_dump(),
+                energy=calculate_energy(participant, meeting.scheduled_time),
+                recent_roles=history[participant.id],
+                streak=schemas.RoleStreak(role=streak_role, length=streak_length)
+            )
+        )
+
+    return schemas.MeetingDetail(
+        id=meeting.id,
+        title=meeting.title,
+        meeting_type=meeting.meeting_type,
+        scheduled_time=meeting.scheduled_time,
+        created_at=meeting.created_at,
+        participants=participants,
+        assignments=assignments
+    )
+
+
+@router.get("/{meeting_id}/substitutes", response_model=schemas.MeetingSubstitutes)
+async def get_meeting_substitutes(
+    meeting_id: int,
+    k: int = Query(3, ge=1, le=20),
+    scope: str = Query("team", pattern="^(team|meeting)$"),
+    team_id: int = Depends(get_current_team_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get the top-k substitutes for every role of a meeting (only from current team).
+
+    Candidates come from the whole team (scope=team) or only the meeting's
+    participants (scope=meeting); the current holder of a role is not listed
+    as its substitute. Scores use the same computation as assign-roles.
+    """
+    stmt = select(Meeting).options(selectinload(Meeting.participants)).where(
+        Meeting.id == meeting_id,
+        Meeting.team_id == team_id
+    )
+    result = await db.execute(stmt)
+    meeting = result.scalar_one_or_none()
+    if not meeting:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Meeting {meeting_id} not found in your team"
+        )
+
+    if scope == "meeting":
+        candidates = list(meeting.participants)
+    else:
+        result = await db.execute(select(Participant).where(Participant.team_id == team_id))
+        candidates = result.scalars().all()
+
+    result = await db.execute(
+        select(RoleAssignment.participant_id, RoleAssignment.role)
+        .where(RoleAssignment.meeting_id == meeting_id)
+    )
+    current_roles = dict(result.all())
+    holders = {role: participant_id for participant_id, role in current_roles.items()}
+
+    history = await load_recent_roles(db, [participant.id for participant in candidates])
+    tables = (await get_team_tables(db, team_id)).tables
+    top = await run_cpu_bound(
+        top_k_per_role,
+        [ParticipantProfile.from_model(participant) for participant in candidates],
+        meeting.meeting_type,
+        meeting.scheduled_time,
+        history,
+        k,
+        tables,
+        holders,
+        size=len(candidates)
+    )
+
+    names = {participant.id: participant.name for participant in candidates}
+    member_ids = {participant.id for participant in meeting.participants}
+    return schemas.MeetingSubstitutes(
+        meeting_id=meeting_id,
+        k=k,
+        roles=[
+            schemas.RoleSubstitutes(
+                role=role,
+                holder_id=holders.get(role),
+                candidates=[
+                    schemas.SubstituteCandidate(
+                        participant_id=breakdown.participant_id,
+                        participant_name=names[breakdown.participant_id],
+                        in_meeting=breakdown.participant_id in member_ids,
+                        current_role=current_roles.get(breakdown.participant_id),
+                        energy=breakdown.energy,
+                        base_score=breakdown.base_score,
+                        history_penalty=breakdown.history_penalty,
+                        context_multiplier=breakdown.context_multiplier,
+                        fitness_score=breakdown.score
+                    )
+                    for breakdown in breakdowns
+                ]
+            )
+            for role, breakdowns in top.items()
+        ]
+    )
+
+
 @router.put("/{meeting_id}", response_model=schemas.Meeting)
 async def update_meeting(
     meeting_id: int,
@@ -97,7 +611,11 @@ async def update_meeting(
     team_id: int = Depends(get_current_team_id),
     db: AsyncSession = Depends(get_db)
 ):
-    """Update meeting (only from current team)."""
+    """
+    Update meeting (only from current team).
+
+    Changing the type or time flags existing assignments as stale.
+    """
     stmt = select(Meeting).options(selectinload(Meeting.participants)).where(
         Meeting.id == meeting_id,
         Meeting.team_id == team_id
@@ -112,11 +630,20 @@ async def update_meeting(
 
     # Update only provided fields
     update_data = meeting_data.model_dump(exclude_unset=True)
+    inputs_changed = any(
+        getattr(meeting, field) != value
+        for field, value in update_data.items()
+        if field in ("meeting_type", "scheduled_time")
+    )
     for field, value in update_data.items():
         setattr(meeting, field, value)
 
+    await db.flush()
+    if inputs_changed:
+        await mark_meetings_stale(db, [meeting_id])
     await db.commit()
-    await db.refresh(meeting, ["participants"])
+    await db.refresh(meeting, ["participants", "assignments_stale"])
+    await event_bus.publish(team_id, MEETING_CHANGED, meeting_ids=[meeting_id], action="updated")
     return meeting
 
 
@@ -141,6 +668,7 @@ async def delete_meeting(
 
     await db.delete(meeting)
     await db.commit()
+    await event_bus.publish(team_id, MEETING_CHANGED, meeting_ids=[meeting_id], action="deleted")
     return None
 
 
@@ -148,81 +676,136 @@ async def delete_meeting(
 async def add_participants(
     meeting_id: int,
     participant_ids: list[int],
+    repair: bool = Query(True, description="Incrementally repair existing role assignments"),
     team_id: int = Depends(get_current_team_id),
     db: AsyncSession = Depends(get_db)
 ):
     """Add participants to meeting (only from current team)."""
-    stmt = select(Meeting).options(selectinload(Meeting.participants)).where(
-        Meeting.id == meeting_id,
-        Meeting.team_id == team_id
-    )
-    result = await db.execute(stmt)
-    meeting = result.scalar_one_or_none()
-    if not meeting:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Meeting {meeting_id} not found in your team"
-        )
+    await _ensure_team_meeting(db, meeting_id, team_id)
+    requested = set(participant_ids)
+    await _ensure_team_participants(db, requested, team_id)
+
+    # Existing links are skipped by the unique constraint
+    added = await add_members(db, meeting_id, requested)
+    reassigned = await repair_assignments(db, meeting_id, added_ids=added) if repair and added else None
+    if added and not repair:
+        await mark_meetings_stale(db, [meeting_id])
+
+    await db.commit()
+    if added:
+        await _publish_membership_change(team_id, meeting_id, reassigned)
+    return {"message": f"Added {len(added)} participants", "added": added, "reassigned_roles": reassigned or []}
+
 
-    # Verify participants belong to the same team
-    stmt_participants = select(Participant).where(
-        Participant.id.in_(participant_ids),
-        Participant.team_id == team_id
+@router.put("/{meeting_id}/participants", response_model=schemas.MeetingMembershipResult)
+async def replace_participants(
+    meeting_id: int,
+    participant_ids: list[int],
+    repair: bool = Query(True, description="Incrementally repair existing role assignments"),
+    team_id: int = Depends(get_current_team_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """Replace the meeting's participant set (only from current team)."""
+    await _ensure_team_meeting(db, meeting_id, team_id)
+    requested = set(participant_ids)
+    await _ensure_team_participants(db, requested, team_id)
+
+    added, removed = await replace_members(db, meeting_id, requested)
+    reassigned = None
+    if repair and (added or removed):
+        reassigned = await repair_assignments(db, meeting_id, added_ids=added, removed_ids=removed)
+    elif added or removed:
+        await mark_meetings_stale(db, [meeting_id])
+
+    await db.commit()
+    if added or removed:
+        await _publish_membership_change(team_id, meeting_id, reassigned)
+    return schemas.MeetingMembershipResult(
+        meeting_id=meeting_id, added=added, removed=removed, reassigned_roles=reassigned or []
     )
-    result_participants = await db.execute(stmt_participants)
-    participants = result_participants.scalars().all()
-    if len(participants) != len(participant_ids):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Some participants do not belong to your team"
-        )
 
-    # Add new participants (avoid duplicates)
-    for participant in participants:
-        if participant not in meeting.participants:
-            meeting.participants.append(participant)
+
+@router.post("/{meeting_id}/participants/remove", response_model=schemas.MeetingMembershipResult)
+async def remove_participants(
+    meeting_id: int,
+    participant_ids: list[int],
+    repair: bool = Query(True, description="Incrementally repair existing role assignments"),
+    team_id: int = Depends(get_current_team_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """Remove several participants from meeting (only from current team)."""
+    await _ensure_team_meeting(db, meeting_id, team_id)
+
+    removed = await remove_members(db, meeting_id, set(participant_ids))
+    reassigned = await repair_assignments(db, meeting_id, removed_ids=removed) if repair and removed else None
+    if removed and not repair:
+        await mark_meetings_stale(db, [meeting_id])
 
     await db.commit()
-    return {"message": f"Added {len(participants)} participants"}
+    if removed:
+        await _publish_membership_change(team_id, meeting_id, reassigned)
+    return schemas.MeetingMembershipResult(meeting_id=meeting_id, removed=removed, reassigned_roles=reassigned or [])
 
 
 @router.delete("/{meeting_id}/participants/{participant_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def remove_participant(
     meeting_id: int,
     participant_id: int,
+    repair: bool = Query(True, description="Incrementally repair existing role assignments"),
     team_id: int = Depends(get_current_team_id),
     db: AsyncSession = Depends(get_db)
 ):
     """Remove participant from meeting (only from current team)."""
-    stmt = select(Meeting).options(selectinload(Meeting.participants)).where(
-        Meeting.id == meeting_id,
-        Meeting.team_id == team_id
-    )
-    result = await db.execute(stmt)
-    meeting = result.scalar_one_or_none()
-    if not meeting:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Meeting {meeting_id} not found in your team"
-        )
+    await _ensure_team_meeting(db, meeting_id, team_id)
 
-    stmt_participant = select(Participant).where(
-        Participant.id == participant_id,
-        Participant.team_id == team_id
-    )
-    result_participant = await db.execute(stmt_participant)
-    participant = result_participant.scalar_one_or_none()
-    if not participant or participant not in meeting.participants:
+    removed = await remove_members(db, meeting_id, {participant_id})
+    if not removed:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Participant {participant_id} not in meeting"
         )
+    reassigned = None
+    if repair:
+        reassigned = await repair_assignments(db, meeting_id, removed_ids=removed)
+    else:
+        await mark_meetings_stale(db, [meeting_id])
 
-    meeting.participants.remove(participant)
     await db.commit()
+    await _publish_membership_change(team_id, meeting_id, reassigned)
     return None
 
 
+# Concurrent assign-roles calls for the same meeting share one computation
+assign_flight = SingleFlight()
+
+
+async def _assign_and_describe(meeting_id: int) -> RoleAssignmentResult:
+    """Run the assignment in its own session (shared by all single-flight callers)."""
+    async with AsyncSessionLocal() as session:
+        assignments = await assign_roles(session, meeting_id)
+
+        result = await session.execute(
+            select(Participant.id, Participant.name)
+            .where(Participant.id.in_([assignment.participant_id for assignment in assignments]))
+        )
+        names = dict(result.all())
+
+    return RoleAssignmentResult(
+        meeting_id=meeting_id,
+        assignments=[_assignment_schema(assignment, names.get(assignment.participant_id)) for assignment in assignments],
+        total_assigned=len(assignments)
+    )
+
+
+async def _refresh_stale(db: AsyncSession, meeting_ids: list[int]) -> None:
+    """Recompute flagged meetings whose inputs changed before their assignments are read."""
+    for meeting_id in await resolve_stale(db, meeting_ids):
+        try:
+            await assign_flight.do(meeting_id, lambda meeting_id=meeting_id: _assign_and_describe(meeting_id))
+        except ValueError:
+            pass  # Nothing to assign; the stored assignment is returned as is
+
+
 @router.post("/{meeting_id}/assign-roles", response_model=RoleAssignmentResult)
 async def assign_meeting_roles(
     meeting_id: int,
@@ -232,48 +815,16 @@ async def assign_meeting_roles(
     """
     Assign roles to participants for this meeting (only from current team).
 
-    Runs the role distribution algorithm and stores results.
+    Runs the role distribution algorithm and stores results; a draft
+    precomputed at creation is confirmed instead if its inputs (participants,
+    role history, settings) are unchanged. Concurrent calls for the same
+    meeting in this worker share one run; writers in other workers are
+    serialized by a Postgres advisory lock.
     """
-    # Verify meeting belongs to team
-    stmt_meeting = select(Meeting).where(
-        Meeting.id == meeting_id,
-        Meeting.team_id == team_id
-    )
-    result_meeting = await db.execute(stmt_meeting)
-    meeting = result_meeting.scalar_one_or_none()
-    if not meeting:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Meeting {meeting_id} not found in your team"
-        )
+    await _ensure_team_meeting(db, meeting_id, team_id)
 
     try:
-        assignments = await assign_roles(db, meeting_id)
-
-        # Build response with participant names
-        result_assignments = []
-        for assignment in assignments:
-            stmt = select(Participant).where(Participant.id == assignment.participant_id)
-            result = await db.execute(stmt)
-            participant = result.scalar_one_or_none()
-            result_assignments.append(
-                RoleAssignmentSchema(
-                    id=assignment.id,
-                    meeting_id=assignment.meeting_id,
-                    participant_id=assignment.participant_id,
-                    role=assignment.role,
-                    fitness_score=assignment.fitness_score,
-                    created_at=assignment.created_at,
-                    participant_name=participant.name if participant else None
-                )
-            )
-
-        return RoleAssignmentResult(
-            meeting_id=meeting_id,
-            assignments=result_assignments,
-            total_assigned=len(result_assignments)
-        )
-
+        return await assign_flight.do(meeting_id, lambda: _assign_and_describe(meeting_id))
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -284,10 +835,27 @@ async def assign_meeting_roles(
 @router.get("/{meeting_id}/assignments", response_model=list[RoleAssignmentSchema])
 async def get_meeting_assignments(
     meeting_id: int,
-    team_id: int = Depends(get_current_team_id),
-    db: AsyncSession = Depends(get_db)
+    if_none_match: str | None = Header(None),
+    team_id: int = Depends(get_current_team_id)
 ):
-    """Get role assignments for a meeting (only from current team)."""
+    """
+    Get role assignments for a meeting (only from current team); stale assignments are recomputed first.
+
+    Cached per meeting until its assignments, the meeting or the team's
+    participants change; a matching If-None-Match is answered with 304.
+    After a change the previous assignments are still served (with their
+    Age) for up to RESPONSE_CACHE_MAX_STALE_SECONDS while they are reloaded
+    in the background.
+    """
+    return await cached_json_response(
+        team_id, ASSIGNMENTS, (meeting_id,),
+        lambda session: _load_meeting_assignments(session, meeting_id, team_id),
+        assignment_list, if_none_match,
+        max_stale=settings.RESPONSE_CACHE_MAX_STALE_SECONDS
+    )
+
+
+async def _load_meeting_assignments(db: AsyncSession, meeting_id: int, team_id: int) -> list[RoleAssignmentSchema]:
     # Verify meeting belongs to team
     stmt_meeting = select(Meeting).where(
         Meeting.id == meeting_id,
@@ -300,27 +868,14 @@ async def get_meeting_assignments(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Meeting {meeting_id} not found in your team"
         )
+    if meeting.assignments_stale:
+        await _refresh_stale(db, [meeting_id])
 
-    stmt = select(RoleAssignment).where(RoleAssignment.meeting_id == meeting_id)
-    result_query = await db.execute(stmt)
-    assignments = result_query.scalars().all()
-
-    # Add participant names
-    result = []
-    for assignment in assignments:
-        stmt_participant = select(Participant).where(Participant.id == assignment.participant_id)
-        result_participant = await db.execute(stmt_participant)
-        participant = result_participant.scalar_one_or_none()
-        result.append(
-            RoleAssignmentSchema(
-                id=assignment.id,
-                meeting_id=assignment.meeting_id,
-                participant_id=assignment.participant_id,
-                role=assignment.role,
-                fitness_score=assignment.fitness_score,
-                created_at=assignment.created_at,
-                participant_name=participant.name if participant else None
-            )
-        )
-
-    return result
+    # Assignments with participant names in one query
+    result = await db.execute(
+        select(RoleAssignment, Participant.name)
+        .outerjoin(Participant, Participant.id == RoleAssignment.participant_id)
+        .where(RoleAssignment.meeting_id == meeting_id)
+        .order_by(RoleAssignment.id)
+    )
+    return [_assignment_schema(assignment, participant_name) for assignment, participant_name in result.all()]
@@ -1,27 +1,71 @@
 """Participants API router."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.dependencies.auth import get_current_team_id
 from app.models.participant import Participant
+from app.routers.cache import cached_json_response
+from app.routers.jobs import submit_job
 from app.schemas import participant as schemas
+from app.services.participant_import import (
+    CSV_CONTENT_TYPES,
+    JSON_CONTENT_TYPES,
+    NDJSON_CONTENT_TYPES,
+    ImportFormatError,
+    import_participants,
+    iter_csv_rows,
+    iter_json_array_rows,
+    iter_lines,
+    iter_ndjson_rows,
+)
+from app.services.event_bus import PARTICIPANT_CHANGED, event_bus
+from app.services.recompute import ASSIGNMENT_INPUT_FIELDS, find_affected_meetings, schedule_recompute
+from app.services.response_cache import PARTICIPANTS
+from app.services.staleness import mark_meetings_stale, mark_participants_stale
 
 router = APIRouter()
 
+participant_list = TypeAdapter(list[schemas.Participant])
+
 
 @router.get("/", response_model=list[schemas.Participant])
 async def list_participants(
+    if_none_match: str | None = Header(None),
+    team_id: int = Depends(get_current_team_id)
+):
+    """List all participants for the current team (cached until a participant of the team changes, with ETag)."""
+    async def load(session: AsyncSession):
+        result = await session.execute(
+            select(Participant).where(Participant.team_id == team_id)
+        )
+        return [schemas.Participant.model_validate(participant) for participant in result.scalars().all()]
+
+    return await cached_json_response(team_id, PARTICIPANTS, "list", load, participant_list, if_none_match)
+
+
+@router.get("/batch", response_model=dict[int, schemas.Participant])
+async def get_participants_batch(
+    ids: list[int] = Query(..., max_length=500, description="Participant IDs (repeat the parameter)"),
     team_id: int = Depends(get_current_team_id),
     db: AsyncSession = Depends(get_db)
 ):
-    """List all participants for the current team."""
+    """
+    Get several participants by ID with one query (only from current team).
+
+    Returns a mapping of participant ID to participant; IDs outside the team are omitted.
+    """
     result = await db.execute(
-        select(Participant).where(Participant.team_id == team_id)
+        select(Participant).where(
+            Participant.id.in_(set(ids)),
+            Participant.team_id == team_id
+        )
     )
-    return result.scalars().all()
+    return {participant.id: participant for participant in result.scalars().all()}
 
 
 @router.post("/", response_model=schemas.Participant, status_code=status.HTTP_201_CREATED)
@@ -48,9 +92,61 @@ async def create_participant(
     db.add(participant)
     await db.commit()
     await db.refresh(participant)
+    await event_bus.publish(team_id, PARTICIPANT_CHANGED, participant_ids=[participant.id], action="created")
     return participant
 
 
+@router.post(
+    "/import",
+    response_model=schemas.ParticipantImportResult,
+    responses={202: {"description": "Import accepted as a background job (background=true)"}}
+)
+async def import_participants_bulk(
+    request: Request,
+    background: bool = Query(False, description="Parse now, insert in a background job and return 202"),
+    team_id: int = Depends(get_current_team_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Bulk import participants into the current team.
+
+    Accepts a JSON array (application/json), or a streamed NDJSON
+    (application/x-ndjson) or CSV (text/csv, header row required) body.
+    Rows are validated and inserted in chunks; rows that fail validation or
+    collide with an existing email are reported individually and do not
+    abort the import. With background=true the body is parsed here and the
+    inserts run as an 'import_participants' job; the result is stored on the job.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+
+    if content_type in NDJSON_CONTENT_TYPES:
+        rows = iter_ndjson_rows(iter_lines(request.stream()))
+    elif content_type in CSV_CONTENT_TYPES:
+        rows = iter_csv_rows(iter_lines(request.stream()))
+    elif content_type in JSON_CONTENT_TYPES:
+        rows = iter_json_array_rows(await request.body())
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Unsupported content type '{content_type}', use JSON, NDJSON or CSV"
+        )
+
+    try:
+        if background:
+            parsed = [[row_number, row, parse_error] async for row_number, row, parse_error in rows]
+            accepted = await submit_job(db, team_id, "import_participants", {"rows": parsed})
+            return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content=accepted.model_dump())
+        result = await import_participants(db, team_id, rows)
+    except ImportFormatError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    if result.created:
+        await event_bus.publish(team_id, PARTICIPANT_CHANGED, action="imported")
+    return result
+
+
 @router.get("/{participant_id}", response_model=schemas.Participant)
 async def get_participant(
     participant_id: int,
@@ -79,7 +175,12 @@ async def update_participant(
     team_id: int = Depends(get_current_team_id),
     db: AsyncSession = Depends(get_db)
 ):
-    """Update participant (only from current team)."""
+    """
+    Update participant (only from current team).
+
+    Changing EI/SI or peak hours flags the upcoming meetings the participant
+    attends as stale and schedules their recompute.
+    """
     stmt = select(Participant).where(
         Participant.id == participant_id,
         Participant.team_id == team_id
@@ -94,11 +195,21 @@ async def update_participant(
 
     # Update only provided fields
     update_data = participant_data.model_dump(exclude_unset=True)
+    inputs_changed = any(
+        getattr(participant, field) != value
+        for field, value in update_data.items()
+        if field in ASSIGNMENT_INPUT_FIELDS
+    )
     for field, value in update_data.items():
         setattr(participant, field, value)
+    if inputs_changed:
+        await mark_participants_stale(db, [participant.id])
 
     await db.commit()
     await db.refresh(participant)
+    await event_bus.publish(team_id, PARTICIPANT_CHANGED, participant_ids=[participant.id], action="updated")
+    if inputs_changed:
+        await schedule_recompute(db, team_id, [participant.id])
     return participant
 
 
@@ -108,7 +219,12 @@ async def delete_participant(
     team_id: int = Depends(get_current_team_id),
     db: AsyncSession = Depends(get_db)
 ):
-    """Delete participant (only from current team)."""
+    """
+    Delete participant (only from current team).
+
+    The upcoming assigned meetings the participant attended are flagged
+    stale (in the same transaction) and their recompute is scheduled.
+    """
     stmt = select(Participant).where(
         Participant.id == participant_id,
         Participant.team_id == team_id
@@ -121,6 +237,14 @@ async def delete_participant(
             detail=f"Participant {participant_id} not found in your team"
         )
 
-    await db.delete(participant)
+    # Found before the delete cascades the participant's memberships
+    affected = await find_affected_meetings(db, team_id, [participant_id])
+    await mark_meetings_stale(db, affected)
+    # A statement, so the database cascades to memberships and role assignments
+    # (an ORM delete would null role_assignments.participant_id instead)
+    await db.execute(delete(Participant).where(Participant.id == participant_id))
     await db.commit()
+    await event_bus.publish(team_id, PARTICIPANT_CHANGED, participant_ids=[participant_id], action="deleted")
+    if affected:
+        await schedule_recompute(db, team_id, meeting_ids=affected)
     return None
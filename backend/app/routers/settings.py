@@ -1,18 +1,232 @@
 """API endpoints for algorithm settings."""
-from fastapi import APIRouter
-from ..constants.roles import ROLE_REQUIREMENTS
-from ..constants.meeting_types import MEETING_MULTIPLIERS
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database import get_db
+from ..dependencies import get_current_team_id, get_current_user, get_optional_team_id
+from ..schemas import settings as schemas
+from ..schemas.user import UserWithTeam
+from .cache import etag_matches
+from ..services.compute_pool import run_cpu_bound
+from ..services.corpus import load_team_corpus
+from ..services.event_bus import SETTINGS_CHANGED, event_bus
+from ..services.fitness import DEFAULT_TABLES
+from ..services.recompute import schedule_recompute
+from ..services.replay import replay_report
+from ..services.settings_store import (
+    SettingsConflict,
+    TeamSettings,
+    get_team_tables,
+    list_versions,
+    save_team_settings,
+    settings_cache,
+)
+from ..services.staleness import mark_team_stale
 
 router = APIRouter(prefix="/api/settings", tags=["settings"])
 
 
+def _not_modified(team_id: int, if_none_match: str | None) -> Response | None:
+    """304 response if the client's ETag matches the cached settings version (no query)."""
+    if if_none_match is None:
+        return None
+    cached = settings_cache.peek(team_id)
+    if cached is not None and etag_matches(if_none_match, cached.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": cached.etag})
+    return None
+
+
+def _version_from_etag(if_match: str) -> int:
+    """Settings version encoded in an ETag ("settings-<team>-<version>")."""
+    try:
+        return int(if_match.strip().strip('"').rsplit("-", 1)[1])
+    except (IndexError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid If-Match header"
+        )
+
+
+def _settings_response(team_settings: TeamSettings) -> schemas.AlgorithmSettings:
+    tables = team_settings.tables
+    return schemas.AlgorithmSettings(
+        version=team_settings.version,
+        role_requirements=tables.role_requirements,
+        meeting_multipliers=tables.meeting_multipliers,
+        history_penalties=list(tables.history_penalties),
+    )
+
+
+def _check_known_keys(override: schemas.ScoringSettingsOverride, team_settings: TeamSettings) -> None:
+    """Reject roles and meeting types the algorithm does not know."""
+    roles = set(team_settings.tables.roles)
+    meeting_types = set(team_settings.tables.meeting_multipliers)
+    unknown_roles = set(override.role_requirements) - roles
+    unknown_types = set(override.meeting_multipliers) - meeting_types
+    for values in override.meeting_multipliers.values():
+        unknown_roles |= set(values) - roles
+    if unknown_roles or unknown_types:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unknown roles {sorted(unknown_roles)} or meeting types {sorted(unknown_types)}"
+        )
+
+
+@router.get("", response_model=schemas.AlgorithmSettings)
+async def get_settings(
+    response: Response,
+    if_none_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_db),
+    team_id: int = Depends(get_current_team_id)
+):
+    """Get the team's active algorithm settings (ETag = settings version)."""
+    not_modified = _not_modified(team_id, if_none_match)
+    if not_modified is not None:
+        return not_modified
+
+    team_settings = await get_team_tables(db, team_id)
+    response.headers["ETag"] = team_settings.etag
+    return _settings_response(team_settings)
+
+
+@router.put("", response_model=schemas.AlgorithmSettings)
+async def update_settings(
+    override: schemas.ScoringSettingsOverride,
+    response: Response,
+    if_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_db),
+    current_user: UserWithTeam = Depends(get_current_user)
+):
+    """
+    Store a new settings version for the team.
+
+    Omitted roles and multipliers keep their current values. With an
+    If-Match header the save only succeeds if it is still based on the
+    latest version. Upcoming assignments of the team are flagged stale in
+    the same transaction and recomputed in a background job
+    (recompute_job_id).
+    """
+    team_id = current_user.team_id
+    current = await get_team_tables(db, team_id)
+    _check_known_keys(override, current)
+
+    expected_version = _version_from_etag(if_match) if if_match is not None else None
+    # A newer expected version than the cached one is left to the save,
+    # which re-checks the latest version in the database
+    if expected_version is not None and expected_version < current.version:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=f"Settings version {expected_version} is not the latest ({current.version})"
+        )
+
+    try:
+        team_settings = await save_team_settings(
+            db, team_id, override.apply(current.tables),
+            created_by=current_user.id,
+            expected_version=expected_version,
+            before_commit=lambda session: mark_team_stale(session, team_id)
+        )
+    except SettingsConflict as e:
+        settings_cache.invalidate(team_id)
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED if expected_version is not None
+            else status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+
+    await event_bus.publish(team_id, SETTINGS_CHANGED, version=team_settings.version)
+
+    response.headers["ETag"] = team_settings.etag
+    body = _settings_response(team_settings)
+    body.recompute_job_id = await schedule_recompute(db, team_id)
+    return body
+
+
+@router.get("/versions", response_model=list[schemas.AlgorithmSettingsVersion])
+async def get_settings_versions(
+    response: Response,
+    if_none_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_db),
+    team_id: int = Depends(get_current_team_id)
+):
+    """List the team's stored settings versions, newest first (ETag = latest version)."""
+    not_modified = _not_modified(team_id, if_none_match)
+    if not_modified is not None:
+        return not_modified
+
+    team_settings = await get_team_tables(db, team_id)
+    response.headers["ETag"] = team_settings.etag
+    return await list_versions(db, team_id)
+
+
 @router.get("/role-requirements")
-async def get_role_requirements():
-    """Get role requirements matrix."""
-    return ROLE_REQUIREMENTS
+async def get_role_requirements(
+    response: Response,
+    if_none_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_db),
+    team_id: int | None = Depends(get_optional_team_id)
+):
+    """
+    Get the role requirements matrix (public).
+
+    Authenticated callers get their team's active settings (with ETag),
+    anonymous callers the built-in defaults.
+    """
+    if team_id is None:
+        return DEFAULT_TABLES.role_requirements
+    not_modified = _not_modified(team_id, if_none_match)
+    if not_modified is not None:
+        return not_modified
+
+    team_settings = await get_team_tables(db, team_id)
+    response.headers["ETag"] = team_settings.etag
+    return team_settings.tables.role_requirements
 
 
 @router.get("/meeting-multipliers")
-async def get_meeting_multipliers():
-    """Get meeting type multipliers."""
-    return MEETING_MULTIPLIERS
+async def get_meeting_multipliers(
+    response: Response,
+    if_none_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_db),
+    team_id: int | None = Depends(get_optional_team_id)
+):
+    """
+    Get the meeting type multipliers (public).
+
+    Authenticated callers get their team's active settings (with ETag),
+    anonymous callers the built-in defaults.
+    """
+    if team_id is None:
+        return DEFAULT_TABLES.meeting_multipliers
+    not_modified = _not_modified(team_id, if_none_match)
+    if not_modified is not None:
+        return not_modified
+
+    team_settings = await get_team_tables(db, team_id)
+    response.headers["ETag"] = team_settings.etag
+    return team_settings.tables.meeting_multipliers
+
+
+@router.post("/replay", response_model=schemas.ReplayResult)
+async def replay_settings(
+    request: schemas.ReplayRequest,
+    db: AsyncSession = Depends(get_db),
+    team_id: int = Depends(get_current_team_id)
+):
+    """
+    Replay the team's meetings chronologically under candidate settings.
+
+    The team's meetings, participants and role history are loaded once and
+    re-simulated in memory twice - under the team's current settings and
+    under the candidate - with history carried forward. Returns the meetings
+    whose assignment would change and fairness metrics of both runs.
+    """
+    team_settings = await get_team_tables(db, team_id)
+    _check_known_keys(request.candidate, team_settings)
+    corpus = await load_team_corpus(db, team_id, request.start, request.end)
+    report = await run_cpu_bound(
+        replay_report, corpus, request.candidate.apply(team_settings.tables), team_settings.tables,
+        request.max_diffs,
+        size=len(corpus.meetings)
+    )
+    return schemas.ReplayResult.model_validate(report)
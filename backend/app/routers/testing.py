@@ -7,17 +7,44 @@ It bypasses authentication to allow public access for demonstration.
 REMOVE THIS ROUTER before production deployment when real EI integration exists.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from pydantic import TypeAdapter
+from sqlalchemy import Integer, bindparam, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.participant import Participant
 from app.models.team import Team
+from app.routers.cache import cached_json_response
 from app.schemas import testing as schemas
+from app.services.event_bus import PARTICIPANT_CHANGED, event_bus
+from app.services.recompute import schedule_recompute
+from app.services.response_cache import PARTICIPANTS
+from app.services.staleness import mark_participants_stale
 
 router = APIRouter()
 
+participants_with_ei = TypeAdapter(list[schemas.ParticipantWithEI])
+participants_with_si = TypeAdapter(list[schemas.ParticipantWithSI])
+
+
+async def _load_team_participants(db: AsyncSession, team_id: int, schema: type) -> list:
+    """Participants of a team ordered by name, as response schemas (404 if the team does not exist)."""
+    team_result = await db.execute(select(Team).where(Team.id == team_id))
+    team = team_result.scalar_one_or_none()
+    if not team:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Team {team_id} not found"
+        )
+
+    result = await db.execute(
+        select(Participant)
+        .where(Participant.team_id == team_id)
+        .order_by(Participant.name)
+    )
+    return [schema.model_validate(participant) for participant in result.scalars().all()]
+
 
 @router.get("/teams", response_model=list[schemas.TeamBasic])
 async def list_teams(db: AsyncSession = Depends(get_db)):
@@ -34,29 +61,84 @@ async def list_teams(db: AsyncSession = Depends(get_db)):
 @router.get("/teams/{team_id}/participants", response_model=list[schemas.ParticipantWithEI])
 async def list_team_participants(
     team_id: int,
-    db: AsyncSession = Depends(get_db)
+    if_none_match: str | None = Header(None)
 ):
     """
     List all participants for a specific team (public endpoint, no authentication required).
 
+    Cached until a participant of the team changes; supports If-None-Match.
+
     TEMPORARY: For demo purposes only.
     """
-    # Check if team exists
-    team_result = await db.execute(select(Team).where(Team.id == team_id))
-    team = team_result.scalar_one_or_none()
-    if not team:
+    return await cached_json_response(
+        team_id, PARTICIPANTS, "testing",
+        lambda session: _load_team_participants(session, team_id, schemas.ParticipantWithEI),
+        participants_with_ei, if_none_match
+    )
+
+
+@router.put("/participants/scores", response_model=list[schemas.ParticipantWithScores])
+async def update_scores_bulk(
+    score_data: schemas.BulkScoreUpdate,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Update EI and/or SI scores for many participants in one transaction (public endpoint, no authentication required).
+
+    Used to submit a whole questionnaire session at once. All updates are applied
+    with a single executemany UPDATE; omitted scores are left unchanged. If the same
+    participant appears twice, the last entry wins.
+    Upcoming assignments of the updated participants are recomputed in the background.
+
+    TEMPORARY: For demo purposes only.
+    """
+    updates = {}
+    for item in score_data.updates:
+        previous = updates.get(item.participant_id, {})
+        updates[item.participant_id] = {
+            "b_id": item.participant_id,
+            "b_ei": item.ei_score if item.ei_score is not None else previous.get("b_ei"),
+            "b_si": item.si_score if item.si_score is not None else previous.get("b_si"),
+        }
+
+    result = await db.execute(
+        select(Participant.id).where(Participant.id.in_(updates.keys()))
+    )
+    missing = set(updates) - set(result.scalars().all())
+    if missing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Team {team_id} not found"
+            detail=f"Participants not found: {sorted(missing)}"
         )
 
-    # Get participants
+    table = Participant.__table__
+    stmt = (
+        update(table)
+        .where(table.c.id == bindparam("b_id"))
+        .values(
+            emotional_intelligence=func.coalesce(bindparam("b_ei", type_=Integer), table.c.emotional_intelligence),
+            social_intelligence=func.coalesce(bindparam("b_si", type_=Integer), table.c.social_intelligence),
+            updated_at=func.now(),
+        )
+    )
+    await db.execute(stmt, list(updates.values()))
+    await mark_participants_stale(db, list(updates))
+    await db.commit()
+
     result = await db.execute(
         select(Participant)
-        .where(Participant.team_id == team_id)
+        .where(Participant.id.in_(updates.keys()))
         .order_by(Participant.name)
     )
     participants = result.scalars().all()
+
+    # One recompute job per affected team
+    by_team: dict[int, list[int]] = {}
+    for participant in participants:
+        by_team.setdefault(participant.team_id, []).append(participant.id)
+    for team_id, participant_ids in by_team.items():
+        await event_bus.publish(team_id, PARTICIPANT_CHANGED, participant_ids=participant_ids, action="updated")
+        await schedule_recompute(db, team_id, participant_ids)
     return participants
 
 
@@ -93,7 +175,8 @@ async def update_ei_score(
     """
     Update participant's emotional intelligence score (public endpoint, no authentication required).
 
-    Only updates the emotional_intelligence field.
+    Only updates the emotional_intelligence field. A changed score schedules a recompute of the
+    participant's upcoming assignments.
 
     TEMPORARY: For demo purposes only.
     """
@@ -108,10 +191,18 @@ async def update_ei_score(
         )
 
     # Update only EI score
+    changed = participant.emotional_intelligence != score_data.ei_score
     participant.emotional_intelligence = score_data.ei_score
+    if changed:
+        await mark_participants_stale(db, [participant.id])
 
     await db.commit()
     await db.refresh(participant)
+    if changed:
+        await event_bus.publish(
+            participant.team_id, PARTICIPANT_CHANGED, participant_ids=[participant.id], action="updated"
+        )
+        await schedule_recompute(db, participant.team_id, [participant.id])
     return participant
 
 
@@ -142,30 +233,20 @@ async def get_participant_si(
 @router.get("/teams/{team_id}/participants/si", response_model=list[schemas.ParticipantWithSI])
 async def list_team_participants_si(
     team_id: int,
-    db: AsyncSession = Depends(get_db)
+    if_none_match: str | None = Header(None)
 ):
     """
     List all participants for a specific team with SI data (public endpoint, no authentication required).
 
+    Cached until a participant of the team changes; supports If-None-Match.
+
     TEMPORARY: For demo purposes only.
     """
-    # Check if team exists
-    team_result = await db.execute(select(Team).where(Team.id == team_id))
-    team = team_result.scalar_one_or_none()
-    if not team:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Team {team_id} not found"
-        )
-
-    # Get participants
-    result = await db.execute(
-        select(Participant)
-        .where(Participant.team_id == team_id)
-        .order_by(Participant.name)
+    return await cached_json_response(
+        team_id, PARTICIPANTS, "testing-si",
+        lambda session: _load_team_participants(session, team_id, schemas.ParticipantWithSI),
+        participants_with_si, if_none_match
     )
-    participants = result.scalars().all()
-    return participants
 
 
 @router.put("/participants/{participant_id}/si-score", response_model=schemas.ParticipantWithSI)
@@ -177,7 +258,8 @@ async def update_si_score(
     """
     Update participant's social intelligence score (public endpoint, no authentication required).
 
-    Only updates the social_intelligence field.
+    Only updates the social_intelligence field. A changed score schedules a recompute of the
+    participant's upcoming assignments.
 
     TEMPORARY: For demo purposes only.
     """
@@ -192,8 +274,16 @@ async def update_si_score(
         )
 
     # Update only SI score
+    changed = participant.social_intelligence != score_data.si_score
     participant.social_intelligence = score_data.si_score
+    if changed:
+        await mark_participants_stale(db, [participant.id])
 
     await db.commit()
     await db.refresh(participant)
+    if changed:
+        await event_bus.publish(
+            participant.team_id, PARTICIPANT_CHANGED, participant_ids=[participant.id], action="updated"
+        )
+        await schedule_recompute(db, participant.team_id, [participant.id])
     return participant
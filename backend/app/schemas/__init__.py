@@ -1,5 +1,5 @@
 """Schemas package."""
 
-from app.schemas import participant, meeting, role_assignment, statistics, team, user, testing
+from app.schemas import participant, meeting, role_assignment, statistics, team, user, testing, job, settings, cache
 
-__all__ = ["participant", "meeting", "role_assignment", "statistics", "team", "user", "testing"]
+__all__ = ["participant", "meeting", "role_assignment", "statistics", "team", "user", "testing", "job", "settings", "cache"]
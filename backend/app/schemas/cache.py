@@ -0,0 +1,23 @@
+"""Response cache metrics schemas."""
+
+from pydantic import BaseModel
+
+
+class CacheScopeStats(BaseModel):
+    """Counters of one response cache scope since the worker started."""
+
+    hits: int
+    stale_hits: int
+    misses: int
+    hit_ratio: float
+    evictions: int
+    invalidations: int
+
+
+class ResponseCacheStats(BaseModel):
+    """Schema for the worker's response cache metrics."""
+
+    entries: int
+    max_entries: int
+    ttl_seconds: float
+    scopes: dict[str, CacheScopeStats]
@@ -0,0 +1,84 @@
+"""Job schemas for background operations."""
+
+from datetime import datetime
+from pydantic import BaseModel, Field, model_validator
+
+from app.services.fairness_simulation import MAX_MEETINGS, MAX_TRIALS, config_from_params
+
+
+class JobSubmit(BaseModel):
+    """Schema for submitting a background job."""
+
+    kind: str = Field(..., min_length=1, max_length=50)
+    params: dict = Field(default_factory=dict)
+
+
+class ReassignMeetingsParams(BaseModel):
+    """Params of 'reassign_meetings' jobs."""
+
+    start: datetime | None = None
+    end: datetime | None = None
+    only_unassigned: bool = False
+
+    model_config = {"extra": "forbid"}
+
+
+class ImportParticipantsParams(BaseModel):
+    """Params of 'import_participants' jobs: [row_number, row, parse_error] triples."""
+
+    rows: list[tuple[int, dict | None, str | None]]
+
+    model_config = {"extra": "forbid"}
+
+
+class FairnessSimulationParams(BaseModel):
+    """Params of 'fairness_simulation' jobs (see fairness_simulation.config_from_params)."""
+
+    trials: int | None = Field(None, ge=1, le=MAX_TRIALS)
+    meetings: int | None = Field(None, ge=1, le=MAX_MEETINGS)
+    type_weights: dict[str, float] | None = None
+    hours: list[int] | None = None
+    attendance: float | None = None
+    seed: int | None = None
+    history_penalties: list[float] | None = None
+
+    model_config = {"extra": "forbid"}
+
+    @model_validator(mode="after")
+    def check_config(self) -> "FairnessSimulationParams":
+        config_from_params(self.model_dump(exclude_none=True))
+        return self
+
+
+class RecomputeAssignmentsParams(BaseModel):
+    """Params of 'recompute_assignments' jobs."""
+
+    participant_ids: list[int] | None = None
+    meeting_ids: list[int] | None = None
+
+    model_config = {"extra": "forbid"}
+
+
+class Job(BaseModel):
+    """Schema for job status response."""
+
+    id: int
+    kind: str
+    status: str
+    progress: int
+    total: int | None = None
+    result: dict | None = None
+    error: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    model_config = {"from_attributes": True}
+
+
+class JobAccepted(BaseModel):
+    """Schema for 202 responses of operations moved to the background."""
+
+    job_id: int
+    status: str
+    status_url: str
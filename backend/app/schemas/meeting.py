@@ -1,7 +1,8 @@
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from app.schemas.participant import Participant
+from app.schemas.role_assignment import RoleAssignment
 
 
 class MeetingBase(BaseModel):
@@ -18,6 +19,40 @@ class MeetingCreate(MeetingBase):
     participant_ids: list[int] = Field(default_factory=list, description="List of participant IDs")
 
 
+class RecurrenceRule(BaseModel):
+    """Schema for a meeting series recurrence rule."""
+
+    frequency: str = Field(..., pattern="^(daily|weekly)$")
+    interval: int = Field(1, ge=1, le=52, description="Days (daily) or weeks (weekly) between occurrences")
+    count: int | None = Field(None, ge=1, le=366, description="Number of occurrences")
+    until: datetime | None = Field(None, description="Last allowed occurrence time (inclusive)")
+    weekdays: list[int] | None = Field(
+        None, min_length=1, description="Allowed weekdays, 0=Monday .. 6=Sunday"
+    )
+
+    @model_validator(mode="after")
+    def check_bounds(self):
+        if self.count is None and self.until is None:
+            raise ValueError("Either count or until is required")
+        if self.weekdays and any(day < 0 or day > 6 for day in self.weekdays):
+            raise ValueError("Weekdays must be between 0 (Monday) and 6 (Sunday)")
+        return self
+
+
+class MeetingSeriesCreate(MeetingBase):
+    """Schema for creating a recurring meeting series (scheduled_time is the first occurrence)."""
+
+    participant_ids: list[int] = Field(default_factory=list, description="List of participant IDs")
+    recurrence: RecurrenceRule
+
+    @model_validator(mode="after")
+    def check_until_timezone(self):
+        until = self.recurrence.until
+        if until is not None and (until.tzinfo is None) != (self.scheduled_time.tzinfo is None):
+            raise ValueError("recurrence.until and scheduled_time must both have a timezone or both have none")
+        return self
+
+
 class MeetingUpdate(BaseModel):
     """Schema for updating a meeting (all fields optional)."""
 
@@ -31,11 +66,20 @@ class Meeting(MeetingBase):
 
     id: int
     created_at: datetime
+    assignments_stale: bool = False
     participants: list[Participant] = []
 
     model_config = {"from_attributes": True}
 
 
+class StaleMeeting(MeetingBase):
+    """Schema for a meeting whose stored assignments are out of date with their inputs."""
+
+    id: int
+
+    model_config = {"from_attributes": True}
+
+
 class MeetingList(MeetingBase):
     """Schema for meeting list (without full participant data)."""
 
@@ -44,3 +88,147 @@ class MeetingList(MeetingBase):
     participant_count: int = 0
 
     model_config = {"from_attributes": True}
+
+
+class MeetingSeriesResult(BaseModel):
+    """Schema for meeting series creation result."""
+
+    total_created: int
+    meetings: list[MeetingList]
+
+
+class MeetingMembershipResult(BaseModel):
+    """Schema for set-based meeting membership edits."""
+
+    meeting_id: int
+    added: list[int] = Field(default_factory=list)
+    removed: list[int] = Field(default_factory=list)
+    reassigned_roles: list[str] = Field(
+        default_factory=list, description="Roles whose holder changed by incremental repair"
+    )
+
+
+class RoleStreak(BaseModel):
+    """Role a participant has been repeating in their most recent meetings."""
+
+    role: str | None = None
+    length: int = 0
+
+
+class MeetingDetailParticipant(Participant):
+    """Meeting participant with energy at meeting time and recent role history."""
+
+    energy: int
+    recent_roles: list[str] = []
+    streak: RoleStreak
+
+
+class MeetingDetail(MeetingBase):
+    """Schema for the composite meeting detail page response."""
+
+    id: int
+    created_at: datetime
+    participants: list[MeetingDetailParticipant] = []
+    assignments: list[RoleAssignment] = []
+
+
+class SlotSearchRequest(BaseModel):
+    """Schema for searching the best time slot for a meeting."""
+
+    participant_ids: list[int] = Field(..., min_length=1, description="List of participant IDs")
+    meeting_type: str = Field(..., pattern="^(brainstorm|review|planning|status_update)$")
+    window_start: datetime
+    window_end: datetime
+    slot_minutes: int = Field(60, ge=5, le=240, description="Slot grid step in minutes")
+    top_k: int = Field(5, ge=1, le=50)
+
+    @model_validator(mode="after")
+    def check_window(self):
+        if self.window_end <= self.window_start:
+            raise ValueError("window_end must be after window_start")
+        return self
+
+
+class SlotScore(BaseModel):
+    """Projected outcome of one candidate slot."""
+
+    scheduled_time: datetime
+    total_fitness: float
+    average_energy: float
+    assigned_roles: int
+
+
+class SlotSearchResult(BaseModel):
+    """Schema for slot search result."""
+
+    meeting_type: str
+    evaluated_slots: int
+    slots: list[SlotScore]
+
+
+class TeamRecommendationRequest(BaseModel):
+    """Schema for requesting the best invite list for a meeting."""
+
+    meeting_type: str = Field(..., pattern="^(brainstorm|review|planning|status_update)$")
+    scheduled_time: datetime
+    max_participants: int = Field(..., ge=1, le=500, description="Size limit of the invite list")
+
+
+class RecommendedRole(BaseModel):
+    """Role the recommended participant would take."""
+
+    participant_id: int
+    participant_name: str
+    role: str
+    fitness_score: float
+
+
+class TeamRecommendation(BaseModel):
+    """Schema for team composition recommendation."""
+
+    participant_ids: list[int]
+    assignments: list[RecommendedRole]
+    reserve_ids: list[int] = Field(default_factory=list, description="Extra invitees without a role")
+    total_fitness: float = Field(..., description="Total fitness of the assignment assign-roles will produce")
+    search_fitness: float = Field(
+        ..., description="Total fitness of the best role mapping found by the search (may exceed total_fitness)"
+    )
+    optimal: bool = Field(..., description="False if the search stopped at its node budget")
+
+
+class SubstituteCandidate(BaseModel):
+    """Candidate for a role with the factors of its fitness score."""
+
+    participant_id: int
+    participant_name: str
+    in_meeting: bool
+    current_role: str | None = None
+    energy: int
+    base_score: float
+    history_penalty: float
+    context_multiplier: float
+    fitness_score: float
+
+
+class RoleSubstitutes(BaseModel):
+    """Best candidates for one role."""
+
+    role: str
+    holder_id: int | None = None
+    candidates: list[SubstituteCandidate]
+
+
+class MeetingSubstitutes(BaseModel):
+    """Schema for top-k substitutes per role of a meeting."""
+
+    meeting_id: int
+    k: int
+    roles: list[RoleSubstitutes]
+
+
+class MeetingReassignRequest(BaseModel):
+    """Schema for re-running role assignment over many meetings in the background."""
+
+    start: datetime | None = None
+    end: datetime | None = None
+    only_unassigned: bool = False
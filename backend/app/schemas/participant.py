@@ -40,3 +40,20 @@ class Participant(ParticipantBase):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class ParticipantImportError(BaseModel):
+    """Schema for a single rejected row of a bulk import."""
+
+    row: int = Field(..., description="1-based data row number in the uploaded payload")
+    email: str | None = None
+    detail: str
+
+
+class ParticipantImportResult(BaseModel):
+    """Schema for bulk participant import result."""
+
+    total_rows: int = 0
+    created: int = 0
+    failed: int = 0
+    errors: list[ParticipantImportError] = Field(default_factory=list)
@@ -0,0 +1,142 @@
+"""Algorithm settings schemas."""
+
+from datetime import datetime
+from pydantic import BaseModel, Field, model_validator
+
+
+class RoleRequirement(BaseModel):
+    """Schema for the parameter ranges of one role."""
+
+    ei_min: int = Field(..., ge=0, le=100)
+    ei_max: int = Field(..., ge=0, le=100)
+    si_min: int = Field(..., ge=0, le=100)
+    si_max: int = Field(..., ge=0, le=100)
+    energy_min: int = Field(..., ge=0, le=100)
+    energy_max: int = Field(..., ge=0, le=100)
+
+    @model_validator(mode="after")
+    def check_ranges(self):
+        for name in ("ei", "si", "energy"):
+            if getattr(self, f"{name}_min") > getattr(self, f"{name}_max"):
+                raise ValueError(f"{name}_min must not exceed {name}_max")
+        return self
+
+
+class ScoringSettingsOverride(BaseModel):
+    """Schema for candidate settings; omitted roles and multipliers keep their current values."""
+
+    role_requirements: dict[str, RoleRequirement] = Field(default_factory=dict)
+    meeting_multipliers: dict[str, dict[str, float]] = Field(default_factory=dict)
+    history_penalties: list[float] | None = Field(
+        None, min_length=1, max_length=10,
+        description="Validator 1 penalty by number of consecutive repeats; more repeats exclude"
+    )
+
+    @model_validator(mode="after")
+    def check_multipliers(self):
+        for meeting_type, values in self.meeting_multipliers.items():
+            if any(value < 0 or value > 5 for value in values.values()):
+                raise ValueError(f"Multipliers of {meeting_type} must be between 0 and 5")
+        if self.history_penalties and any(value < 0 or value > 1 for value in self.history_penalties):
+            raise ValueError("History penalties must be between 0 and 1")
+        return self
+
+    def apply(self, tables):
+        """Return a copy of the given ScoringTables with this override applied."""
+        return tables.with_overrides(
+            {role: requirement.model_dump() for role, requirement in self.role_requirements.items()},
+            self.meeting_multipliers,
+            self.history_penalties
+        )
+
+
+class AlgorithmSettings(BaseModel):
+    """Schema for a team's active algorithm settings."""
+
+    version: int
+    role_requirements: dict[str, RoleRequirement]
+    meeting_multipliers: dict[str, dict[str, float]]
+    history_penalties: list[float]
+    recompute_job_id: int | None = Field(None, description="Job recomputing upcoming assignments (after a save)")
+
+
+class AlgorithmSettingsVersion(BaseModel):
+    """Schema for one stored settings version (without the tables)."""
+
+    version: int
+    created_by: int | None = None
+    created_at: datetime | None = None
+
+    model_config = {"from_attributes": True}
+
+
+class ReplayRequest(BaseModel):
+    """Schema for replaying a team's meetings under candidate settings."""
+
+    candidate: ScoringSettingsOverride
+    start: datetime | None = Field(None, description="Replay meetings scheduled at or after this time")
+    end: datetime | None = Field(None, description="Replay meetings scheduled before this time")
+    max_diffs: int = Field(100, ge=0, le=1000, description="Maximum number of meeting diffs returned")
+
+
+class ParticipantFairness(BaseModel):
+    """Schema for one participant's role distribution."""
+
+    participant_id: int
+    assignments: int
+    role_counts: dict[str, int]
+    entropy: float
+    longest_streak: int
+
+    model_config = {"from_attributes": True}
+
+
+class FairnessMetrics(BaseModel):
+    """Schema for role rotation metrics of a sequence of meetings."""
+
+    meetings: int
+    mean_entropy: float
+    min_entropy: float
+    assignment_gini: float
+    mean_longest_streak: float
+    max_streak: int
+    participants: list[ParticipantFairness]
+
+    model_config = {"from_attributes": True}
+
+
+class RoleChange(BaseModel):
+    """Schema for a role whose holder changes under the candidate settings."""
+
+    role: str
+    baseline_participant_id: int | None
+    candidate_participant_id: int | None
+
+    model_config = {"from_attributes": True}
+
+
+class MeetingDiff(BaseModel):
+    """Schema for the changed roles of one replayed meeting."""
+
+    meeting_id: int
+    changes: list[RoleChange]
+    baseline_fitness: float
+    candidate_fitness: float
+
+    model_config = {"from_attributes": True}
+
+
+class ReplayResult(BaseModel):
+    """Schema for replay response: current settings (baseline) vs candidate."""
+
+    meetings: int
+    meetings_changed: int
+    roles_changed: int
+    baseline_fitness: float
+    candidate_fitness: float
+    baseline_fairness: FairnessMetrics
+    candidate_fairness: FairnessMetrics
+    diffs: list[MeetingDiff]
+    meetings_per_second: float
+
+    model_config = {"from_attributes": True}
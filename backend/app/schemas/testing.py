@@ -3,7 +3,7 @@ TEMPORARY: Testing module schemas for demo purposes only.
 This module will be removed when real EI/SI integration is implemented.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 class EIScoreUpdate(BaseModel):
@@ -16,6 +16,24 @@ class SIScoreUpdate(BaseModel):
     si_score: int = Field(..., ge=0, le=100, description="Social intelligence score (0-100)")
 
 
+class ScoreUpdateItem(BaseModel):
+    """Single participant entry of a bulk score update (EI and/or SI)."""
+    participant_id: int
+    ei_score: int | None = Field(None, ge=0, le=100, description="Emotional intelligence score (0-100)")
+    si_score: int | None = Field(None, ge=0, le=100, description="Social intelligence score (0-100)")
+
+    @model_validator(mode="after")
+    def check_any_score(self):
+        if self.ei_score is None and self.si_score is None:
+            raise ValueError("At least one of ei_score or si_score is required")
+        return self
+
+
+class BulkScoreUpdate(BaseModel):
+    """Schema for submitting a whole questionnaire session at once."""
+    updates: list[ScoreUpdateItem] = Field(..., min_length=1)
+
+
 class ParticipantWithEI(BaseModel):
     """Participant data for EI testing module (minimal fields)."""
     id: int
@@ -36,6 +54,17 @@ class ParticipantWithSI(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class ParticipantWithScores(BaseModel):
+    """Participant data with both EI and SI scores (bulk update response)."""
+    id: int
+    name: str
+    email: str
+    emotional_intelligence: int
+    social_intelligence: int
+
+    model_config = {"from_attributes": True}
+
+
 class TeamBasic(BaseModel):
     """Basic team info for testing module."""
     id: int
@@ -1,146 +1,146 @@
 """Assignment engine service - orchestrates the role assignment algorithm."""
 
-from sqlalchemy import select
+import logging
+
+from sqlalchemy import delete, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.database import AsyncSessionLocal
 
-from app.constants.roles import ALL_ROLES
-from app.constants.meeting_types import MEETING_MULTIPLIERS
-from app.models.meeting import Meeting
+from app.models.meeting import Meeting, meeting_participants
 from app.models.participant import Participant
 from app.models.role_assignment import RoleAssignment
-from app.services.energy_calculator import calculate_energy
-from app.services.role_matcher import calculate_base_fitness
-
-
-async def get_history_penalty(db: AsyncSession, participant_id: int, role: str) -> float | str:
+from app.services.compute_pool import run_cpu_bound
+from app.services.drafts import store_draft, take_draft
+from app.services.event_bus import ASSIGNMENT_CHANGED, event_bus
+from app.services.fitness import (
+    CompiledTables,
+    ParticipantProfile,
+    ScoringTables,
+    compute_assignment,
+    history_penalty_from_roles,
+    repair_holders,
+    score_participant,
+)
+from app.services.settings_store import get_team_tables
+from app.services.staleness import assignment_fingerprint, load_member_profiles, record_fingerprints
+
+logger = logging.getLogger(__name__)
+
+# Number of most recent assignments inspected by Validator 1
+HISTORY_DEPTH = 10
+
+# First key of the two-key Postgres advisory lock guarding a meeting's assignments
+ASSIGNMENT_LOCK_NAMESPACE = 7301
+
+
+async def lock_meeting_assignments(db: AsyncSession, meeting_id: int) -> None:
     """
-    Calculate penalty based on participant's recent role history (Validator 1).
+    Serialize writers of one meeting's role assignments across processes.
 
-    Checks if the participant has performed this role in recent meetings
-    and applies penalties to avoid role repetition.
+    Takes a transaction-scoped Postgres advisory lock, released on commit or
+    rollback, so concurrent assign/repair runs for the same meeting in any
+    worker wait for each other instead of racing on delete-then-insert.
+    """
+    await db.execute(select(func.pg_advisory_xact_lock(ASSIGNMENT_LOCK_NAMESPACE, meeting_id)))
 
-    Rules from tech_task.md lines 23-26:
-    - Last 2 meetings: -40% weight
-    - Last 3 meetings: -70% weight
-    - Last 4+ meetings: exclude from candidates
 
-    Args:
-        db: Database session
-        participant_id: Participant ID
-        role: Role to check
+async def lock_many_meeting_assignments(db: AsyncSession, meeting_ids: list[int]) -> None:
+    """
+    Take the assignment locks of many meetings with a single statement.
 
-    Returns:
-        - Float (0.0-0.7): Penalty percentage
-        - "EXCLUDE": Participant should be excluded from this role
+    Locks are acquired in ascending meeting_id order, so batch writers never
+    deadlock with each other or with single-meeting writers.
     """
-    # Query last assignments for this participant, ordered by date DESC
-    stmt = (
-        select(RoleAssignment)
-        .where(RoleAssignment.participant_id == participant_id)
-        .order_by(RoleAssignment.created_at.desc())
-        .limit(10)
+    if not meeting_ids:
+        return
+    ordered = (
+        select(Meeting.id)
+        .where(Meeting.id.in_(meeting_ids))
+        .order_by(Meeting.id)
+        .subquery()
     )
-    result = await db.execute(stmt)
-    recent_assignments = result.scalars().all()
-
-    # Count consecutive occurrences of this role
-    consecutive_count = 0
-    for assignment in recent_assignments:
-        if assignment.role == role:
-            consecutive_count += 1
-        else:
-            break  # Stop at first different role
-
-    if consecutive_count >= 4:
-        return "EXCLUDE"
-    elif consecutive_count == 3:
-        return 0.7
-    elif consecutive_count == 2:
-        return 0.4
-    else:
-        return 0.0
-
-
-def get_meeting_multiplier(meeting_type: str, role: str) -> float:
+    await db.execute(select(func.pg_advisory_xact_lock(ASSIGNMENT_LOCK_NAMESPACE, ordered.c.id)))
+
+
+async def load_recent_roles(
+    db: AsyncSession,
+    participant_ids: list[int],
+    depth: int = HISTORY_DEPTH,
+    exclude_meeting_ids: list[int] | None = None
+) -> dict[int, list[str]]:
     """
-    Get context multiplier for role based on meeting type (Validator 2).
+    Load the most recent roles of many participants with a single query.
 
-    Different meeting types prioritize different roles.
-    Multipliers from tech_task.md lines 28-35.
+    Uses a ROW_NUMBER() window per participant so only `depth` rows per
+    participant leave the database.
 
     Args:
-        meeting_type: Type of meeting ('brainstorm', 'review', etc.)
-        role: Role name
+        db: Database session
+        participant_ids: Participants to load history for
+        depth: Number of most recent assignments per participant
+        exclude_meeting_ids: Ignore assignments of these meetings (e.g. the ones being recomputed)
 
     Returns:
-        Multiplier (0.5 to 1.5)
+        Dict mapping participant_id -> roles, most recent first
+        (participants without history map to an empty list)
     """
-    return MEETING_MULTIPLIERS.get(meeting_type, {}).get(role, 1.0)
+    history = {participant_id: [] for participant_id in participant_ids}
+    if not participant_ids:
+        return history
+
+    ranked = (
+        select(
+            RoleAssignment.participant_id,
+            RoleAssignment.role,
+            func.row_number().over(
+                partition_by=RoleAssignment.participant_id,
+                order_by=(RoleAssignment.created_at.desc(), RoleAssignment.id.desc())
+            ).label("position")
+        )
+        .where(RoleAssignment.participant_id.in_(participant_ids))
+    )
+    if exclude_meeting_ids:
+        ranked = ranked.where(RoleAssignment.meeting_id.not_in(exclude_meeting_ids))
+    ranked = ranked.subquery()
+    stmt = (
+        select(ranked.c.participant_id, ranked.c.role)
+        .where(ranked.c.position <= depth)
+        .order_by(ranked.c.participant_id, ranked.c.position)
+    )
+    result = await db.execute(stmt)
+    for participant_id, role in result.all():
+        history[participant_id].append(role)
+    return history
 
 
-def greedy_assignment(fitness_matrix: dict, participants: list[Participant], roles: list[str]) -> list[dict]:
+async def get_history_penalty(db: AsyncSession, participant_id: int, role: str) -> float | str:
     """
-    Greedy algorithm for role assignment.
-
-    Strategy:
-    1. Sort all (participant, role) pairs by fitness score (DESC)
-    2. Iterate and assign greedily
-    3. Skip if participant already assigned OR role already filled
-    4. Stop when all 7 roles filled OR all participants assigned
+    Calculate penalty based on participant's recent role history (Validator 1).
 
-    For determinism, break ties alphabetically by participant name.
+    Checks if the participant has performed this role in recent meetings
+    and applies penalties to avoid role repetition.
+    See history_penalty_from_roles for the rules.
 
     Args:
-        fitness_matrix: Dict mapping (participant_id, role) -> score
-        participants: List of participants
-        roles: List of roles to assign
+        db: Database session
+        participant_id: Participant ID
+        role: Role to check
 
     Returns:
-        List of assignment dicts with participant_id, role, score
+        - Float (0.0-0.7): Penalty percentage
+        - "EXCLUDE": Participant should be excluded from this role
     """
-    # Convert fitness matrix to sorted list
-    assignments_pool = [
-        {
-            "participant_id": p_id,
-            "role": r,
-            "score": score
-        }
-        for (p_id, r), score in fitness_matrix.items()
-    ]
+    history = await load_recent_roles(db, [participant_id])
+    return history_penalty_from_roles(history[participant_id], role)
 
-    # Create participant name map for tie-breaking
-    participant_names = {p.id: p.name for p in participants}
 
-    # Sort by score DESC, then by participant name (for determinism)
-    assignments_pool.sort(
-        key=lambda x: (-x["score"], participant_names.get(x["participant_id"], ""))
-    )
-
-    assigned_participants = set()
-    assigned_roles = set()
-    final_assignments = []
-
-    for candidate in assignments_pool:
-        p_id = candidate["participant_id"]
-        role = candidate["role"]
-
-        # Skip if already assigned
-        if p_id in assigned_participants or role in assigned_roles:
-            continue
-
-        # Make assignment
-        final_assignments.append(candidate)
-        assigned_participants.add(p_id)
-        assigned_roles.add(role)
-
-        # Stop if all roles filled
-        if len(assigned_roles) == len(roles):
-            break
-
-    return final_assignments
-
-
-async def assign_roles(db: AsyncSession, meeting_id: int) -> list[RoleAssignment]:
+async def assign_roles(
+    db: AsyncSession,
+    meeting_id: int,
+    tables: ScoringTables | CompiledTables | None = None
+) -> list[RoleAssignment]:
     """
     Main function to assign roles for a meeting.
 
@@ -152,9 +152,13 @@ async def assign_roles(db: AsyncSession, meeting_id: int) -> list[RoleAssignment
     5. Run greedy assignment algorithm
     6. Save results to database
 
+    With the team's active settings, a draft stored at meeting creation is
+    confirmed instead of steps 2-5 if it was computed from the same inputs.
+
     Args:
         db: Database session
         meeting_id: ID of the meeting
+        tables: Scoring tables (defaults to the team's active settings)
 
     Returns:
         List of RoleAssignment objects
@@ -162,9 +166,10 @@ async def assign_roles(db: AsyncSession, meeting_id: int) -> list[RoleAssignment
     Raises:
         ValueError: If meeting not found or has no participants
     """
-    # Load meeting with participants
-    from sqlalchemy.orm import selectinload
+    # Only one writer per meeting at a time (across workers)
+    await lock_meeting_assignments(db, meeting_id)
 
+    # Load meeting with participants
     stmt = (
         select(Meeting)
         .options(selectinload(Meeting.participants))
@@ -179,57 +184,236 @@ async def assign_roles(db: AsyncSession, meeting_id: int) -> list[RoleAssignment
     participants = meeting.participants
     if not participants:
         raise ValueError(f"Meeting {meeting_id} has no participants")
+    stale_seq = meeting.stale_seq
 
-    # Calculate fitness scores for all combinations
-    fitness_matrix = {}
+    # Load role history of all participants at once (Validator 1 input)
+    history = await load_recent_roles(db, [participant.id for participant in participants])
+    team_settings = await get_team_tables(db, meeting.team_id)
+    if tables is None:
+        tables = team_settings.compiled
 
-    for participant in participants:
-        # Calculate energy level at meeting time
-        energy = calculate_energy(participant, meeting.scheduled_time)
+    profiles = [ParticipantProfile.from_model(participant) for participant in participants]
 
-        for role in ALL_ROLES:
-            # Calculate base fitness
-            base_score = calculate_base_fitness(participant, role, energy)
+    # A draft precomputed from exactly these inputs (incl. history) is confirmed as is
+    assignments = None
+    if tables is team_settings.compiled:
+        draft_fingerprint = assignment_fingerprint(
+            meeting.meeting_type, meeting.scheduled_time, profiles, team_settings.version, history
+        )
+        assignments = await take_draft(db, meeting_id, draft_fingerprint)
+
+    # Calculate fitness scores for all combinations (base fitness + Validators 1 and 2)
+    # and run the greedy assignment; large pools run in the compute pool
+    if assignments is None:
+        assignments = await run_cpu_bound(
+            compute_assignment, profiles, meeting.meeting_type, meeting.scheduled_time, history, tables,
+            size=len(profiles)
+        )
 
-            # Apply Validator 1: Role balance (history check)
-            history_penalty = await get_history_penalty(db, participant.id, role)
-            if history_penalty == "EXCLUDE":
-                continue  # Skip this combination
+    # Delete existing assignments for this meeting (if re-running).
+    # Executed as a statement right away: with ORM deletes the unit of work
+    # would flush the new INSERTs first and hit unique_meeting_participant.
+    await db.execute(delete(RoleAssignment).where(RoleAssignment.meeting_id == meeting_id))
 
-            # Apply Validator 2: Meeting context multiplier
-            context_multiplier = get_meeting_multiplier(meeting.meeting_type, role)
+    # Save to database (one executemany INSERT returning full rows incl. created_at)
+    db_assignments = []
+    if assignments:
+        result = await db.scalars(
+            insert(RoleAssignment).returning(RoleAssignment, sort_by_parameter_order=True),
+            [
+                {
+                    "meeting_id": meeting_id,
+                    "participant_id": assignment["participant_id"],
+                    "role": assignment["role"],
+                    "fitness_score": assignment["score"]
+                }
+                for assignment in assignments
+            ]
+        )
+        db_assignments = list(result.all())
 
-            # Calculate final score
-            final_score = base_score * (1 - history_penalty) * context_multiplier
+    # Inputs the assignment was computed from (clears the stale flag unless marked since they were read)
+    await record_fingerprints(db, {
+        meeting_id: (
+            assignment_fingerprint(meeting.meeting_type, meeting.scheduled_time, profiles, team_settings.version),
+            stale_seq
+        )
+    })
+    await db.commit()
+    await event_bus.publish(meeting.team_id, ASSIGNMENT_CHANGED, meeting_ids=[meeting_id])
 
-            fitness_matrix[(participant.id, role)] = final_score
+    return db_assignments
 
-    # Run greedy assignment algorithm
-    assignments = greedy_assignment(fitness_matrix, participants, ALL_ROLES)
 
-    # Delete existing assignments for this meeting (if re-running)
-    delete_stmt = select(RoleAssignment).where(RoleAssignment.meeting_id == meeting_id)
-    result = await db.execute(delete_stmt)
-    existing_assignments = result.scalars().all()
-    for assignment in existing_assignments:
-        await db.delete(assignment)
+async def precompute_draft(meeting_id: int) -> None:
+    """
+    Compute a meeting's assignment speculatively and store it as a draft.
 
-    # Save to database
-    db_assignments = []
-    for assignment in assignments:
-        db_assignment = RoleAssignment(
-            meeting_id=meeting_id,
-            participant_id=assignment["participant_id"],
-            role=assignment["role"],
-            fitness_score=assignment["score"]
+    Runs after the creating request has been answered (FastAPI background
+    task) in its own session. Failures are logged only: assign-roles then
+    simply computes the assignment itself.
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(Meeting).options(selectinload(Meeting.participants)).where(Meeting.id == meeting_id)
+            )
+            meeting = result.scalar_one_or_none()
+            if meeting is None or not meeting.participants:
+                return
+
+            profiles = [ParticipantProfile.from_model(participant) for participant in meeting.participants]
+            history = await load_recent_roles(db, [profile.id for profile in profiles])
+            team_settings = await get_team_tables(db, meeting.team_id)
+            assignments = await run_cpu_bound(
+                compute_assignment, profiles, meeting.meeting_type, meeting.scheduled_time, history,
+                team_settings.compiled,
+                size=len(profiles)
+            )
+            fingerprint = assignment_fingerprint(
+                meeting.meeting_type, meeting.scheduled_time, profiles, team_settings.version, history
+            )
+            await store_draft(db, meeting_id, fingerprint, assignments)
+            await db.commit()
+    except Exception:
+        logger.exception("Precomputing the draft assignment of meeting %s failed", meeting_id)
+
+
+async def _load_fitness_rows(
+    db: AsyncSession,
+    participant_ids: set[int],
+    meeting_type: str,
+    meeting_time,
+    tables: ScoringTables
+) -> dict[int, tuple[str, dict[str, float]]]:
+    """Compute fitness rows for only the given participants: participant_id -> (name, role -> score)."""
+    if not participant_ids:
+        return {}
+    result = await db.execute(select(Participant).where(Participant.id.in_(participant_ids)))
+    participants = result.scalars().all()
+    history = await load_recent_roles(db, [participant.id for participant in participants])
+    return {
+        participant.id: (
+            participant.name,
+            {
+                breakdown.role: breakdown.score
+                for breakdown in score_participant(
+                    participant, meeting_type, meeting_time, history[participant.id], tables
+                )
+            }
         )
-        db.add(db_assignment)
-        db_assignments.append(db_assignment)
+        for participant in participants
+    }
 
-    await db.commit()
 
-    # Refresh to get created_at timestamps
-    for assignment in db_assignments:
-        await db.refresh(assignment)
+async def repair_assignments(
+    db: AsyncSession,
+    meeting_id: int,
+    added_ids: list[int] | set[int] = (),
+    removed_ids: list[int] | set[int] = (),
+    tables: ScoringTables | None = None
+) -> list[str] | None:
+    """
+    Incrementally repair a meeting's assignment after membership changes.
+
+    Instead of re-running assign_roles, only the fitness rows of affected
+    participants (added participants, current holders and - if roles are
+    vacant - members without a role) are computed, with one query, and the
+    stored assignment is fixed locally by repair_holders: vacancies are
+    filled greedily and every added participant without a role follows its
+    own augmenting path. Only rows of roles whose holder changed are deleted
+    and re-inserted.
+
+    The result is a local optimum of the stored assignment, identical to a
+    full greedy recompute in the cases listed in repair_holders; assign_roles
+    remains the way to recompute from scratch. With the team's settings, the
+    new inputs' fingerprint is recorded, so the repaired assignment is not
+    recomputed on the next read; a meeting that was already flagged stale
+    keeps its flag (inputs other than the membership changed). The caller
+    commits.
+
+    Args:
+        db: Database session (membership changes already executed in it)
+        meeting_id: ID of the meeting
+        added_ids: Participants that joined the meeting
+        removed_ids: Participants that left the meeting
+        tables: Scoring tables (defaults to the team's active settings)
 
-    return db_assignments
+    Returns:
+        Roles whose holder changed, or None if the meeting had no assignment to repair
+    """
+    await lock_meeting_assignments(db, meeting_id)
+
+    result = await db.execute(
+        select(RoleAssignment.role, RoleAssignment.participant_id, RoleAssignment.fitness_score)
+        .where(RoleAssignment.meeting_id == meeting_id)
+    )
+    original = {role: (participant_id, score) for role, participant_id, score in result.all()}
+    if not original:
+        return None
+
+    removed = set(removed_ids)
+    holders = {role: holder for role, holder in original.items() if holder[0] not in removed}
+
+    result = await db.execute(
+        select(
+            Meeting.meeting_type, Meeting.scheduled_time, Meeting.team_id, Meeting.assignments_stale, Meeting.stale_seq
+        ).where(Meeting.id == meeting_id)
+    )
+    meeting_type, meeting_time, team_id, was_stale, stale_seq = result.one()
+    team_settings = None
+    if tables is None:
+        team_settings = await get_team_tables(db, team_id)
+        tables = team_settings.tables
+
+    result = await db.execute(
+        select(meeting_participants.c.participant_id).where(meeting_participants.c.meeting_id == meeting_id)
+    )
+    member_ids = set(result.scalars().all())
+
+    roles = tables.roles
+    assigned = {participant_id for participant_id, _ in holders.values()}
+    added = set(added_ids) & member_ids
+
+    # Everyone who can move: added participants, holders (may be displaced) and,
+    # if roles are vacant, members without a role
+    needed = added | assigned
+    if len(holders) < len(roles):
+        needed |= member_ids - assigned
+    rows = await _load_fitness_rows(db, needed, meeting_type, meeting_time, tables)
+    holders = repair_holders(holders, rows, roles, added)
+
+    # Write only the rows whose holder changed
+    changed = [
+        role for role in roles
+        if original.get(role, (None,))[0] != holders.get(role, (None,))[0]
+    ]
+    if changed:
+        await db.execute(
+            delete(RoleAssignment).where(
+                RoleAssignment.meeting_id == meeting_id,
+                RoleAssignment.role.in_(changed)
+            )
+        )
+        new_rows = [
+            {
+                "meeting_id": meeting_id,
+                "participant_id": holders[role][0],
+                "role": role,
+                "fitness_score": holders[role][1],
+            }
+            for role in changed
+            if role in holders
+        ]
+        if new_rows:
+            await db.execute(insert(RoleAssignment), new_rows)
+
+    if team_settings is not None and not was_stale:
+        members = await load_member_profiles(db, [meeting_id])
+        await record_fingerprints(db, {
+            meeting_id: (
+                assignment_fingerprint(meeting_type, meeting_time, members[meeting_id], team_settings.version),
+                stale_seq
+            )
+        })
+    return changed
@@ -0,0 +1,288 @@
+"""Batch assignment service - assigns many teams in parallel, one team per process-pool task.
+
+Teams share nothing (participants, history and meetings are team-scoped),
+so work is sharded by team_id: each worker process loads its team's corpus
+in bulk, assigns it in memory and writes the results with its own
+connection. Total time scales with the number of cores until the database
+becomes the bottleneck.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from sqlalchemy import exists, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.database import database_url
+from app.models.meeting import Meeting, meeting_participants
+from app.services.compute_pool import available_cores
+from app.services.corpus import (
+    assign_chronologically,
+    corpus_fingerprints,
+    filter_meetings,
+    load_team_corpus,
+    write_assignments,
+)
+from app.services.event_bus import ASSIGNMENT_CHANGED, event_bus
+from app.services.settings_store import load_team_settings
+
+
+@dataclass
+class TeamRunResult:
+    """Outcome and timings of one team's batch assignment."""
+
+    team_id: int
+    worker: int  # PID of the process that ran the team (0 if it failed)
+    meetings: int = 0
+    assignments: int = 0
+    load_seconds: float = 0.0
+    compute_seconds: float = 0.0
+    write_seconds: float = 0.0
+    results: dict[int, list[dict]] = field(default_factory=dict)  # meeting_id -> assignments
+    error: str | None = None  # set if the team failed; nothing of it was written
+
+    @property
+    def seconds(self) -> float:
+        return self.load_seconds + self.compute_seconds + self.write_seconds
+
+
+@dataclass
+class WorkerThroughput:
+    """Aggregated work of one pool process."""
+
+    worker: int
+    teams: int
+    meetings: int
+    assignments: int
+    busy_seconds: float
+
+    @property
+    def meetings_per_second(self) -> float:
+        return self.meetings / self.busy_seconds if self.busy_seconds else 0.0
+
+
+@dataclass
+class BatchReport:
+    """Result of a batch run over many teams."""
+
+    teams: list[TeamRunResult]
+    workers: list[WorkerThroughput]
+    wall_seconds: float
+    dry_run: bool
+
+    @property
+    def failed(self) -> list[TeamRunResult]:
+        return [team for team in self.teams if team.error is not None]
+
+    @property
+    def meetings(self) -> int:
+        return sum(team.meetings for team in self.teams)
+
+    @property
+    def assignments(self) -> int:
+        return sum(team.assignments for team in self.teams)
+
+    @property
+    def meetings_per_second(self) -> float:
+        return self.meetings / self.wall_seconds if self.wall_seconds else 0.0
+
+
+def isolated_session_factory() -> tuple:
+    """
+    Engine and session factory private to the calling process and event loop.
+
+    NullPool: connections belong to the event loop that opened them, and
+    every task runs in a fresh asyncio.run().
+    """
+    engine = create_async_engine(database_url, poolclass=NullPool)
+    return engine, async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def count_team_meetings(
+    db: AsyncSession,
+    start: datetime | None,
+    end: datetime | None,
+    team_ids: list[int] | None = None,
+    only_unassigned: bool = False
+) -> dict[int, int]:
+    """
+    Count meetings with participants per team in [start, end) with one GROUP BY.
+
+    Returns:
+        Dict team_id -> meeting count (teams without such meetings are omitted)
+    """
+    stmt = (
+        select(Meeting.team_id, func.count(Meeting.id))
+        .where(exists().where(meeting_participants.c.meeting_id == Meeting.id))
+        .group_by(Meeting.team_id)
+    )
+    stmt = filter_meetings(stmt, start, end, only_unassigned)
+    if team_ids:
+        stmt = stmt.where(Meeting.team_id.in_(team_ids))
+    result = await db.execute(stmt)
+    return dict(result.all())
+
+
+async def assign_team(
+    session_factory: async_sessionmaker,
+    team_id: int,
+    start: datetime | None,
+    end: datetime | None,
+    dry_run: bool = False,
+    only_unassigned: bool = False
+) -> TeamRunResult:
+    """
+    Load, assign and write one team's meetings in [start, end) in one transaction.
+
+    With dry_run the assignment is computed and returned but nothing is written;
+    with only_unassigned meetings that already have assignments are left alone.
+    Written teams publish ASSIGNMENT_CHANGED in the same transaction, which
+    bumps their data version (API workers stop serving cached assignments)
+    and, with EVENT_BUS_NOTIFY, reaches the API workers' subscribers.
+    """
+    run = TeamRunResult(team_id=team_id, worker=os.getpid())
+    async with session_factory() as db:
+        started = time.perf_counter()
+        corpus = await load_team_corpus(db, team_id, start, end, only_unassigned)
+        team_settings = await load_team_settings(db, team_id)
+        run.load_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        run.results = assign_chronologically(corpus, team_settings.compiled)
+        run.compute_seconds = time.perf_counter() - started
+        run.meetings = len(run.results)
+        run.assignments = sum(len(assignments) for assignments in run.results.values())
+
+        if not dry_run:
+            started = time.perf_counter()
+            await write_assignments(db, run.results, corpus_fingerprints(corpus, team_settings.version))
+            if run.results:
+                # Whole scope: the meeting IDs of a team could exceed the NOTIFY payload limit
+                await event_bus.publish_in(db, team_id, ASSIGNMENT_CHANGED)
+            await db.commit()
+            run.write_seconds = time.perf_counter() - started
+    return run
+
+
+async def _assign_team_isolated(
+    team_id: int,
+    start: datetime | None,
+    end: datetime | None,
+    dry_run: bool,
+    only_unassigned: bool
+) -> TeamRunResult:
+    engine, session_factory = isolated_session_factory()
+    try:
+        return await assign_team(session_factory, team_id, start, end, dry_run, only_unassigned)
+    finally:
+        await engine.dispose()
+
+
+def _assign_team_in_worker(
+    team_id: int,
+    start: datetime | None,
+    end: datetime | None,
+    dry_run: bool,
+    only_unassigned: bool,
+    keep_results: bool
+) -> TeamRunResult:
+    """Process-pool entry point: runs one team on a fresh event loop and connection."""
+    run = asyncio.run(_assign_team_isolated(team_id, start, end, dry_run, only_unassigned))
+    if not keep_results:
+        run.results = {}  # Avoid pickling every assignment back to the parent
+    return run
+
+
+async def _list_teams(
+    start: datetime | None,
+    end: datetime | None,
+    team_ids: list[int] | None,
+    only_unassigned: bool
+) -> dict[int, int]:
+    engine, session_factory = isolated_session_factory()
+    try:
+        async with session_factory() as db:
+            return await count_team_meetings(db, start, end, team_ids, only_unassigned)
+    finally:
+        await engine.dispose()
+
+
+def run_batch(
+    start: datetime | None,
+    end: datetime | None,
+    team_ids: list[int] | None = None,
+    workers: int | None = None,
+    dry_run: bool = False,
+    only_unassigned: bool = False,
+    keep_results: bool = False,
+    on_team_done: Callable[[TeamRunResult, int, int], None] | None = None
+) -> BatchReport:
+    """
+    Assign every team's meetings in [start, end) across a process pool.
+
+    Teams are submitted largest first (longest-processing-time scheduling),
+    so one big team started last does not leave the other cores idle. A
+    team that fails (its transaction is rolled back) is reported with its
+    error in TeamRunResult.error; the other teams still run.
+
+    Args:
+        start: Inclusive lower bound of scheduled_time
+        end: Exclusive upper bound of scheduled_time
+        team_ids: Restrict to these teams (default: all teams with meetings in the window)
+        workers: Pool size (default: available cores)
+        dry_run: Compute without writing
+        only_unassigned: Skip meetings that already have assignments
+        keep_results: Return per-meeting assignments in TeamRunResult.results
+        on_team_done: Progress callback (result, completed teams, total teams)
+
+    Returns:
+        BatchReport with per-team timings, per-worker throughput and failed teams
+    """
+    started = time.perf_counter()
+    counts = asyncio.run(_list_teams(start, end, team_ids, only_unassigned))
+    ordered_teams = sorted(counts, key=lambda team_id: (-counts[team_id], team_id))
+
+    teams: list[TeamRunResult] = []
+    if ordered_teams:
+        pool_size = min(workers or available_cores(), len(ordered_teams))
+        with ProcessPoolExecutor(
+            max_workers=pool_size,
+            mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            futures = {
+                pool.submit(
+                    _assign_team_in_worker, team_id, start, end, dry_run, only_unassigned, keep_results
+                ): team_id
+                for team_id in ordered_teams
+            }
+            for future in as_completed(futures):
+                try:
+                    teams.append(future.result())
+                except Exception as e:
+                    teams.append(TeamRunResult(team_id=futures[future], worker=0, error=f"{type(e).__name__}: {e}"))
+                if on_team_done is not None:
+                    on_team_done(teams[-1], len(teams), len(ordered_teams))
+
+    by_worker: dict[int, WorkerThroughput] = {}
+    for team in teams:
+        if team.error is not None:
+            continue
+        worker = by_worker.setdefault(team.worker, WorkerThroughput(team.worker, 0, 0, 0, 0.0))
+        worker.teams += 1
+        worker.meetings += team.meetings
+        worker.assignments += team.assignments
+        worker.busy_seconds += team.seconds
+
+    return BatchReport(
+        teams=sorted(teams, key=lambda team: team.team_id),
+        workers=sorted(by_worker.values(), key=lambda worker: worker.worker),
+        wall_seconds=time.perf_counter() - started,
+        dry_run=dry_run,
+    )
@@ -0,0 +1,73 @@
+"""Compute pool service - runs CPU-heavy scoring off the event loop for large candidate pools."""
+
+import asyncio
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any
+
+from app.config import settings
+
+_executor: Executor | None = None
+
+
+def available_cores() -> int:
+    """Cores this process may run on (respects CPU affinity / container limits)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def get_executor() -> Executor:
+    """
+    Get the shared executor, creating it on first use.
+
+    Process pools use the 'spawn' start method so workers never inherit the
+    parent's event loop or open database connections; arguments and results
+    must be picklable (use ParticipantProfile, not ORM models).
+    """
+    global _executor
+    if _executor is None:
+        workers = settings.ENGINE_POOL_WORKERS or available_cores()
+        if settings.ENGINE_POOL_KIND == "thread":
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scoring")
+        else:
+            _executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+    return _executor
+
+
+def shutdown_executor() -> None:
+    """Shut the executor down (called from the application lifespan)."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def run_cpu_bound(fn: Callable[..., Any], *args, size: int, threshold: int | None = None) -> Any:
+    """
+    Run fn(*args) inline for small inputs, otherwise in the compute pool.
+
+    Dispatching to a pool costs pickling and a context switch, which only
+    pays off once the work blocks the loop noticeably.
+
+    Args:
+        fn: Pure, module-level function
+        *args: Picklable arguments
+        size: Size of the input (number of candidates)
+        threshold: Offload when size is at least this (defaults to ENGINE_OFFLOAD_THRESHOLD)
+
+    Returns:
+        fn's return value
+    """
+    limit = settings.ENGINE_OFFLOAD_THRESHOLD if threshold is None else threshold
+    if size < limit:
+        return fn(*args)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), partial(fn, *args))
@@ -0,0 +1,262 @@
+"""Team corpus service - bulk loading of a team's data for in-memory batch assignment.
+
+Batch paths (nightly runs, the CLI) load everything a team needs with a
+handful of set-based queries, run the pure scoring core over it in memory
+and write the results back in one transaction, instead of driving
+assign_roles meeting by meeting.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from sqlalchemy import delete, exists, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.meeting import Meeting, meeting_participants
+from app.models.participant import Participant
+from app.models.role_assignment import RoleAssignment
+from app.services.assignment_engine import HISTORY_DEPTH, load_recent_roles, lock_many_meeting_assignments
+from app.services.fitness import DEFAULT_TABLES, CompiledTables, ParticipantProfile, ScoringTables, compute_assignment
+from app.services.staleness import assignment_fingerprint, record_fingerprints
+
+
+@dataclass(frozen=True)
+class MeetingRecord:
+    """Detached snapshot of a meeting and its member IDs."""
+
+    id: int
+    meeting_type: str
+    scheduled_time: datetime
+    participant_ids: tuple[int, ...]
+    stale_seq: int = 0  # read with the inputs (see staleness.record_fingerprints)
+    stored_fingerprint: str | None = None  # fingerprint of the stored assignment when loaded
+
+
+@dataclass
+class TeamCorpus:
+    """Everything needed to assign a team's meetings without further queries."""
+
+    team_id: int
+    participants: dict[int, ParticipantProfile] = field(default_factory=dict)
+    meetings: list[MeetingRecord] = field(default_factory=list)  # chronological
+    history: dict[int, list[str]] = field(default_factory=dict)  # before the first meeting, most recent first
+
+
+def filter_meetings(stmt, start: datetime | None, end: datetime | None, only_unassigned: bool = False):
+    """Restrict a statement over Meeting to [start, end) and optionally to meetings without assignments."""
+    if start is not None:
+        stmt = stmt.where(Meeting.scheduled_time >= start)
+    if end is not None:
+        stmt = stmt.where(Meeting.scheduled_time < end)
+    if only_unassigned:
+        stmt = stmt.where(~exists().where(RoleAssignment.meeting_id == Meeting.id))
+    return stmt
+
+
+async def load_team_corpus(
+    db: AsyncSession,
+    team_id: int,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    only_unassigned: bool = False,
+    depth: int = HISTORY_DEPTH,
+    meeting_ids: list[int] | None = None
+) -> TeamCorpus:
+    """
+    Load a team's participants, meetings in [start, end) and role history in bulk.
+
+    Four queries regardless of team size: participants, meetings, membership
+    links and history (one window query). History excludes assignments of
+    the loaded meetings, since those are the ones being recomputed.
+    Meetings without participants are skipped.
+
+    Args:
+        db: Database session
+        team_id: Team to load
+        start: Inclusive lower bound of scheduled_time (None = unbounded)
+        end: Exclusive upper bound of scheduled_time (None = unbounded)
+        only_unassigned: Load only meetings that have no assignments yet
+        depth: Number of most recent roles kept per participant
+        meeting_ids: Load only these meetings (None = all meetings in range)
+
+    Returns:
+        TeamCorpus with meetings in chronological order
+    """
+    result = await db.execute(select(Participant).where(Participant.team_id == team_id))
+    participants = {
+        participant.id: ParticipantProfile.from_model(participant)
+        for participant in result.scalars().all()
+    }
+
+    selected = filter_meetings(select(Meeting.id).where(Meeting.team_id == team_id), start, end, only_unassigned)
+    if meeting_ids is not None:
+        selected = selected.where(Meeting.id.in_(meeting_ids))
+    selected = selected.subquery()
+    result = await db.execute(
+        select(meeting_participants.c.meeting_id, meeting_participants.c.participant_id)
+        .where(meeting_participants.c.meeting_id.in_(select(selected.c.id)))
+        .order_by(meeting_participants.c.meeting_id, meeting_participants.c.participant_id)
+    )
+    members: dict[int, list[int]] = {}
+    for meeting_id, participant_id in result.all():
+        members.setdefault(meeting_id, []).append(participant_id)
+
+    result = await db.execute(
+        select(
+            Meeting.id, Meeting.meeting_type, Meeting.scheduled_time, Meeting.stale_seq, Meeting.assignment_fingerprint
+        )
+        .where(Meeting.id.in_(select(selected.c.id)))
+        .order_by(Meeting.scheduled_time, Meeting.id)
+    )
+    meetings = [
+        MeetingRecord(
+            id=meeting_id,
+            meeting_type=meeting_type,
+            scheduled_time=scheduled_time,
+            participant_ids=tuple(members[meeting_id]),
+            stale_seq=stale_seq,
+            stored_fingerprint=stored_fingerprint
+        )
+        for meeting_id, meeting_type, scheduled_time, stale_seq, stored_fingerprint in result.all()
+        if meeting_id in members
+    ]
+
+    history = await load_recent_roles(
+        db, list(participants), depth, exclude_meeting_ids=[meeting.id for meeting in meetings]
+    )
+    return TeamCorpus(team_id=team_id, participants=participants, meetings=meetings, history=history)
+
+
+async def load_team_profiles(
+    db: AsyncSession,
+    team_id: int,
+    depth: int = HISTORY_DEPTH
+) -> tuple[list[ParticipantProfile], dict[int, list[str]]]:
+    """
+    Load a team's participant profiles and their current role history (two queries).
+
+    Returns:
+        (profiles ordered by name, participant_id -> roles, most recent first)
+    """
+    result = await db.execute(
+        select(Participant).where(Participant.team_id == team_id).order_by(Participant.name, Participant.id)
+    )
+    profiles = [ParticipantProfile.from_model(participant) for participant in result.scalars().all()]
+    history = await load_recent_roles(db, [profile.id for profile in profiles], depth)
+    return profiles, history
+
+
+def assign_chronologically(
+    corpus: TeamCorpus,
+    tables: ScoringTables | CompiledTables = DEFAULT_TABLES,
+    depth: int = HISTORY_DEPTH
+) -> dict[int, list[dict]]:
+    """
+    Assign all corpus meetings in scheduled order, carrying role history forward.
+
+    Each meeting sees the roles assigned in the earlier ones, exactly as if
+    assign_roles had been called for them one after another. The corpus
+    history is not modified.
+
+    Returns:
+        Dict meeting_id -> assignment dicts (participant_id, role, score), chronological
+    """
+    history = {participant_id: list(roles) for participant_id, roles in corpus.history.items()}
+    results = {}
+    for meeting in corpus.meetings:
+        profiles = [
+            corpus.participants[participant_id]
+            for participant_id in meeting.participant_ids
+            if participant_id in corpus.participants
+        ]
+        assignments = compute_assignment(
+            profiles, meeting.meeting_type, meeting.scheduled_time, history, tables
+        )
+        for assignment in assignments:
+            recent = history.setdefault(assignment["participant_id"], [])
+            recent.insert(0, assignment["role"])
+            del recent[depth:]
+        results[meeting.id] = assignments
+    return results
+
+
+def corpus_fingerprints(corpus: TeamCorpus, settings_version: int) -> dict[int, tuple[str, int]]:
+    """Input fingerprints of all corpus meetings with their stale_seq (see staleness.record_fingerprints)."""
+    return {
+        meeting.id: (
+            assignment_fingerprint(
+                meeting.meeting_type,
+                meeting.scheduled_time,
+                [corpus.participants[pid] for pid in meeting.participant_ids if pid in corpus.participants],
+                settings_version
+            ),
+            meeting.stale_seq
+        )
+        for meeting in corpus.meetings
+    }
+
+
+async def load_stored_assignments(db: AsyncSession, meeting_ids: list[int]) -> dict[int, list[dict]]:
+    """
+    Load the stored assignments of many meetings with one query.
+
+    Returns:
+        Dict meeting_id -> assignment dicts (participant_id, role, score);
+        meetings without assignments map to an empty list
+    """
+    stored = {meeting_id: [] for meeting_id in meeting_ids}
+    if not meeting_ids:
+        return stored
+    result = await db.execute(
+        select(
+            RoleAssignment.meeting_id,
+            RoleAssignment.participant_id,
+            RoleAssignment.role,
+            RoleAssignment.fitness_score
+        )
+        .where(RoleAssignment.meeting_id.in_(meeting_ids))
+        .order_by(RoleAssignment.meeting_id, RoleAssignment.id)
+    )
+    for meeting_id, participant_id, role, score in result.all():
+        stored[meeting_id].append({"participant_id": participant_id, "role": role, "score": score})
+    return stored
+
+
+async def write_assignments(
+    db: AsyncSession,
+    results: dict[int, list[dict]],
+    fingerprints: dict[int, tuple[str, int]] | None = None
+) -> int:
+    """
+    Replace the stored assignments of many meetings in one round of statements.
+
+    Takes the assignment locks of all meetings, then runs one DELETE and one
+    executemany INSERT. Rows are inserted in the order of `results`, so
+    chronological input keeps the history order (created_at, id) correct.
+    Fingerprints of the written meetings (see corpus_fingerprints) are stored
+    and clear their stale flags. The caller commits.
+
+    Returns:
+        Number of inserted assignments
+    """
+    meeting_ids = list(results)
+    if not meeting_ids:
+        return 0
+    await lock_many_meeting_assignments(db, meeting_ids)
+    await db.execute(delete(RoleAssignment).where(RoleAssignment.meeting_id.in_(meeting_ids)))
+
+    rows = [
+        {
+            "meeting_id": meeting_id,
+            "participant_id": assignment["participant_id"],
+            "role": assignment["role"],
+            "fitness_score": assignment["score"]
+        }
+        for meeting_id, assignments in results.items()
+        for assignment in assignments
+    ]
+    if rows:
+        await db.execute(insert(RoleAssignment), rows)
+    if fingerprints:
+        await record_fingerprints(db, {meeting_id: fingerprints[meeting_id] for meeting_id in meeting_ids})
+    return len(rows)
@@ -0,0 +1,27 @@
+"""Data version service - persisted per-team counter of the data behind cached reads.
+
+Every published data event (participants, meetings, assignments, settings)
+increments its team's teams.data_version. Cached read endpoints derive
+their ETags from the counter, so If-None-Match is answered after a single
+primary-key lookup - in any worker, after TTL expiry or invalidation -
+before the response is loaded or serialized. Cached bodies remember the
+version they were loaded under, so a change made by another worker or an
+offline writer (the CLI) is noticed on the next read even without
+EVENT_BUS_NOTIFY.
+"""
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.team import Team
+
+
+async def get_data_version(db: AsyncSession, team_id: int) -> int:
+    """Current data version of a team (0 for unknown teams)."""
+    result = await db.execute(select(Team.data_version).where(Team.id == team_id))
+    return result.scalar_one_or_none() or 0
+
+
+async def bump_data_version(db: AsyncSession, team_id: int) -> None:
+    """Increment a team's data version (the caller commits)."""
+    await db.execute(update(Team).where(Team.id == team_id).values(data_version=Team.data_version + 1))
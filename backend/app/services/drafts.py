@@ -0,0 +1,48 @@
+"""Draft service - storage of speculatively precomputed assignments.
+
+Meetings created one by one get a proposed assignment computed in the
+background (assignment_engine.precompute_draft). assign-roles takes the
+draft and confirms it without running the algorithm if its fingerprint,
+which includes role history, matches the current inputs.
+"""
+
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.assignment_draft import AssignmentDraft
+
+
+async def store_draft(db: AsyncSession, meeting_id: int, fingerprint: str, assignments: list[dict]) -> None:
+    """Insert or replace the draft of a meeting. The caller commits."""
+    rows = [
+        {"participant_id": a["participant_id"], "role": a["role"], "score": a["score"]}
+        for a in assignments
+    ]
+    stmt = pg_insert(AssignmentDraft).values(meeting_id=meeting_id, fingerprint=fingerprint, assignments=rows)
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[AssignmentDraft.meeting_id],
+            set_={"fingerprint": stmt.excluded.fingerprint, "assignments": stmt.excluded.assignments}
+        )
+    )
+
+
+async def take_draft(db: AsyncSession, meeting_id: int, fingerprint: str) -> list[dict] | None:
+    """
+    Consume the draft of a meeting (one DELETE ... RETURNING).
+
+    A draft is used at most once: it is removed whether or not it matches.
+
+    Returns:
+        The drafted assignment dicts if the draft's fingerprint matches, else None
+    """
+    result = await db.execute(
+        delete(AssignmentDraft)
+        .where(AssignmentDraft.meeting_id == meeting_id)
+        .returning(AssignmentDraft.fingerprint, AssignmentDraft.assignments)
+    )
+    row = result.one_or_none()
+    if row is None or row.fingerprint != fingerprint:
+        return None
+    return row.assignments
@@ -0,0 +1,183 @@
+"""Event bus service - team-scoped pub/sub feeding the server-sent events stream.
+
+Writers publish small events (IDs only) after their transaction commits;
+every subscriber of the team gets them through its own bounded queue. A
+slow subscriber loses its oldest events rather than blocking publishers.
+
+With EVENT_BUS_NOTIFY enabled, events are also sent with Postgres NOTIFY
+and a listener connection per worker delivers events published by other
+workers to local subscribers, so a client connected to any worker sees
+every change. Locally published events are delivered directly; the
+worker's own notifications are recognised by their origin and skipped.
+
+In-process consumers (e.g. the response cache) can register handlers that
+see every delivered event, local or from another worker. Data events also
+increment the team's persisted data version (see services.data_version),
+which every worker checks before serving a cached read.
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal, engine
+from app.services.data_version import bump_data_version
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "team_events"
+
+# Seconds between reconnect attempts of the LISTEN connection
+LISTEN_RETRY_SECONDS = 5.0
+
+ASSIGNMENT_CHANGED = "assignment-changed"
+MEETING_CHANGED = "meeting-changed"
+JOB_PROGRESS = "job-progress"
+PARTICIPANT_CHANGED = "participant-changed"
+SETTINGS_CHANGED = "settings-changed"
+
+# Events that change data served by cached read endpoints
+DATA_EVENTS = frozenset({ASSIGNMENT_CHANGED, MEETING_CHANGED, PARTICIPANT_CHANGED, SETTINGS_CHANGED})
+
+
+@dataclass
+class Event:
+    """One published event."""
+
+    team_id: int
+    type: str
+    data: dict = field(default_factory=dict)
+    at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+
+
+class EventBus:
+    """In-process pub/sub of team events with optional LISTEN/NOTIFY fan-out across workers."""
+
+    def __init__(self, queue_size: int, notify: bool = False):
+        self.queue_size = queue_size
+        self.notify = notify
+        self.origin = uuid.uuid4().hex
+        self._subscribers: dict[int, set[asyncio.Queue]] = {}
+        self._handlers: list[Callable[[Event], None]] = []
+        self._listener: asyncio.Task | None = None
+
+    def subscriber_count(self, team_id: int) -> int:
+        return len(self._subscribers.get(team_id, ()))
+
+    @asynccontextmanager
+    async def subscribe(self, team_id: int) -> AsyncIterator[asyncio.Queue]:
+        """Queue receiving the team's events for the duration of the context."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(team_id, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            subscribers = self._subscribers.get(team_id)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[team_id]
+
+    def add_handler(self, handler: Callable[[Event], None]) -> None:
+        """Call handler synchronously with every delivered event (of any team)."""
+        self._handlers.append(handler)
+
+    def _deliver(self, event: Event) -> None:
+        for handler in self._handlers:
+            try:
+                handler(event)
+            except Exception:
+                logger.exception("Event handler %r failed on %s event", handler, event.type)
+        for queue in self._subscribers.get(event.team_id, ()):
+            if queue.full():
+                queue.get_nowait()  # Drop the oldest event of a slow subscriber
+            queue.put_nowait(event)
+
+    async def publish(self, team_id: int, event_type: str, **data) -> None:
+        """
+        Publish an event to the team's subscribers (call after the change is committed).
+
+        Data events bump the team's data version in the same transaction as
+        the NOTIFY, before local delivery. Never raises: a failed bump or
+        NOTIFY is logged and the event is still delivered locally.
+        """
+        event = Event(team_id=team_id, type=event_type, data=data)
+        if event_type in DATA_EVENTS or self.notify:
+            try:
+                async with AsyncSessionLocal() as session:
+                    await self._stage(session, event)
+                    await session.commit()
+            except Exception:
+                logger.exception("Publishing %s event for team %s failed", event_type, team_id)
+        self._deliver(event)
+
+    async def publish_in(self, db: AsyncSession, team_id: int, event_type: str, **data) -> None:
+        """
+        Publish an event as part of the caller's transaction, for writers outside the API (CLI, batch workers).
+
+        The data version bump and the NOTIFY take effect when the caller
+        commits; there are no local subscribers to deliver to. Keep data
+        small: NOTIFY payloads are limited to 8000 bytes.
+        """
+        await self._stage(db, Event(team_id=team_id, type=event_type, data=data))
+
+    async def _stage(self, db: AsyncSession, event: Event) -> None:
+        """Bump the team's data version (data events) and queue the NOTIFY in db's transaction."""
+        if event.type in DATA_EVENTS:
+            await bump_data_version(db, event.team_id)
+        if self.notify:
+            payload = json.dumps({
+                "origin": self.origin, "team_id": event.team_id, "type": event.type, "data": event.data, "at": event.at
+            })
+            await db.execute(select(func.pg_notify(NOTIFY_CHANNEL, payload)))
+
+    def _on_notification(self, connection, pid, channel, payload) -> None:
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            return
+        if message.get("origin") == self.origin:
+            return
+        self._deliver(Event(team_id=message["team_id"], type=message["type"], data=message["data"], at=message["at"]))
+
+    async def _listen(self) -> None:
+        """Hold a LISTEN connection, reconnecting after failures."""
+        while True:
+            try:
+                async with engine.connect() as connection:
+                    raw = await connection.get_raw_connection()
+                    driver_connection = raw.driver_connection
+                    await driver_connection.add_listener(NOTIFY_CHANNEL, self._on_notification)
+                    try:
+                        while not driver_connection.is_closed():
+                            await asyncio.sleep(LISTEN_RETRY_SECONDS)
+                    finally:
+                        if not driver_connection.is_closed():
+                            await driver_connection.remove_listener(NOTIFY_CHANNEL, self._on_notification)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Event bus LISTEN connection failed")
+            await asyncio.sleep(LISTEN_RETRY_SECONDS)
+
+    async def start(self) -> None:
+        if self.notify and self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+
+
+event_bus = EventBus(settings.EVENT_QUEUE_SIZE, settings.EVENT_BUS_NOTIFY)
@@ -0,0 +1,131 @@
+"""Fairness metrics - how evenly roles rotate across participants over a sequence of meetings."""
+
+import math
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ParticipantFairness:
+    """Role distribution of one participant over the evaluated meetings."""
+
+    participant_id: int
+    assignments: int
+    role_counts: dict[str, int] = field(default_factory=dict)
+    entropy: float = 0.0  # normalized to 0..1 by log(number of roles)
+    longest_streak: int = 0
+
+
+@dataclass
+class FairnessMetrics:
+    """Team-level summary of role rotation."""
+
+    meetings: int
+    mean_entropy: float
+    min_entropy: float
+    assignment_gini: float  # inequality of assignment counts between participants, 0 = equal
+    mean_longest_streak: float
+    max_streak: int
+    participants: list[ParticipantFairness] = field(default_factory=list)
+
+
+def normalized_entropy(counts: Iterable[int], categories: int) -> float:
+    """
+    Shannon entropy of a count distribution divided by log(categories).
+
+    1.0 means every category occurred equally often, 0.0 means a single one.
+    """
+    counts = [count for count in counts if count > 0]
+    total = sum(counts)
+    if total == 0 or categories < 2:
+        return 0.0
+    entropy = -sum(count / total * math.log(count / total) for count in counts)
+    return entropy / math.log(categories)
+
+
+def gini(values: Iterable[float]) -> float:
+    """Gini coefficient of non-negative values (0 = perfectly equal)."""
+    ordered = sorted(values)
+    total = sum(ordered)
+    if not ordered or total == 0:
+        return 0.0
+    weighted = sum(index * value for index, value in enumerate(ordered, 1))
+    return (2 * weighted) / (len(ordered) * total) - (len(ordered) + 1) / len(ordered)
+
+
+def streak_lengths(results: dict[int, list[dict]]) -> Counter:
+    """
+    Histogram of role streaks: length -> number of streaks.
+
+    A streak is a run of consecutive assignments of the same role to one
+    participant (meetings where the participant got no role do not break it,
+    matching how Validator 1 reads history).
+    """
+    histogram = Counter()
+    current: dict[int, tuple[str, int]] = {}
+    for assignments in results.values():
+        for assignment in assignments:
+            participant_id, role = assignment["participant_id"], assignment["role"]
+            previous_role, length = current.get(participant_id, (None, 0))
+            if previous_role == role:
+                current[participant_id] = (role, length + 1)
+            else:
+                if previous_role is not None:
+                    histogram[length] += 1
+                current[participant_id] = (role, 1)
+    for _, length in current.values():
+        histogram[length] += 1
+    return histogram
+
+
+def fairness_metrics(
+    results: dict[int, list[dict]],
+    participant_ids: Iterable[int],
+    roles: list[str]
+) -> FairnessMetrics:
+    """
+    Compute rotation metrics from a chronological sequence of assignments.
+
+    Args:
+        results: meeting_id -> assignment dicts (participant_id, role), in chronological order
+        participant_ids: Participants to evaluate (those never assigned count with zero)
+        roles: All roles, for entropy normalization
+
+    Returns:
+        FairnessMetrics with per-participant details
+    """
+    counts: dict[int, Counter] = {participant_id: Counter() for participant_id in participant_ids}
+    last_role: dict[int, str] = {}
+    streak: dict[int, int] = {}
+    longest: dict[int, int] = {}
+
+    for assignments in results.values():
+        for assignment in assignments:
+            participant_id, role = assignment["participant_id"], assignment["role"]
+            counts.setdefault(participant_id, Counter())[role] += 1
+            streak[participant_id] = streak.get(participant_id, 0) + 1 if last_role.get(participant_id) == role else 1
+            last_role[participant_id] = role
+            longest[participant_id] = max(longest.get(participant_id, 0), streak[participant_id])
+
+    participants = [
+        ParticipantFairness(
+            participant_id=participant_id,
+            assignments=sum(role_counts.values()),
+            role_counts=dict(role_counts),
+            entropy=round(normalized_entropy(role_counts.values(), len(roles)), 4),
+            longest_streak=longest.get(participant_id, 0),
+        )
+        for participant_id, role_counts in sorted(counts.items())
+    ]
+    assigned = [participant for participant in participants if participant.assignments]
+
+    return FairnessMetrics(
+        meetings=len(results),
+        mean_entropy=round(sum(p.entropy for p in assigned) / len(assigned), 4) if assigned else 0.0,
+        min_entropy=min((p.entropy for p in assigned), default=0.0),
+        assignment_gini=round(gini(p.assignments for p in participants), 4),
+        mean_longest_streak=round(sum(p.longest_streak for p in assigned) / len(assigned), 2) if assigned else 0.0,
+        max_streak=max((p.longest_streak for p in assigned), default=0),
+        participants=participants,
+    )
@@ -0,0 +1,297 @@
+"""Fairness simulation - Monte Carlo estimate of long-run role rotation for a team.
+
+Each trial generates a synthetic sequence of future meetings (meeting type
+mix, hours, attendance) and assigns it in memory with the replay engine,
+history carried forward. Trials are independent, seeded and run in chunks
+across processes; nothing here touches the database.
+"""
+
+import random
+import statistics
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import Executor, as_completed
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime, timedelta
+
+from app.services.corpus import MeetingRecord, TeamCorpus
+from app.services.fairness_metrics import fairness_metrics, streak_lengths
+from app.services.fitness import DEFAULT_TABLES, CompiledTables, ParticipantProfile, ScoringTables
+from app.services.replay import replay_corpus
+
+# Upper bounds keeping a single simulation request bounded
+MAX_TRIALS = 2000
+MAX_MEETINGS = 2000
+
+# Trials per process-pool task
+TRIALS_PER_TASK = 10
+
+
+@dataclass(frozen=True)
+class SimulationConfig:
+    """How synthetic meeting sequences are generated."""
+
+    meetings: int = 200
+    trials: int = 100
+    type_weights: dict[str, float] = field(
+        default_factory=lambda: {"brainstorm": 1.0, "review": 1.0, "planning": 1.0, "status_update": 1.0}
+    )
+    hours: tuple[int, ...] = (9, 10, 11, 12, 14, 15, 16, 17)
+    attendance: float = 1.0  # probability that a participant attends a meeting
+    seed: int = 0
+
+
+@dataclass
+class TrialSummary:
+    """Compact, picklable outcome of one trial."""
+
+    mean_entropy: float
+    min_entropy: float
+    assignment_gini: float
+    max_streak: int
+    entropy: dict[int, float]  # participant_id -> normalized role entropy
+    longest_streak: dict[int, int]
+    assignments: dict[int, int]
+    streaks: dict[int, int]  # streak length -> count
+
+
+@dataclass
+class Distribution:
+    """Mean and 5th/95th percentile of a metric across trials."""
+
+    mean: float
+    p5: float
+    p95: float
+
+
+@dataclass
+class ParticipantSimulation:
+    """Per-participant averages across trials."""
+
+    participant_id: int
+    name: str
+    mean_entropy: float
+    mean_longest_streak: float
+    max_longest_streak: int
+    mean_assignments: float
+
+
+@dataclass
+class SimulationReport:
+    """Aggregated outcome of all trials."""
+
+    trials: int
+    meetings_per_trial: int
+    mean_entropy: Distribution
+    min_entropy: Distribution
+    assignment_gini: Distribution
+    max_streak: Distribution
+    streak_histogram: dict[int, float]  # streak length -> average number per trial
+    participants: list[ParticipantSimulation]
+
+
+def generate_meetings(
+    participant_ids: list[int],
+    config: SimulationConfig,
+    rng: random.Random,
+    start: datetime = datetime(2000, 1, 3)
+) -> list[MeetingRecord]:
+    """
+    Generate one synthetic chronological meeting sequence.
+
+    Meetings are one day apart; only the hour matters to the energy model.
+    Every meeting has at least one participant.
+    """
+    types = list(config.type_weights)
+    weights = [config.type_weights[meeting_type] for meeting_type in types]
+    meetings = []
+    for index in range(config.meetings):
+        attendees = [pid for pid in participant_ids if rng.random() < config.attendance]
+        if not attendees and participant_ids:
+            attendees = [rng.choice(participant_ids)]
+        meetings.append(MeetingRecord(
+            id=index,
+            meeting_type=rng.choices(types, weights)[0],
+            scheduled_time=(start + timedelta(days=index)).replace(hour=rng.choice(config.hours)),
+            participant_ids=tuple(attendees),
+        ))
+    return meetings
+
+
+def run_trials(
+    participants: list[ParticipantProfile],
+    history: dict[int, list[str]],
+    config: SimulationConfig,
+    tables: ScoringTables,
+    seeds: list[int]
+) -> list[TrialSummary]:
+    """Run the trials with the given seeds (process-pool entry point)."""
+    compiled = CompiledTables(tables)
+    profiles = {participant.id: participant for participant in participants}
+    participant_ids = sorted(profiles)
+
+    summaries = []
+    for seed in seeds:
+        rng = random.Random(seed)
+        corpus = TeamCorpus(
+            team_id=0,
+            participants=profiles,
+            meetings=generate_meetings(participant_ids, config, rng),
+            history=history,
+        )
+        results = replay_corpus(corpus, compiled)
+        metrics = fairness_metrics(results, participant_ids, tables.roles)
+        summaries.append(TrialSummary(
+            mean_entropy=metrics.mean_entropy,
+            min_entropy=metrics.min_entropy,
+            assignment_gini=metrics.assignment_gini,
+            max_streak=metrics.max_streak,
+            entropy={p.participant_id: p.entropy for p in metrics.participants},
+            longest_streak={p.participant_id: p.longest_streak for p in metrics.participants},
+            assignments={p.participant_id: p.assignments for p in metrics.participants},
+            streaks=dict(streak_lengths(results)),
+        ))
+    return summaries
+
+
+def _distribution(values: list[float]) -> Distribution:
+    if not values:
+        return Distribution(0.0, 0.0, 0.0)
+    ordered = sorted(values)
+    return Distribution(
+        mean=round(statistics.fmean(ordered), 4),
+        p5=round(ordered[int(0.05 * (len(ordered) - 1))], 4),
+        p95=round(ordered[int(0.95 * (len(ordered) - 1))], 4),
+    )
+
+
+def aggregate(
+    trials: list[TrialSummary],
+    participants: list[ParticipantProfile],
+    config: SimulationConfig
+) -> SimulationReport:
+    """Combine trial summaries into distributions and per-participant averages."""
+    streaks = Counter()
+    for trial in trials:
+        streaks.update(trial.streaks)
+    count = len(trials) or 1
+
+    return SimulationReport(
+        trials=len(trials),
+        meetings_per_trial=config.meetings,
+        mean_entropy=_distribution([trial.mean_entropy for trial in trials]),
+        min_entropy=_distribution([trial.min_entropy for trial in trials]),
+        assignment_gini=_distribution([trial.assignment_gini for trial in trials]),
+        max_streak=_distribution([trial.max_streak for trial in trials]),
+        streak_histogram={length: round(streaks[length] / count, 2) for length in sorted(streaks)},
+        participants=[
+            ParticipantSimulation(
+                participant_id=participant.id,
+                name=participant.name,
+                mean_entropy=round(sum(trial.entropy.get(participant.id, 0.0) for trial in trials) / count, 4),
+                mean_longest_streak=round(
+                    sum(trial.longest_streak.get(participant.id, 0) for trial in trials) / count, 2
+                ),
+                max_longest_streak=max((trial.longest_streak.get(participant.id, 0) for trial in trials), default=0),
+                mean_assignments=round(sum(trial.assignments.get(participant.id, 0) for trial in trials) / count, 2),
+            )
+            for participant in sorted(participants, key=lambda participant: participant.name)
+        ],
+    )
+
+
+def config_from_params(
+    params: dict,
+    base_tables: ScoringTables = DEFAULT_TABLES
+) -> tuple[SimulationConfig, ScoringTables]:
+    """
+    Build simulation settings from job parameters.
+
+    Params (all optional): trials, meetings, type_weights, hours, attendance,
+    seed, history_penalties (Validator 1 penalties to evaluate instead of
+    those of base_tables).
+
+    Raises:
+        ValueError: If a parameter is out of range
+    """
+    defaults = SimulationConfig()
+    config = SimulationConfig(
+        meetings=int(params.get("meetings", defaults.meetings)),
+        trials=int(params.get("trials", defaults.trials)),
+        type_weights={key: float(value) for key, value in params.get("type_weights", defaults.type_weights).items()},
+        hours=tuple(int(hour) for hour in params.get("hours", defaults.hours)),
+        attendance=float(params.get("attendance", defaults.attendance)),
+        seed=int(params.get("seed", defaults.seed)),
+    )
+    if not 1 <= config.trials <= MAX_TRIALS:
+        raise ValueError(f"trials must be between 1 and {MAX_TRIALS}")
+    if not 1 <= config.meetings <= MAX_MEETINGS:
+        raise ValueError(f"meetings must be between 1 and {MAX_MEETINGS}")
+    if not config.type_weights or any(weight < 0 for weight in config.type_weights.values()) \
+            or sum(config.type_weights.values()) <= 0:
+        raise ValueError("type_weights must contain non-negative weights with a positive sum")
+    if not config.hours or any(hour < 0 or hour > 23 for hour in config.hours):
+        raise ValueError("hours must be a non-empty list of hours 0-23")
+    if not 0 < config.attendance <= 1:
+        raise ValueError("attendance must be in (0, 1]")
+
+    tables = base_tables
+    if "history_penalties" in params:
+        penalties = tuple(float(value) for value in params["history_penalties"])
+        if not 1 <= len(penalties) <= 10 or any(value < 0 or value > 1 for value in penalties):
+            raise ValueError("history_penalties must be 1-10 values between 0 and 1")
+        tables = replace(base_tables, history_penalties=penalties)
+    return config, tables
+
+
+def trial_chunks(config: SimulationConfig, chunk_size: int = TRIALS_PER_TASK) -> list[list[int]]:
+    """Split trial seeds into process-pool tasks (seed + trial index, so results are reproducible)."""
+    seeds = [config.seed + index for index in range(config.trials)]
+    return [seeds[index:index + chunk_size] for index in range(0, len(seeds), chunk_size)]
+
+
+def simulate(
+    participants: list[ParticipantProfile],
+    history: dict[int, list[str]],
+    config: SimulationConfig,
+    tables: ScoringTables = DEFAULT_TABLES,
+    executor: Executor | None = None,
+    on_progress: Callable[[int, int], None] | None = None
+) -> SimulationReport:
+    """
+    Run all trials, in parallel when an executor is given, and aggregate them.
+
+    Args:
+        participants: Team participants (profiles)
+        history: Current role history, most recent first (start state of every trial)
+        config: Meeting generation settings
+        tables: Scoring tables, including the Validator 1 penalties under test
+        executor: Process pool for the trial chunks (None runs inline)
+        on_progress: Callback (finished trials, total trials)
+
+    Returns:
+        SimulationReport
+    """
+    chunks = trial_chunks(config)
+    trials: list[TrialSummary] = []
+    if executor is None:
+        for chunk in chunks:
+            trials.extend(run_trials(participants, history, config, tables, chunk))
+            if on_progress is not None:
+                on_progress(len(trials), config.trials)
+    else:
+        futures = [executor.submit(run_trials, participants, history, config, tables, chunk) for chunk in chunks]
+        finished = 0
+        for future in as_completed(futures):
+            finished += len(future.result())
+            if on_progress is not None:
+                on_progress(finished, config.trials)
+        # Aggregate in seed order: float sums depend on order, and the report must not depend on scheduling
+        for future in futures:
+            trials.extend(future.result())
+    return aggregate(trials, participants, config)
+
+
+def report_to_dict(report: SimulationReport) -> dict:
+    """JSON-compatible representation (job results, CLI output)."""
+    return asdict(report)
@@ -0,0 +1,497 @@
+"""Fitness core - pure in-memory scoring shared by the assignment engine and planners.
+
+Nothing in this module touches the database: callers load participants and
+role history (see assignment_engine.load_recent_roles) and pass them in.
+Participants may be ORM models or ParticipantProfile instances.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from app.constants.roles import ROLE_REQUIREMENTS
+from app.constants.meeting_types import MEETING_MULTIPLIERS
+from app.services.energy_calculator import calculate_energy
+from app.services.role_matcher import calculate_base_fitness, calculate_parameter_fit
+
+
+@dataclass(frozen=True)
+class ParticipantProfile:
+    """Detached, picklable snapshot of the participant fields the algorithm reads."""
+
+    id: int
+    name: str
+    peak_hours_start: int
+    peak_hours_end: int
+    emotional_intelligence: int
+    social_intelligence: int
+
+    @classmethod
+    def from_model(cls, participant) -> "ParticipantProfile":
+        """Snapshot a Participant model (or any object with the same attributes)."""
+        return cls(
+            id=participant.id,
+            name=participant.name,
+            peak_hours_start=participant.peak_hours_start,
+            peak_hours_end=participant.peak_hours_end,
+            emotional_intelligence=participant.emotional_intelligence,
+            social_intelligence=participant.social_intelligence,
+        )
+
+
+# Validator 1 penalty by number of consecutive repeats of a role (index);
+# repeats beyond the last entry exclude the participant from the role
+HISTORY_PENALTIES = (0.0, 0.0, 0.4, 0.7)
+
+
+@dataclass(frozen=True)
+class ScoringTables:
+    """Role requirements, meeting multipliers and Validator 1 penalties the algorithm scores against."""
+
+    role_requirements: dict
+    meeting_multipliers: dict
+    history_penalties: tuple[float, ...] = field(default=HISTORY_PENALTIES)
+
+    @property
+    def roles(self) -> list[str]:
+        return list(self.role_requirements.keys())
+
+    def with_overrides(
+        self,
+        role_requirements: dict | None = None,
+        meeting_multipliers: dict | None = None,
+        history_penalties: tuple[float, ...] | list[float] | None = None
+    ) -> "ScoringTables":
+        """
+        Copy of the tables with some entries replaced.
+
+        role_requirements replaces whole roles (new roles are added);
+        meeting_multipliers is merged per meeting type and role;
+        history_penalties replaces the whole schedule.
+        """
+        requirements = {role: dict(values) for role, values in self.role_requirements.items()}
+        requirements.update({role: dict(values) for role, values in (role_requirements or {}).items()})
+        multipliers = {meeting_type: dict(values) for meeting_type, values in self.meeting_multipliers.items()}
+        for meeting_type, values in (meeting_multipliers or {}).items():
+            multipliers.setdefault(meeting_type, {}).update(values)
+        return ScoringTables(
+            role_requirements=requirements,
+            meeting_multipliers=multipliers,
+            history_penalties=self.history_penalties if history_penalties is None else tuple(history_penalties)
+        )
+
+
+DEFAULT_TABLES = ScoringTables(role_requirements=ROLE_REQUIREMENTS, meeting_multipliers=MEETING_MULTIPLIERS)
+
+
+@dataclass(frozen=True)
+class FitnessBreakdown:
+    """Final score of one (participant, role) pair with the factors that produced it."""
+
+    participant_id: int
+    role: str
+    energy: int
+    base_score: float
+    history_penalty: float
+    context_multiplier: float
+    score: float
+
+
+def history_penalty_from_roles(
+    recent_roles: list[str],
+    role: str,
+    penalties: tuple[float, ...] = HISTORY_PENALTIES
+) -> float | str:
+    """
+    Calculate Validator 1 penalty from an already loaded role history.
+
+    Rules from tech_task.md lines 23-26 (the default penalties):
+    - Last 2 meetings: -40% weight
+    - Last 3 meetings: -70% weight
+    - Last 4+ meetings: exclude from candidates
+
+    Args:
+        recent_roles: Participant's roles, most recent first
+        role: Role to check
+        penalties: Penalty by number of consecutive repeats; more repeats than entries excludes
+
+    Returns:
+        - Float (0.0-0.7): Penalty percentage
+        - "EXCLUDE": Participant should be excluded from this role
+    """
+    # Count consecutive occurrences of this role
+    consecutive_count = 0
+    for recent_role in recent_roles:
+        if recent_role == role:
+            consecutive_count += 1
+        else:
+            break  # Stop at first different role
+
+    if consecutive_count >= len(penalties):
+        return "EXCLUDE"
+    return penalties[consecutive_count]
+
+
+def current_streak(recent_roles: list[str]) -> tuple[str | None, int]:
+    """
+    Get the role a participant has been repeating and for how many meetings.
+
+    Args:
+        recent_roles: Participant's roles, most recent first
+
+    Returns:
+        (role, length) - (None, 0) if there is no history
+    """
+    if not recent_roles:
+        return None, 0
+    length = 1
+    for recent_role in recent_roles[1:]:
+        if recent_role != recent_roles[0]:
+            break
+        length += 1
+    return recent_roles[0], length
+
+
+def get_meeting_multiplier(meeting_type: str, role: str, meeting_multipliers: dict | None = None) -> float:
+    """
+    Get context multiplier for role based on meeting type (Validator 2).
+
+    Different meeting types prioritize different roles.
+    Multipliers from tech_task.md lines 28-35.
+
+    Args:
+        meeting_type: Type of meeting ('brainstorm', 'review', etc.)
+        role: Role name
+        meeting_multipliers: Multiplier table (defaults to MEETING_MULTIPLIERS)
+
+    Returns:
+        Multiplier (0.5 to 1.5)
+    """
+    multipliers = MEETING_MULTIPLIERS if meeting_multipliers is None else meeting_multipliers
+    return multipliers.get(meeting_type, {}).get(role, 1.0)
+
+
+def greedy_assignment(fitness_matrix: dict, participants: list, roles: list[str]) -> list[dict]:
+    """
+    Greedy algorithm for role assignment.
+
+    Strategy:
+    1. Sort all (participant, role) pairs by fitness score (DESC)
+    2. Iterate and assign greedily
+    3. Skip if participant already assigned OR role already filled
+    4. Stop when all 7 roles filled OR all participants assigned
+
+    For determinism, break ties alphabetically by participant name.
+
+    Args:
+        fitness_matrix: Dict mapping (participant_id, role) -> score
+        participants: List of participants
+        roles: List of roles to assign
+
+    Returns:
+        List of assignment dicts with participant_id, role, score
+    """
+    # Convert fitness matrix to sorted list
+    assignments_pool = [
+        {
+            "participant_id": p_id,
+            "role": r,
+            "score": score
+        }
+        for (p_id, r), score in fitness_matrix.items()
+    ]
+
+    # Create participant name map for tie-breaking
+    participant_names = {p.id: p.name for p in participants}
+
+    # Sort by score DESC, then by participant name (for determinism)
+    assignments_pool.sort(
+        key=lambda x: (-x["score"], participant_names.get(x["participant_id"], ""))
+    )
+
+    assigned_participants = set()
+    assigned_roles = set()
+    final_assignments = []
+
+    for candidate in assignments_pool:
+        p_id = candidate["participant_id"]
+        role = candidate["role"]
+
+        # Skip if already assigned
+        if p_id in assigned_participants or role in assigned_roles:
+            continue
+
+        # Make assignment
+        final_assignments.append(candidate)
+        assigned_participants.add(p_id)
+        assigned_roles.add(role)
+
+        # Stop if all roles filled
+        if len(assigned_roles) == len(roles):
+            break
+
+    return final_assignments
+
+
+def repair_holders(
+    holders: dict[str, tuple[int, float]],
+    fitness_rows: dict[int, tuple[str, dict[str, float]]],
+    roles: list[str],
+    added_ids: set[int]
+) -> dict[str, tuple[int, float]]:
+    """
+    Repair a stored assignment locally after membership changes.
+
+    1. Vacant roles are filled greedily from members without a role (best
+       score first, ties by name and role order).
+    2. Each added participant still without a role starts an augmenting
+       path: it takes the role where it beats the holder's score by the
+       most, the displaced holder tries the same, and so on until someone
+       finds no gain or takes a vacant role. Every step strictly increases
+       total fitness; each path is bounded by len(roles)**2 steps.
+
+    The result is a local optimum: no participant left without a role beats
+    any holder. It equals a full greedy recompute when the change only adds
+    participants who beat no holder (they take the best vacant role, if
+    any) or removes participants without a role.
+
+    Args:
+        holders: role -> (participant_id, score) of the stored assignment,
+            roles of removed participants already vacated
+        fitness_rows: participant_id -> (name, role -> score) for added
+            participants, current holders and, if roles are vacant,
+            members without a role
+        roles: Roles to assign
+        added_ids: Participants that joined the meeting
+
+    Returns:
+        New role -> (participant_id, score) mapping
+    """
+    holders = dict(holders)
+    assigned = {participant_id for participant_id, _ in holders.values()}
+    vacancies = [role for role in roles if role not in holders]
+
+    # Same order as greedy_assignment: score, then name, then role order
+    pool = sorted(
+        (-fitness[role], name, participant_id, index, role)
+        for participant_id, (name, fitness) in fitness_rows.items()
+        if participant_id not in assigned
+        for index, role in enumerate(vacancies)
+        if role in fitness
+    )
+    for negative_score, _, participant_id, _, role in pool:
+        if participant_id in assigned or role in holders:
+            continue
+        holders[role] = (participant_id, -negative_score)
+        assigned.add(participant_id)
+
+    for start_id in sorted(set(added_ids) - assigned):
+        participant_id = start_id
+        for _ in range(len(roles) ** 2):
+            fitness = fitness_rows.get(participant_id, ("", {}))[1]
+            best_role, best_gain = None, 0.0
+            for role in roles:
+                if role not in fitness:
+                    continue
+                gain = fitness[role] - holders.get(role, (None, 0.0))[1]
+                if gain > best_gain:
+                    best_role, best_gain = role, gain
+            if best_role is None:
+                break
+            displaced = holders.get(best_role, (None, 0.0))[0]
+            holders[best_role] = (participant_id, fitness[best_role])
+            if displaced is None:
+                break
+            participant_id = displaced
+
+    return holders
+
+
+def score_participant(
+    participant,
+    meeting_type: str,
+    meeting_time: datetime,
+    recent_roles: list[str],
+    tables: ScoringTables = DEFAULT_TABLES,
+    energy: int | None = None
+) -> list[FitnessBreakdown]:
+    """
+    Score one participant for every role (base fitness + Validators 1 and 2).
+
+    Args:
+        participant: Participant model or profile
+        meeting_type: Type of meeting
+        meeting_time: Scheduled meeting datetime
+        recent_roles: Participant's roles, most recent first
+        tables: Scoring tables to use
+        energy: Precomputed energy at meeting time (computed if None)
+
+    Returns:
+        One breakdown per role; roles excluded by Validator 1 are omitted
+    """
+    if energy is None:
+        energy = calculate_energy(participant, meeting_time)
+
+    scores = []
+    for role in tables.roles:
+        # Apply Validator 1: Role balance (history check)
+        history_penalty = history_penalty_from_roles(recent_roles, role, tables.history_penalties)
+        if history_penalty == "EXCLUDE":
+            continue  # Skip this combination
+
+        # Calculate base fitness
+        base_score = calculate_base_fitness(participant, role, energy, tables.role_requirements)
+
+        # Apply Validator 2: Meeting context multiplier
+        context_multiplier = get_meeting_multiplier(meeting_type, role, tables.meeting_multipliers)
+
+        scores.append(FitnessBreakdown(
+            participant_id=participant.id,
+            role=role,
+            energy=energy,
+            base_score=base_score,
+            history_penalty=history_penalty,
+            context_multiplier=context_multiplier,
+            score=base_score * (1 - history_penalty) * context_multiplier,
+        ))
+    return scores
+
+
+def build_fitness_matrix(
+    participants: list,
+    meeting_type: str,
+    meeting_time: datetime,
+    history: dict[int, list[str]],
+    tables: ScoringTables = DEFAULT_TABLES
+) -> dict[tuple[int, str], float]:
+    """
+    Calculate final fitness scores for all (participant, role) combinations.
+
+    Args:
+        participants: Participant models or profiles
+        meeting_type: Type of meeting
+        meeting_time: Scheduled meeting datetime
+        history: participant_id -> roles, most recent first
+        tables: Scoring tables to use
+
+    Returns:
+        Dict mapping (participant_id, role) -> score (excluded pairs omitted)
+    """
+    fitness_matrix = {}
+    for participant in participants:
+        for breakdown in score_participant(
+            participant, meeting_type, meeting_time, history.get(participant.id, []), tables
+        ):
+            fitness_matrix[(participant.id, breakdown.role)] = breakdown.score
+    return fitness_matrix
+
+
+def compute_assignment(
+    participants: list,
+    meeting_type: str,
+    meeting_time: datetime,
+    history: dict[int, list[str]],
+    tables: "ScoringTables | CompiledTables" = DEFAULT_TABLES
+) -> list[dict]:
+    """
+    Run the full in-memory algorithm for one meeting (fitness matrix + greedy).
+
+    Accepts plain or compiled tables; both give identical results.
+
+    Returns:
+        List of assignment dicts with participant_id, role, score
+    """
+    if isinstance(tables, CompiledTables):
+        fitness_matrix = tables.fitness_matrix(
+            participants,
+            meeting_type,
+            {participant.id: calculate_energy(participant, meeting_time) for participant in participants},
+            {participant.id: tables.static_fit(participant) for participant in participants},
+            history
+        )
+    else:
+        fitness_matrix = build_fitness_matrix(participants, meeting_type, meeting_time, history, tables)
+    return greedy_assignment(fitness_matrix, participants, tables.roles)
+
+
+class CompiledTables:
+    """
+    Scoring tables precompiled for scoring many meetings in a row.
+
+    Requirements become per-role tuples, multipliers per-meeting-type lists
+    and energy fits are memoized per (role, energy level): energy is an
+    integer 0-100, so at most 101 values per role are ever computed. Scores
+    are identical to score_participant.
+
+    Participant-dependent parts (EI/SI fit, energy per hour) are returned
+    by static_fit/energy for the caller to keep, since participant data
+    may change between uses of the same compiled tables.
+    """
+
+    def __init__(self, tables: ScoringTables = DEFAULT_TABLES):
+        self.tables = tables
+        self.roles = tables.roles
+        self._requirements = [
+            (
+                requirements["ei_min"], requirements["ei_max"],
+                requirements["si_min"], requirements["si_max"],
+                requirements["energy_min"], requirements["energy_max"],
+            )
+            for requirements in (tables.role_requirements[role] for role in self.roles)
+        ]
+        self._multipliers: dict[str, list[float]] = {}
+        self._energy_fit: dict[tuple[int, int], float] = {}
+
+    def multipliers(self, meeting_type: str) -> list[float]:
+        """Validator 2 multipliers of every role for a meeting type."""
+        if meeting_type not in self._multipliers:
+            self._multipliers[meeting_type] = [
+                get_meeting_multiplier(meeting_type, role, self.tables.meeting_multipliers) for role in self.roles
+            ]
+        return self._multipliers[meeting_type]
+
+    def static_fit(self, participant) -> list[float]:
+        """EI fit + SI fit of a participant for every role (time independent)."""
+        return [
+            calculate_parameter_fit(participant.emotional_intelligence, ei_min, ei_max)
+            + calculate_parameter_fit(participant.social_intelligence, si_min, si_max)
+            for ei_min, ei_max, si_min, si_max, _, _ in self._requirements
+        ]
+
+    def energy_fit(self, role_index: int, energy: int) -> float:
+        key = (role_index, energy)
+        if key not in self._energy_fit:
+            _, _, _, _, energy_min, energy_max = self._requirements[role_index]
+            self._energy_fit[key] = calculate_parameter_fit(energy, energy_min, energy_max)
+        return self._energy_fit[key]
+
+    def fitness_matrix(
+        self,
+        participants: list,
+        meeting_type: str,
+        energies: dict[int, int],
+        static_fits: dict[int, list[float]],
+        history: dict[int, list[str]]
+    ) -> dict[tuple[int, str], float]:
+        """
+        Same result as build_fitness_matrix from precomputed participant parts.
+
+        Args:
+            participants: Participant models or profiles
+            meeting_type: Type of meeting
+            energies: participant_id -> energy at the meeting time
+            static_fits: participant_id -> static_fit(participant)
+            history: participant_id -> roles, most recent first
+        """
+        multipliers = self.multipliers(meeting_type)
+        fitness_matrix = {}
+        for participant in participants:
+            recent_roles = history.get(participant.id, [])
+            energy = energies[participant.id]
+            static = static_fits[participant.id]
+            for role_index, role in enumerate(self.roles):
+                history_penalty = history_penalty_from_roles(recent_roles, role, self.tables.history_penalties)
+                if history_penalty == "EXCLUDE":
+                    continue
+                base_score = (static[role_index] + self.energy_fit(role_index, energy)) / 3 * 100
+                fitness_matrix[(participant.id, role)] = base_score * (1 - history_penalty) * multipliers[role_index]
+        return fitness_matrix
@@ -0,0 +1,154 @@
+"""Job handlers - heavy operations executed by the background job runner."""
+
+import asyncio
+from functools import partial
+
+from sqlalchemy import exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.meeting import Meeting, meeting_participants
+from app.models.role_assignment import RoleAssignment
+from app.schemas.job import (
+    FairnessSimulationParams,
+    ImportParticipantsParams,
+    ReassignMeetingsParams,
+    RecomputeAssignmentsParams,
+)
+from app.services.assignment_engine import assign_roles
+from app.services.compute_pool import get_executor
+from app.services.corpus import load_team_profiles
+from app.services.event_bus import PARTICIPANT_CHANGED, event_bus
+from app.services.fairness_simulation import aggregate, config_from_params, report_to_dict, run_trials, trial_chunks
+from app.services.job_runner import JobContext, JobRunner
+from app.services.participant_import import import_participants
+from app.services.recompute import find_affected_meetings, lock_team_recompute, recompute_meetings
+from app.services.settings_store import load_team_settings
+
+# Persist progress every N processed items
+PROGRESS_EVERY = 10
+
+
+async def reassign_meetings_job(db: AsyncSession, context: JobContext) -> dict:
+    """
+    Re-run role assignment for a team's meetings in chronological order.
+
+    Each meeting is assigned and committed on its own; a meeting that cannot
+    be assigned is recorded in the result and the job continues.
+
+    Params:
+        See schemas.job.ReassignMeetingsParams (start / end bound scheduled_time)
+    """
+    params = ReassignMeetingsParams.model_validate(context.params)
+    stmt = (
+        select(Meeting.id)
+        .where(
+            Meeting.team_id == context.team_id,
+            exists().where(meeting_participants.c.meeting_id == Meeting.id)
+        )
+        .order_by(Meeting.scheduled_time, Meeting.id)
+    )
+    if params.start is not None:
+        stmt = stmt.where(Meeting.scheduled_time >= params.start)
+    if params.end is not None:
+        stmt = stmt.where(Meeting.scheduled_time <= params.end)
+    if params.only_unassigned:
+        stmt = stmt.where(~exists().where(RoleAssignment.meeting_id == Meeting.id))
+
+    meeting_ids = (await db.execute(stmt)).scalars().all()
+    await context.report(0, total=len(meeting_ids))
+
+    total_assignments = 0
+    failed = []
+    for index, meeting_id in enumerate(meeting_ids, 1):
+        try:
+            total_assignments += len(await assign_roles(db, meeting_id))
+        except ValueError as e:
+            await db.rollback()
+            failed.append({"meeting_id": meeting_id, "error": str(e)})
+        if index % PROGRESS_EVERY == 0 or index == len(meeting_ids):
+            await context.report(index)
+
+    return {"meetings": len(meeting_ids), "assignments": total_assignments, "failed": failed}
+
+
+async def import_participants_job(db: AsyncSession, context: JobContext) -> dict:
+    """
+    Import participants parsed by the request handler.
+
+    Params:
+        rows: [row_number, row, parse_error] triples (dropped from the stored
+            params once the job finishes)
+    """
+    rows = context.params.get("rows", [])
+    await context.report(0, total=len(rows))
+    result = await import_participants(db, context.team_id, (tuple(row) for row in rows))
+    if result.created:
+        await event_bus.publish(context.team_id, PARTICIPANT_CHANGED, action="imported")
+    await context.report(len(rows))
+    return result.model_dump()
+
+
+async def fairness_simulation_job(db: AsyncSession, context: JobContext) -> dict:
+    """
+    Monte Carlo simulation of long-run role rotation for the team.
+
+    Participants and their current history are read once; the trials run
+    in the compute pool without further database access.
+
+    Params:
+        See fairness_simulation.config_from_params
+    """
+    team_settings = await load_team_settings(db, context.team_id)
+    config, tables = config_from_params(context.params, team_settings.tables)
+    profiles, history = await load_team_profiles(db, context.team_id)
+    await db.close()  # Release the connection for the (long) compute phase
+    await context.report(0, total=config.trials)
+
+    loop = asyncio.get_running_loop()
+    executor = get_executor()
+    futures = [
+        loop.run_in_executor(executor, partial(run_trials, profiles, history, config, tables, chunk))
+        for chunk in trial_chunks(config)
+    ]
+    trials = []
+    try:
+        for future in asyncio.as_completed(futures):
+            trials.extend(await future)
+            await context.report(len(trials))
+    finally:
+        for future in futures:
+            future.cancel()
+
+    return report_to_dict(aggregate(trials, profiles, config))
+
+
+async def recompute_assignments_job(db: AsyncSession, context: JobContext) -> dict:
+    """
+    Recompute the team's upcoming assignments after a settings or profile change.
+
+    Params:
+        participant_ids: Meetings attended by these participants
+        meeting_ids: These meetings
+        (both omitted = all upcoming meetings of the team)
+
+    Recompute jobs of a team run one at a time, so two of them never write
+    the same meetings concurrently.
+    """
+    async with lock_team_recompute(context.team_id):
+        meeting_ids = await find_affected_meetings(
+            db, context.team_id, context.params.get("participant_ids"), meeting_ids=context.params.get("meeting_ids")
+        )
+        await context.report(0, total=len(meeting_ids))
+        result = await recompute_meetings(db, context.team_id, meeting_ids, on_progress=context.report)
+    await context.report(result["rewritten"], total=result["rewritten"])
+    return result
+
+
+def register_job_handlers(runner: JobRunner) -> None:
+    """Register all job kinds on the runner."""
+    runner.register("reassign_meetings", reassign_meetings_job, ReassignMeetingsParams)
+    runner.register(
+        "import_participants", import_participants_job, ImportParticipantsParams, transient_params=("rows",)
+    )
+    runner.register("fairness_simulation", fairness_simulation_job, FairnessSimulationParams)
+    runner.register("recompute_assignments", recompute_assignments_job, RecomputeAssignmentsParams)
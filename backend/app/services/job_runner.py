@@ -0,0 +1,310 @@
+"""Job runner service - in-process asyncio execution of persisted background jobs."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+
+from pydantic import BaseModel
+from sqlalchemy import case, func, or_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.job import Job
+from app.services.event_bus import JOB_PROGRESS, event_bus
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = ("queued", "running", "cancelling")
+
+
+class JobCancelled(Exception):
+    """Raised inside a handler when cancellation was requested for its job."""
+
+
+class JobContext:
+    """Handle passed to job handlers for reporting progress."""
+
+    def __init__(self, job_id: int, team_id: int, params: dict):
+        self.job_id = job_id
+        self.team_id = team_id
+        self.params = params
+
+    async def report(self, progress: int, total: int | None = None) -> None:
+        """
+        Persist progress and check for cancellation.
+
+        Cancellation requested from another worker is only visible here, so
+        long handlers should report regularly.
+
+        Raises:
+            JobCancelled: If the job was marked 'cancelling'
+        """
+        values = {"progress": progress}
+        if total is not None:
+            values["total"] = total
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                update(Job).where(Job.id == self.job_id).values(**values).returning(Job.status, Job.total)
+            )
+            row = result.one_or_none()
+            await session.commit()
+        status = row.status if row is not None else None
+        if row is not None:
+            await event_bus.publish(
+                self.team_id, JOB_PROGRESS, job_id=self.job_id, status=row.status, progress=progress, total=row.total
+            )
+        if status == "cancelling":
+            raise JobCancelled()
+
+
+JobHandler = Callable[[AsyncSession, JobContext], Awaitable[dict | None]]
+
+
+class JobRunner:
+    """
+    Runs background jobs as asyncio tasks with bounded concurrency.
+
+    Jobs are persisted in the jobs table before they are scheduled, so their
+    status can be polled from any worker. Execution happens in the worker
+    that accepted the job; started from the FastAPI lifespan.
+
+    Status changes are compare-and-set, so a 'cancelling' written by another
+    worker is never overwritten. The owning worker refreshes heartbeat_at of
+    its active jobs; active jobs whose heartbeat is older than orphan_seconds
+    (their worker crashed or was killed) are finished as failed at startup
+    and periodically afterwards.
+    """
+
+    def __init__(self, max_concurrency: int, heartbeat_seconds: float = 15.0, orphan_seconds: float = 60.0):
+        self.max_concurrency = max_concurrency
+        self.heartbeat_seconds = heartbeat_seconds
+        self.orphan_seconds = orphan_seconds
+        self._handlers: dict[str, JobHandler] = {}
+        self._params_models: dict[str, type[BaseModel] | None] = {}
+        self._transient_params: dict[str, tuple[str, ...]] = {}
+        self._tasks: dict[int, asyncio.Task] = {}
+        self._semaphore: asyncio.Semaphore | None = None
+        self._heartbeat: asyncio.Task | None = None
+        self._running = False
+
+    @property
+    def kinds(self) -> list[str]:
+        return sorted(self._handlers.keys())
+
+    def register(
+        self,
+        kind: str,
+        handler: JobHandler,
+        params_model: type[BaseModel] | None = None,
+        transient_params: tuple[str, ...] = ()
+    ) -> None:
+        """
+        Register the coroutine that executes jobs of the given kind.
+
+        Submitted params are validated with params_model and stored in its
+        JSON form (unset and None fields omitted). transient_params are
+        removed from the stored params once the job finishes (e.g. uploaded
+        rows that are only needed while it runs).
+        """
+        self._handlers[kind] = handler
+        self._params_models[kind] = params_model
+        self._transient_params[kind] = tuple(transient_params)
+
+    def _final_params(self, kind: str, params: dict) -> dict | None:
+        """Params to store when a job finishes, or None if they stay as they are."""
+        transient = self._transient_params.get(kind, ())
+        if not any(key in params for key in transient):
+            return None
+        return {key: value for key, value in params.items() if key not in transient}
+
+    async def start(self) -> None:
+        """Finish jobs orphaned by a previous run, then accept work."""
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        await self.fail_orphaned_jobs()
+        self._heartbeat = asyncio.create_task(self._heartbeat_loop())
+        self._running = True
+
+    async def stop(self) -> None:
+        """Cancel in-flight jobs of this worker and wait for them to record their status."""
+        self._running = False
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            await asyncio.gather(self._heartbeat, return_exceptions=True)
+            self._heartbeat = None
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def submit(self, db: AsyncSession, team_id: int, kind: str, params: dict | None = None) -> Job:
+        """
+        Persist a job and schedule it.
+
+        Raises:
+            pydantic.ValidationError: If params do not match the kind's params model
+            ValueError: If no handler is registered for kind
+            RuntimeError: If the runner is not started
+        """
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+        params_model = self._params_models.get(kind)
+        if params_model is not None:
+            params = params_model.model_validate(params or {}).model_dump(mode="json", exclude_none=True)
+        if not self._running:
+            raise RuntimeError("Job runner is not running")
+
+        job = Job(team_id=team_id, kind=kind, status="queued", progress=0, params=params or {})
+        db.add(job)
+        await db.commit()
+        await db.refresh(job)
+
+        task = asyncio.create_task(self._run(job.id, team_id, kind, job.params))
+        self._tasks[job.id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job.id, None))
+        return job
+
+    async def cancel(self, db: AsyncSession, job: Job) -> bool:
+        """
+        Request cancellation of an active job.
+
+        The job is marked 'cancelling'; if it runs in this worker its task is
+        cancelled right away, otherwise the owning worker stops it at the
+        next progress report.
+
+        Returns:
+            False if the job had already finished
+        """
+        result = await db.execute(
+            update(Job)
+            .where(Job.id == job.id, Job.status.in_(ACTIVE_STATUSES))
+            .values(status="cancelling")
+            .returning(Job.id)
+        )
+        requested = result.scalar_one_or_none() is not None
+        await db.commit()
+
+        task = self._tasks.get(job.id)
+        if requested and task is not None:
+            task.cancel()
+        return requested
+
+    async def fail_orphaned_jobs(self) -> int:
+        """
+        Finish active jobs whose worker stopped refreshing their heartbeat.
+
+        Queued and running jobs become 'failed', 'cancelling' ones
+        'cancelled'; transient params are dropped.
+
+        Returns:
+            Number of jobs finished
+        """
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                update(Job)
+                .where(
+                    Job.status.in_(ACTIVE_STATUSES),
+                    or_(
+                        Job.heartbeat_at.is_(None),
+                        Job.heartbeat_at < func.now() - timedelta(seconds=self.orphan_seconds)
+                    )
+                )
+                .values(
+                    status=case((Job.status == "cancelling", "cancelled"), else_="failed"),
+                    error=case(
+                        (Job.status == "cancelling", Job.error),
+                        else_="The worker running the job stopped before it finished"
+                    ),
+                    finished_at=func.now()
+                )
+                .returning(Job.id, Job.team_id, Job.kind, Job.status, Job.progress, Job.total, Job.params)
+            )
+            rows = result.all()
+            for row in rows:
+                final_params = self._final_params(row.kind, row.params or {})
+                if final_params is not None:
+                    await session.execute(update(Job).where(Job.id == row.id).values(params=final_params))
+            await session.commit()
+
+        for row in rows:
+            logger.warning("Job %s (%s) orphaned by its worker, marked %s", row.id, row.kind, row.status)
+            await event_bus.publish(
+                row.team_id, JOB_PROGRESS, job_id=row.id, status=row.status, progress=row.progress, total=row.total
+            )
+        return len(rows)
+
+    async def _heartbeat_loop(self) -> None:
+        """Refresh the heartbeat of this worker's jobs and finish other workers' orphans."""
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            try:
+                if self._tasks:
+                    async with AsyncSessionLocal() as session:
+                        await session.execute(
+                            update(Job)
+                            .where(Job.id.in_(list(self._tasks)), Job.status.in_(ACTIVE_STATUSES))
+                            .values(heartbeat_at=func.now())
+                        )
+                        await session.commit()
+                await self.fail_orphaned_jobs()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Job heartbeat failed")
+
+    async def _set_status(self, job_id: int, from_statuses: tuple[str, ...], **values) -> dict | None:
+        """
+        Move a job to a new status if it is currently in one of from_statuses.
+
+        Returns:
+            The job's params after the update, or None if the job was in
+            another status (e.g. 'cancelling') and was left unchanged
+        """
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                update(Job)
+                .where(Job.id == job_id, Job.status.in_(from_statuses))
+                .values(**values)
+                .returning(Job.team_id, Job.status, Job.progress, Job.total, Job.params)
+            )
+            row = result.one_or_none()
+            await session.commit()
+        if row is None:
+            return None
+        await event_bus.publish(
+            row.team_id, JOB_PROGRESS, job_id=job_id, status=row.status, progress=row.progress, total=row.total
+        )
+        return row.params or {}
+
+    async def _run(self, job_id: int, team_id: int, kind: str, params: dict) -> None:
+        final = {"finished_at": func.now()}
+        final_params = self._final_params(kind, params)
+        if final_params is not None:
+            final["params"] = final_params
+        try:
+            async with self._semaphore:
+                # A cancellation requested while queued (possibly by another worker) wins
+                # Params are re-read: they may have been extended while queued (see schedule_recompute)
+                params = await self._set_status(
+                    job_id, ("queued",), status="running", started_at=func.now(), heartbeat_at=func.now()
+                )
+                if params is None:
+                    raise JobCancelled()
+                final_params = self._final_params(kind, params)
+                if final_params is not None:
+                    final["params"] = final_params
+                context = JobContext(job_id, team_id, params)
+                async with AsyncSessionLocal() as session:
+                    result = await self._handlers[kind](session, context)
+            if await self._set_status(job_id, ("running",), status="succeeded", result=result, **final) is None:
+                raise JobCancelled()
+        except (asyncio.CancelledError, JobCancelled):
+            await asyncio.shield(self._set_status(job_id, ACTIVE_STATUSES, status="cancelled", **final))
+        except Exception as e:
+            logger.exception("Job %s (%s) failed", job_id, kind)
+            await self._set_status(job_id, ACTIVE_STATUSES, status="failed", error=str(e), **final)
+
+
+job_runner = JobRunner(settings.JOB_CONCURRENCY, settings.JOB_HEARTBEAT_SECONDS, settings.JOB_ORPHAN_SECONDS)
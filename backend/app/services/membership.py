@@ -0,0 +1,92 @@
+"""Meeting membership service - set-based edits of the meeting_participants association."""
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.meeting import meeting_participants
+from app.models.participant import Participant
+
+
+async def find_foreign_participants(db: AsyncSession, team_id: int, participant_ids: set[int]) -> set[int]:
+    """
+    Return the subset of participant_ids that do not exist in the given team.
+
+    Only IDs are selected, so no participant rows are loaded into the session.
+    """
+    if not participant_ids:
+        return set()
+    result = await db.execute(
+        select(Participant.id).where(
+            Participant.id.in_(participant_ids),
+            Participant.team_id == team_id
+        )
+    )
+    return participant_ids - set(result.scalars().all())
+
+
+async def add_members(db: AsyncSession, meeting_id: int, participant_ids: set[int]) -> list[int]:
+    """
+    Link participants to a meeting with one INSERT ... ON CONFLICT DO NOTHING.
+
+    Returns:
+        IDs of participants that were not already in the meeting
+    """
+    if not participant_ids:
+        return []
+    stmt = (
+        pg_insert(meeting_participants)
+        .values([
+            {"meeting_id": meeting_id, "participant_id": participant_id}
+            for participant_id in sorted(participant_ids)
+        ])
+        .on_conflict_do_nothing(index_elements=["meeting_id", "participant_id"])
+        .returning(meeting_participants.c.participant_id)
+    )
+    result = await db.execute(stmt)
+    return sorted(result.scalars().all())
+
+
+async def remove_members(db: AsyncSession, meeting_id: int, participant_ids: set[int]) -> list[int]:
+    """
+    Unlink participants from a meeting with one DELETE.
+
+    Returns:
+        IDs of participants that were actually in the meeting
+    """
+    if not participant_ids:
+        return []
+    stmt = (
+        delete(meeting_participants)
+        .where(
+            meeting_participants.c.meeting_id == meeting_id,
+            meeting_participants.c.participant_id.in_(participant_ids)
+        )
+        .returning(meeting_participants.c.participant_id)
+    )
+    result = await db.execute(stmt)
+    return sorted(result.scalars().all())
+
+
+async def replace_members(
+    db: AsyncSession,
+    meeting_id: int,
+    participant_ids: set[int]
+) -> tuple[list[int], list[int]]:
+    """
+    Make the meeting's participant set equal to participant_ids.
+
+    Runs one DELETE for links outside the new set and one INSERT ... ON CONFLICT
+    DO NOTHING for the new set; links that are kept are not touched.
+
+    Returns:
+        (added_ids, removed_ids)
+    """
+    stmt = delete(meeting_participants).where(meeting_participants.c.meeting_id == meeting_id)
+    if participant_ids:
+        stmt = stmt.where(meeting_participants.c.participant_id.not_in(participant_ids))
+    result = await db.execute(stmt.returning(meeting_participants.c.participant_id))
+    removed = sorted(result.scalars().all())
+
+    added = await add_members(db, meeting_id, participant_ids)
+    return added, removed
@@ -0,0 +1,228 @@
+"""Participant import service - streaming parsing and batched inserts for bulk onboarding."""
+
+import codecs
+import csv
+import json
+from collections.abc import AsyncIterator, Iterable
+
+from pydantic import ValidationError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.participant import Participant
+from app.schemas.participant import ParticipantCreate, ParticipantImportError, ParticipantImportResult
+
+# Rows validated and inserted per statement (8 columns -> 8000 bind params, well below the asyncpg limit)
+IMPORT_CHUNK_SIZE = 1000
+
+JSON_CONTENT_TYPES = ("application/json",)
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl", "application/x-jsonlines")
+CSV_CONTENT_TYPES = ("text/csv", "application/csv")
+
+
+class ImportFormatError(ValueError):
+    """Raised when the request body cannot be parsed in the declared format."""
+
+
+async def iter_lines(stream: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """
+    Split a streamed UTF-8 body into text lines without buffering it whole.
+
+    Args:
+        stream: Async iterator of raw body chunks (e.g. Request.stream())
+
+    Yields:
+        Lines without trailing newline characters
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    async for chunk in stream:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+
+async def iter_ndjson_rows(lines: AsyncIterator[str]) -> AsyncIterator[tuple[int, dict | None, str | None]]:
+    """
+    Parse NDJSON lines into row dicts.
+
+    Yields:
+        (row_number, row, error) - row is None when the line is not a JSON object
+    """
+    row_number = 0
+    async for line in lines:
+        if not line.strip():
+            continue
+        row_number += 1
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield row_number, None, f"Invalid JSON: {e.msg}"
+            continue
+        if not isinstance(row, dict):
+            yield row_number, None, "Row must be a JSON object"
+            continue
+        yield row_number, row, None
+
+
+async def iter_csv_rows(lines: AsyncIterator[str]) -> AsyncIterator[tuple[int, dict | None, str | None]]:
+    """
+    Parse CSV lines into row dicts using the first line as header.
+
+    Quoted fields spanning several lines are not supported - each physical line is one row.
+
+    Yields:
+        (row_number, row, error) - row is None when the column count does not match the header
+    """
+    header = None
+    row_number = 0
+    async for line in lines:
+        if not line.strip():
+            continue
+        values = next(csv.reader([line]))
+        if header is None:
+            header = [column.strip() for column in values]
+            continue
+        row_number += 1
+        if len(values) != len(header):
+            yield row_number, None, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        yield row_number, {column: value.strip() for column, value in zip(header, values)}, None
+
+
+async def iter_json_array_rows(body: bytes) -> AsyncIterator[tuple[int, dict | None, str | None]]:
+    """
+    Parse a JSON array body into row dicts.
+
+    Raises:
+        ImportFormatError: If the body is not a JSON array
+    """
+    try:
+        data = json.loads(body or b"[]")
+    except json.JSONDecodeError as e:
+        raise ImportFormatError(f"Invalid JSON: {e.msg}")
+    if not isinstance(data, list):
+        raise ImportFormatError("JSON body must be an array of participants")
+
+    for row_number, row in enumerate(data, 1):
+        if not isinstance(row, dict):
+            yield row_number, None, "Row must be a JSON object"
+        else:
+            yield row_number, row, None
+
+
+def format_validation_error(error: ValidationError) -> str:
+    """Collapse pydantic validation errors into a single readable line."""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc']) or 'row'}: {err['msg']}"
+        for err in error.errors()
+    )
+
+
+async def _insert_chunk(
+    db: AsyncSession,
+    team_id: int,
+    chunk: list[tuple[int, ParticipantCreate]],
+    result: ParticipantImportResult
+) -> None:
+    """Insert one validated chunk with a multi-row statement, reporting email conflicts per row."""
+    stmt = (
+        pg_insert(Participant)
+        .values([{**participant.model_dump(), "team_id": team_id} for _, participant in chunk])
+        .on_conflict_do_nothing(index_elements=[Participant.email])
+        .returning(Participant.email)
+    )
+    inserted = set((await db.execute(stmt)).scalars().all())
+
+    for row_number, participant in chunk:
+        if participant.email in inserted:
+            result.created += 1
+        else:
+            result.failed += 1
+            result.errors.append(ParticipantImportError(
+                row=row_number,
+                email=participant.email,
+                detail=f"Participant with email {participant.email} already exists"
+            ))
+
+
+async def import_participants(
+    db: AsyncSession,
+    team_id: int,
+    rows: AsyncIterator[tuple[int, dict | None, str | None]] | Iterable[tuple[int, dict | None, str | None]],
+    chunk_size: int = IMPORT_CHUNK_SIZE
+) -> ParticipantImportResult:
+    """
+    Validate and insert participants in chunks within a single transaction.
+
+    Rows are validated against ParticipantCreate as they arrive; valid rows are
+    buffered up to chunk_size and written with one INSERT ... ON CONFLICT DO NOTHING.
+    The unique email constraint is the source of truth for duplicates, so no
+    per-row SELECT is issued. Duplicate emails inside the import itself are
+    rejected before reaching the database.
+
+    Args:
+        db: Database session
+        team_id: Team the participants are imported into
+        rows: (row_number, row, parse_error) tuples from one of the iter_*_rows parsers
+        chunk_size: Number of rows per INSERT statement
+
+    Returns:
+        ParticipantImportResult with counters and per-row errors
+    """
+    result = ParticipantImportResult()
+    seen_emails = set()
+    chunk = []
+
+    async def _rows():
+        if hasattr(rows, "__aiter__"):
+            async for item in rows:
+                yield item
+        else:
+            for item in rows:
+                yield item
+
+    async for row_number, row, parse_error in _rows():
+        result.total_rows += 1
+
+        if parse_error is not None:
+            result.failed += 1
+            result.errors.append(ParticipantImportError(row=row_number, detail=parse_error))
+            continue
+
+        try:
+            participant = ParticipantCreate.model_validate(row)
+        except ValidationError as e:
+            result.failed += 1
+            result.errors.append(ParticipantImportError(
+                row=row_number,
+                email=str(row.get("email")) if row.get("email") is not None else None,
+                detail=format_validation_error(e)
+            ))
+            continue
+
+        if participant.email in seen_emails:
+            result.failed += 1
+            result.errors.append(ParticipantImportError(
+                row=row_number,
+                email=participant.email,
+                detail=f"Duplicate email {participant.email} within import"
+            ))
+            continue
+        seen_emails.add(participant.email)
+
+        chunk.append((row_number, participant))
+        if len(chunk) >= chunk_size:
+            await _insert_chunk(db, team_id, chunk, result)
+            chunk = []
+
+    if chunk:
+        await _insert_chunk(db, team_id, chunk, result)
+
+    await db.commit()
+    result.errors.sort(key=lambda error: error.row)
+    return result
@@ -0,0 +1,301 @@
+"""Recompute service - bulk refresh of upcoming assignments after their inputs changed.
+
+A settings save changes the scores of every upcoming meeting of the team; a
+profile edit (EI/SI, peak hours) changes those of the meetings the
+participant attends. The affected meetings are found with one query and
+recomputed in a background job: loaded as a corpus, assigned
+chronologically in memory and written back in chunks - only meetings whose
+assignment actually differs are rewritten.
+"""
+
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import exists, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import engine
+from app.models.job import Job
+from app.models.meeting import Meeting, meeting_participants
+from app.models.role_assignment import RoleAssignment
+from app.services.assignment_engine import lock_many_meeting_assignments
+from app.services.compute_pool import run_cpu_bound
+from app.services.corpus import (
+    assign_chronologically,
+    MeetingRecord,
+    corpus_fingerprints,
+    load_stored_assignments,
+    load_team_corpus,
+    write_assignments,
+)
+from app.services.event_bus import ASSIGNMENT_CHANGED, event_bus
+from app.services.job_runner import job_runner
+from app.services.settings_store import load_team_settings
+from app.services.staleness import record_fingerprints
+
+logger = logging.getLogger(__name__)
+
+# Participant fields the algorithm reads; changing one of them invalidates assignments
+ASSIGNMENT_INPUT_FIELDS = frozenset({
+    "emotional_intelligence", "social_intelligence", "peak_hours_start", "peak_hours_end"
+})
+
+# Meetings written per transaction
+RECOMPUTE_CHUNK = 100
+
+# First key of the two-key Postgres advisory lock serializing a team's recompute jobs
+RECOMPUTE_LOCK_NAMESPACE = 7302
+
+
+@asynccontextmanager
+async def lock_team_recompute(team_id: int) -> AsyncIterator[None]:
+    """
+    Serialize recompute jobs of one team across workers.
+
+    recompute_meetings commits chunk by chunk, so the transaction-scoped
+    advisory lock is held on a dedicated connection for the whole block.
+    """
+    async with engine.begin() as connection:
+        await connection.execute(select(func.pg_advisory_xact_lock(RECOMPUTE_LOCK_NAMESPACE, team_id)))
+        yield
+
+
+async def find_affected_meetings(
+    db: AsyncSession,
+    team_id: int,
+    participant_ids: list[int] | None = None,
+    since: datetime | None = None,
+    meeting_ids: list[int] | None = None
+) -> list[int]:
+    """
+    Upcoming meetings whose stored assignment depends on the changed inputs (one query).
+
+    Without participant_ids and meeting_ids every upcoming meeting is
+    affected (e.g. after a settings change); otherwise meetings matching
+    either of them.
+
+    Args:
+        db: Database session
+        team_id: Team whose meetings are searched
+        participant_ids: Meetings attended by one of these participants
+        since: Earliest scheduled_time considered (defaults to now)
+        meeting_ids: These meetings (e.g. those a deleted participant attended)
+
+    Returns:
+        Meeting IDs in chronological order; meetings without assignments are skipped
+    """
+    stmt = (
+        select(Meeting.id)
+        .where(
+            Meeting.team_id == team_id,
+            Meeting.scheduled_time >= (since or datetime.now(timezone.utc)),
+            exists().where(RoleAssignment.meeting_id == Meeting.id)
+        )
+        .order_by(Meeting.scheduled_time, Meeting.id)
+    )
+    conditions = []
+    if participant_ids is not None:
+        conditions.append(
+            exists().where(
+                meeting_participants.c.meeting_id == Meeting.id,
+                meeting_participants.c.participant_id.in_(participant_ids)
+            )
+        )
+    if meeting_ids is not None:
+        conditions.append(Meeting.id.in_(meeting_ids))
+    if conditions:
+        stmt = stmt.where(or_(*conditions))
+    result = await db.execute(stmt)
+    return list(result.scalars().all())
+
+
+def _holders(assignments: list[dict]) -> dict[str, int]:
+    return {assignment["role"]: assignment["participant_id"] for assignment in assignments}
+
+
+def _rounded(assignments: list[dict]) -> set[tuple]:
+    return {
+        (assignment["role"], assignment["participant_id"], round(assignment["score"], 4))
+        for assignment in assignments
+    }
+
+
+async def recompute_meetings(
+    db: AsyncSession,
+    team_id: int,
+    meeting_ids: list[int],
+    on_progress: Callable[[int, int], Awaitable[None]] | None = None
+) -> dict:
+    """
+    Recompute the given meetings of a team and write back those that differ.
+
+    The meetings are assigned chronologically with history carried forward
+    (history before them excludes their own stored assignments), under the
+    team's current settings. Meetings whose holders or scores differ from
+    the stored assignment are rewritten, RECOMPUTE_CHUNK per transaction;
+    all recomputed meetings get fresh fingerprints and lose their stale flag.
+    Writes happen under the meetings' assignment locks and skip meetings
+    changed since the corpus was loaded (see _lock_unchanged).
+
+    Args:
+        db: Database session
+        team_id: Team of the meetings
+        meeting_ids: Meetings to recompute
+        on_progress: Awaited with (written meetings, meetings to write) after each chunk
+
+    Returns:
+        Dict with meetings (recomputed), rewritten, assignments (inserted),
+        changed (IDs of meetings where at least one role changed holder) and
+        skipped (IDs of outdated meetings changed concurrently, left as stored)
+    """
+    corpus = await load_team_corpus(db, team_id, meeting_ids=meeting_ids)
+    team_settings = await load_team_settings(db, team_id)
+    results = await run_cpu_bound(
+        assign_chronologically, corpus, team_settings.compiled,
+        size=len(corpus.meetings)
+    )
+    stored = await load_stored_assignments(db, list(results))
+    fingerprints = corpus_fingerprints(corpus, team_settings.version)
+
+    changed = [
+        meeting_id for meeting_id, assignments in results.items()
+        if _holders(assignments) != _holders(stored[meeting_id])
+    ]
+    outdated = {
+        meeting_id: assignments for meeting_id, assignments in results.items()
+        if _rounded(assignments) != _rounded(stored[meeting_id])
+    }
+
+    # Meetings that stay as stored only need their fingerprint refreshed
+    records = {meeting.id: meeting for meeting in corpus.meetings}
+    kept = await _lock_unchanged(db, records, [meeting_id for meeting_id in fingerprints if meeting_id not in outdated])
+    await record_fingerprints(db, {meeting_id: fingerprints[meeting_id] for meeting_id in kept})
+    await db.commit()
+
+    inserted = 0
+    processed = 0
+    skipped: list[int] = []
+    ids = list(outdated)
+    for index in range(0, len(ids), RECOMPUTE_CHUNK):
+        chunk = ids[index:index + RECOMPUTE_CHUNK]
+        unchanged = await _lock_unchanged(db, records, chunk)
+        skipped.extend(meeting_id for meeting_id in chunk if meeting_id not in unchanged)
+        inserted += await write_assignments(
+            db, {meeting_id: outdated[meeting_id] for meeting_id in unchanged}, fingerprints
+        )
+        await db.commit()
+        if unchanged:
+            await event_bus.publish(team_id, ASSIGNMENT_CHANGED, meeting_ids=unchanged)
+        processed += len(chunk)
+        if on_progress is not None:
+            await on_progress(processed, len(ids))
+
+    return {
+        "meetings": len(results),
+        "rewritten": len(outdated) - len(skipped),
+        "assignments": inserted,
+        "changed": [meeting_id for meeting_id in changed if meeting_id not in skipped],
+        "skipped": skipped,
+    }
+
+
+async def _lock_unchanged(db: AsyncSession, records: dict[int, MeetingRecord], meeting_ids: list[int]) -> list[int]:
+    """
+    Take the assignment locks of the meetings and keep those unchanged since the corpus was loaded.
+
+    A meeting whose stale_seq, stored fingerprint or member set differs was
+    edited, reassigned or repaired concurrently; results computed from the
+    corpus would overwrite newer work, so it is left to a later recompute
+    (a change that matters has flagged it stale again). The locks are held
+    until the caller commits.
+    """
+    if not meeting_ids:
+        return []
+    await lock_many_meeting_assignments(db, meeting_ids)
+    result = await db.execute(
+        select(Meeting.id, Meeting.stale_seq, Meeting.assignment_fingerprint).where(Meeting.id.in_(meeting_ids))
+    )
+    current = {meeting_id: (stale_seq, fingerprint) for meeting_id, stale_seq, fingerprint in result.all()}
+    result = await db.execute(
+        select(meeting_participants.c.meeting_id, meeting_participants.c.participant_id)
+        .where(meeting_participants.c.meeting_id.in_(meeting_ids))
+    )
+    members: dict[int, set[int]] = {}
+    for meeting_id, participant_id in result.all():
+        members.setdefault(meeting_id, set()).add(participant_id)
+    return [
+        meeting_id for meeting_id in meeting_ids
+        if current.get(meeting_id) == (records[meeting_id].stale_seq, records[meeting_id].stored_fingerprint)
+        and members.get(meeting_id) == set(records[meeting_id].participant_ids)
+    ]
+
+
+def _merge_recompute_params(pending: dict, params: dict) -> dict:
+    """Union of two recompute_assignments params ({} = all upcoming meetings)."""
+    if not pending or not params:
+        return {}
+    return {
+        key: sorted(set(pending.get(key, ())) | set(params.get(key, ())))
+        for key in ("participant_ids", "meeting_ids")
+        if key in pending or key in params
+    }
+
+
+async def schedule_recompute(
+    db: AsyncSession,
+    team_id: int,
+    participant_ids: list[int] | None = None,
+    meeting_ids: list[int] | None = None
+) -> int | None:
+    """
+    Submit a 'recompute_assignments' job for the team's upcoming meetings.
+
+    Without participant_ids and meeting_ids every upcoming meeting is
+    recomputed (see find_affected_meetings).
+
+    Called after the triggering write has been committed. Finding and
+    recomputing the meetings happens in the job, so the caller only pays
+    for persisting it; concurrency is bounded by the job runner.
+
+    Bursts of edits are coalesced: while a recompute job of the team is
+    still queued, its participants and meetings are extended instead of
+    submitting another job (the runner reads params when the job starts).
+
+    Returns:
+        Job ID, or None if the job runner is not running (the change is kept,
+        assignments are recomputed on the next explicit assignment)
+    """
+    queued = await db.execute(
+        select(Job.id, Job.params)
+        .where(
+            Job.team_id == team_id,
+            Job.kind == "recompute_assignments",
+            Job.status == "queued",
+            # Not one orphaned by a stopped worker; it would fail instead of running
+            Job.heartbeat_at >= func.now() - timedelta(seconds=job_runner.orphan_seconds)
+        )
+        .order_by(Job.id)
+        .limit(1)
+        .with_for_update()
+    )
+    params = {}
+    if participant_ids is not None:
+        params["participant_ids"] = sorted(set(participant_ids))
+    if meeting_ids is not None:
+        params["meeting_ids"] = sorted(set(meeting_ids))
+
+    row = queued.one_or_none()
+    if row is not None:
+        merged = _merge_recompute_params(row.params or {}, params)
+        await db.execute(update(Job).where(Job.id == row.id).values(params=merged))
+        await db.commit()
+        return row.id
+
+    try:
+        job = await job_runner.submit(db, team_id, "recompute_assignments", params)
+    except (RuntimeError, ValueError):
+        logger.warning("Recompute for team %s not scheduled: job runner unavailable", team_id)
+        return None
+    return job.id
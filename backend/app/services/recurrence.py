@@ -0,0 +1,102 @@
+"""Recurrence service - expands meeting series rules into concrete occurrence times."""
+
+from datetime import datetime, timedelta
+
+# Upper bound for a single series (a year of daily stand-ups)
+MAX_OCCURRENCES = 366
+
+
+def expand_recurrence(
+    start: datetime,
+    frequency: str,
+    interval: int = 1,
+    count: int | None = None,
+    until: datetime | None = None,
+    weekdays: list[int] | None = None
+) -> list[datetime]:
+    """
+    Expand a recurrence rule into a list of occurrence datetimes.
+
+    Every occurrence keeps the time of day and timezone of `start`.
+
+    Rules:
+    - daily: every `interval` days, optionally filtered to `weekdays`
+    - weekly: every `interval` weeks on each of `weekdays`
+      (defaults to the weekday of `start`)
+
+    Args:
+        start: First possible occurrence
+        frequency: 'daily' or 'weekly'
+        interval: Step between periods (days or weeks)
+        count: Maximum number of occurrences
+        until: Last allowed occurrence time (inclusive)
+        weekdays: Allowed weekdays, 0=Monday .. 6=Sunday
+
+    Returns:
+        Sorted list of occurrence datetimes
+
+    Raises:
+        ValueError: If the rule is unbounded, mixes timezone-aware and naive
+            datetimes, can never reach its weekdays, or yields more than
+            MAX_OCCURRENCES
+    """
+    if count is None and until is None:
+        raise ValueError("Recurrence rule needs either count or until")
+    if interval < 1:
+        raise ValueError("Recurrence interval must be at least 1")
+    if until is not None and (until.tzinfo is None) != (start.tzinfo is None):
+        raise ValueError("Recurrence until and the start time must both have a timezone or both have none")
+
+    limit = min(count, MAX_OCCURRENCES + 1) if count is not None else MAX_OCCURRENCES + 1
+    allowed_days = sorted(set(weekdays)) if weekdays else None
+    occurrences = []
+
+    def _accept(candidate: datetime) -> bool:
+        """Append candidate if within bounds; return False once the series is exhausted."""
+        if until is not None and candidate > until:
+            return False
+        occurrences.append(candidate)
+        return len(occurrences) < limit
+
+    if frequency == "daily":
+        # Stepping by interval days only visits these weekdays (the cycle repeats after 7 steps)
+        reachable = {(start.weekday() + step * interval) % 7 for step in range(7)}
+        if allowed_days is not None and not reachable & set(allowed_days):
+            raise ValueError(
+                f"Every {interval} days from a {start.strftime('%A')} never falls on the allowed weekdays"
+            )
+        current = start
+        # Each 7 steps accept at least one day, so this bound is never hit by a valid rule
+        for _ in range(7 * (MAX_OCCURRENCES + 1)):
+            if until is not None and current > until:
+                break
+            if allowed_days is None or current.weekday() in allowed_days:
+                if not _accept(current):
+                    break
+            try:
+                current += timedelta(days=interval)
+            except OverflowError:
+                break  # Past the last representable date
+    elif frequency == "weekly":
+        days = allowed_days or [start.weekday()]
+        week_start = start - timedelta(days=start.weekday())
+        exhausted = False
+        while not exhausted:
+            for day in days:
+                candidate = week_start + timedelta(days=day)
+                if candidate < start:
+                    continue
+                if not _accept(candidate):
+                    exhausted = True
+                    break
+            try:
+                week_start += timedelta(weeks=interval)
+            except OverflowError:
+                break  # Past the last representable date
+    else:
+        raise ValueError(f"Unknown recurrence frequency: {frequency}")
+
+    if len(occurrences) > MAX_OCCURRENCES:
+        raise ValueError(f"Recurrence rule yields more than {MAX_OCCURRENCES} occurrences")
+
+    return occurrences
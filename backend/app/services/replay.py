@@ -0,0 +1,169 @@
+"""Replay engine - re-simulates a team's past assignments under candidate scoring tables.
+
+The team corpus is loaded once (see corpus.load_team_corpus) and replayed
+in memory, so evaluating a settings change over thousands of meetings does
+not touch the database per meeting.
+"""
+
+import time
+from dataclasses import dataclass, field
+
+from app.services.assignment_engine import HISTORY_DEPTH
+from app.services.corpus import TeamCorpus
+from app.services.energy_calculator import calculate_energy
+from app.services.fairness_metrics import FairnessMetrics, fairness_metrics
+from app.services.fitness import DEFAULT_TABLES, CompiledTables, ScoringTables, greedy_assignment
+
+
+@dataclass
+class RoleChange:
+    """One role whose holder differs between baseline and candidate."""
+
+    role: str
+    baseline_participant_id: int | None
+    candidate_participant_id: int | None
+
+
+@dataclass
+class MeetingDiff:
+    """Differences of one meeting's assignment."""
+
+    meeting_id: int
+    changes: list[RoleChange]
+    baseline_fitness: float
+    candidate_fitness: float
+
+
+@dataclass
+class ReplayReport:
+    """Outcome of replaying a corpus under baseline and candidate tables."""
+
+    meetings: int
+    meetings_changed: int
+    roles_changed: int
+    baseline_fitness: float
+    candidate_fitness: float
+    baseline_fairness: FairnessMetrics
+    candidate_fairness: FairnessMetrics
+    diffs: list[MeetingDiff] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def meetings_per_second(self) -> float:
+        return self.meetings * 2 / self.seconds if self.seconds else 0.0
+
+
+def replay_corpus(
+    corpus: TeamCorpus,
+    tables: ScoringTables | CompiledTables = DEFAULT_TABLES,
+    depth: int = HISTORY_DEPTH
+) -> dict[int, list[dict]]:
+    """
+    Assign every corpus meeting in order under the given tables, carrying history forward.
+
+    Produces the same result as corpus.assign_chronologically, but EI/SI fit
+    is computed once per participant and energy once per (participant, hour)
+    for the whole corpus instead of for every meeting.
+
+    Returns:
+        Dict meeting_id -> assignment dicts (participant_id, role, score), chronological
+    """
+    compiled = tables if isinstance(tables, CompiledTables) else CompiledTables(tables)
+    static_fits = {
+        participant_id: compiled.static_fit(participant)
+        for participant_id, participant in corpus.participants.items()
+    }
+    energy_by_hour: dict[tuple[int, int], int] = {}
+    history = {participant_id: list(roles) for participant_id, roles in corpus.history.items()}
+
+    results = {}
+    for meeting in corpus.meetings:
+        participants = [
+            corpus.participants[participant_id]
+            for participant_id in meeting.participant_ids
+            if participant_id in corpus.participants
+        ]
+        hour = meeting.scheduled_time.hour
+        energies = {}
+        for participant in participants:
+            key = (participant.id, hour)
+            if key not in energy_by_hour:
+                energy_by_hour[key] = calculate_energy(participant, meeting.scheduled_time)
+            energies[participant.id] = energy_by_hour[key]
+
+        fitness_matrix = compiled.fitness_matrix(participants, meeting.meeting_type, energies, static_fits, history)
+        assignments = greedy_assignment(fitness_matrix, participants, compiled.roles)
+        for assignment in assignments:
+            recent = history.setdefault(assignment["participant_id"], [])
+            recent.insert(0, assignment["role"])
+            del recent[depth:]
+        results[meeting.id] = assignments
+    return results
+
+
+def diff_results(
+    baseline: dict[int, list[dict]],
+    candidate: dict[int, list[dict]],
+    roles: list[str]
+) -> list[MeetingDiff]:
+    """List meetings whose role holders differ, in the order of baseline."""
+    diffs = []
+    for meeting_id, baseline_assignments in baseline.items():
+        before = {assignment["role"]: assignment["participant_id"] for assignment in baseline_assignments}
+        after = {assignment["role"]: assignment["participant_id"] for assignment in candidate.get(meeting_id, [])}
+        changes = [
+            RoleChange(role=role, baseline_participant_id=before.get(role), candidate_participant_id=after.get(role))
+            for role in roles
+            if before.get(role) != after.get(role)
+        ]
+        if changes:
+            diffs.append(MeetingDiff(
+                meeting_id=meeting_id,
+                changes=changes,
+                baseline_fitness=round(sum(assignment["score"] for assignment in baseline_assignments), 2),
+                candidate_fitness=round(sum(assignment["score"] for assignment in candidate.get(meeting_id, [])), 2),
+            ))
+    return diffs
+
+
+def replay_report(
+    corpus: TeamCorpus,
+    candidate: ScoringTables,
+    baseline: ScoringTables = DEFAULT_TABLES,
+    max_diffs: int | None = None
+) -> ReplayReport:
+    """
+    Replay the corpus under baseline and candidate tables and compare them.
+
+    Both sides are replayed from the same starting history, so the diff
+    isolates the effect of the settings change; stored assignments are not
+    used as the baseline because they also reflect profile edits and
+    meetings assigned out of order.
+
+    Args:
+        corpus: Team corpus (meetings in chronological order)
+        candidate: Tables to evaluate
+        baseline: Tables to compare against (current settings by default)
+        max_diffs: Keep only the first N meeting diffs in the report (counts stay complete)
+
+    Returns:
+        ReplayReport with diffs, total fitness and fairness of both sides
+    """
+    started = time.perf_counter()
+    baseline_results = replay_corpus(corpus, baseline)
+    candidate_results = replay_corpus(corpus, candidate)
+    seconds = time.perf_counter() - started
+
+    roles = list(dict.fromkeys(baseline.roles + candidate.roles))
+    diffs = diff_results(baseline_results, candidate_results, roles)
+    return ReplayReport(
+        meetings=len(corpus.meetings),
+        meetings_changed=len(diffs),
+        roles_changed=sum(len(diff.changes) for diff in diffs),
+        baseline_fitness=round(sum(a["score"] for rows in baseline_results.values() for a in rows), 2),
+        candidate_fitness=round(sum(a["score"] for rows in candidate_results.values() for a in rows), 2),
+        baseline_fairness=fairness_metrics(baseline_results, corpus.participants, baseline.roles),
+        candidate_fairness=fairness_metrics(candidate_results, corpus.participants, candidate.roles),
+        diffs=diffs if max_diffs is None else diffs[:max_diffs],
+        seconds=seconds,
+    )
@@ -0,0 +1,328 @@
+"""Response cache - bounded per-worker cache of team-scoped GET responses.
+
+Read endpoints whose data changes rarely (participant and meeting lists,
+meeting assignments, participant statistics, the testing team lists) keep
+their response here, keyed by team, scope and the route's arguments. The
+least recently used entries are evicted beyond RESPONSE_CACHE_MAX_ENTRIES;
+entries also expire after RESPONSE_CACHE_TTL_SECONDS.
+
+Writes invalidate through the event bus: every write endpoint publishes an
+event after its commit, and the cache drops the scopes that event touches
+(for assignments, only the meetings named in it). Entries also remember the
+team's data version (see services.data_version) they were loaded under; a
+read passing a newer version treats them as invalidated, so writes of other
+workers and offline writers are noticed without EVENT_BUS_NOTIFY. Writers
+outside the API (batch assignment from the CLI) publish with
+event_bus.publish_in in their own transaction for that reason.
+
+Invalidated and expired entries are kept as stale. Reads that accept
+staleness (stale-while-revalidate, max_stale > 0) are served a stale entry
+immediately - for at most max_stale seconds after it went stale - while a
+background refresh replaces it; other reads treat stale entries as misses.
+
+Fills are single-flight per entry: concurrent misses and refreshes of the
+same entry run one load. A load racing with a write is not stored:
+invalidation bumps a generation - the scope's, or only the named entries'
+for keyed invalidations - a value loaded under an older generation is
+discarded, and callers arriving after the write do not join a load started
+before it. Writes made by a load itself (the lazy recompute of stale
+assignments) do not discard that load.
+
+Endpoints cache the serialized JSON body; their ETags are derived from the
+data version, so If-None-Match is answered before the cache is consulted
+(see routers.cache.cached_json_response).
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from app.config import settings
+from app.services.event_bus import (
+    ASSIGNMENT_CHANGED,
+    MEETING_CHANGED,
+    PARTICIPANT_CHANGED,
+    SETTINGS_CHANGED,
+    Event,
+    event_bus,
+)
+from app.services.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+PARTICIPANTS = "participants"
+MEETINGS = "meetings"
+ASSIGNMENTS = "assignments"
+STATISTICS = "statistics"
+
+# Entry key of the fill running in the current task (see ResponseCache.invalidate)
+_current_fill: ContextVar[tuple | None] = ContextVar("response_cache_fill", default=None)
+
+
+@dataclass
+class ScopeStats:
+    """Counters of one cache scope."""
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / lookups if lookups else 0.0
+
+
+@dataclass
+class _Entry:
+    value: Any
+    stored_at: float
+    stale_since: float | None = None  # set by invalidation
+    version: int | None = None  # team data version the value was loaded under
+
+
+class ResponseCache:
+    """LRU cache of response values keyed by (team_id, scope, key)."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple, _Entry] = OrderedDict()
+        self._index: dict[tuple[int, str], set[tuple]] = {}
+        self._generations: dict[tuple[int, str], int] = {}
+        self._key_generations: dict[tuple[int, str], dict[Hashable, int]] = {}
+        self._flight = SingleFlight()
+        self.stats: dict[str, ScopeStats] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _stats(self, scope: str) -> ScopeStats:
+        return self.stats.setdefault(scope, ScopeStats())
+
+    def _remove(self, entry_key: tuple) -> None:
+        self._entries.pop(entry_key, None)
+        scope_key = entry_key[:2]
+        keys = self._index.get(scope_key)
+        if keys is not None:
+            keys.discard(entry_key)
+            if not keys:
+                del self._index[scope_key]
+
+    def _stale_for(self, entry: _Entry, now: float) -> float:
+        """Seconds since the entry went stale (negative while fresh)."""
+        stale_since = entry.stored_at + self.ttl_seconds
+        if entry.stale_since is not None:
+            stale_since = min(stale_since, entry.stale_since)
+        return now - stale_since
+
+    def generation(self, team_id: int, scope: str, key: Hashable = ()) -> tuple[int, int]:
+        """(scope generation, entry generation) of an entry."""
+        scope_key = (team_id, scope)
+        return self._generations.get(scope_key, 0), self._key_generations.get(scope_key, {}).get(key, 0)
+
+    def put(
+        self,
+        team_id: int,
+        scope: str,
+        key: Hashable,
+        value: Any,
+        generation: tuple[int, int] | None = None,
+        version: int | None = None
+    ) -> None:
+        """
+        Store a value, evicting the least recently used entries beyond max_entries.
+
+        With generation, the value is dropped if the scope or the entry was
+        invalidated since that generation was read (it may predate the write).
+        """
+        if generation is not None and generation != self.generation(team_id, scope, key):
+            return
+        entry_key = (team_id, scope, key)
+        self._entries[entry_key] = _Entry(value=value, stored_at=time.monotonic(), version=version)
+        self._entries.move_to_end(entry_key)
+        self._index.setdefault((team_id, scope), set()).add(entry_key)
+        while len(self._entries) > self.max_entries:
+            evicted = next(iter(self._entries))
+            self._remove(evicted)
+            self._stats(evicted[1]).evictions += 1
+
+    def _fill(
+        self,
+        team_id: int,
+        scope: str,
+        key: Hashable,
+        load: Callable[[], Awaitable[Any]],
+        version: int | None
+    ) -> asyncio.Task:
+        """Single-flight task loading and storing one entry under its current generation."""
+        generation = self.generation(team_id, scope, key)
+
+        async def run() -> Any:
+            _current_fill.set((team_id, scope, key))
+            value = await load()
+            self.put(team_id, scope, key, value, generation, version)
+            return value
+
+        return self._flight.start((team_id, scope, key, generation, version), run)
+
+    def _refresh_in_background(
+        self,
+        team_id: int,
+        scope: str,
+        key: Hashable,
+        load: Callable[[], Awaitable[Any]],
+        version: int | None
+    ) -> None:
+        entry_key = (team_id, scope, key)
+        stale = self._entries.get(entry_key)
+
+        def _done(task: asyncio.Task) -> None:
+            if task.cancelled() or task.exception() is None:
+                return
+            exc = task.exception()
+            # Stop serving an entry whose data is gone (e.g. deleted meeting); after
+            # transient failures (DB timeouts) it is served until max_stale runs out
+            gone = isinstance(exc, LookupError) or getattr(exc, "status_code", None) == 404
+            if gone and self._entries.get(entry_key) is stale:
+                self._remove(entry_key)
+            logger.info("Refresh of cached %s %r for team %s failed: %s", scope, key, team_id, exc)
+
+        self._fill(team_id, scope, key, load, version).add_done_callback(_done)
+
+    async def get_or_load(
+        self,
+        team_id: int,
+        scope: str,
+        key: Hashable,
+        load: Callable[[], Awaitable[Any]],
+        max_stale: float = 0.0,
+        version: int | None = None
+    ) -> tuple[Any, float, int | None]:
+        """
+        Cached value, or the result of load() which is then cached.
+
+        load() must not use the caller's request-scoped resources: concurrent
+        callers share one load, and background refreshes outlive the request.
+        Exceptions of load() propagate and are not cached.
+
+        Args:
+            team_id: Team the value belongs to
+            scope: Cache scope (invalidated by the team's writes)
+            key: Route arguments distinguishing entries within the scope
+            load: Loads the current value
+            max_stale: Seconds a stale entry may still be served while a
+                background refresh runs (0 = wait for a fresh value)
+            version: Current data version of the team; entries loaded under
+                an older one are treated as invalidated
+
+        Returns:
+            (value, age in seconds since the value was loaded, data version
+            the value was loaded under)
+        """
+        entry_key = (team_id, scope, key)
+        entry = self._entries.get(entry_key)
+        now = time.monotonic()
+        if entry is not None:
+            outdated = version is not None and (entry.version is None or entry.version < version)
+            if outdated and entry.stale_since is None:
+                entry.stale_since = now
+                self._stats(scope).invalidations += 1
+            stale_for = self._stale_for(entry, now)
+            if stale_for < 0:
+                self._entries.move_to_end(entry_key)
+                self._stats(scope).hits += 1
+                return entry.value, now - entry.stored_at, entry.version
+            # Only reads accepting staleness; an entry outdated just now has stale_for == 0
+            if max_stale > 0 and stale_for <= max_stale:
+                self._entries.move_to_end(entry_key)
+                self._stats(scope).stale_hits += 1
+                self._refresh_in_background(team_id, scope, key, load, version)
+                return entry.value, now - entry.stored_at, entry.version
+
+        self._stats(scope).misses += 1
+        value = await asyncio.shield(self._fill(team_id, scope, key, load, version))
+        return value, 0.0, version
+
+    def invalidate(self, team_id: int, scope: str, keys: Iterable[Hashable] | None = None) -> None:
+        """
+        Mark a team's entries of a scope stale (only the given keys if keys is not None).
+
+        A full invalidation discards every load of the scope in flight; a
+        keyed one only those of the given keys, except a load whose own
+        write is being published.
+        """
+        scope_key = (team_id, scope)
+        if keys is None:
+            self._generations[scope_key] = self._generations.get(scope_key, 0) + 1
+            # Entry generations are superseded by the new scope generation
+            self._key_generations.pop(scope_key, None)
+            entry_keys = list(self._index.get(scope_key, ()))
+        else:
+            entry_keys = [(team_id, scope, key) for key in keys]
+            key_generations = self._key_generations.setdefault(scope_key, {})
+            filling = _current_fill.get()
+            for entry_key in entry_keys:
+                if entry_key != filling:
+                    key_generations[entry_key[2]] = key_generations.get(entry_key[2], 0) + 1
+        now = time.monotonic()
+        for entry_key in entry_keys:
+            entry = self._entries.get(entry_key)
+            if entry is not None and entry.stale_since is None:
+                entry.stale_since = now
+                self._stats(scope).invalidations += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._index.clear()
+        self._generations.clear()
+        self._key_generations.clear()
+
+    def on_event(self, event: Event) -> None:
+        """Invalidate the entries a published write affects."""
+        meeting_ids = event.data.get("meeting_ids")
+        if event.type in (PARTICIPANT_CHANGED, SETTINGS_CHANGED):
+            # Participant data is embedded in meetings and assignments; both
+            # writes also flag upcoming assignments stale
+            if event.type == PARTICIPANT_CHANGED:
+                self.invalidate(event.team_id, PARTICIPANTS)
+                self.invalidate(event.team_id, STATISTICS)
+            self.invalidate(event.team_id, MEETINGS)
+            self.invalidate(event.team_id, ASSIGNMENTS)
+        elif event.type in (MEETING_CHANGED, ASSIGNMENT_CHANGED):
+            # Meeting lists carry participants and the assignments_stale flag
+            self.invalidate(event.team_id, MEETINGS)
+            self.invalidate(event.team_id, STATISTICS)
+            if meeting_ids is None:
+                self.invalidate(event.team_id, ASSIGNMENTS)
+            else:
+                self.invalidate(event.team_id, ASSIGNMENTS, [(meeting_id,) for meeting_id in meeting_ids])
+
+    def metrics(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "scopes": {
+                scope: {
+                    "hits": stats.hits,
+                    "stale_hits": stats.stale_hits,
+                    "misses": stats.misses,
+                    "hit_ratio": stats.hit_ratio,
+                    "evictions": stats.evictions,
+                    "invalidations": stats.invalidations,
+                }
+                for scope, stats in sorted(self.stats.items())
+            },
+        }
+
+
+response_cache = ResponseCache(settings.RESPONSE_CACHE_MAX_ENTRIES, settings.RESPONSE_CACHE_TTL_SECONDS)
+event_bus.add_handler(response_cache.on_event)
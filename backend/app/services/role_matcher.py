@@ -48,7 +48,12 @@ def calculate_parameter_fit(value: int, min_threshold: int, max_threshold: int)
         return max(0.0, 1.0 - (excess * 0.033))
 
 
-def calculate_base_fitness(participant: Participant, role: str, energy: int) -> float:
+def calculate_base_fitness(
+    participant: Participant,
+    role: str,
+    energy: int,
+    role_requirements: dict | None = None
+) -> float:
     """
     Calculate base fitness score for participant-role combination.
 
@@ -56,7 +61,7 @@ def calculate_base_fitness(participant: Participant, role: str, energy: int) ->
     match the requirements for the given role.
 
     Algorithm:
-    1. Get role requirements from ROLE_REQUIREMENTS
+    1. Get role requirements from ROLE_REQUIREMENTS (or the given table)
     2. Calculate fit for each parameter (EI, SI, energy)
     3. Average the three fit scores
     4. Convert to 0-100 scale
@@ -65,14 +70,16 @@ def calculate_base_fitness(participant: Participant, role: str, energy: int) ->
         participant: Participant model with EI and SI scores
         role: Role name (e.g., 'moderator', 'critic')
         energy: Calculated energy level at meeting time (0-100)
+        role_requirements: Requirements table (defaults to ROLE_REQUIREMENTS)
 
     Returns:
         Base fitness score (0-100)
     """
-    if role not in ROLE_REQUIREMENTS:
+    requirements_table = ROLE_REQUIREMENTS if role_requirements is None else role_requirements
+    if role not in requirements_table:
         raise ValueError(f"Unknown role: {role}")
 
-    requirements = ROLE_REQUIREMENTS[role]
+    requirements = requirements_table[role]
 
     # Calculate fit for each parameter
     ei_fit = calculate_parameter_fit(
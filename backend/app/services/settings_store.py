@@ -0,0 +1,203 @@
+"""Settings store - versioned per-team algorithm settings with a compiled in-process cache.
+
+Each team's active settings are the highest version in algorithm_settings
+(teams without rows use the built-in tables as version 0). A version is
+compiled into ScoringTables/CompiledTables once and cached per worker;
+cached entries are trusted for SETTINGS_CACHE_TTL_SECONDS, after which a
+single `max(version)` query revalidates them. Saves in this worker replace
+the entry immediately; other workers pick the change up within the TTL.
+"""
+
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from sqlalchemy import JSON, Integer, func, insert, literal, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.algorithm_settings import AlgorithmSettings
+from app.services.fitness import DEFAULT_TABLES, CompiledTables, ScoringTables
+
+
+@dataclass(frozen=True)
+class TeamSettings:
+    """One compiled settings version of a team."""
+
+    team_id: int
+    version: int
+    tables: ScoringTables
+    compiled: CompiledTables
+
+    @property
+    def etag(self) -> str:
+        return f'"settings-{self.team_id}-{self.version}"'
+
+
+class SettingsConflict(Exception):
+    """Raised when a save is based on a version that is no longer the latest."""
+
+
+def _compile(team_id: int, version: int, tables: ScoringTables) -> TeamSettings:
+    return TeamSettings(team_id=team_id, version=version, tables=tables, compiled=CompiledTables(tables))
+
+
+def _tables_from_row(row: AlgorithmSettings) -> ScoringTables:
+    return ScoringTables(
+        role_requirements=row.role_requirements,
+        meeting_multipliers=row.meeting_multipliers,
+        history_penalties=tuple(row.history_penalties),
+    )
+
+
+async def current_version(db: AsyncSession, team_id: int) -> int:
+    """Latest settings version of a team (0 = built-in defaults)."""
+    result = await db.execute(
+        select(func.coalesce(func.max(AlgorithmSettings.version), 0)).where(AlgorithmSettings.team_id == team_id)
+    )
+    return result.scalar_one()
+
+
+async def load_team_settings(db: AsyncSession, team_id: int, version: int | None = None) -> TeamSettings:
+    """
+    Load and compile a settings version without the cache (latest if version is None).
+
+    Raises:
+        LookupError: If the requested version does not exist
+    """
+    stmt = select(AlgorithmSettings).where(AlgorithmSettings.team_id == team_id)
+    if version is None:
+        stmt = stmt.order_by(AlgorithmSettings.version.desc()).limit(1)
+    else:
+        stmt = stmt.where(AlgorithmSettings.version == version)
+    row = (await db.execute(stmt)).scalar_one_or_none()
+
+    if row is None:
+        if version not in (None, 0):
+            raise LookupError(f"Settings version {version} not found")
+        return _compile(team_id, 0, DEFAULT_TABLES)
+    return _compile(team_id, row.version, _tables_from_row(row))
+
+
+class SettingsCache:
+    """Per-worker cache of each team's active compiled settings."""
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[int, tuple[TeamSettings, float]] = {}
+
+    def peek(self, team_id: int) -> TeamSettings | None:
+        """Cached settings if still within the TTL (never queries)."""
+        entry = self._entries.get(team_id)
+        if entry is not None and time.monotonic() - entry[1] < self.ttl_seconds:
+            return entry[0]
+        return None
+
+    async def get(self, db: AsyncSession, team_id: int) -> TeamSettings:
+        """
+        Active settings of a team.
+
+        No query within the TTL; afterwards one `max(version)` query, and the
+        full row is loaded and compiled only when the version changed.
+        """
+        cached = self.peek(team_id)
+        if cached is not None:
+            return cached
+
+        entry = self._entries.get(team_id)
+        version = await current_version(db, team_id)
+        if entry is not None and entry[0].version == version:
+            team_settings = entry[0]
+        else:
+            team_settings = await load_team_settings(db, team_id)
+        self.put(team_settings)
+        return team_settings
+
+    def put(self, team_settings: TeamSettings) -> None:
+        current = self._entries.get(team_settings.team_id)
+        if current is None or current[0].version <= team_settings.version:
+            self._entries[team_settings.team_id] = (team_settings, time.monotonic())
+
+    def invalidate(self, team_id: int) -> None:
+        self._entries.pop(team_id, None)
+
+
+settings_cache = SettingsCache(settings.SETTINGS_CACHE_TTL_SECONDS)
+
+
+async def get_team_tables(db: AsyncSession, team_id: int) -> TeamSettings:
+    """Active compiled settings of a team (cached)."""
+    return await settings_cache.get(db, team_id)
+
+
+async def save_team_settings(
+    db: AsyncSession,
+    team_id: int,
+    tables: ScoringTables,
+    created_by: int | None = None,
+    expected_version: int | None = None,
+    before_commit: Callable[[AsyncSession], Awaitable[None]] | None = None
+) -> TeamSettings:
+    """
+    Store tables as the team's next settings version and commit.
+
+    The new version (latest + 1) is computed inside a single INSERT ... SELECT;
+    with expected_version the row is only inserted if that is still the
+    latest version. Concurrent saves computing the same version are rejected
+    by the unique (team_id, version) constraint. before_commit runs in the
+    same transaction after the insert (e.g. flagging dependent assignments
+    stale), so either both or neither are committed.
+
+    Raises:
+        SettingsConflict: If expected_version is not the latest or another
+            version was saved concurrently
+    """
+    latest = (
+        select(func.coalesce(func.max(AlgorithmSettings.version), 0))
+        .where(AlgorithmSettings.team_id == team_id)
+        .scalar_subquery()
+    )
+    source = select(
+        literal(team_id),
+        latest + 1,
+        literal(tables.role_requirements, JSON),
+        literal(tables.meeting_multipliers, JSON),
+        literal(list(tables.history_penalties), JSON),
+        literal(created_by, Integer),
+    )
+    if expected_version is not None:
+        source = source.where(latest == expected_version)
+    stmt = (
+        insert(AlgorithmSettings)
+        .from_select(
+            ["team_id", "version", "role_requirements", "meeting_multipliers", "history_penalties", "created_by"],
+            source
+        )
+        .returning(AlgorithmSettings.version)
+    )
+    try:
+        new_version = (await db.execute(stmt)).scalar_one_or_none()
+    except IntegrityError as e:
+        await db.rollback()
+        raise SettingsConflict("Settings were changed concurrently") from e
+    if new_version is None:
+        await db.rollback()
+        raise SettingsConflict(f"Settings version {expected_version} is not the latest")
+    if before_commit is not None:
+        await before_commit(db)
+    await db.commit()
+
+    team_settings = _compile(team_id, new_version, tables)
+    settings_cache.put(team_settings)
+    return team_settings
+
+
+async def list_versions(db: AsyncSession, team_id: int) -> list[AlgorithmSettings]:
+    """All stored versions of a team, newest first."""
+    result = await db.execute(
+        select(AlgorithmSettings)
+        .where(AlgorithmSettings.team_id == team_id)
+        .order_by(AlgorithmSettings.version.desc())
+    )
+    return list(result.scalars().all())
@@ -0,0 +1,42 @@
+"""Single-flight helper - concurrent callers with the same key share one in-flight computation."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent async calls per key (per process).
+
+    The first caller starts the computation as a task; callers arriving while
+    it runs await the same task. The task is shielded, so a caller that is
+    cancelled (e.g. client disconnect) does not cancel it for the others.
+    Results are not cached: once the task finishes the next call starts anew.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Task] = {}
+
+    def start(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """Task of the call in flight for key, starting fn() if there is none (not awaited)."""
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.create_task(fn())
+            self._calls[key] = task
+
+            def _forget(finished: asyncio.Task) -> None:
+                if self._calls.get(key) is finished:
+                    del self._calls[key]
+
+            task.add_done_callback(_forget)
+        return task
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fn() unless a call with the same key is already in flight.
+
+        fn must not depend on the caller's request-scoped resources (such as
+        its DB session), since other callers share the result.
+        """
+        return await asyncio.shield(self.start(key, fn))
@@ -0,0 +1,161 @@
+"""Slot finder service - ranks candidate meeting times by projected energy and role fitness."""
+
+import heapq
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from app.services.energy_calculator import calculate_energy
+from app.services.fitness import (
+    DEFAULT_TABLES,
+    ScoringTables,
+    get_meeting_multiplier,
+    greedy_assignment,
+    history_penalty_from_roles,
+)
+from app.services.role_matcher import calculate_parameter_fit
+
+# Hard cap on evaluated slots per request (a month in 15-minute steps)
+MAX_SLOTS = 31 * 24 * 4
+
+
+@dataclass(frozen=True)
+class SlotScore:
+    """Projected outcome of holding the meeting at one candidate time."""
+
+    scheduled_time: datetime
+    total_fitness: float
+    average_energy: float
+    assigned_roles: int
+
+
+def candidate_slots(window_start: datetime, window_end: datetime, slot_minutes: int) -> list[datetime]:
+    """
+    Generate slot start times in [window_start, window_end) with a fixed step.
+
+    Raises:
+        ValueError: If the window yields more than MAX_SLOTS slots
+    """
+    step = timedelta(minutes=slot_minutes)
+    count = int((window_end - window_start) / step)
+    if count > MAX_SLOTS:
+        raise ValueError(f"Window contains {count} slots, maximum is {MAX_SLOTS}")
+    return [window_start + step * index for index in range(count)]
+
+
+def _energy_key(slot: datetime) -> int:
+    """
+    Hour the engine will see for this slot.
+
+    Meetings are stored as timestamptz and read back in UTC, so assign_roles
+    evaluates energy at the UTC hour; aware slots are normalized the same way.
+    """
+    if slot.tzinfo is not None:
+        slot = slot.astimezone(timezone.utc)
+    return slot.hour
+
+
+def find_best_slots(
+    participants: list,
+    meeting_type: str,
+    slots: list[datetime],
+    history: dict[int, list[str]],
+    top_k: int = 5,
+    tables: ScoringTables = DEFAULT_TABLES
+) -> list[SlotScore]:
+    """
+    Evaluate every candidate slot and return the top-k.
+
+    Energy depends only on the hour of the meeting, so the fitness matrix and
+    greedy assignment are computed once per distinct hour (at most 24 times,
+    however fine the slot grid) and shared by all slots in that hour. The
+    EI/SI fit and history penalty do not depend on time at all and are
+    precomputed once per (participant, role); scores are identical to
+    fitness.score_participant.
+
+    Ranking: best achievable total role fitness, then average energy, then the
+    earliest time.
+
+    Args:
+        participants: Participant models or profiles
+        meeting_type: Type of meeting
+        slots: Candidate start times
+        history: participant_id -> roles, most recent first (Validator 1 input)
+        top_k: Number of slots to return
+        tables: Scoring tables to use
+
+    Returns:
+        Up to top_k SlotScore entries, best first
+    """
+    roles = tables.roles
+    multipliers = [get_meeting_multiplier(meeting_type, role, tables.meeting_multipliers) for role in roles]
+
+    # Hour-independent part of the score, precomputed once per (participant, role):
+    # EI fit + SI fit and the Validator 1 penalty (None = excluded)
+    static_rows = []
+    for participant in participants:
+        recent_roles = history.get(participant.id, [])
+        row = []
+        for role in roles:
+            requirements = tables.role_requirements[role]
+            penalty = history_penalty_from_roles(recent_roles, role, tables.history_penalties)
+            static_fit = (
+                calculate_parameter_fit(participant.emotional_intelligence, requirements["ei_min"], requirements["ei_max"])
+                + calculate_parameter_fit(participant.social_intelligence, requirements["si_min"], requirements["si_max"])
+            )
+            row.append(None if penalty == "EXCLUDE" else (static_fit, 1 - penalty))
+        static_rows.append(row)
+
+    # Energy fit only depends on (role, energy level)
+    energy_fit_cache = {}
+
+    def _energy_fit(role_index: int, energy: int) -> float:
+        key = (role_index, energy)
+        if key not in energy_fit_cache:
+            requirements = tables.role_requirements[roles[role_index]]
+            energy_fit_cache[key] = calculate_parameter_fit(
+                energy, requirements["energy_min"], requirements["energy_max"]
+            )
+        return energy_fit_cache[key]
+
+    by_hour = {}
+    for slot in slots:
+        hour = _energy_key(slot)
+        if hour in by_hour:
+            continue
+
+        reference_time = slot.astimezone(timezone.utc) if slot.tzinfo is not None else slot
+        fitness_matrix = {}
+        total_energy = 0
+        for participant, row in zip(participants, static_rows):
+            energy = calculate_energy(participant, reference_time)
+            total_energy += energy
+            for role_index, static in enumerate(row):
+                if static is None:
+                    continue
+                static_fit, history_factor = static
+                base_score = (static_fit + _energy_fit(role_index, energy)) / 3 * 100
+                fitness_matrix[(participant.id, roles[role_index])] = (
+                    base_score * history_factor * multipliers[role_index]
+                )
+
+        assignments = greedy_assignment(fitness_matrix, participants, roles)
+        by_hour[hour] = (
+            sum(assignment["score"] for assignment in assignments),
+            total_energy / len(participants) if participants else 0.0,
+            len(assignments),
+        )
+
+    best = heapq.nsmallest(
+        top_k,
+        slots,
+        key=lambda slot: (-by_hour[_energy_key(slot)][0], -by_hour[_energy_key(slot)][1], slot)
+    )
+    return [
+        SlotScore(
+            scheduled_time=slot,
+            total_fitness=round(by_hour[_energy_key(slot)][0], 2),
+            average_energy=round(by_hour[_energy_key(slot)][1], 2),
+            assigned_roles=by_hour[_energy_key(slot)][2],
+        )
+        for slot in best
+    ]
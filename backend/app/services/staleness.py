@@ -0,0 +1,208 @@
+"""Staleness service - input fingerprints and stale flags of stored assignments.
+
+A meeting's assignment is computed from its type, the hour it is scheduled
+at, its participants' EI/SI and peak hours, and the team's settings
+version. When an assignment is written, those inputs are hashed into the
+meeting's assignment_fingerprint. Writes to any of the inputs flag the
+dependent meetings with one UPDATE (assignments_stale).
+
+The next read of a flagged meeting's assignments recomputes it lazily,
+unless its inputs hash to the stored fingerprint again (a value changed
+and back). In that case only the flag is cleared.
+
+Clearing the flag is a compare-and-set: every stale-mark also increments
+the meeting's stale_seq, writers read stale_seq together with the inputs
+they compute from, and the flag is only cleared if stale_seq is unchanged.
+A mark committed while an assignment was computed keeps the flag set.
+
+Role history is not part of the fingerprint. It changes with every
+assignment, and batch recomputes (recompute_assignments jobs) carry it
+forward.
+"""
+
+import hashlib
+import json
+from collections.abc import Iterable
+from datetime import datetime, timezone
+
+from sqlalchemy import Integer, String, bindparam, case, exists, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.meeting import Meeting, meeting_participants
+from app.models.participant import Participant
+from app.models.role_assignment import RoleAssignment
+from app.services.fitness import ParticipantProfile
+from app.services.settings_store import get_team_tables
+
+
+def assignment_fingerprint(
+    meeting_type: str,
+    scheduled_time: datetime,
+    participants: Iterable[ParticipantProfile],
+    settings_version: int,
+    history: dict[int, list[str]] | None = None
+) -> str:
+    """
+    Hash of the inputs a meeting's assignment is computed from.
+
+    Role history is only included when given (assignment drafts, which must
+    match a fresh computation exactly).
+    """
+    payload = [
+        settings_version,
+        meeting_type,
+        scheduled_time.hour,  # energy depends on the hour only
+        sorted(
+            [p.id, p.emotional_intelligence, p.social_intelligence, p.peak_hours_start, p.peak_hours_end]
+            for p in participants
+        ),
+    ]
+    if history is not None:
+        payload.append(sorted([participant_id, roles] for participant_id, roles in history.items()))
+    return hashlib.sha1(json.dumps(payload).encode()).hexdigest()
+
+
+async def record_fingerprints(db: AsyncSession, fingerprints: dict[int, tuple[str, int]]) -> None:
+    """
+    Store fingerprints of freshly written assignments and clear their stale flags (one executemany UPDATE).
+
+    Args:
+        db: Database session
+        fingerprints: meeting_id -> (fingerprint, stale_seq read together with
+            the inputs); the flag stays set if the meeting was marked since
+    """
+    if not fingerprints:
+        return
+    table = Meeting.__table__
+    await db.execute(
+        update(table)
+        .where(table.c.id == bindparam("b_id"))
+        .values(
+            assignment_fingerprint=bindparam("b_fingerprint", type_=String),
+            assignments_stale=case(
+                (table.c.stale_seq == bindparam("b_seq", type_=Integer), False),
+                else_=table.c.assignments_stale
+            )
+        ),
+        [
+            {"b_id": meeting_id, "b_fingerprint": fingerprint, "b_seq": seq}
+            for meeting_id, (fingerprint, seq) in fingerprints.items()
+        ]
+    )
+
+
+def _assigned():
+    return exists().where(RoleAssignment.meeting_id == Meeting.id)
+
+
+async def mark_meetings_stale(db: AsyncSession, meeting_ids: list[int]) -> None:
+    """Flag the assignments of the given meetings as stale (meetings without assignments are skipped)."""
+    if not meeting_ids:
+        return
+    await db.execute(
+        update(Meeting)
+        .where(Meeting.id.in_(meeting_ids), _assigned())
+        .values(assignments_stale=True, stale_seq=Meeting.stale_seq + 1)
+    )
+
+
+async def mark_participants_stale(
+    db: AsyncSession,
+    participant_ids: list[int],
+    since: datetime | None = None
+) -> None:
+    """Flag the upcoming assigned meetings attended by any of the participants (one UPDATE)."""
+    if not participant_ids:
+        return
+    await db.execute(
+        update(Meeting)
+        .where(
+            Meeting.scheduled_time >= (since or datetime.now(timezone.utc)),
+            exists().where(
+                meeting_participants.c.meeting_id == Meeting.id,
+                meeting_participants.c.participant_id.in_(participant_ids)
+            ),
+            _assigned()
+        )
+        .values(assignments_stale=True, stale_seq=Meeting.stale_seq + 1)
+    )
+
+
+async def mark_team_stale(db: AsyncSession, team_id: int, since: datetime | None = None) -> None:
+    """Flag all upcoming assigned meetings of a team (after a settings change)."""
+    await db.execute(
+        update(Meeting)
+        .where(
+            Meeting.team_id == team_id,
+            Meeting.scheduled_time >= (since or datetime.now(timezone.utc)),
+            _assigned()
+        )
+        .values(assignments_stale=True, stale_seq=Meeting.stale_seq + 1)
+    )
+
+
+async def list_stale_meetings(db: AsyncSession, team_id: int) -> list[Meeting]:
+    """Meetings of a team whose stored assignments are flagged stale, chronological."""
+    result = await db.execute(
+        select(Meeting)
+        .where(Meeting.team_id == team_id, Meeting.assignments_stale.is_(True))
+        .order_by(Meeting.scheduled_time, Meeting.id)
+    )
+    return list(result.scalars().all())
+
+
+async def load_member_profiles(db: AsyncSession, meeting_ids: list[int]) -> dict[int, list[ParticipantProfile]]:
+    """Participant profiles of many meetings with one query: meeting_id -> profiles."""
+    members = {meeting_id: [] for meeting_id in meeting_ids}
+    if not meeting_ids:
+        return members
+    result = await db.execute(
+        select(meeting_participants.c.meeting_id, Participant)
+        .join(Participant, Participant.id == meeting_participants.c.participant_id)
+        .where(meeting_participants.c.meeting_id.in_(meeting_ids))
+    )
+    for meeting_id, participant in result.all():
+        members[meeting_id].append(ParticipantProfile.from_model(participant))
+    return members
+
+
+async def resolve_stale(db: AsyncSession, meeting_ids: list[int]) -> list[int]:
+    """
+    Check which of the given meetings really need a recompute before their assignments are read.
+
+    Flagged meetings whose current inputs hash to the stored fingerprint (or
+    that have no participants left to assign) get their flag cleared and
+    commit; meetings that are not flagged are never returned.
+
+    Returns:
+        IDs of flagged meetings whose inputs changed, chronological
+    """
+    if not meeting_ids:
+        return []
+    result = await db.execute(
+        select(
+            Meeting.id, Meeting.team_id, Meeting.meeting_type, Meeting.scheduled_time,
+            Meeting.assignment_fingerprint, Meeting.stale_seq
+        )
+        .where(Meeting.id.in_(meeting_ids), Meeting.assignments_stale.is_(True))
+        .order_by(Meeting.scheduled_time, Meeting.id)
+    )
+    flagged = result.all()
+    if not flagged:
+        return []
+
+    members = await load_member_profiles(db, [row.id for row in flagged])
+    unchanged = {}
+    changed = []
+    for row in flagged:
+        team_settings = await get_team_tables(db, row.team_id)
+        fingerprint = assignment_fingerprint(row.meeting_type, row.scheduled_time, members[row.id], team_settings.version)
+        if fingerprint == row.assignment_fingerprint or not members[row.id]:
+            unchanged[row.id] = (fingerprint, row.stale_seq)
+        else:
+            changed.append(row.id)
+
+    if unchanged:
+        await record_fingerprints(db, unchanged)
+        await db.commit()
+    return changed
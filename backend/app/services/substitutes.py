@@ -0,0 +1,52 @@
+"""Substitutes service - best replacement candidates per role without re-running the assignment."""
+
+import heapq
+from datetime import datetime
+
+from app.services.fitness import DEFAULT_TABLES, FitnessBreakdown, ScoringTables, score_participant
+
+
+def top_k_per_role(
+    participants: list,
+    meeting_type: str,
+    meeting_time: datetime,
+    history: dict[int, list[str]],
+    k: int,
+    tables: ScoringTables = DEFAULT_TABLES,
+    exclude: dict[str, int] | None = None
+) -> dict[str, list[FitnessBreakdown]]:
+    """
+    Get the k best candidates for every role.
+
+    Uses the same per-pair scoring as assign_roles and selects with a bounded
+    heap (heapq.nsmallest), so the cost is O(n log k) per role instead of a full sort.
+    Ties are broken by participant name, as in greedy_assignment.
+
+    Args:
+        participants: Candidate participant models or profiles
+        meeting_type: Type of meeting
+        meeting_time: Scheduled meeting datetime
+        history: participant_id -> roles, most recent first (Validator 1 input)
+        k: Number of candidates per role
+        tables: Scoring tables to use
+        exclude: role -> participant_id to leave out (e.g. the current holder)
+
+    Returns:
+        Dict mapping role -> up to k breakdowns, best first
+    """
+    exclude = exclude or {}
+    names = {participant.id: participant.name for participant in participants}
+    pools = {role: [] for role in tables.roles}
+
+    for participant in participants:
+        for breakdown in score_participant(
+            participant, meeting_type, meeting_time, history.get(participant.id, []), tables
+        ):
+            if exclude.get(breakdown.role) == participant.id:
+                continue
+            pools[breakdown.role].append(breakdown)
+
+    return {
+        role: heapq.nsmallest(k, candidates, key=lambda item: (-item.score, names.get(item.participant_id, "")))
+        for role, candidates in pools.items()
+    }
@@ -0,0 +1,170 @@
+"""Team recommender service - picks the invitee subset that maximises assigned role fitness."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from app.services.fitness import DEFAULT_TABLES, ScoringTables, greedy_assignment, score_participant
+
+# Maximum number of search nodes expanded before returning the best solution found
+NODE_BUDGET = 200_000
+
+
+@dataclass
+class Recommendation:
+    """Result of the composition search."""
+
+    assignments: list[dict] = field(default_factory=list)  # participant_id, role, score
+    reserves: list[int] = field(default_factory=list)
+    total_fitness: float = 0.0
+    search_fitness: float = 0.0
+    optimal: bool = True
+    nodes_expanded: int = 0
+
+
+def recommend_participants(
+    participants: list,
+    meeting_type: str,
+    meeting_time: datetime,
+    history: dict[int, list[str]],
+    max_participants: int,
+    tables: ScoringTables = DEFAULT_TABLES,
+    node_budget: int = NODE_BUDGET
+) -> Recommendation:
+    """
+    Choose which participants to invite so the assigned role fitness is maximal.
+
+    Each participant takes at most one role, so the best subset is a
+    maximum-weight matching between roles and participants with at most
+    `max_participants` matched. Search is branch-and-bound over roles:
+
+    1. Per-role fitness vectors are computed once (same scoring as assign_roles).
+    2. Each role keeps only its top-N candidates, N = number of roles: a lower
+       ranked candidate can always be replaced by an unused one from the top-N,
+       so pruning never loses the optimum and the search space is independent
+       of team size.
+    3. Upper bound = current total + best scores of the remaining roles that
+       still fit in the capacity; branches that cannot beat the incumbent
+       (seeded with the greedy solution) are cut.
+
+    If the node budget is exhausted the best solution found is returned with
+    optimal=False. Remaining invite slots are filled with reserves ranked by
+    their best single-role score.
+
+    assign_roles distributes roles greedily, which can differ from the
+    search's mapping, so the reported assignments are the greedy assignment
+    of the final invite list (what assign-roles will produce for the same
+    inputs); search_fitness is the total of the search's mapping.
+
+    Args:
+        participants: Candidate participant models or profiles
+        meeting_type: Type of meeting
+        meeting_time: Planned meeting datetime
+        history: participant_id -> roles, most recent first (Validator 1 input)
+        max_participants: Size limit of the invite list
+        tables: Scoring tables to use
+        node_budget: Maximum number of search nodes
+
+    Returns:
+        Recommendation with the greedy role assignment of the invite list,
+        reserves (invitees without a role) and search statistics
+    """
+    roles = tables.roles
+    names = {participant.id: participant.name for participant in participants}
+
+    fitness_matrix = {}
+    best_single = {}
+    for participant in participants:
+        for breakdown in score_participant(
+            participant, meeting_type, meeting_time, history.get(participant.id, []), tables
+        ):
+            fitness_matrix[(participant.id, breakdown.role)] = breakdown.score
+            best_single[participant.id] = max(best_single.get(participant.id, 0.0), breakdown.score)
+
+    # Per-role candidate lists: best first, ties by name, pruned to top-N
+    candidates = {role: [] for role in roles}
+    for (participant_id, role), score in fitness_matrix.items():
+        candidates[role].append((score, participant_id))
+    for role in roles:
+        candidates[role].sort(key=lambda item: (-item[0], names.get(item[1], "")))
+        del candidates[role][len(roles):]
+
+    # Branch on the most valuable roles first; roles without candidates are skipped
+    search_roles = sorted(
+        (role for role in roles if candidates[role]),
+        key=lambda role: -candidates[role][0][0]
+    )
+    capacity = min(max_participants, len(search_roles))
+
+    # suffix_best[i] = best scores of roles[i:], descending, for the capacity-aware bound
+    suffix_best = [
+        sorted((candidates[role][0][0] for role in search_roles[index:]), reverse=True)
+        for index in range(len(search_roles) + 1)
+    ]
+
+    # Incumbent: greedy solution truncated to capacity (a feasible lower bound)
+    greedy = greedy_assignment(fitness_matrix, participants, roles)[:capacity]
+    best_total = sum(assignment["score"] for assignment in greedy)
+    best_choice = [(assignment["role"], assignment["participant_id"], assignment["score"]) for assignment in greedy]
+
+    nodes = 0
+    budget_exhausted = False
+    chosen = []
+    used = set()
+
+    def _search(index: int, total: float, remaining: int) -> None:
+        nonlocal nodes, best_total, best_choice, budget_exhausted
+        nodes += 1
+        if nodes > node_budget:
+            budget_exhausted = True
+            return
+
+        if total > best_total:
+            best_total = total
+            best_choice = list(chosen)
+        if index == len(search_roles) or remaining == 0:
+            return
+        if total + sum(suffix_best[index][:remaining]) <= best_total:
+            return
+
+        role = search_roles[index]
+        for score, participant_id in candidates[role]:
+            if participant_id in used:
+                continue
+            used.add(participant_id)
+            chosen.append((role, participant_id, score))
+            _search(index + 1, total + score, remaining - 1)
+            chosen.pop()
+            used.discard(participant_id)
+            if budget_exhausted:
+                return
+
+        # Leave this role unfilled
+        _search(index + 1, total, remaining)
+
+    if capacity > 0:
+        _search(0, 0.0, capacity)
+
+    selected = [participant_id for _, participant_id, _ in sorted(best_choice, key=lambda item: roles.index(item[0]))]
+    extra = sorted(
+        (participant.id for participant in participants if participant.id not in set(selected)),
+        key=lambda participant_id: (-best_single.get(participant_id, 0.0), names.get(participant_id, ""))
+    )[:max(0, max_participants - len(selected))]
+
+    # Score the invite list the way assign_roles will
+    invited = set(selected) | set(extra)
+    assignments = greedy_assignment(
+        {key: score for key, score in fitness_matrix.items() if key[0] in invited},
+        [participant for participant in participants if participant.id in invited],
+        roles
+    )
+    assignments.sort(key=lambda assignment: roles.index(assignment["role"]))
+    assigned = {assignment["participant_id"] for assignment in assignments}
+
+    return Recommendation(
+        assignments=assignments,
+        reserves=[participant_id for participant_id in selected + extra if participant_id not in assigned],
+        total_fitness=sum(assignment["score"] for assignment in assignments),
+        search_fitness=best_total,
+        optimal=not budget_exhausted,
+        nodes_expanded=nodes,
+    )
@@ -0,0 +1,106 @@
+"""Benchmark: latency of other endpoints while a large assignment is being scored.
+
+Runs the scoring core on a large synthetic pool twice - inline on the event
+loop and offloaded to the compute pool - while a client keeps calling the
+health endpoint of the same app in the same event loop. No database needed.
+
+Usage:
+    uv run python benchmark_offload.py [--participants 5000] [--runs 5]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timezone
+
+import httpx
+
+from app.main import app
+from app.services.compute_pool import available_cores, run_cpu_bound, shutdown_executor
+from app.services.fitness import ParticipantProfile, compute_assignment
+
+
+def make_profiles(count: int, seed: int = 42) -> list[ParticipantProfile]:
+    rng = random.Random(seed)
+    return [
+        ParticipantProfile(
+            id=index,
+            name=f"Participant {index:05d}",
+            peak_hours_start=rng.randint(0, 23),
+            peak_hours_end=rng.randint(0, 23),
+            emotional_intelligence=rng.randint(0, 100),
+            social_intelligence=rng.randint(0, 100),
+        )
+        for index in range(count)
+    ]
+
+
+async def probe(client: httpx.AsyncClient, stop: asyncio.Event, latencies: list[float]) -> None:
+    """Call the health endpoint back to back and record each round trip."""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await client.get("/")
+        latencies.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(0.005)
+
+
+async def measure(profiles: list[ParticipantProfile], runs: int, offload: bool) -> tuple[list[float], float]:
+    latencies = []
+    stop = asyncio.Event()
+    meeting_time = datetime(2026, 1, 1, 10, tzinfo=timezone.utc)
+    threshold = 0 if offload else len(profiles) + 1
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        probe_task = asyncio.create_task(probe(client, stop, latencies))
+        await asyncio.sleep(0.1)
+
+        started = time.perf_counter()
+        for _ in range(runs):
+            await run_cpu_bound(
+                compute_assignment, profiles, "review", meeting_time, {},
+                size=len(profiles), threshold=threshold
+            )
+        elapsed = time.perf_counter() - started
+
+        stop.set()
+        await probe_task
+    return latencies, elapsed
+
+
+def summarize(label: str, latencies: list[float], elapsed: float, runs: int) -> None:
+    ordered = sorted(latencies)
+    p50 = statistics.median(ordered)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"{label:<10} runs/s={runs / elapsed:6.2f}  health calls={len(ordered):5d}  "
+        f"p50={p50:7.2f} ms  p99={p99:7.2f} ms  max={ordered[-1]:7.2f} ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--participants", type=int, default=5000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    profiles = make_profiles(args.participants)
+    print(f"{args.participants} participants, {args.runs} runs, {available_cores()} cores\n")
+
+    # Warm up the pool so process start-up is not measured
+    await run_cpu_bound(
+        compute_assignment, profiles[:10], "review", datetime.now(timezone.utc), {},
+        size=1, threshold=0
+    )
+
+    for label, offload in (("inline", False), ("offloaded", True)):
+        latencies, elapsed = await measure(profiles, args.runs, offload)
+        summarize(label, latencies, elapsed, args.runs)
+
+    shutdown_executor()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,64 @@
+"""Nightly batch: assign roles for every team's meetings of the next day.
+
+Teams are processed in parallel, one team per process-pool task (see
+app/services/batch_assignment.py).
+
+Usage:
+    uv run python nightly_assign.py [--date 2026-01-31] [--workers 4] [--team 1 --team 2] [--dry-run]
+"""
+
+import argparse
+import sys
+from datetime import date, datetime, time, timedelta, timezone
+
+from app.services.batch_assignment import TeamRunResult, run_batch
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Assign next-day roles for all teams in parallel")
+    parser.add_argument("--date", type=date.fromisoformat, help="Day to assign (UTC), defaults to tomorrow")
+    parser.add_argument("--workers", type=int, help="Worker processes, defaults to available cores")
+    parser.add_argument("--team", type=int, action="append", dest="teams", help="Restrict to team ID (repeatable)")
+    parser.add_argument("--dry-run", action="store_true", help="Compute without writing")
+    return parser.parse_args()
+
+
+def print_progress(result: TeamRunResult, done: int, total: int) -> None:
+    if result.error is not None:
+        print(f"  [{done}/{total}] team {result.team_id}: failed - {result.error}")
+        return
+    print(
+        f"  [{done}/{total}] team {result.team_id}: {result.meetings} meetings, "
+        f"{result.assignments} roles in {result.seconds:.2f}s (worker {result.worker})"
+    )
+
+
+def main() -> int:
+    args = parse_args()
+    day = args.date or (datetime.now(timezone.utc) + timedelta(days=1)).date()
+    start = datetime.combine(day, time.min, tzinfo=timezone.utc)
+    end = start + timedelta(days=1)
+
+    print(f"Assigning meetings on {day.isoformat()}{' (dry run)' if args.dry_run else ''}...")
+    report = run_batch(start, end, args.teams, args.workers, args.dry_run, on_team_done=print_progress)
+
+    print("\nThroughput per worker:")
+    for worker in report.workers:
+        print(
+            f"  worker {worker.worker}: {worker.teams} teams, {worker.meetings} meetings "
+            f"in {worker.busy_seconds:.2f}s ({worker.meetings_per_second:.1f} meetings/s)"
+        )
+    print(
+        f"\n✓ {len(report.teams) - len(report.failed)} teams, {report.meetings} meetings, {report.assignments} roles "
+        f"in {report.wall_seconds:.2f}s ({report.meetings_per_second:.1f} meetings/s)"
+    )
+    if report.failed:
+        print(f"\n✗ {len(report.failed)} teams failed:", file=sys.stderr)
+        for team in report.failed:
+            print(f"  team {team.team_id}: {team.error}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
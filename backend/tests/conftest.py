@@ -0,0 +1,73 @@
+"""Shared fixtures.
+
+Database tests run against the Postgres database in TEST_DATABASE_URL (its
+tables are created and truncated by the tests) and are skipped without it.
+"""
+
+import asyncio
+import os
+
+import pytest
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+if TEST_DATABASE_URL:
+    # Before app.database creates its engine
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+
+
+@pytest.fixture
+def run_db():
+    """
+    Run an async scenario against the test database, emptied before the first call of a test.
+
+    Every call runs on a fresh event loop, so the engine's connections are
+    disposed afterwards (asyncpg connections belong to the loop that opened them).
+    IDs are not restarted: per-team state cached in the process (responses,
+    settings) never matches a team of a later test.
+    """
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+
+    import app.models  # noqa: F401 - registers the tables on Base.metadata
+    from sqlalchemy import text
+
+    from app.database import Base, engine
+
+    emptied = False
+
+    def run(scenario):
+        async def main():
+            nonlocal emptied
+            try:
+                if not emptied:
+                    async with engine.begin() as conn:
+                        await conn.run_sync(Base.metadata.create_all)
+                        tables = ", ".join(table.name for table in Base.metadata.sorted_tables)
+                        await conn.execute(text(f"TRUNCATE {tables} CASCADE"))
+                    emptied = True
+                return await scenario()
+            finally:
+                await engine.dispose()
+
+        return asyncio.run(main())
+
+    return run
+
+
+
+@pytest.fixture
+def run_api(run_db):
+    """Run an async scenario with an HTTP client of the app, its background services started."""
+    from httpx import ASGITransport, AsyncClient
+
+    from app.main import app, lifespan
+
+    def run(scenario):
+        async def main():
+            async with lifespan(app):
+                async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                    return await scenario(client)
+
+        return run_db(main)
+
+    return run
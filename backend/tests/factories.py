@@ -0,0 +1,60 @@
+"""Row factories for the database tests (see conftest.run_db)."""
+
+from datetime import datetime
+
+from app.models.meeting import Meeting, meeting_participants
+from app.models.participant import Participant
+from app.models.team import Team
+from app.models.user import User
+from app.services.auth_service import create_access_token
+
+
+async def create_team(db, name: str = "Team") -> int:
+    """Insert a team and return its ID."""
+    team = Team(name=name)
+    db.add(team)
+    await db.flush()
+    return team.id
+
+
+async def create_participant(db, team_id: int, email: str, **fields) -> int:
+    """Insert a participant with neutral defaults and return its ID."""
+    participant = Participant(**{
+        "name": email.split("@")[0],
+        "email": email,
+        "team_id": team_id,
+        "chronotype": "intermediate",
+        "peak_hours_start": 9,
+        "peak_hours_end": 17,
+        "emotional_intelligence": 50,
+        "social_intelligence": 50,
+        **fields,
+    })
+    db.add(participant)
+    await db.flush()
+    return participant.id
+
+
+async def create_user(db, team_id: int, email: str) -> dict[str, str]:
+    """Insert a team lead and return the Authorization header of its token."""
+    db.add(User(email=email, password="secret", full_name=email.split("@")[0], team_id=team_id))
+    await db.flush()
+    return {"Authorization": f"Bearer {create_access_token({'sub': email})}"}
+
+
+async def create_meeting(
+    db,
+    team_id: int,
+    scheduled_time: datetime,
+    participant_ids: list[int] | None = None,
+    meeting_type: str = "review"
+) -> int:
+    """Insert a meeting with the given members and return its ID."""
+    meeting = Meeting(title=meeting_type, meeting_type=meeting_type, scheduled_time=scheduled_time, team_id=team_id)
+    db.add(meeting)
+    await db.flush()
+    if participant_ids:
+        await db.execute(meeting_participants.insert(), [
+            {"meeting_id": meeting.id, "participant_id": participant_id} for participant_id in participant_ids
+        ])
+    return meeting.id
@@ -0,0 +1,120 @@
+"""Process-pool batch assignment across teams."""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, text
+
+from app.database import AsyncSessionLocal
+from app.models.role_assignment import RoleAssignment
+from app.models.team import Team
+from app.services.batch_assignment import run_batch
+from tests.factories import create_meeting, create_participant, create_team
+
+DAY = datetime(2026, 10, 20, tzinfo=timezone.utc)
+
+
+async def _teams(sizes: list[int]) -> list[int]:
+    """Teams of the given sizes, each with meetings at 9, 10 and 11 on DAY and one two days later."""
+    team_ids = []
+    async with AsyncSessionLocal() as db:
+        for team_index, size in enumerate(sizes):
+            team_id = await create_team(db, f"Team {team_index}")
+            participant_ids = [
+                await create_participant(db, team_id, f"t{team_index}-p{index}@example.com") for index in range(size)
+            ]
+            for hour in (9, 10, 11):
+                await create_meeting(db, team_id, DAY + timedelta(hours=hour), participant_ids)
+            await create_meeting(db, team_id, DAY + timedelta(days=2), participant_ids)
+            team_ids.append(team_id)
+        await db.commit()
+    return team_ids
+
+
+async def _stored() -> dict[int, set[tuple[int, str]]]:
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(RoleAssignment.meeting_id, RoleAssignment.participant_id, RoleAssignment.role))
+        stored: dict[int, set[tuple[int, str]]] = {}
+        for meeting_id, participant_id, role in result.all():
+            stored.setdefault(meeting_id, set()).add((participant_id, role))
+        return stored
+
+
+async def _data_versions(team_ids: list[int]) -> list[int]:
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(Team.id, Team.data_version).where(Team.id.in_(team_ids)))
+        versions = dict(result.all())
+    return [versions[team_id] for team_id in team_ids]
+
+
+def test_batch_writes_what_a_dry_run_computes(run_db):
+    team_ids = run_db(lambda: _teams([8, 5, 9]))
+
+    preview = run_batch(DAY, DAY + timedelta(days=1), workers=2, dry_run=True, keep_results=True)
+    assert run_db(_stored) == {}
+
+    report = run_batch(DAY, DAY + timedelta(days=1), workers=2)
+    stored = run_db(_stored)
+
+    expected = {
+        meeting_id: {(assignment["participant_id"], assignment["role"]) for assignment in assignments}
+        for team in preview.teams
+        for meeting_id, assignments in team.results.items()
+    }
+    assert stored == expected
+    assert [team.team_id for team in report.teams] == sorted(team_ids)
+    assert report.failed == []
+    assert report.meetings == 9
+    assert sum(worker.teams for worker in report.workers) == 3
+    assert all(version > 0 for version in run_db(lambda: _data_versions(team_ids)))
+
+
+def test_batch_reports_a_failing_team_and_writes_the_others(run_db):
+    team_ids = run_db(lambda: _teams([8, 8]))
+
+    async def reject_team(team_id: int | None):
+        async with AsyncSessionLocal() as db:
+            if team_id is None:
+                await db.execute(text("DROP TRIGGER IF EXISTS reject_assignment ON role_assignments"))
+            else:
+                await db.execute(text(f"""
+                    CREATE OR REPLACE FUNCTION reject_assignment() RETURNS trigger AS $$
+                    BEGIN
+                        IF (SELECT team_id FROM meetings WHERE id = NEW.meeting_id) = {team_id} THEN
+                            RAISE EXCEPTION 'assignment rejected';
+                        END IF;
+                        RETURN NEW;
+                    END $$ LANGUAGE plpgsql
+                """))
+                await db.execute(text(
+                    "CREATE TRIGGER reject_assignment BEFORE INSERT ON role_assignments "
+                    "FOR EACH ROW EXECUTE FUNCTION reject_assignment()"
+                ))
+            await db.commit()
+
+    run_db(lambda: reject_team(team_ids[0]))
+    try:
+        report = run_batch(DAY, DAY + timedelta(days=1), workers=2)
+    finally:
+        run_db(lambda: reject_team(None))
+    stored = run_db(_stored)
+
+    assert [team.team_id for team in report.failed] == [team_ids[0]]
+    assert "assignment rejected" in report.failed[0].error
+    assert report.meetings == 3
+    assert sum(worker.teams for worker in report.workers) == 1
+    assert len(stored) == 3
+    assert run_db(lambda: _data_versions(team_ids)) == [0, 1]
+
+
+def test_only_unassigned_leaves_assigned_meetings_alone(run_db):
+    run_db(lambda: _teams([8]))
+    run_batch(DAY, DAY + timedelta(hours=10), workers=1)
+    first = run_db(_stored)
+
+    report = run_batch(DAY, DAY + timedelta(days=1), workers=1, only_unassigned=True)
+
+    assert len(first) == 1
+    assert report.meetings == 2
+    stored = run_db(_stored)
+    assert {meeting_id: stored[meeting_id] for meeting_id in first} == first
+    assert len(stored) == 3
@@ -0,0 +1,71 @@
+"""Batch-get endpoints for participants, meetings and assignments."""
+
+from datetime import datetime, timezone
+
+from app.database import AsyncSessionLocal
+from tests.factories import create_meeting, create_participant, create_team, create_user
+
+MEETING_TIME = datetime(2026, 10, 20, 10, tzinfo=timezone.utc)
+
+
+async def _team_with_meetings():
+    async with AsyncSessionLocal() as db:
+        team_id = await create_team(db)
+        other_team_id = await create_team(db, "Other")
+        headers = await create_user(db, team_id, "lead@example.com")
+        participant_ids = [await create_participant(db, team_id, f"p{index}@example.com") for index in range(8)]
+        foreign = await create_participant(db, other_team_id, "foreign@example.com")
+        assigned = await create_meeting(db, team_id, MEETING_TIME, participant_ids)
+        unassigned = await create_meeting(db, team_id, MEETING_TIME, participant_ids[:3])
+        foreign_meeting = await create_meeting(db, other_team_id, MEETING_TIME, [foreign])
+        await db.commit()
+    return headers, participant_ids, foreign, assigned, unassigned, foreign_meeting
+
+
+def test_batch_get_omits_ids_outside_the_team(run_api):
+    async def scenario(client):
+        headers, participant_ids, foreign, assigned, unassigned, foreign_meeting = await _team_with_meetings()
+        participants = await client.get(
+            "/api/participants/batch", params={"ids": [participant_ids[0], participant_ids[1], foreign, 999999]},
+            headers=headers
+        )
+        meetings = await client.get(
+            "/api/meetings/batch", params={"ids": [assigned, unassigned, foreign_meeting]}, headers=headers
+        )
+        return participant_ids, assigned, unassigned, participants, meetings
+
+    participant_ids, assigned, unassigned, participants, meetings = run_api(scenario)
+
+    assert participants.status_code == 200
+    assert sorted(participants.json()) == [str(participant_id) for participant_id in participant_ids[:2]]
+    assert meetings.status_code == 200
+    assert sorted(meetings.json()) == sorted([str(assigned), str(unassigned)])
+    assert len(meetings.json()[str(unassigned)]["participants"]) == 3
+
+
+def test_batch_assignments_list_every_team_meeting(run_api):
+    async def scenario(client):
+        headers, participant_ids, foreign, assigned, unassigned, foreign_meeting = await _team_with_meetings()
+        assign = await client.post(f"/api/meetings/{assigned}/assign-roles", headers=headers)
+        batch = await client.get(
+            "/api/meetings/assignments", params={"meeting_ids": [assigned, unassigned, foreign_meeting]},
+            headers=headers
+        )
+        return assigned, unassigned, assign, batch
+
+    assigned, unassigned, assign, batch = run_api(scenario)
+
+    assert assign.status_code == 200
+    body = batch.json()
+    assert sorted(body) == sorted([str(assigned), str(unassigned)])
+    assert body[str(unassigned)] == []
+    assert len(body[str(assigned)]) == 7
+    assert all(assignment["participant_name"] for assignment in body[str(assigned)])
+
+
+def test_batch_get_limits_the_number_of_ids(run_api):
+    async def scenario(client):
+        headers, *_ = await _team_with_meetings()
+        return await client.get("/api/participants/batch", params={"ids": list(range(1, 502))}, headers=headers)
+
+    assert run_api(scenario).status_code == 422
@@ -0,0 +1,78 @@
+"""Bulk EI/SI score updates of the testing module."""
+
+from sqlalchemy import select
+
+from app.database import AsyncSessionLocal
+from app.models.participant import Participant
+from tests.factories import create_participant, create_team
+
+
+async def _setup() -> list[int]:
+    async with AsyncSessionLocal() as db:
+        team_id = await create_team(db)
+        ids = [
+            await create_participant(
+                db, team_id, f"p{index}@example.com", emotional_intelligence=10, social_intelligence=20
+            )
+            for index in range(3)
+        ]
+        await db.commit()
+    return ids
+
+
+async def _scores(ids: list[int]) -> dict[int, tuple[int, int]]:
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(Participant.id, Participant.emotional_intelligence, Participant.social_intelligence)
+            .where(Participant.id.in_(ids))
+        )
+        return {participant_id: (ei, si) for participant_id, ei, si in result.all()}
+
+
+def test_omitted_scores_are_kept_and_later_entries_win(run_api):
+    async def scenario(client):
+        ids = await _setup()
+        response = await client.put("/api/testing/participants/scores", json={"updates": [
+            {"participant_id": ids[0], "ei_score": 80},
+            {"participant_id": ids[1], "si_score": 90},
+            {"participant_id": ids[0], "si_score": 70},
+            {"participant_id": ids[0], "ei_score": 85},
+        ]})
+        return ids, response, await _scores(ids)
+
+    ids, response, scores = run_api(scenario)
+
+    assert response.status_code == 200
+    assert sorted(participant["id"] for participant in response.json()) == ids[:2]
+    assert scores == {ids[0]: (85, 70), ids[1]: (10, 90), ids[2]: (10, 20)}
+
+
+def test_unknown_participants_reject_the_whole_update(run_api):
+    async def scenario(client):
+        ids = await _setup()
+        response = await client.put("/api/testing/participants/scores", json={"updates": [
+            {"participant_id": ids[0], "ei_score": 80},
+            {"participant_id": 999999, "ei_score": 80},
+        ]})
+        return ids, response, await _scores(ids)
+
+    ids, response, scores = run_api(scenario)
+
+    assert response.status_code == 404
+    assert "999999" in response.json()["detail"]
+    assert scores[ids[0]] == (10, 20)
+
+
+def test_entries_need_a_score_in_range(run_api):
+    async def scenario(client):
+        ids = await _setup()
+        return [
+            (await client.put("/api/testing/participants/scores", json=body)).status_code
+            for body in (
+                {"updates": []},
+                {"updates": [{"participant_id": ids[0]}]},
+                {"updates": [{"participant_id": ids[0], "ei_score": 101}]},
+            )
+        ]
+
+    assert run_api(scenario) == [422, 422, 422]
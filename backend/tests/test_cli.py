@@ -0,0 +1,60 @@
+"""Offline batch CLI."""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, update
+
+from app.cli import main, parse_moment
+from app.database import AsyncSessionLocal
+from app.models.role_assignment import RoleAssignment
+from tests.factories import create_meeting, create_participant, create_team
+
+DAY = datetime(2026, 10, 20, tzinfo=timezone.utc)
+WINDOW = ["--start", "2026-10-20", "--end", "2026-10-21", "--workers", "1"]
+
+
+async def _team() -> list[int]:
+    async with AsyncSessionLocal() as db:
+        team_id = await create_team(db)
+        participant_ids = [await create_participant(db, team_id, f"p{index}@example.com") for index in range(8)]
+        meeting_ids = [
+            await create_meeting(db, team_id, DAY + timedelta(hours=hour), participant_ids) for hour in (9, 11)
+        ]
+        await db.commit()
+    return meeting_ids
+
+
+async def _swap_roles(meeting_id: int) -> None:
+    """Exchange the roles of the first two assignees, so the stored assignment differs from a fresh one."""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(RoleAssignment).where(RoleAssignment.meeting_id == meeting_id).order_by(RoleAssignment.id).limit(2)
+        )
+        first, second = result.scalars().all()
+        roles = (first.role, second.role)
+        await db.execute(update(RoleAssignment).where(RoleAssignment.id == first.id).values(role=roles[1]))
+        await db.execute(update(RoleAssignment).where(RoleAssignment.id == second.id).values(role=roles[0]))
+        await db.commit()
+
+
+def test_parse_moment_defaults_to_utc():
+    assert parse_moment("2026-10-20") == DAY
+    assert parse_moment("2026-10-20T12:00:00+02:00") == DAY + timedelta(hours=10)
+
+
+def test_verify_detects_changed_assignments(run_db, capsys):
+    meeting_ids = run_db(_team)
+
+    assert main(["assign", "--dry-run", *WINDOW]) == 0
+    assert main(["verify", *WINDOW]) == 1  # nothing stored yet
+    assert main(["assign", *WINDOW]) == 0
+    capsys.readouterr()
+    assert main(["verify", *WINDOW]) == 0
+    assert "All 2 meetings match" in capsys.readouterr().out
+
+    run_db(lambda: _swap_roles(meeting_ids[1]))
+
+    assert main(["verify", *WINDOW]) == 1
+    assert f"meeting {meeting_ids[1]}:" in capsys.readouterr().out
+    assert main(["reassign", *WINDOW]) == 0
+    assert main(["verify", *WINDOW]) == 0
@@ -0,0 +1,58 @@
+"""Offloading CPU-heavy scoring to the compute pool."""
+
+import asyncio
+import os
+import random
+import threading
+from datetime import datetime
+
+from app.services.compute_pool import run_cpu_bound, shutdown_executor
+from app.services.fitness import DEFAULT_TABLES, CompiledTables, ParticipantProfile, compute_assignment
+
+MEETING_TIME = datetime(2026, 10, 19, 10)
+
+
+def _thread_id() -> int:
+    return threading.get_ident()
+
+
+def _profiles(count: int) -> list[ParticipantProfile]:
+    rng = random.Random(count)
+    return [
+        ParticipantProfile(
+            id=participant_id,
+            name=f"p{participant_id:03d}",
+            peak_hours_start=rng.randint(6, 12),
+            peak_hours_end=rng.randint(13, 20),
+            emotional_intelligence=rng.randint(0, 100),
+            social_intelligence=rng.randint(0, 100),
+        )
+        for participant_id in range(1, count + 1)
+    ]
+
+
+def test_small_inputs_run_inline():
+    async def scenario():
+        return await run_cpu_bound(_thread_id, size=1, threshold=2)
+
+    assert asyncio.run(scenario()) == threading.get_ident()
+
+
+def test_offloaded_scoring_matches_inline_scoring():
+    participants = _profiles(250)
+    args = (participants, "planning", MEETING_TIME, {}, CompiledTables(DEFAULT_TABLES))
+
+    async def scenario():
+        inline = await run_cpu_bound(compute_assignment, *args, size=len(participants), threshold=len(participants) + 1)
+        offloaded = await run_cpu_bound(compute_assignment, *args, size=len(participants), threshold=1)
+        worker = await run_cpu_bound(os.getpid, size=1, threshold=1)
+        return inline, offloaded, worker
+
+    try:
+        inline, offloaded, worker = asyncio.run(scenario())
+    finally:
+        shutdown_executor()
+
+    assert worker != os.getpid()
+    assert offloaded == inline
+    assert len(inline) == len(DEFAULT_TABLES.roles)
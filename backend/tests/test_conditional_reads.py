@@ -0,0 +1,97 @@
+"""ETags of cached reads derived from the team data version."""
+
+import asyncio
+
+from app.database import AsyncSessionLocal
+from app.routers.cache import data_etag, etag_matches
+from app.services.event_bus import PARTICIPANT_CHANGED, event_bus
+from app.services.response_cache import MEETINGS, PARTICIPANTS, ResponseCache, response_cache
+from tests.factories import create_participant, create_team, create_user
+
+
+def test_if_none_match_uses_weak_comparison():
+    etag = '"participants-1-3-abc"'
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"participants-1-4-abc"', etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches("", etag)
+
+
+def test_etags_change_with_version_arguments_and_period():
+    etag = data_etag(1, "assignments", (5,), 3)
+
+    assert data_etag(1, "assignments", (5,), 3) == etag
+    assert data_etag(1, "assignments", (5,), 4) != etag
+    assert data_etag(1, "assignments", (6,), 3) != etag
+    assert data_etag(2, "assignments", (5,), 3) != etag
+    assert data_etag(1, "assignments", (5,), 3, period=7) != etag
+
+
+def test_entries_of_an_older_data_version_are_reloaded():
+    calls = []
+
+    async def load():
+        calls.append(1)
+        return f"value-{len(calls)}"
+
+    async def scenario():
+        cache = ResponseCache(max_entries=10, ttl_seconds=60)
+        first = await cache.get_or_load(1, MEETINGS, "list", load, version=3)
+        same = await cache.get_or_load(1, MEETINGS, "list", load, version=3)
+        unversioned = await cache.get_or_load(1, MEETINGS, "list", load)
+        newer = await cache.get_or_load(1, MEETINGS, "list", load, version=4)
+        return first, same, unversioned, newer
+
+    first, same, unversioned, newer = asyncio.run(scenario())
+
+    assert first == ("value-1", 0.0, 3)
+    assert (same[0], same[2]) == (unversioned[0], unversioned[2]) == ("value-1", 3)
+    assert newer == ("value-2", 0.0, 4)
+
+
+def test_conditional_reads_follow_the_team_data_version(run_api):
+    participant = {
+        "name": "New", "email": "new@example.com", "chronotype": "morning", "peak_hours_start": 8,
+        "peak_hours_end": 12, "emotional_intelligence": 70, "social_intelligence": 40,
+    }
+
+    async def scenario(client):
+        async with AsyncSessionLocal() as db:
+            team_id = await create_team(db)
+            headers = await create_user(db, team_id, "lead@example.com")
+            await create_participant(db, team_id, "p0@example.com")
+            await db.commit()
+        listed = await client.get("/api/participants/", headers=headers)
+        etag = listed.headers["ETag"]
+        lookups = response_cache.metrics()["scopes"][PARTICIPANTS]
+        not_modified = await client.get("/api/participants/", headers={**headers, "If-None-Match": etag})
+        untouched = response_cache.metrics()["scopes"][PARTICIPANTS] == lookups
+        created = await client.post("/api/participants/", json=participant, headers=headers)
+        after_write = await client.get("/api/participants/", headers={**headers, "If-None-Match": etag})
+        # An offline writer (CLI) commits its change and data version bump without a local event
+        async with AsyncSessionLocal() as db:
+            await create_participant(db, team_id, "offline@example.com")
+            await event_bus.publish_in(db, team_id, PARTICIPANT_CHANGED, participant_ids=[])
+            await db.commit()
+        after_offline = await client.get(
+            "/api/participants/", headers={**headers, "If-None-Match": after_write.headers["ETag"]}
+        )
+        return listed, not_modified, untouched, created, after_write, after_offline
+
+    listed, not_modified, untouched, created, after_write, after_offline = run_api(scenario)
+
+    assert listed.status_code == 200
+    assert listed.headers["Cache-Control"] == "private, no-cache"
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["ETag"] == listed.headers["ETag"]
+    assert untouched  # answered before the cache and the loader
+    assert created.status_code == 201
+    assert after_write.status_code == 200
+    assert after_write.headers["ETag"] != listed.headers["ETag"]
+    assert {p["email"] for p in after_write.json()} == {"p0@example.com", "new@example.com"}
+    assert after_offline.status_code == 200
+    assert "offline@example.com" in [p["email"] for p in after_offline.json()]
@@ -0,0 +1,121 @@
+"""Speculative assignment drafts confirmed by assign-roles."""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, update
+
+from app.database import AsyncSessionLocal
+from app.models.assignment_draft import AssignmentDraft
+from app.services.assignment_engine import assign_roles, precompute_draft
+from app.services.drafts import take_draft
+from tests.factories import create_meeting, create_participant, create_team, create_user
+
+MEETING_TIME = datetime(2026, 10, 20, 10, tzinfo=timezone.utc)
+
+
+async def _team(meetings: int) -> list[int]:
+    async with AsyncSessionLocal() as db:
+        team_id = await create_team(db)
+        participant_ids = [await create_participant(db, team_id, f"p{index}@example.com") for index in range(8)]
+        meeting_ids = [
+            await create_meeting(db, team_id, MEETING_TIME + timedelta(days=day), participant_ids)
+            for day in range(meetings)
+        ]
+        await db.commit()
+    return meeting_ids
+
+
+async def _draft(meeting_id: int) -> AssignmentDraft | None:
+    async with AsyncSessionLocal() as db:
+        return await db.get(AssignmentDraft, meeting_id)
+
+
+async def _mark_draft(meeting_id: int) -> list[dict]:
+    """Replace the drafted scores with a marker, keeping its fingerprint, and return the marked rows."""
+    draft = await _draft(meeting_id)
+    rows = [{**row, "score": 1.0} for row in draft.assignments]
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(AssignmentDraft).where(AssignmentDraft.meeting_id == meeting_id).values(assignments=rows)
+        )
+        await db.commit()
+    return rows
+
+
+async def _assign(meeting_id: int) -> list[tuple[str, int, float]]:
+    async with AsyncSessionLocal() as db:
+        assignments = await assign_roles(db, meeting_id)
+    return [(assignment.role, assignment.participant_id, assignment.fitness_score) for assignment in assignments]
+
+
+def test_an_unchanged_draft_is_confirmed_as_is(run_db):
+    async def scenario():
+        (meeting_id,) = await _team(1)
+        await precompute_draft(meeting_id)
+        marked = await _mark_draft(meeting_id)
+        return marked, await _assign(meeting_id), await _draft(meeting_id)
+
+    marked, assigned, left = run_db(scenario)
+
+    assert assigned == [(row["role"], row["participant_id"], 1.0) for row in marked]
+    assert left is None
+
+
+def test_a_draft_is_discarded_when_role_history_changed(run_db):
+    async def scenario():
+        first, second = await _team(2)
+        await precompute_draft(second)
+        await _mark_draft(second)
+        await _assign(first)  # gives the second meeting's participants a role history
+        return await _assign(second), await _draft(second)
+
+    assigned, left = run_db(scenario)
+
+    assert len(assigned) == 7
+    assert all(score != 1.0 for _, _, score in assigned)
+    assert left is None
+
+
+def test_drafts_are_consumed_even_if_they_do_not_match(run_db):
+    async def scenario():
+        (meeting_id,) = await _team(1)
+        await precompute_draft(meeting_id)
+        stored = await _draft(meeting_id)
+        async with AsyncSessionLocal() as db:
+            mismatch = await take_draft(db, meeting_id, "0" * 40)
+            missing = await take_draft(db, meeting_id, stored.fingerprint)
+            await db.commit()
+        return stored, mismatch, missing
+
+    stored, mismatch, missing = run_db(scenario)
+
+    assert len(stored.assignments) == 7
+    assert mismatch is None and missing is None
+
+
+def test_creating_a_meeting_precomputes_its_draft(run_api):
+    async def scenario(client):
+        async with AsyncSessionLocal() as db:
+            team_id = await create_team(db)
+            headers = await create_user(db, team_id, "lead@example.com")
+            participant_ids = [await create_participant(db, team_id, f"p{index}@example.com") for index in range(8)]
+            await db.commit()
+        body = {"title": "Review", "meeting_type": "review", "scheduled_time": MEETING_TIME.isoformat()}
+        created = await client.post(
+            "/api/meetings/", json={**body, "participant_ids": participant_ids}, headers=headers
+        )
+        empty = await client.post("/api/meetings/", json=body, headers=headers)
+        draft = await _draft(created.json()["id"])
+        async with AsyncSessionLocal() as db:
+            drafts = (await db.execute(select(AssignmentDraft.meeting_id))).scalars().all()
+        assigned = await client.post(f"/api/meetings/{created.json()['id']}/assign-roles", headers=headers)
+        return draft, drafts, empty.json()["id"], assigned, await _draft(created.json()["id"])
+
+    draft, drafts, empty_id, assigned, left = run_api(scenario)
+
+    assert draft is not None
+    assert empty_id not in drafts
+    assert sorted((a["role"], a["participant_id"]) for a in assigned.json()["assignments"]) == sorted(
+        (row["role"], row["participant_id"]) for row in draft.assignments
+    )
+    assert left is None
@@ -0,0 +1,122 @@
+"""Team-scoped event bus, data versions and cross-worker delivery."""
+
+import asyncio
+import json
+
+from app.database import AsyncSessionLocal
+from app.routers.events import _format_event
+from app.services.data_version import get_data_version
+from app.services.event_bus import ASSIGNMENT_CHANGED, JOB_PROGRESS, MEETING_CHANGED, Event, EventBus
+from tests.factories import create_team
+
+
+def test_subscribers_get_their_team_events_in_order():
+    async def scenario():
+        bus = EventBus(queue_size=10)
+        seen = []
+        bus.add_handler(lambda event: seen.append((event.team_id, event.data["job_id"])))
+        async with bus.subscribe(1) as first, bus.subscribe(2) as second:
+            for job_id in range(3):
+                await bus.publish(1, JOB_PROGRESS, job_id=job_id)
+            await bus.publish(2, JOB_PROGRESS, job_id=9)
+            subscribed = (bus.subscriber_count(1), bus.subscriber_count(2))
+            received = [first.get_nowait().data["job_id"] for _ in range(first.qsize())], second.qsize()
+        return subscribed, received, bus.subscriber_count(1), seen
+
+    subscribed, received, after, seen = asyncio.run(scenario())
+
+    assert subscribed == (1, 1)
+    assert received == ([0, 1, 2], 1)
+    assert after == 0
+    assert seen == [(1, 0), (1, 1), (1, 2), (2, 9)]
+
+
+def test_slow_subscribers_lose_their_oldest_events():
+    async def scenario():
+        bus = EventBus(queue_size=2)
+
+        def failing(event):
+            raise RuntimeError("handler bug")
+
+        bus.add_handler(failing)
+        async with bus.subscribe(1) as queue:
+            for job_id in range(5):
+                await bus.publish(1, JOB_PROGRESS, job_id=job_id)
+            return [queue.get_nowait().data["job_id"] for _ in range(queue.qsize())]
+
+    assert asyncio.run(scenario()) == [3, 4]
+
+
+def test_events_are_encoded_for_server_sent_events():
+    event = Event(team_id=1, type=MEETING_CHANGED, data={"meeting_ids": [4], "action": "created"}, at="now")
+
+    name, data, end = _format_event(event).split("\n", 2)
+
+    assert name == f"event: {MEETING_CHANGED}"
+    assert json.loads(data.removeprefix("data: ")) == {"meeting_ids": [4], "action": "created", "at": "now"}
+    assert end == "\n"
+
+
+def test_data_events_bump_the_data_version(run_db):
+    async def scenario():
+        bus = EventBus(queue_size=10)
+        async with AsyncSessionLocal() as db:
+            team_id = await create_team(db)
+            await db.commit()
+
+        async def version():
+            async with AsyncSessionLocal() as db:
+                return await get_data_version(db, team_id)
+
+        versions = [await version()]
+        await bus.publish(team_id, ASSIGNMENT_CHANGED, meeting_ids=[1])
+        versions.append(await version())
+        await bus.publish(team_id, JOB_PROGRESS, job_id=1)
+        versions.append(await version())
+        async with AsyncSessionLocal() as db:
+            await bus.publish_in(db, team_id, MEETING_CHANGED, meeting_ids=[1])
+            await db.rollback()
+        versions.append(await version())
+        async with AsyncSessionLocal() as db:
+            await bus.publish_in(db, team_id, MEETING_CHANGED, meeting_ids=[1])
+            await db.commit()
+        versions.append(await version())
+        return versions
+
+    assert run_db(scenario) == [0, 1, 1, 1, 2]
+
+
+def test_notifications_reach_subscribers_of_other_workers(run_db):
+    async def scenario():
+        publisher, listener = EventBus(queue_size=100, notify=True), EventBus(queue_size=100, notify=True)
+        async with AsyncSessionLocal() as db:
+            team_id = await create_team(db)
+            await db.commit()
+        await listener.start()
+        try:
+            async with publisher.subscribe(team_id) as local, listener.subscribe(team_id) as remote:
+                # The LISTEN connection is set up in the background: publish until it delivers
+                for attempt in range(50):
+                    await publisher.publish(team_id, JOB_PROGRESS, job_id=attempt)
+                    try:
+                        event = await asyncio.wait_for(remote.get(), timeout=0.2)
+                        break
+                    except asyncio.TimeoutError:
+                        continue
+                else:
+                    raise AssertionError("No notification delivered")
+                async with AsyncSessionLocal() as db:
+                    await publisher.publish_in(db, team_id, MEETING_CHANGED, meeting_ids=[7])
+                    await db.commit()
+                offline = await asyncio.wait_for(remote.get(), timeout=5)
+                while offline.type == JOB_PROGRESS:  # a late notification of an earlier attempt
+                    offline = await asyncio.wait_for(remote.get(), timeout=5)
+                return event, attempt, offline, local.qsize()
+        finally:
+            await listener.stop()
+
+    event, attempt, offline, local = run_db(scenario)
+
+    assert event.type == JOB_PROGRESS and event.data["job_id"] <= attempt
+    assert (offline.type, offline.data) == (MEETING_CHANGED, {"meeting_ids": [7]})
+    assert local == attempt + 1  # delivered once locally, never again through the notification
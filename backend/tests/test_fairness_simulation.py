@@ -0,0 +1,107 @@
+"""Monte Carlo simulation of long-run role fairness."""
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.services.fairness_simulation import (
+    MAX_TRIALS,
+    SimulationConfig,
+    config_from_params,
+    generate_meetings,
+    report_to_dict,
+    simulate,
+    trial_chunks,
+)
+from app.services.fitness import DEFAULT_TABLES, ParticipantProfile
+
+
+def _profiles(rng: random.Random, count: int) -> list[ParticipantProfile]:
+    return [
+        ParticipantProfile(
+            id=participant_id,
+            name=f"p{participant_id:03d}",
+            peak_hours_start=rng.randint(6, 12),
+            peak_hours_end=rng.randint(13, 20),
+            emotional_intelligence=rng.randint(0, 100),
+            social_intelligence=rng.randint(0, 100),
+        )
+        for participant_id in range(1, count + 1)
+    ]
+
+
+@pytest.mark.parametrize("params", [
+    {"trials": 0},
+    {"trials": MAX_TRIALS + 1},
+    {"meetings": 0},
+    {"type_weights": {}},
+    {"type_weights": {"review": -1.0}},
+    {"type_weights": {"review": 0.0}},
+    {"hours": [24]},
+    {"hours": []},
+    {"attendance": 0},
+    {"history_penalties": []},
+    {"history_penalties": [0.5, 1.5]},
+])
+def test_out_of_range_params_are_rejected(params):
+    with pytest.raises(ValueError):
+        config_from_params(params)
+
+
+def test_params_override_defaults_and_penalties():
+    config, tables = config_from_params({"trials": 3, "hours": [9], "history_penalties": [0, 0.5]})
+
+    assert (config.trials, config.hours, config.meetings) == (3, (9,), SimulationConfig().meetings)
+    assert tables.history_penalties == (0.0, 0.5)
+    assert tables.role_requirements == DEFAULT_TABLES.role_requirements
+    assert config_from_params({})[1] is DEFAULT_TABLES
+
+
+def test_generated_meetings_always_have_an_attendee():
+    config = SimulationConfig(meetings=200, attendance=0.05, hours=(9, 15))
+    meetings = generate_meetings(list(range(1, 6)), config, random.Random(1))
+
+    assert [meeting.id for meeting in meetings] == list(range(200))
+    assert all(meeting.participant_ids for meeting in meetings)
+    assert {meeting.scheduled_time.hour for meeting in meetings} <= {9, 15}
+    assert all(earlier.scheduled_time < later.scheduled_time for earlier, later in zip(meetings, meetings[1:]))
+
+
+def test_trial_seeds_follow_the_config_seed():
+    chunks = trial_chunks(SimulationConfig(trials=25, seed=100), chunk_size=10)
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert [seed for chunk in chunks for seed in chunk] == list(range(100, 125))
+
+
+def test_simulation_is_reproducible_inline_and_in_parallel():
+    participants = _profiles(random.Random(5), 10)
+    config = SimulationConfig(meetings=40, trials=12, seed=3)
+    progress = []
+
+    inline = simulate(participants, {}, config, on_progress=lambda done, total: progress.append((done, total)))
+    again = simulate(participants, {}, config)
+    with ThreadPoolExecutor(2) as executor:
+        parallel = simulate(participants, {}, config, executor=executor)
+    other_seed = simulate(participants, {}, SimulationConfig(meetings=40, trials=12, seed=4))
+
+    assert report_to_dict(again) == report_to_dict(inline)
+    assert report_to_dict(parallel) == report_to_dict(inline)
+    assert report_to_dict(other_seed) != report_to_dict(inline)
+    assert progress[-1] == (12, 12)
+    assert inline.trials == 12
+    assert [p.participant_id for p in inline.participants] == [p.id for p in participants]
+
+
+def test_penalties_bound_the_longest_streak():
+    participants = _profiles(random.Random(8), 10)
+    config = SimulationConfig(meetings=60, trials=5)
+
+    default = simulate(participants, {}, config)
+    _, strict_tables = config_from_params({"history_penalties": [0]})
+    strict = simulate(participants, {}, config, strict_tables)
+
+    assert default.max_streak.p95 <= len(DEFAULT_TABLES.history_penalties)
+    assert strict.max_streak.p95 == 1
+    assert set(strict.streak_histogram) == {1}
@@ -0,0 +1,281 @@
+"""Background job runner: compare-and-set statuses, cancellation and orphan recovery."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import delete, func, select
+
+from app.database import AsyncSessionLocal
+from app.models.job import Job
+from app.models.meeting import Meeting
+from app.schemas.job import FairnessSimulationParams, ReassignMeetingsParams
+from app.services.job_handlers import reassign_meetings_job
+from app.services.job_runner import JobContext, JobRunner
+from tests.factories import create_meeting, create_participant, create_team, create_user
+
+FINISHED = ("succeeded", "failed", "cancelled")
+
+
+class EchoParams(BaseModel):
+    value: int
+    rows: list[int] | None = None
+
+    model_config = {"extra": "forbid"}
+
+
+async def _job(job_id: int) -> Job:
+    async with AsyncSessionLocal() as db:
+        return await db.get(Job, job_id)
+
+
+async def _wait_finished(job_id: int) -> Job:
+    for _ in range(200):
+        job = await _job(job_id)
+        if job.status in FINISHED:
+            return job
+        await asyncio.sleep(0.02)
+    raise AssertionError(f"Job {job_id} did not finish (status {job.status})")
+
+
+async def _wait_status(job_id: int, status: str) -> None:
+    for _ in range(200):
+        if (await _job(job_id)).status == status:
+            return
+        await asyncio.sleep(0.02)
+    raise AssertionError(f"Job {job_id} never reached {status}")
+
+
+async def _submit(runner: JobRunner, kind: str, params: dict) -> int:
+    async with AsyncSessionLocal() as db:
+        team_id = await create_team(db)
+        await db.commit()
+        return (await runner.submit(db, team_id, kind, params)).id
+
+
+def test_finished_jobs_keep_their_result_and_lose_transient_params(run_db):
+    async def handler(db, context):
+        return {"doubled": context.params["value"] * 2}
+
+    async def failing(db, context):
+        raise RuntimeError("boom")
+
+    async def scenario():
+        runner = JobRunner(2)
+        runner.register("echo", handler, EchoParams, transient_params=("rows",))
+        runner.register("failing", failing)
+        await runner.start()
+        try:
+            succeeded = await _wait_finished(await _submit(runner, "echo", {"value": 21, "rows": [1, 2]}))
+            failed = await _wait_finished(await _submit(runner, "failing", {}))
+        finally:
+            await runner.stop()
+        return succeeded, failed
+
+    succeeded, failed = run_db(scenario)
+
+    assert (succeeded.status, succeeded.result, succeeded.params) == ("succeeded", {"doubled": 42}, {"value": 21})
+    assert succeeded.started_at is not None and succeeded.finished_at is not None
+    assert (failed.status, failed.error) == ("failed", "boom")
+
+
+def test_params_are_validated_before_the_job_is_stored(run_db):
+    async def handler(db, context):
+        return None
+
+    async def scenario():
+        runner = JobRunner(1)
+        runner.register("echo", handler, EchoParams)
+        await runner.start()
+        errors = []
+        try:
+            for kind, params in (("echo", {"value": "x"}), ("echo", {"value": 1, "other": 2}), ("missing", {})):
+                try:
+                    await _submit(runner, kind, params)
+                except (ValidationError, ValueError) as e:
+                    errors.append(type(e))
+        finally:
+            await runner.stop()
+        async with AsyncSessionLocal() as db:
+            return errors, await db.scalar(select(func.count()).select_from(Job))
+
+    errors, stored = run_db(scenario)
+
+    assert errors == [ValidationError, ValidationError, ValueError]
+    assert stored == 0
+
+
+def test_cancelling_a_running_or_queued_job(run_db):
+    started = []
+
+    async def blocking(db, context):
+        started.append(context.job_id)
+        await asyncio.sleep(60)
+
+    async def scenario():
+        runner = JobRunner(1)
+        runner.register("blocking", blocking)
+        await runner.start()
+        try:
+            running_id = await _submit(runner, "blocking", {})
+            queued_id = await _submit(runner, "blocking", {})
+            await _wait_status(running_id, "running")
+            async with AsyncSessionLocal() as db:
+                assert await runner.cancel(db, await db.get(Job, queued_id))
+                assert await runner.cancel(db, await db.get(Job, running_id))
+            jobs = [await _wait_finished(running_id), await _wait_finished(queued_id)]
+            async with AsyncSessionLocal() as db:
+                again = await runner.cancel(db, await db.get(Job, running_id))
+        finally:
+            await runner.stop()
+        return running_id, jobs, again
+
+    running_id, jobs, again = run_db(scenario)
+
+    assert [job.status for job in jobs] == ["cancelled", "cancelled"]
+    assert started == [running_id]
+    assert not again
+
+
+def test_cancellation_from_another_worker_wins_over_completion(run_db):
+    async def scenario():
+        proceed = asyncio.Event()
+
+        async def handler(db, context):
+            await proceed.wait()
+            return {"done": True}
+
+        runner = JobRunner(1)
+        runner.register("slow", handler)
+        await runner.start()
+        try:
+            job_id = await _submit(runner, "slow", {})
+            await _wait_status(job_id, "running")
+            # Another worker only writes the status; this worker's task is not cancelled
+            async with AsyncSessionLocal() as db:
+                job = await db.get(Job, job_id)
+                job.status = "cancelling"
+                await db.commit()
+            proceed.set()
+            return await _wait_finished(job_id)
+        finally:
+            await runner.stop()
+
+    job = run_db(scenario)
+
+    assert job.status == "cancelled"
+    assert job.result is None
+
+
+def test_orphaned_jobs_are_finished(run_db):
+    async def handler(db, context):
+        return None
+
+    async def scenario():
+        now = datetime.now(timezone.utc)
+        async with AsyncSessionLocal() as db:
+            team_id = await create_team(db)
+            jobs = {
+                name: Job(
+                    team_id=team_id, kind="echo", status=status, progress=0,
+                    params={"value": 1, "rows": [1]}, heartbeat_at=now - age
+                )
+                for name, status, age in (
+                    ("running", "running", timedelta(minutes=5)),
+                    ("queued", "queued", timedelta(minutes=5)),
+                    ("cancelling", "cancelling", timedelta(minutes=5)),
+                    ("alive", "running", timedelta(seconds=5)),
+                    ("finished", "succeeded", timedelta(minutes=5)),
+                )
+            }
+            db.add_all(jobs.values())
+            await db.commit()
+
+        runner = JobRunner(1, orphan_seconds=60)
+        runner.register("echo", handler, transient_params=("rows",))
+        finished = await runner.fail_orphaned_jobs()
+        return finished, {name: await _job(job.id) for name, job in jobs.items()}
+
+    finished, jobs = run_db(scenario)
+
+    assert finished == 3
+    assert {name: job.status for name, job in jobs.items()} == {
+        "running": "failed",
+        "queued": "failed",
+        "cancelling": "cancelled",
+        "alive": "running",
+        "finished": "succeeded",
+    }
+    assert jobs["running"].error and jobs["running"].finished_at is not None
+    assert jobs["running"].params == {"value": 1}
+    assert jobs["alive"].params == {"value": 1, "rows": [1]}
+
+
+class _DeletingContext(JobContext):
+    """Context whose first progress report deletes a meeting, after the job listed the meetings."""
+
+    def __init__(self, team_id: int, meeting_id: int):
+        super().__init__(0, team_id, {})
+        self.meeting_id = meeting_id
+
+    async def report(self, progress: int, total: int | None = None) -> None:
+        if progress == 0:
+            async with AsyncSessionLocal() as db:
+                await db.execute(delete(Meeting).where(Meeting.id == self.meeting_id))
+                await db.commit()
+
+
+def test_reassign_records_failed_meetings_and_continues(run_db):
+    async def scenario():
+        async with AsyncSessionLocal() as db:
+            team_id = await create_team(db)
+            participant_ids = [await create_participant(db, team_id, f"p{index}@example.com") for index in range(8)]
+            time = datetime(2026, 10, 20, 10, tzinfo=timezone.utc)
+            meeting_ids = [
+                await create_meeting(db, team_id, time + timedelta(days=day), participant_ids) for day in range(3)
+            ]
+            await db.commit()
+        async with AsyncSessionLocal() as db:
+            return meeting_ids, await reassign_meetings_job(db, _DeletingContext(team_id, meeting_ids[1]))
+
+    meeting_ids, result = run_db(scenario)
+
+    assert result == {
+        "meetings": 3,
+        "assignments": 2 * 7,
+        "failed": [{"meeting_id": meeting_ids[1], "error": f"Meeting {meeting_ids[1]} not found"}],
+    }
+
+
+def test_invalid_params_are_rejected_with_422(run_api):
+    async def scenario(client):
+        async with AsyncSessionLocal() as db:
+            team_id = await create_team(db)
+            headers = await create_user(db, team_id, "lead@example.com")
+            await db.commit()
+        return await client.post(
+            "/api/jobs/", json={"kind": "reassign_meetings", "params": {"days": 3}}, headers=headers
+        )
+
+    response = run_api(scenario)
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["days"]
+
+
+@pytest.mark.parametrize("params", [
+    {"trials": 0},
+    {"meetings": 10 ** 9},
+    {"attendance": 2.0},
+    {"unknown": 1},
+])
+def test_simulation_params_are_checked_on_submit(params):
+    with pytest.raises(ValidationError):
+        FairnessSimulationParams.model_validate(params)
+
+
+def test_reassign_params_reject_unknown_keys():
+    assert ReassignMeetingsParams.model_validate({}).model_dump(exclude_none=True) == {"only_unassigned": False}
+    with pytest.raises(ValidationError):
+        ReassignMeetingsParams.model_validate({"days": 3})
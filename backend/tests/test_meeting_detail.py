@@ -0,0 +1,90 @@
+"""Composite meeting-detail endpoint."""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import event
+
+from app.database import AsyncSessionLocal, engine
+from app.models.participant import Participant
+from app.services.energy_calculator import calculate_energy
+from tests.factories import create_meeting, create_participant, create_team, create_user
+
+MEETING_TIME = datetime(2026, 10, 20, 10, tzinfo=timezone.utc)
+
+
+async def _get_counting_queries(client, url: str, headers: dict) -> tuple:
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    try:
+        response = await client.get(url, headers=headers)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count)
+    return response, len(statements)
+
+
+def test_detail_matches_the_separate_endpoints(run_api):
+    async def scenario(client):
+        async with AsyncSessionLocal() as db:
+            team_id = await create_team(db)
+            headers = await create_user(db, team_id, "lead@example.com")
+            participant_ids = [
+                await create_participant(db, team_id, f"p{index}@example.com", peak_hours_start=6 + index)
+                for index in range(8)
+            ]
+            earlier = await create_meeting(db, team_id, MEETING_TIME - timedelta(days=1), participant_ids)
+            meeting_id = await create_meeting(db, team_id, MEETING_TIME, participant_ids)
+            await db.commit()
+        await client.post(f"/api/meetings/{earlier}/assign-roles", headers=headers)
+        await client.post(f"/api/meetings/{meeting_id}/assign-roles", headers=headers)
+
+        detail = await client.get(f"/api/meetings/{meeting_id}/detail", headers=headers)
+        assignments = await client.get(f"/api/meetings/{meeting_id}/assignments", headers=headers)
+        earlier_assignments = await client.get(f"/api/meetings/{earlier}/assignments", headers=headers)
+        async with AsyncSessionLocal() as db:
+            participants = [await db.get(Participant, participant_id) for participant_id in participant_ids]
+        return detail, assignments, earlier_assignments, participants
+
+    detail, assignments, earlier_assignments, participants = run_api(scenario)
+
+    assert detail.status_code == 200
+    body = detail.json()
+    assert body["assignments"] == assignments.json()
+    energy = {participant.id: calculate_energy(participant, MEETING_TIME) for participant in participants}
+    assert {participant["id"]: participant["energy"] for participant in body["participants"]} == energy
+
+    # The history holds both meetings, most recent first
+    earlier_roles = {assignment["participant_id"]: assignment["role"] for assignment in earlier_assignments.json()}
+    roles = {assignment["participant_id"]: assignment["role"] for assignment in body["assignments"]}
+    for participant in body["participants"]:
+        expected = [roles[participant["id"]]] if participant["id"] in roles else []
+        if participant["id"] in earlier_roles:
+            expected.append(earlier_roles[participant["id"]])
+        assert participant["recent_roles"] == expected
+        if expected:
+            assert participant["streak"]["role"] == expected[0]
+
+
+def test_detail_query_count_does_not_grow_with_participants(run_api):
+    async def scenario(client):
+        async with AsyncSessionLocal() as db:
+            team_id = await create_team(db)
+            headers = await create_user(db, team_id, "lead@example.com")
+            participant_ids = [await create_participant(db, team_id, f"p{index}@example.com") for index in range(20)]
+            small = await create_meeting(db, team_id, MEETING_TIME, participant_ids[:8])
+            large = await create_meeting(db, team_id, MEETING_TIME, participant_ids)
+            await db.commit()
+        counts = []
+        for meeting_id in (small, large):
+            await client.post(f"/api/meetings/{meeting_id}/assign-roles", headers=headers)
+            response, queries = await _get_counting_queries(client, f"/api/meetings/{meeting_id}/detail", headers)
+            assert response.status_code == 200
+            counts.append(queries)
+        return counts
+
+    small, large = run_api(scenario)
+
+    assert small == large
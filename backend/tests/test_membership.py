@@ -0,0 +1,82 @@
+"""Set-based meeting membership edits."""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+
+from app.database import AsyncSessionLocal
+from app.models.meeting import meeting_participants
+from app.services.membership import add_members, find_foreign_participants, remove_members, replace_members
+from tests.factories import create_meeting, create_participant, create_team, create_user
+
+MEETING_TIME = datetime(2026, 10, 20, 10, tzinfo=timezone.utc)
+
+
+async def _members(db, meeting_id: int) -> list[int]:
+    result = await db.execute(
+        select(meeting_participants.c.participant_id).where(meeting_participants.c.meeting_id == meeting_id)
+    )
+    return sorted(result.scalars().all())
+
+
+def test_edits_report_only_the_links_they_changed(run_db):
+    async def scenario():
+        async with AsyncSessionLocal() as db:
+            team_id = await create_team(db)
+            p1, p2, p3, p4 = [await create_participant(db, team_id, f"p{index}@example.com") for index in range(4)]
+            meeting_id = await create_meeting(db, team_id, MEETING_TIME, [p1, p2])
+
+            added = await add_members(db, meeting_id, {p2, p3})
+            removed = await remove_members(db, meeting_id, {p1, p4})
+            replaced = await replace_members(db, meeting_id, {p3, p4})
+            members = await _members(db, meeting_id)
+            emptied = await replace_members(db, meeting_id, set())
+            return (p1, p2, p3, p4), added, removed, replaced, members, emptied, await _members(db, meeting_id)
+
+    (p1, p2, p3, p4), added, removed, replaced, members, emptied, final = run_db(scenario)
+
+    assert added == [p3]
+    assert removed == [p1]
+    assert replaced == ([p4], [p2])
+    assert members == [p3, p4]
+    assert emptied == ([], [p3, p4])
+    assert final == []
+
+
+def test_foreign_participants_are_found_by_id(run_db):
+    async def scenario():
+        async with AsyncSessionLocal() as db:
+            team_id = await create_team(db)
+            other_team_id = await create_team(db, "Other")
+            own = await create_participant(db, team_id, "own@example.com")
+            foreign = await create_participant(db, other_team_id, "foreign@example.com")
+            return foreign, await find_foreign_participants(db, team_id, {own, foreign, 999999})
+
+    foreign, found = run_db(scenario)
+
+    assert found == {foreign, 999999}
+
+
+def test_adding_a_foreign_participant_changes_nothing(run_api):
+    async def scenario(client):
+        async with AsyncSessionLocal() as db:
+            team_id = await create_team(db)
+            other_team_id = await create_team(db, "Other")
+            headers = await create_user(db, team_id, "lead@example.com")
+            own = await create_participant(db, team_id, "own@example.com")
+            foreign = await create_participant(db, other_team_id, "foreign@example.com")
+            meeting_id = await create_meeting(db, team_id, MEETING_TIME)
+            await db.commit()
+
+        rejected = await client.post(f"/api/meetings/{meeting_id}/participants", json=[own, foreign], headers=headers)
+        async with AsyncSessionLocal() as db:
+            members = await _members(db, meeting_id)
+        replaced = await client.put(f"/api/meetings/{meeting_id}/participants", json=[own], headers=headers)
+        return rejected, members, replaced, own
+
+    rejected, members, replaced, own = run_api(scenario)
+
+    assert rejected.status_code == 400
+    assert members == []
+    assert replaced.status_code == 200
+    assert (replaced.json()["added"], replaced.json()["removed"]) == ([own], [])
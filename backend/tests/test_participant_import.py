@@ -0,0 +1,111 @@
+"""Streaming participant import: body parsers and the chunked ON CONFLICT insert."""
+
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+
+from app.database import AsyncSessionLocal
+from app.models.participant import Participant
+from app.services.participant_import import (
+    ImportFormatError,
+    import_participants,
+    iter_csv_rows,
+    iter_json_array_rows,
+    iter_lines,
+    iter_ndjson_rows,
+)
+from tests.factories import create_participant, create_team
+
+
+async def _stream(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def _collect(rows) -> list:
+    return [row async for row in rows]
+
+
+def _parse(parser, *chunks: bytes) -> list:
+    return asyncio.run(_collect(parser(iter_lines(_stream(*chunks)))))
+
+
+def _row(email: str, **fields) -> dict:
+    return {
+        "name": email.split("@")[0],
+        "email": email,
+        "chronotype": "morning",
+        "peak_hours_start": 8,
+        "peak_hours_end": 12,
+        "emotional_intelligence": 70,
+        "social_intelligence": 60,
+        **fields,
+    }
+
+
+def test_lines_are_split_across_chunk_boundaries():
+    # BOM, CRLF and a multi-byte character split between two chunks
+    body = "﻿name\r\nЖанна\r\nlast".encode()
+    split = body.index("Ж".encode()) + 1
+    lines = asyncio.run(_collect(iter_lines(_stream(body[:split], body[split:]))))
+
+    assert lines == ["name", "Жанна", "last"]
+
+
+def test_ndjson_reports_bad_lines_and_skips_blank_ones():
+    rows = _parse(iter_ndjson_rows, b'{"a": 1}\n\n[1, 2]\n{broken\n{"b": 2}\n')
+
+    assert [(number, row) for number, row, _ in rows] == [(1, {"a": 1}), (2, None), (3, None), (4, {"b": 2})]
+    assert rows[1][2] == "Row must be a JSON object"
+    assert rows[2][2].startswith("Invalid JSON")
+
+
+def test_csv_uses_the_header_and_checks_the_column_count():
+    rows = _parse(iter_csv_rows, b"name, email\nAnna, anna@example.com\nonly-one\n\nBob,bob@example.com\n")
+
+    assert rows == [
+        (1, {"name": "Anna", "email": "anna@example.com"}, None),
+        (2, None, "Expected 2 columns, got 1"),
+        (3, {"name": "Bob", "email": "bob@example.com"}, None),
+    ]
+
+
+def test_json_array_rejects_other_documents():
+    assert asyncio.run(_collect(iter_json_array_rows(b'[{"a": 1}, 5]'))) == [
+        (1, {"a": 1}, None),
+        (2, None, "Row must be a JSON object"),
+    ]
+    assert asyncio.run(_collect(iter_json_array_rows(b""))) == []
+    for body in (b'{"a": 1}', b"[1,"):
+        with pytest.raises(ImportFormatError):
+            asyncio.run(_collect(iter_json_array_rows(body)))
+
+
+def test_import_inserts_valid_rows_and_reports_conflicts(run_db):
+    async def scenario():
+        async with AsyncSessionLocal() as db:
+            team_id = await create_team(db)
+            await create_participant(db, team_id, "taken@example.com")
+            await db.commit()
+
+            rows = [
+                (1, _row("new1@example.com"), None),
+                (2, _row("taken@example.com"), None),
+                (3, None, "Invalid JSON: Expecting value"),
+                (4, _row("bad@example.com", emotional_intelligence=101), None),
+                (5, _row("new1@example.com"), None),
+                (6, _row("new2@example.com"), None),
+            ]
+            result = await import_participants(db, team_id, rows, chunk_size=2)
+            count = await db.scalar(select(func.count()).select_from(Participant).where(Participant.team_id == team_id))
+        return result, count
+
+    result, count = run_db(scenario)
+
+    assert (result.total_rows, result.created, result.failed) == (6, 2, 4)
+    assert [error.row for error in result.errors] == [2, 3, 4, 5]
+    assert "already exists" in result.errors[0].detail
+    assert result.errors[2].email == "bad@example.com"
+    assert "within import" in result.errors[3].detail
+    assert count == 3
@@ -0,0 +1,181 @@
+"""Bulk recompute of upcoming assignments after a settings change."""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+
+from app.database import AsyncSessionLocal
+from app.models.job import Job
+from app.models.meeting import Meeting
+from app.models.role_assignment import RoleAssignment
+from app.services import recompute
+from app.services.assignment_engine import assign_roles
+from app.services.fitness import DEFAULT_TABLES
+from app.services.recompute import (
+    _merge_recompute_params,
+    find_affected_meetings,
+    recompute_meetings,
+    schedule_recompute,
+)
+from app.services.settings_store import save_team_settings
+from app.services.staleness import mark_meetings_stale, mark_team_stale
+from tests.factories import create_meeting, create_participant, create_team
+
+CRITIC_FAVOURED = DEFAULT_TABLES.with_overrides(meeting_multipliers={"review": {"critic": 5.0, "moderator": 0.2}})
+
+
+def test_merged_params_cover_both_requests():
+    assert _merge_recompute_params({"participant_ids": [3, 1]}, {"participant_ids": [2, 3]}) == {
+        "participant_ids": [1, 2, 3]
+    }
+    assert _merge_recompute_params({"participant_ids": [1]}, {"meeting_ids": [7]}) == {
+        "participant_ids": [1], "meeting_ids": [7]
+    }
+    assert _merge_recompute_params({}, {"meeting_ids": [7]}) == {}
+    assert _merge_recompute_params({"meeting_ids": [7]}, {}) == {}
+
+
+async def _assigned_team() -> tuple[int, list[int], list[int]]:
+    """A team with four assigned upcoming meetings, one past and one unassigned meeting."""
+    now = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    async with AsyncSessionLocal() as db:
+        team_id = await create_team(db)
+        participant_ids = [
+            await create_participant(
+                db, team_id, f"p{index}@example.com",
+                emotional_intelligence=10 * index, social_intelligence=90 - 10 * index
+            )
+            for index in range(9)
+        ]
+        upcoming = [
+            await create_meeting(db, team_id, now + timedelta(days=day, hours=2), participant_ids)
+            for day in range(1, 5)
+        ]
+        past = await create_meeting(db, team_id, now - timedelta(days=1), participant_ids)
+        await create_meeting(db, team_id, now + timedelta(days=9), participant_ids)
+        await db.commit()
+    for meeting_id in [past, *upcoming]:
+        async with AsyncSessionLocal() as db:
+            await assign_roles(db, meeting_id)
+    return team_id, participant_ids, upcoming
+
+
+async def _change_settings(team_id: int) -> None:
+    async with AsyncSessionLocal() as db:
+        await save_team_settings(
+            db, team_id, CRITIC_FAVOURED, before_commit=lambda session: mark_team_stale(session, team_id)
+        )
+
+
+async def _stale_flags(meeting_ids: list[int]) -> dict[int, bool]:
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(Meeting.id, Meeting.assignments_stale).where(Meeting.id.in_(meeting_ids)))
+        return dict(result.all())
+
+
+async def _stored(meeting_ids: list[int]) -> dict[int, set[tuple[str, int]]]:
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(RoleAssignment.meeting_id, RoleAssignment.role, RoleAssignment.participant_id)
+            .where(RoleAssignment.meeting_id.in_(meeting_ids))
+        )
+        stored = {meeting_id: set() for meeting_id in meeting_ids}
+        for meeting_id, role, participant_id in result.all():
+            stored[meeting_id].add((role, participant_id))
+        return stored
+
+
+def test_affected_meetings_are_upcoming_and_assigned(run_db):
+    async def scenario():
+        team_id, participant_ids, upcoming = await _assigned_team()
+        async with AsyncSessionLocal() as db:
+            return upcoming, (
+                await find_affected_meetings(db, team_id),
+                await find_affected_meetings(db, team_id, participant_ids=[participant_ids[0]]),
+                await find_affected_meetings(db, team_id, participant_ids=[], meeting_ids=upcoming[2:]),
+                await find_affected_meetings(db, team_id, participant_ids=[]),
+            )
+
+    upcoming, (everything, attended, listed, nothing) = run_db(scenario)
+
+    assert everything == upcoming
+    assert attended == upcoming
+    assert listed == upcoming[2:]
+    assert nothing == []
+
+
+def test_recompute_rewrites_outdated_meetings_once(run_db):
+    async def scenario():
+        team_id, _, upcoming = await _assigned_team()
+        before = await _stored(upcoming)
+        await _change_settings(team_id)
+        flagged = await _stale_flags(upcoming)
+        async with AsyncSessionLocal() as db:
+            first = await recompute_meetings(db, team_id, await find_affected_meetings(db, team_id))
+        async with AsyncSessionLocal() as db:
+            second = await recompute_meetings(db, team_id, await find_affected_meetings(db, team_id))
+        return upcoming, before, flagged, first, second, await _stored(upcoming), await _stale_flags(upcoming)
+
+    upcoming, before, flagged, first, second, after, cleared = run_db(scenario)
+
+    assert all(flagged.values())
+    assert (first["meetings"], first["rewritten"], first["skipped"]) == (4, 4, [])
+    assert first["assignments"] == 4 * len(DEFAULT_TABLES.roles)
+    assert first["changed"] == [meeting_id for meeting_id in upcoming if after[meeting_id] != before[meeting_id]]
+    assert first["changed"]
+    assert (second["rewritten"], second["changed"], second["assignments"]) == (0, [], 0)
+    assert not any(cleared.values())
+
+
+def test_recompute_skips_meetings_changed_while_it_runs(run_db, monkeypatch):
+    monkeypatch.setattr(recompute, "RECOMPUTE_CHUNK", 1)
+
+    async def scenario():
+        team_id, _, upcoming = await _assigned_team()
+        before = await _stored(upcoming)
+        await _change_settings(team_id)
+
+        async def edit_the_rest(processed: int, total: int) -> None:
+            # Another writer flags the meetings not yet written (e.g. a profile edit)
+            if processed == 1:
+                async with AsyncSessionLocal() as other:
+                    await mark_meetings_stale(other, upcoming[1:])
+                    await other.commit()
+
+        async with AsyncSessionLocal() as db:
+            result = await recompute_meetings(db, team_id, upcoming, on_progress=edit_the_rest)
+        return upcoming, before, result, await _stored(upcoming), await _stale_flags(upcoming)
+
+    upcoming, before, result, after, flags = run_db(scenario)
+
+    assert result["rewritten"] == 1
+    assert result["skipped"] == upcoming[1:]
+    assert result["assignments"] == len(DEFAULT_TABLES.roles)
+    assert all(after[meeting_id] == before[meeting_id] for meeting_id in upcoming[1:])
+    assert all(flags[meeting_id] for meeting_id in upcoming[1:])
+
+
+def test_queued_recompute_jobs_are_extended(run_db):
+    async def scenario():
+        async with AsyncSessionLocal() as db:
+            team_id = await create_team(db)
+            job = Job(
+                team_id=team_id, kind="recompute_assignments", status="queued", progress=0,
+                params={"participant_ids": [5]}, heartbeat_at=datetime.now(timezone.utc)
+            )
+            db.add(job)
+            await db.commit()
+            ids = [
+                await schedule_recompute(db, team_id, participant_ids=[9, 7]),
+                await schedule_recompute(db, team_id, meeting_ids=[3]),
+            ]
+            extended = dict((await db.get(Job, job.id, populate_existing=True)).params)
+            ids.append(await schedule_recompute(db, team_id))
+            everything = (await db.get(Job, job.id, populate_existing=True)).params
+        return job.id, ids, extended, everything
+
+    job_id, ids, extended, everything = run_db(scenario)
+
+    assert ids == [job_id] * 3
+    assert extended == {"participant_ids": [5, 7, 9], "meeting_ids": [3]}
+    assert everything == {}
@@ -0,0 +1,140 @@
+"""Recurrence expansion and meeting series creation."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select
+
+from app.database import AsyncSessionLocal
+from app.models.meeting import Meeting, meeting_participants
+from app.services.recurrence import MAX_OCCURRENCES, expand_recurrence
+from tests.factories import create_participant, create_team, create_user
+
+MONDAY = datetime(2026, 10, 19, 9, 30, tzinfo=timezone.utc)
+
+
+def test_daily_steps_by_interval_and_keeps_the_time_of_day():
+    occurrences = expand_recurrence(MONDAY, "daily", interval=2, count=4)
+
+    assert occurrences == [MONDAY + timedelta(days=days) for days in (0, 2, 4, 6)]
+
+
+def test_daily_with_weekdays_skips_the_other_days():
+    occurrences = expand_recurrence(MONDAY, "daily", until=MONDAY + timedelta(days=13), weekdays=[0, 2, 4])
+
+    assert [occurrence.weekday() for occurrence in occurrences] == [0, 2, 4] * 2
+
+
+def test_weekly_visits_each_weekday_from_the_start_on():
+    wednesday = MONDAY + timedelta(days=2)
+    occurrences = expand_recurrence(wednesday, "weekly", interval=2, count=5, weekdays=[4, 0, 2])
+
+    assert occurrences == [
+        wednesday,
+        wednesday + timedelta(days=2),
+        MONDAY + timedelta(weeks=2),
+        wednesday + timedelta(weeks=2),
+        wednesday + timedelta(weeks=2, days=2),
+    ]
+
+
+def test_until_is_inclusive():
+    occurrences = expand_recurrence(MONDAY, "weekly", until=MONDAY + timedelta(weeks=3))
+
+    assert occurrences[-1] == MONDAY + timedelta(weeks=3)
+    assert len(occurrences) == 4
+
+
+def test_count_caps_an_until_rule():
+    assert len(expand_recurrence(MONDAY, "daily", count=3, until=MONDAY + timedelta(days=30))) == 3
+
+
+def test_series_may_reach_but_not_exceed_the_limit():
+    assert len(expand_recurrence(MONDAY, "daily", count=MAX_OCCURRENCES)) == MAX_OCCURRENCES
+    with pytest.raises(ValueError, match="more than"):
+        expand_recurrence(MONDAY, "daily", until=MONDAY + timedelta(days=MAX_OCCURRENCES))
+
+
+@pytest.mark.parametrize("kwargs, message", [
+    ({"frequency": "daily"}, "count or until"),
+    ({"frequency": "daily", "count": 3, "interval": 0}, "interval"),
+    ({"frequency": "daily", "until": datetime(2026, 11, 1)}, "timezone"),
+    ({"frequency": "daily", "count": 3, "interval": 7, "weekdays": [1]}, "never falls"),
+    ({"frequency": "monthly", "count": 3}, "Unknown"),
+])
+def test_invalid_rules_are_rejected(kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        expand_recurrence(MONDAY, **kwargs)
+
+
+def test_expansion_stops_at_the_last_representable_date():
+    start = datetime(9999, 12, 20, 9, 30)
+
+    assert len(expand_recurrence(start, "daily", count=30)) == 12
+    assert len(expand_recurrence(start, "weekly", count=30)) == 2
+
+
+def _series(participant_ids: list[int], **recurrence) -> dict:
+    return {
+        "title": "Stand-up",
+        "meeting_type": "status_update",
+        "scheduled_time": MONDAY.isoformat(),
+        "participant_ids": participant_ids,
+        "recurrence": {"frequency": "daily", **recurrence},
+    }
+
+
+async def _counts(team_id: int) -> tuple[int, int]:
+    async with AsyncSessionLocal() as db:
+        meetings = await db.scalar(select(func.count()).select_from(Meeting).where(Meeting.team_id == team_id))
+        links = await db.scalar(
+            select(func.count()).select_from(meeting_participants)
+            .join(Meeting, Meeting.id == meeting_participants.c.meeting_id)
+            .where(Meeting.team_id == team_id)
+        )
+    return meetings, links
+
+
+def test_series_creates_every_meeting_with_its_participants(run_api):
+    async def scenario(client):
+        async with AsyncSessionLocal() as db:
+            team_id = await create_team(db)
+            headers = await create_user(db, team_id, "lead@example.com")
+            participant_ids = [await create_participant(db, team_id, f"p{index}@example.com") for index in range(3)]
+            await db.commit()
+        response = await client.post(
+            "/api/meetings/series", json=_series(participant_ids, count=5, weekdays=[0, 1, 2, 3, 4]), headers=headers
+        )
+        return response, await _counts(team_id)
+
+    response, counts = run_api(scenario)
+
+    assert response.status_code == 201
+    body = response.json()
+    assert body["total_created"] == 5
+    assert [meeting["participant_count"] for meeting in body["meetings"]] == [3] * 5
+    assert counts == (5, 15)
+
+
+def test_series_with_a_foreign_participant_creates_nothing(run_api):
+    async def scenario(client):
+        async with AsyncSessionLocal() as db:
+            team_id = await create_team(db)
+            other_team_id = await create_team(db, "Other")
+            headers = await create_user(db, team_id, "lead@example.com")
+            own = await create_participant(db, team_id, "own@example.com")
+            foreign = await create_participant(db, other_team_id, "foreign@example.com")
+            await db.commit()
+        invalid = await client.post("/api/meetings/series", json=_series([own, foreign], count=3), headers=headers)
+        too_long = await client.post(
+            "/api/meetings/series",
+            json=_series([own], until=(MONDAY + timedelta(days=MAX_OCCURRENCES)).isoformat()),
+            headers=headers
+        )
+        return invalid, too_long, await _counts(team_id)
+
+    invalid, too_long, counts = run_api(scenario)
+
+    assert invalid.status_code == 400
+    assert too_long.status_code == 400
+    assert counts == (0, 0)
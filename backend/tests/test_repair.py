@@ -0,0 +1,125 @@
+"""Incremental assignment repair compared with a full greedy recompute."""
+
+import random
+from datetime import datetime
+
+import pytest
+
+from app.services.fitness import (
+    DEFAULT_TABLES,
+    ParticipantProfile,
+    build_fitness_matrix,
+    greedy_assignment,
+    repair_holders,
+)
+
+ROLES = DEFAULT_TABLES.roles
+MEETING_TIME = datetime(2026, 10, 19, 10)
+
+
+def _profiles(rng: random.Random, count: int, first_id: int = 1) -> list[ParticipantProfile]:
+    return [
+        ParticipantProfile(
+            id=participant_id,
+            name=f"p{participant_id:03d}",
+            peak_hours_start=rng.randint(6, 12),
+            peak_hours_end=rng.randint(13, 20),
+            emotional_intelligence=rng.randint(0, 100),
+            social_intelligence=rng.randint(0, 100),
+        )
+        for participant_id in range(first_id, first_id + count)
+    ]
+
+
+def _matrix(participants: list[ParticipantProfile]) -> dict:
+    return build_fitness_matrix(participants, "review", MEETING_TIME, {}, DEFAULT_TABLES)
+
+
+def _recompute(participants: list[ParticipantProfile]) -> dict[str, tuple[int, float]]:
+    return {
+        assignment["role"]: (assignment["participant_id"], assignment["score"])
+        for assignment in greedy_assignment(_matrix(participants), participants, ROLES)
+    }
+
+
+def _rows(participants: list[ParticipantProfile]) -> dict[int, tuple[str, dict[str, float]]]:
+    matrix = _matrix(participants)
+    return {
+        participant.id: (participant.name, {role: matrix[(participant.id, role)] for role in ROLES})
+        for participant in participants
+    }
+
+
+def _repair(before, after, added_ids=(), removed_ids=()):
+    stored = _recompute(before)
+    holders = {role: holder for role, holder in stored.items() if holder[0] not in set(removed_ids)}
+    return stored, repair_holders(holders, _rows(after), ROLES, set(added_ids))
+
+
+def _holder_ids(holders: dict) -> dict[str, int]:
+    return {role: participant_id for role, (participant_id, _) in holders.items()}
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_removing_participant_without_role_matches_recompute(seed):
+    rng = random.Random(seed)
+    team = _profiles(rng, rng.randint(len(ROLES) + 1, 12))
+    assigned = {participant_id for participant_id, _ in _recompute(team).values()}
+    leaving = next(participant for participant in team if participant.id not in assigned)
+    after = [participant for participant in team if participant is not leaving]
+
+    _, repaired = _repair(team, after, removed_ids=[leaving.id])
+
+    assert _holder_ids(repaired) == _holder_ids(_recompute(after))
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_joining_participant_beating_no_holder_matches_recompute(seed):
+    rng = random.Random(seed)
+    team = _profiles(rng, rng.randint(1, 12))
+    joining = ParticipantProfile(
+        id=100, name="p100", peak_hours_start=rng.randint(18, 22), peak_hours_end=23,
+        emotional_intelligence=rng.randint(0, 30), social_intelligence=rng.randint(0, 30)
+    )
+    after = team + [joining]
+    stored = _recompute(team)
+    scores = _rows(after)[joining.id][1]
+    if any(scores[role] > score for role, (_, score) in stored.items()):
+        pytest.skip("Generated participant beats a holder")
+
+    _, repaired = _repair(team, after, added_ids=[joining.id])
+
+    assert _holder_ids(repaired) == _holder_ids(_recompute(after))
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_repair_is_valid_and_locally_optimal(seed):
+    rng = random.Random(seed)
+    team = _profiles(rng, rng.randint(2, 12))
+    joining = _profiles(rng, rng.randint(1, 4), first_id=100)
+    leaving = rng.sample(team, rng.randint(0, len(team) - 1))
+    after = [participant for participant in team if participant not in leaving] + joining
+
+    stored, repaired = _repair(
+        team, after,
+        added_ids=[participant.id for participant in joining],
+        removed_ids=[participant.id for participant in leaving]
+    )
+    rows = _rows(after)
+
+    holder_ids = [participant_id for participant_id, _ in repaired.values()]
+    assert len(holder_ids) == len(set(holder_ids))
+    assert set(holder_ids) <= {participant.id for participant in after}
+    assert len(repaired) == min(len(ROLES), len(after))
+
+    # Every joiner without a role was considered: it beats no holder
+    for participant in joining:
+        if participant.id in holder_ids:
+            continue
+        for role, (_, score) in repaired.items():
+            assert rows[participant.id][1][role] <= score
+
+    # Repair never lowers fitness of roles kept from the stored assignment
+    for role, (participant_id, score) in stored.items():
+        if participant_id not in {participant.id for participant in leaving}:
+            assert repaired[role][1] >= score
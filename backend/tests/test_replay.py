@@ -0,0 +1,142 @@
+"""Corpus replay and compiled scoring tables compared with the per-meeting algorithm."""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.constants.meeting_types import VALID_MEETING_TYPES
+from app.services.corpus import MeetingRecord, TeamCorpus, assign_chronologically
+from app.services.energy_calculator import calculate_energy
+from app.services.fitness import (
+    DEFAULT_TABLES,
+    CompiledTables,
+    ParticipantProfile,
+    build_fitness_matrix,
+    compute_assignment,
+)
+from app.services.replay import replay_corpus, replay_report
+
+ROLES = DEFAULT_TABLES.roles
+START = datetime(2026, 10, 19, 8)
+
+
+def _profiles(rng: random.Random, count: int) -> list[ParticipantProfile]:
+    return [
+        ParticipantProfile(
+            id=participant_id,
+            name=f"p{participant_id:03d}",
+            peak_hours_start=rng.randint(6, 12),
+            peak_hours_end=rng.randint(13, 20),
+            emotional_intelligence=rng.randint(0, 100),
+            social_intelligence=rng.randint(0, 100),
+        )
+        for participant_id in range(1, count + 1)
+    ]
+
+
+def _corpus(seed: int, members: int = 12, meetings: int = 40) -> TeamCorpus:
+    rng = random.Random(seed)
+    participants = _profiles(rng, members)
+    records = [
+        MeetingRecord(
+            id=index + 1,
+            meeting_type=rng.choice(VALID_MEETING_TYPES),
+            scheduled_time=START + timedelta(days=index // 3, hours=rng.randint(0, 9)),
+            participant_ids=tuple(sorted(rng.sample(range(1, members + 1), rng.randint(len(ROLES), members)))),
+        )
+        for index in range(meetings)
+    ]
+    records.sort(key=lambda record: record.scheduled_time)
+    history = {participant.id: rng.sample(ROLES, 2) for participant in participants[:members // 2]}
+    return TeamCorpus(
+        team_id=1,
+        participants={participant.id: participant for participant in participants},
+        meetings=records,
+        history=history,
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_compiled_matrix_matches_the_plain_one(seed):
+    rng = random.Random(seed)
+    participants = _profiles(rng, 15)
+    compiled = CompiledTables(DEFAULT_TABLES)
+    history = {participant.id: rng.sample(ROLES, 3) for participant in participants[:5]}
+    history[participants[5].id] = ["critic"] * 4  # excluded from critic
+    for meeting_type in VALID_MEETING_TYPES:
+        time = START + timedelta(hours=rng.randint(0, 12))
+        plain = build_fitness_matrix(participants, meeting_type, time, history, DEFAULT_TABLES)
+        fast = compiled.fitness_matrix(
+            participants,
+            meeting_type,
+            {participant.id: calculate_energy(participant, time) for participant in participants},
+            {participant.id: compiled.static_fit(participant) for participant in participants},
+            history,
+        )
+        assert fast.keys() == plain.keys()
+        assert fast == pytest.approx(plain)
+    assert (participants[5].id, "critic") not in plain
+
+
+def test_compute_assignment_accepts_either_tables():
+    participants = _profiles(random.Random(7), 10)
+    plain = compute_assignment(participants, "planning", START, {}, DEFAULT_TABLES)
+    fast = compute_assignment(participants, "planning", START, {}, CompiledTables(DEFAULT_TABLES))
+
+    assert [(a["role"], a["participant_id"]) for a in fast] == [(a["role"], a["participant_id"]) for a in plain]
+    assert [a["score"] for a in fast] == pytest.approx([a["score"] for a in plain])
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_replay_matches_chronological_assignment(seed):
+    corpus = _corpus(seed)
+    history_before = {participant_id: list(roles) for participant_id, roles in corpus.history.items()}
+
+    replayed = replay_corpus(corpus)
+    expected = assign_chronologically(corpus)
+
+    assert list(replayed) == [meeting.id for meeting in corpus.meetings]
+    assert {
+        meeting_id: [(a["role"], a["participant_id"]) for a in rows] for meeting_id, rows in replayed.items()
+    } == {
+        meeting_id: [(a["role"], a["participant_id"]) for a in rows] for meeting_id, rows in expected.items()
+    }
+    assert corpus.history == history_before
+
+
+def test_history_carries_between_replayed_meetings():
+    corpus = _corpus(11, members=len(ROLES), meetings=12)
+    results = replay_corpus(corpus)
+
+    # With exactly one member per role, nobody holds the same role five meetings in a row
+    streaks: dict[int, list[str]] = {pid: list(roles) for pid, roles in corpus.history.items()}
+    for meeting in corpus.meetings:
+        for assignment in results[meeting.id]:
+            recent = streaks.setdefault(assignment["participant_id"], [])
+            assert recent[:4] != [assignment["role"]] * 4
+            recent.insert(0, assignment["role"])
+
+
+def test_report_of_identical_tables_has_no_changes():
+    corpus = _corpus(3)
+    report = replay_report(corpus, DEFAULT_TABLES, DEFAULT_TABLES)
+
+    assert report.meetings == len(corpus.meetings)
+    assert (report.meetings_changed, report.roles_changed, report.diffs) == (0, 0, [])
+    assert report.candidate_fitness == report.baseline_fitness
+
+
+def test_report_counts_the_meetings_a_change_moves():
+    corpus = _corpus(4)
+    candidate = DEFAULT_TABLES.with_overrides(meeting_multipliers={
+        meeting_type: {"critic": 3.0} for meeting_type in VALID_MEETING_TYPES
+    })
+
+    report = replay_report(corpus, candidate, max_diffs=2)
+    full = replay_report(corpus, candidate)
+
+    assert report.meetings_changed == full.meetings_changed > 0
+    assert report.roles_changed == sum(len(diff.changes) for diff in full.diffs)
+    assert report.diffs == full.diffs[:2]
+    assert report.candidate_fitness != report.baseline_fitness
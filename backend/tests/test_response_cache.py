@@ -0,0 +1,160 @@
+"""Per-worker response cache: invalidation, generations and single-flight fills."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.services.event_bus import ASSIGNMENT_CHANGED, MEETING_CHANGED, PARTICIPANT_CHANGED, Event
+from app.services.response_cache import ASSIGNMENTS, MEETINGS, PARTICIPANTS, STATISTICS, ResponseCache
+
+
+class Loader:
+    """Counting load() whose calls can be held until released."""
+
+    def __init__(self, value: str = "value"):
+        self.value = value
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        await self.release.wait()
+        return f"{self.value}-{self.calls}"
+
+
+def _cached(cache: ResponseCache, team_id: int, scope: str, key) -> bool:
+    """Whether a fresh entry would be served without loading."""
+    entry = cache._entries.get((team_id, scope, key))
+    return entry is not None and cache._stale_for(entry, time.monotonic()) < 0
+
+
+def test_hits_misses_and_lru_eviction():
+    async def scenario():
+        cache = ResponseCache(max_entries=2, ttl_seconds=60)
+        load = Loader()
+        first = await cache.get_or_load(1, MEETINGS, "a", load)
+        again = await cache.get_or_load(1, MEETINGS, "a", load)
+        await cache.get_or_load(1, MEETINGS, "b", load)
+        await cache.get_or_load(1, MEETINGS, "a", load)  # a becomes the most recently used
+        await cache.get_or_load(1, MEETINGS, "c", load)
+        return cache, first, again, load.calls
+
+    cache, first, again, calls = asyncio.run(scenario())
+
+    assert first[0] == again[0] == "value-1"
+    assert calls == 3
+    assert _cached(cache, 1, MEETINGS, "a") and _cached(cache, 1, MEETINGS, "c")
+    assert not _cached(cache, 1, MEETINGS, "b")
+    assert cache.metrics()["scopes"][MEETINGS]["evictions"] >= 1
+
+
+def test_errors_are_not_cached():
+    async def scenario():
+        cache = ResponseCache(max_entries=10, ttl_seconds=60)
+
+        async def failing():
+            raise LookupError("gone")
+
+        with pytest.raises(LookupError):
+            await cache.get_or_load(1, MEETINGS, "list", failing)
+        return await cache.get_or_load(1, MEETINGS, "list", Loader())
+
+    assert asyncio.run(scenario())[0] == "value-1"
+
+
+def test_events_invalidate_the_scopes_they_touch():
+    cache = ResponseCache(max_entries=100, ttl_seconds=60)
+
+    def fill():
+        for scope, key in ((PARTICIPANTS, "list"), (MEETINGS, "list"), (STATISTICS, (1, 30)),
+                           (ASSIGNMENTS, (1,)), (ASSIGNMENTS, (2,))):
+            for team_id in (1, 2):
+                asyncio.run(cache.get_or_load(team_id, scope, key, Loader()))
+
+    def fresh(team_id: int) -> set:
+        return {
+            (scope, key) for scope, key in ((PARTICIPANTS, "list"), (MEETINGS, "list"), (STATISTICS, (1, 30)),
+                                            (ASSIGNMENTS, (1,)), (ASSIGNMENTS, (2,)))
+            if _cached(cache, team_id, scope, key)
+        }
+
+    fill()
+    cache.on_event(Event(team_id=1, type=ASSIGNMENT_CHANGED, data={"meeting_ids": [2]}))
+    assert fresh(1) == {(PARTICIPANTS, "list"), (ASSIGNMENTS, (1,))}
+    assert len(fresh(2)) == 5
+
+    cache.clear()
+    fill()
+    cache.on_event(Event(team_id=1, type=MEETING_CHANGED, data={}))
+    assert fresh(1) == {(PARTICIPANTS, "list")}
+
+    cache.clear()
+    fill()
+    cache.on_event(Event(team_id=1, type=PARTICIPANT_CHANGED, data={"participant_ids": [1]}))
+    assert fresh(1) == set()
+
+
+def test_concurrent_misses_share_one_load():
+    async def scenario():
+        cache = ResponseCache(max_entries=10, ttl_seconds=60)
+        load = Loader()
+        load.release.clear()
+        waiting = [asyncio.create_task(cache.get_or_load(1, MEETINGS, "list", load)) for _ in range(5)]
+        await asyncio.sleep(0)
+        waiting[0].cancel()  # a cancelled request does not cancel the shared load
+        load.release.set()
+        results = await asyncio.gather(*waiting[1:])
+        return results, load.calls, await cache.get_or_load(1, MEETINGS, "list", load)
+
+    results, calls, cached = asyncio.run(scenario())
+
+    assert [value for value, _, _ in results] == ["value-1"] * 4
+    assert calls == 1
+    assert cached[0] == "value-1"
+
+
+@pytest.mark.parametrize("keys", [None, [(1,)]])
+def test_a_load_racing_with_a_write_is_not_stored(keys):
+    async def scenario():
+        cache = ResponseCache(max_entries=10, ttl_seconds=60)
+        before = Loader("before")
+        before.release.clear()
+        started = asyncio.create_task(cache.get_or_load(1, ASSIGNMENTS, (1,), before))
+        await asyncio.sleep(0)
+        cache.invalidate(1, ASSIGNMENTS, keys)
+        after = Loader("after")
+        late = asyncio.create_task(cache.get_or_load(1, ASSIGNMENTS, (1,), after))
+        await asyncio.sleep(0)
+        before.release.set()
+        return await started, await late, await cache.get_or_load(1, ASSIGNMENTS, (1,), Loader("next"))
+
+    started, late, cached = asyncio.run(scenario())
+
+    assert started[0] == "before-1"
+    assert late[0] == "after-1"  # did not join the load that predates the write
+    assert cached[0] == "after-1"
+
+
+def test_other_keys_and_own_writes_do_not_discard_a_load():
+    async def scenario():
+        cache = ResponseCache(max_entries=10, ttl_seconds=60)
+
+        async def repairing():
+            # The load itself writes and publishes the meeting it is loading (lazy recompute)
+            cache.invalidate(1, ASSIGNMENTS, [(1,), (2,)])
+            return "repaired"
+
+        other = Loader("other")
+        other.release.clear()
+        pending = asyncio.create_task(cache.get_or_load(1, ASSIGNMENTS, (3,), other))
+        await asyncio.sleep(0)
+        await cache.get_or_load(1, ASSIGNMENTS, (1,), repairing)
+        other.release.set()
+        await pending
+        return _cached(cache, 1, ASSIGNMENTS, (1,)), _cached(cache, 1, ASSIGNMENTS, (3,))
+
+    own, other = asyncio.run(scenario())
+
+    assert own and other
@@ -0,0 +1,103 @@
+"""Versioned per-team algorithm settings and their conditional requests."""
+
+import pytest
+
+from app.database import AsyncSessionLocal
+from app.services.fitness import DEFAULT_TABLES
+from app.services.settings_store import (
+    SettingsConflict,
+    current_version,
+    list_versions,
+    load_team_settings,
+    save_team_settings,
+)
+from tests.factories import create_team, create_user
+
+
+def test_saves_create_consecutive_versions(run_db):
+    async def scenario():
+        async with AsyncSessionLocal() as db:
+            team_id = await create_team(db)
+            await db.commit()
+            initial = await load_team_settings(db, team_id)
+            strict = DEFAULT_TABLES.with_overrides(history_penalties=[0.0, 0.5])
+            first = await save_team_settings(db, team_id, strict)
+            second = await save_team_settings(db, team_id, DEFAULT_TABLES, expected_version=1)
+            with pytest.raises(SettingsConflict):
+                await save_team_settings(db, team_id, strict, expected_version=1)
+            with pytest.raises(LookupError):
+                await load_team_settings(db, team_id, version=5)
+            return (
+                initial, first, second,
+                await load_team_settings(db, team_id, version=1),
+                await current_version(db, team_id),
+                [row.version for row in await list_versions(db, team_id)],
+            )
+
+    initial, first, second, stored_first, latest, versions = run_db(scenario)
+
+    assert (initial.version, initial.tables) == (0, DEFAULT_TABLES)
+    assert (first.version, second.version, latest) == (1, 2, 2)
+    assert stored_first.tables.history_penalties == (0.0, 0.5)
+    assert stored_first.tables.role_requirements == DEFAULT_TABLES.role_requirements
+    assert versions == [2, 1]
+    assert first.etag != second.etag
+
+
+def test_settings_api_uses_etags_for_reads_and_saves(run_api):
+    async def scenario(client):
+        async with AsyncSessionLocal() as db:
+            team_id = await create_team(db)
+            headers = await create_user(db, team_id, "lead@example.com")
+            await db.commit()
+        initial = await client.get("/api/settings", headers=headers)
+        etag = initial.headers["ETag"]
+        not_modified = await client.get("/api/settings", headers={**headers, "If-None-Match": etag})
+        body = {"meeting_multipliers": {"review": {"critic": 2.0}}}
+        saved = await client.put("/api/settings", json=body, headers={**headers, "If-Match": etag})
+        lost_update = await client.put("/api/settings", json=body, headers={**headers, "If-Match": etag})
+        unconditional = await client.put("/api/settings", json=body, headers=headers)
+        invalid = await client.put("/api/settings", json=body, headers={**headers, "If-Match": "garbage"})
+        unknown = await client.put("/api/settings", json={"meeting_multipliers": {"party": {}}}, headers=headers)
+        changed = await client.get("/api/settings", headers={**headers, "If-None-Match": etag})
+        return initial, not_modified, saved, lost_update, unconditional, invalid, unknown, changed
+
+    initial, not_modified, saved, lost_update, unconditional, invalid, unknown, changed = run_api(scenario)
+
+    assert initial.status_code == 200 and initial.json()["version"] == 0
+    assert not_modified.status_code == 304
+    assert saved.status_code == 200
+    assert saved.json()["version"] == 1
+    assert saved.json()["meeting_multipliers"]["review"]["critic"] == 2.0
+    assert saved.json()["recompute_job_id"] is not None
+    assert saved.headers["ETag"] != initial.headers["ETag"]
+    assert lost_update.status_code == 412
+    assert unconditional.json()["version"] == 2
+    assert invalid.status_code == 400
+    assert unknown.status_code == 422
+    assert changed.status_code == 200 and changed.headers["ETag"] == unconditional.headers["ETag"]
+
+
+def test_scoring_tables_are_public(run_api):
+    async def scenario(client):
+        async with AsyncSessionLocal() as db:
+            team_id = await create_team(db)
+            headers = await create_user(db, team_id, "lead@example.com")
+            await db.commit()
+        await client.put("/api/settings", json={"meeting_multipliers": {"review": {"critic": 2.0}}}, headers=headers)
+        return (
+            await client.get("/api/settings/meeting-multipliers"),
+            await client.get("/api/settings/role-requirements"),
+            await client.get("/api/settings/meeting-multipliers", headers=headers),
+            await client.get("/api/settings"),
+        )
+
+    anonymous, requirements, team, private = run_api(scenario)
+
+    assert anonymous.status_code == 200
+    assert anonymous.json() == DEFAULT_TABLES.meeting_multipliers
+    assert "ETag" not in anonymous.headers
+    assert requirements.json() == DEFAULT_TABLES.role_requirements
+    assert team.json()["review"]["critic"] == 2.0
+    assert team.headers["ETag"]
+    assert private.status_code == 401
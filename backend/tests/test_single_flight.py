@@ -0,0 +1,112 @@
+"""Single-flight coalescing of concurrent calls."""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import func, select
+
+from app.database import AsyncSessionLocal
+from app.models.role_assignment import RoleAssignment
+from app.services.single_flight import SingleFlight
+from tests.factories import create_meeting, create_participant, create_team, create_user
+
+
+def test_concurrent_calls_share_one_run():
+    async def scenario():
+        flight = SingleFlight()
+        calls = []
+        release = asyncio.Event()
+
+        async def compute(key):
+            calls.append(key)
+            await release.wait()
+            return f"result-{key}"
+
+        waiting = [asyncio.create_task(flight.do(key, lambda key=key: compute(key))) for key in ("a", "a", "b", "a")]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiting)
+        after = await flight.do("a", lambda: compute("a"))
+        return calls, results, after
+
+    calls, results, after = asyncio.run(scenario())
+
+    assert results == ["result-a", "result-a", "result-b", "result-a"]
+    assert calls == ["a", "b", "a"]  # a finished call is not cached
+    assert after == "result-a"
+
+
+def test_a_cancelled_caller_does_not_cancel_the_others():
+    async def scenario():
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def compute():
+            await release.wait()
+            return 42
+
+        first = asyncio.create_task(flight.do("key", compute))
+        second = asyncio.create_task(flight.do("key", compute))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        return first, await second
+
+    first, result = asyncio.run(scenario())
+
+    assert first.cancelled()
+    assert result == 42
+
+
+def test_errors_reach_every_caller_and_the_key_is_released():
+    async def scenario():
+        flight = SingleFlight()
+        attempts = []
+
+        async def failing():
+            attempts.append(1)
+            await asyncio.sleep(0)
+            raise ValueError("no participants")
+
+        results = await asyncio.gather(
+            flight.do("key", failing), flight.do("key", failing), return_exceptions=True
+        )
+        with pytest.raises(ValueError):
+            await flight.do("key", failing)
+        return results, len(attempts)
+
+    results, attempts = asyncio.run(scenario())
+
+    assert [str(result) for result in results] == ["no participants", "no participants"]
+    assert attempts == 2
+
+
+def test_concurrent_assign_roles_requests_write_one_assignment(run_api):
+    async def scenario(client):
+        async with AsyncSessionLocal() as db:
+            team_id = await create_team(db)
+            headers = await create_user(db, team_id, "lead@example.com")
+            participant_ids = [await create_participant(db, team_id, f"p{index}@example.com") for index in range(9)]
+            meeting_id = await create_meeting(
+                db, team_id, datetime(2026, 10, 20, 10, tzinfo=timezone.utc), participant_ids
+            )
+            await db.commit()
+        responses = await asyncio.gather(*(
+            client.post(f"/api/meetings/{meeting_id}/assign-roles", headers=headers) for _ in range(5)
+        ))
+        async with AsyncSessionLocal() as db:
+            stored = await db.scalar(
+                select(func.count()).select_from(RoleAssignment).where(RoleAssignment.meeting_id == meeting_id)
+            )
+        return responses, stored
+
+    responses, stored = run_api(scenario)
+
+    assert [response.status_code for response in responses] == [200] * 5
+    bodies = [
+        sorted((a["role"], a["participant_id"]) for a in response.json()["assignments"]) for response in responses
+    ]
+    assert all(body == bodies[0] for body in bodies)
+    assert stored == 7
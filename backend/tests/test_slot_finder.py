@@ -0,0 +1,93 @@
+"""Optimal meeting-time finder compared with scoring every slot from scratch."""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.services.energy_calculator import calculate_energy
+from app.services.fitness import DEFAULT_TABLES, ParticipantProfile, build_fitness_matrix, greedy_assignment
+from app.services.slot_finder import MAX_SLOTS, candidate_slots, find_best_slots
+
+WINDOW_START = datetime(2026, 10, 19, 6, tzinfo=timezone.utc)
+
+
+def _profiles(rng: random.Random, count: int) -> list[ParticipantProfile]:
+    return [
+        ParticipantProfile(
+            id=participant_id,
+            name=f"p{participant_id:03d}",
+            peak_hours_start=rng.randint(6, 12),
+            peak_hours_end=rng.randint(13, 20),
+            emotional_intelligence=rng.randint(0, 100),
+            social_intelligence=rng.randint(0, 100),
+        )
+        for participant_id in range(1, count + 1)
+    ]
+
+
+def _naive(participants, meeting_type, slots, history) -> list[tuple[datetime, float, float, int]]:
+    scored = []
+    for slot in slots:
+        fitness_matrix = build_fitness_matrix(participants, meeting_type, slot, history, DEFAULT_TABLES)
+        assignments = greedy_assignment(fitness_matrix, participants, DEFAULT_TABLES.roles)
+        energy = sum(calculate_energy(participant, slot) for participant in participants) / len(participants)
+        scored.append((slot, sum(assignment["score"] for assignment in assignments), energy, len(assignments)))
+    return scored
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_best_slots_match_scoring_every_slot(seed):
+    rng = random.Random(seed)
+    participants = _profiles(rng, rng.randint(5, 12))
+    roles = DEFAULT_TABLES.roles
+    history = {
+        participant.id: [rng.choice(roles)] * rng.randint(0, 4) for participant in participants
+    }
+    slots = candidate_slots(WINDOW_START, WINDOW_START + timedelta(hours=36), 15)
+
+    best = find_best_slots(participants, "planning", slots, history, top_k=len(slots))
+    naive = {
+        slot: (total, energy, count) for slot, total, energy, count in _naive(participants, "planning", slots, history)
+    }
+
+    assert [slot.scheduled_time for slot in best] == sorted(slots, key=lambda slot: (
+        -round(naive[slot][0], 6), -round(naive[slot][1], 6), slot
+    ))
+    for slot in best:
+        total, energy, count = naive[slot.scheduled_time]
+        assert slot.total_fitness == pytest.approx(round(total, 2))
+        assert slot.average_energy == pytest.approx(round(energy, 2))
+        assert slot.assigned_roles == count
+
+
+def test_top_k_is_the_head_of_the_full_ranking():
+    participants = _profiles(random.Random(7), 8)
+    slots = candidate_slots(WINDOW_START, WINDOW_START + timedelta(days=2), 30)
+
+    ranking = find_best_slots(participants, "review", slots, {}, top_k=len(slots))
+
+    assert find_best_slots(participants, "review", slots, {}, top_k=5) == ranking[:5]
+
+
+def test_aware_slots_are_scored_at_their_utc_hour():
+    participants = _profiles(random.Random(3), 6)
+    offset = timezone(timedelta(hours=3))
+    utc_slots = candidate_slots(WINDOW_START, WINDOW_START + timedelta(hours=12), 60)
+    local_slots = [slot.astimezone(offset) for slot in utc_slots]
+
+    utc = find_best_slots(participants, "brainstorm", utc_slots, {}, top_k=12)
+    local = find_best_slots(participants, "brainstorm", local_slots, {}, top_k=12)
+
+    assert [(slot.total_fitness, slot.average_energy) for slot in local] == [
+        (slot.total_fitness, slot.average_energy) for slot in utc
+    ]
+
+
+def test_candidate_slots_cover_the_half_open_window():
+    slots = candidate_slots(WINDOW_START, WINDOW_START + timedelta(hours=2, minutes=10), 30)
+
+    assert slots == [WINDOW_START + timedelta(minutes=30 * index) for index in range(4)]
+    assert len(candidate_slots(WINDOW_START, WINDOW_START + timedelta(minutes=15 * MAX_SLOTS), 15)) == MAX_SLOTS
+    with pytest.raises(ValueError):
+        candidate_slots(WINDOW_START, WINDOW_START + timedelta(minutes=15 * (MAX_SLOTS + 1)), 15)
@@ -0,0 +1,108 @@
+"""Stale-while-revalidate reads of the response cache."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from app.database import AsyncSessionLocal
+from app.services.event_bus import ASSIGNMENT_CHANGED, event_bus
+from app.services.response_cache import ASSIGNMENTS, ResponseCache
+from tests.factories import create_meeting, create_participant, create_team, create_user
+
+
+def _loads(*outcomes):
+    """load() returning (or raising) the given outcomes in turn, recording its calls."""
+    calls = []
+
+    async def load():
+        calls.append(len(calls))
+        outcome = outcomes[min(len(calls), len(outcomes)) - 1]
+        await asyncio.sleep(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return load, calls
+
+
+def test_stale_entries_are_served_while_they_refresh():
+    async def scenario():
+        cache = ResponseCache(max_entries=10, ttl_seconds=60)
+        load, calls = _loads("old", "new")
+        await cache.get_or_load(1, ASSIGNMENTS, (1,), load, max_stale=5)
+        await asyncio.sleep(0.05)
+        cache.invalidate(1, ASSIGNMENTS, [(1,)])
+        stale = await cache.get_or_load(1, ASSIGNMENTS, (1,), load, max_stale=5)
+        also_stale = await cache.get_or_load(1, ASSIGNMENTS, (1,), load, max_stale=5)
+        await asyncio.sleep(0.01)
+        fresh = await cache.get_or_load(1, ASSIGNMENTS, (1,), load, max_stale=5)
+        return stale, also_stale, fresh, len(calls), cache.metrics()["scopes"][ASSIGNMENTS]
+
+    stale, also_stale, fresh, calls, stats = asyncio.run(scenario())
+
+    assert stale[0] == also_stale[0] == "old"
+    assert stale[1] >= 0.05  # age of the served value
+    assert fresh[0] == "new" and fresh[1] < stale[1]
+    assert calls == 2  # one refresh for both stale reads
+    assert stats["stale_hits"] == 2
+
+
+def test_reads_wait_for_a_fresh_value_beyond_max_stale():
+    async def scenario():
+        cache = ResponseCache(max_entries=10, ttl_seconds=60)
+        load, _ = _loads("old", "new", "newest")
+        await cache.get_or_load(1, ASSIGNMENTS, (1,), load)
+        cache.invalidate(1, ASSIGNMENTS)
+        strict = await cache.get_or_load(1, ASSIGNMENTS, (1,), load)
+        cache.invalidate(1, ASSIGNMENTS)
+        await asyncio.sleep(0.05)
+        expired = await cache.get_or_load(1, ASSIGNMENTS, (1,), load, max_stale=0.01)
+        return strict[0], expired[0]
+
+    assert asyncio.run(scenario()) == ("new", "newest")
+
+
+def test_failed_refreshes_keep_or_drop_the_stale_entry():
+    async def scenario(error: Exception):
+        cache = ResponseCache(max_entries=10, ttl_seconds=60)
+        load, _ = _loads("old", error, "reloaded")
+        await cache.get_or_load(1, ASSIGNMENTS, (1,), load)
+        cache.invalidate(1, ASSIGNMENTS)
+        served = await cache.get_or_load(1, ASSIGNMENTS, (1,), load, max_stale=5)
+        await asyncio.sleep(0.01)
+        after = await cache.get_or_load(1, ASSIGNMENTS, (1,), load, max_stale=5)
+        return served[0], after[0]
+
+    assert asyncio.run(scenario(TimeoutError("database busy"))) == ("old", "old")
+    assert asyncio.run(scenario(LookupError("meeting deleted"))) == ("old", "reloaded")
+
+
+def test_a_stale_body_keeps_the_etag_of_its_version(run_api):
+    async def scenario(client):
+        async with AsyncSessionLocal() as db:
+            team_id = await create_team(db)
+            headers = await create_user(db, team_id, "lead@example.com")
+            participant_ids = [await create_participant(db, team_id, f"p{index}@example.com") for index in range(8)]
+            meeting_id = await create_meeting(
+                db, team_id, datetime.now(timezone.utc) + timedelta(days=1), participant_ids
+            )
+            await db.commit()
+        await client.post(f"/api/meetings/{meeting_id}/assign-roles", headers=headers)
+        url = f"/api/meetings/{meeting_id}/assignments"
+        cached = await client.get(url, headers=headers)
+        # Another worker's write: only the data version tells this worker's cache
+        async with AsyncSessionLocal() as db:
+            await event_bus.publish_in(db, team_id, ASSIGNMENT_CHANGED, meeting_ids=[meeting_id])
+            await db.commit()
+        stale = await client.get(url, headers=headers)
+        await asyncio.sleep(0.2)
+        refreshed = await client.get(url, headers=headers)
+        return cached, stale, refreshed
+
+    cached, stale, refreshed = run_api(scenario)
+
+    assert stale.status_code == 200
+    assert stale.headers["ETag"] == cached.headers["ETag"]
+    assert stale.json() == cached.json()
+    assert refreshed.headers["ETag"] != cached.headers["ETag"]
+    assert refreshed.headers["Age"] == "0"
+    assert refreshed.json() == cached.json()
@@ -0,0 +1,145 @@
+"""Input fingerprints and stale flags of stored assignments."""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+
+from app.database import AsyncSessionLocal
+from app.models.meeting import Meeting, meeting_participants
+from app.services.assignment_engine import assign_roles
+from app.services.fitness import ParticipantProfile
+from app.services.staleness import (
+    assignment_fingerprint,
+    mark_meetings_stale,
+    record_fingerprints,
+    resolve_stale,
+)
+from tests.factories import create_meeting, create_participant, create_team, create_user
+
+MEETING_TIME = datetime(2026, 10, 19, 10, tzinfo=timezone.utc)
+
+
+def _profile(participant_id: int, ei: int = 50) -> ParticipantProfile:
+    return ParticipantProfile(
+        id=participant_id, name=f"p{participant_id}", peak_hours_start=9, peak_hours_end=17,
+        emotional_intelligence=ei, social_intelligence=50,
+    )
+
+
+def test_fingerprint_covers_exactly_the_assignment_inputs():
+    people = [_profile(1), _profile(2)]
+    base = assignment_fingerprint("review", MEETING_TIME, people, 1)
+
+    assert assignment_fingerprint("review", MEETING_TIME + timedelta(minutes=30), people[::-1], 1) == base
+    assert assignment_fingerprint("review", MEETING_TIME + timedelta(days=7), people, 1) == base
+    assert assignment_fingerprint("review", MEETING_TIME + timedelta(hours=1), people, 1) != base
+    assert assignment_fingerprint("planning", MEETING_TIME, people, 1) != base
+    assert assignment_fingerprint("review", MEETING_TIME, people, 2) != base
+    assert assignment_fingerprint("review", MEETING_TIME, [_profile(1), _profile(2, ei=51)], 1) != base
+    assert assignment_fingerprint("review", MEETING_TIME, people[:1], 1) != base
+    assert assignment_fingerprint("review", MEETING_TIME, people, 1, {1: ["critic"]}) != base
+
+
+async def _state(meeting_ids: list[int]) -> dict[int, tuple[bool, int, str | None]]:
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(Meeting.id, Meeting.assignments_stale, Meeting.stale_seq, Meeting.assignment_fingerprint)
+            .where(Meeting.id.in_(meeting_ids))
+        )
+        return {row.id: (row.assignments_stale, row.stale_seq, row.assignment_fingerprint) for row in result.all()}
+
+
+async def _team(meetings: int) -> tuple[list[int], list[int]]:
+    """Assigned meetings of one team (plus an unassigned one, last)."""
+    async with AsyncSessionLocal() as db:
+        team_id = await create_team(db)
+        participant_ids = [await create_participant(db, team_id, f"p{index}@example.com") for index in range(8)]
+        meeting_ids = [
+            await create_meeting(db, team_id, MEETING_TIME + timedelta(days=day), participant_ids)
+            for day in range(meetings + 1)
+        ]
+        await db.commit()
+    for meeting_id in meeting_ids[:-1]:
+        async with AsyncSessionLocal() as db:
+            await assign_roles(db, meeting_id)
+    return participant_ids, meeting_ids
+
+
+def test_clearing_the_flag_is_a_compare_and_set(run_db):
+    async def scenario():
+        _, meeting_ids = await _team(1)
+        assigned, unassigned = meeting_ids
+        fresh = await _state(meeting_ids)
+        async with AsyncSessionLocal() as db:
+            await mark_meetings_stale(db, meeting_ids)
+            await db.commit()
+        marked = await _state(meeting_ids)
+        fingerprint = fresh[assigned][2]
+        async with AsyncSessionLocal() as db:
+            # Computed before the mark: the flag stays
+            await record_fingerprints(db, {assigned: (fingerprint, fresh[assigned][1])})
+            await db.commit()
+        outdated = await _state(meeting_ids)
+        async with AsyncSessionLocal() as db:
+            await record_fingerprints(db, {assigned: (fingerprint, marked[assigned][1])})
+            await db.commit()
+        return assigned, unassigned, fresh, marked, outdated, await _state(meeting_ids)
+
+    assigned, unassigned, fresh, marked, outdated, cleared = run_db(scenario)
+
+    assert fresh[assigned][0] is False and fresh[assigned][2] is not None
+    assert marked[assigned][:2] == (True, fresh[assigned][1] + 1)
+    assert marked[unassigned] == fresh[unassigned] == (False, 0, None)
+    assert outdated[assigned][0] is True
+    assert cleared[assigned] == (False, marked[assigned][1], fresh[assigned][2])
+
+
+def test_only_meetings_with_changed_inputs_need_a_recompute(run_db):
+    async def scenario():
+        participant_ids, meeting_ids = await _team(2)
+        unchanged, edited = meeting_ids[:2]
+        async with AsyncSessionLocal() as db:
+            await mark_meetings_stale(db, [unchanged, edited])
+            await db.execute(meeting_participants.delete().where(
+                meeting_participants.c.meeting_id == edited,
+                meeting_participants.c.participant_id == participant_ids[0]
+            ))
+            await db.commit()
+        async with AsyncSessionLocal() as db:
+            changed = await resolve_stale(db, meeting_ids)
+            again = await resolve_stale(db, meeting_ids)
+        return unchanged, edited, changed, again, await _state([unchanged, edited])
+
+    unchanged, edited, changed, again, state = run_db(scenario)
+
+    assert changed == again == [edited]
+    assert state[unchanged][0] is False
+    assert state[edited][0] is True
+
+
+def test_profile_edits_reach_stored_assignments(run_api):
+    async def scenario(client):
+        now = datetime.now(timezone.utc)
+        async with AsyncSessionLocal() as db:
+            team_id = await create_team(db)
+            headers = await create_user(db, team_id, "lead@example.com")
+            participant_ids = [await create_participant(db, team_id, f"p{index}@example.com") for index in range(9)]
+            meeting_id = await create_meeting(db, team_id, now + timedelta(days=1), participant_ids)
+            await db.commit()
+        assigned = await client.post(f"/api/meetings/{meeting_id}/assign-roles", headers=headers)
+        removed = assigned.json()["assignments"][0]["participant_id"]
+        renamed = await client.put(f"/api/participants/{participant_ids[-1]}", json={"name": "x"}, headers=headers)
+        unflagged = await _state([meeting_id])
+        deleted = await client.delete(f"/api/participants/{removed}", headers=headers)
+        after = await client.get(f"/api/meetings/{meeting_id}/assignments", headers=headers)
+        return meeting_id, removed, renamed, unflagged, deleted, after, await _state([meeting_id])
+
+    meeting_id, removed, renamed, unflagged, deleted, after, state = run_api(scenario)
+
+    assert renamed.status_code == 200
+    assert unflagged[meeting_id][0] is False
+    assert deleted.status_code == 204
+    assert after.status_code == 200
+    holders = [assignment["participant_id"] for assignment in after.json()]
+    assert len(holders) == 7 and removed not in holders
+    assert state[meeting_id][0] is False
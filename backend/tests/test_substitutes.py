@@ -0,0 +1,92 @@
+"""Top-k substitutes per role."""
+
+import random
+from datetime import datetime, timezone
+
+import pytest
+
+from app.database import AsyncSessionLocal
+from app.services.fitness import DEFAULT_TABLES, ParticipantProfile, score_participant
+from app.services.substitutes import top_k_per_role
+from tests.factories import create_meeting, create_participant, create_team, create_user
+
+ROLES = DEFAULT_TABLES.roles
+MEETING_TIME = datetime(2026, 10, 19, 10)
+
+
+def _profiles(rng: random.Random, count: int) -> list[ParticipantProfile]:
+    return [
+        ParticipantProfile(
+            id=participant_id,
+            name=f"p{rng.randint(0, 999):03d}-{participant_id}",
+            peak_hours_start=rng.randint(6, 12),
+            peak_hours_end=rng.randint(13, 20),
+            # Few distinct values, so equal scores (ties) are common
+            emotional_intelligence=rng.choice((20, 50, 80)),
+            social_intelligence=rng.choice((20, 50, 80)),
+        )
+        for participant_id in range(1, count + 1)
+    ]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_top_k_is_the_head_of_the_sorted_scores(seed):
+    rng = random.Random(seed)
+    participants = _profiles(rng, 25)
+    history = {participant.id: [rng.choice(ROLES)] * rng.randint(0, 4) for participant in participants}
+    exclude = {role: rng.choice(participants).id for role in ROLES[:3]}
+    names = {participant.id: participant.name for participant in participants}
+
+    top = top_k_per_role(participants, "review", MEETING_TIME, history, 4, exclude=exclude)
+
+    for role in ROLES:
+        ranked = sorted(
+            (
+                breakdown
+                for participant in participants
+                for breakdown in score_participant(participant, "review", MEETING_TIME, history[participant.id])
+                if breakdown.role == role and exclude.get(role) != participant.id
+            ),
+            key=lambda breakdown: (-breakdown.score, names[breakdown.participant_id])
+        )
+        assert top[role] == ranked[:4]
+
+
+def test_excluded_roles_of_a_participant_are_not_offered():
+    participants = _profiles(random.Random(1), 3)
+    history = {participants[0].id: ["critic"] * 4}
+
+    top = top_k_per_role(participants, "planning", MEETING_TIME, history, 3)
+
+    assert participants[0].id not in {breakdown.participant_id for breakdown in top["critic"]}
+    assert all(len(top[role]) == 3 for role in ROLES if role != "critic")
+
+
+def test_substitutes_skip_the_holder_and_respect_the_scope(run_api):
+    async def scenario(client):
+        async with AsyncSessionLocal() as db:
+            team_id = await create_team(db)
+            headers = await create_user(db, team_id, "lead@example.com")
+            participant_ids = [await create_participant(db, team_id, f"p{index}@example.com") for index in range(10)]
+            meeting_id = await create_meeting(
+                db, team_id, datetime(2026, 10, 20, 10, tzinfo=timezone.utc), participant_ids[:8]
+            )
+            await db.commit()
+        await client.post(f"/api/meetings/{meeting_id}/assign-roles", headers=headers)
+        team = await client.get(f"/api/meetings/{meeting_id}/substitutes", params={"k": 10}, headers=headers)
+        meeting = await client.get(
+            f"/api/meetings/{meeting_id}/substitutes", params={"k": 10, "scope": "meeting"}, headers=headers
+        )
+        return participant_ids, team.json(), meeting.json()
+
+    participant_ids, team, meeting = run_api(scenario)
+
+    for role in team["roles"]:
+        candidates = {candidate["participant_id"] for candidate in role["candidates"]}
+        assert role["holder_id"] is not None
+        assert role["holder_id"] not in candidates
+        assert candidates == set(participant_ids) - {role["holder_id"]}
+    for role in meeting["roles"]:
+        candidates = {candidate["participant_id"] for candidate in role["candidates"]}
+        assert candidates == set(participant_ids[:8]) - {role["holder_id"]}
+        assert all(candidate["in_meeting"] for candidate in role["candidates"])
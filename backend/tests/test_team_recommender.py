@@ -0,0 +1,105 @@
+"""Branch-and-bound team recommender compared with an exhaustive optimum."""
+
+import random
+from datetime import datetime
+
+import pytest
+
+from app.services.fitness import DEFAULT_TABLES, ParticipantProfile, build_fitness_matrix, greedy_assignment
+from app.services.team_recommender import recommend_participants
+
+ROLES = DEFAULT_TABLES.roles
+MEETING_TIME = datetime(2026, 10, 19, 10)
+
+
+def _profiles(rng: random.Random, count: int) -> list[ParticipantProfile]:
+    return [
+        ParticipantProfile(
+            id=participant_id,
+            name=f"p{participant_id:03d}",
+            peak_hours_start=rng.randint(6, 12),
+            peak_hours_end=rng.randint(13, 20),
+            emotional_intelligence=rng.randint(0, 100),
+            social_intelligence=rng.randint(0, 100),
+        )
+        for participant_id in range(1, count + 1)
+    ]
+
+
+def _history(rng: random.Random, participants: list[ParticipantProfile]) -> dict[int, list[str]]:
+    return {participant.id: [rng.choice(ROLES)] * rng.randint(0, 4) for participant in participants}
+
+
+def _optimum(fitness_matrix: dict, participants: list[ParticipantProfile], capacity: int) -> float:
+    """Best total of a matching of roles to distinct participants with at most capacity matched (DP over subsets)."""
+    index = {participant.id: position for position, participant in enumerate(participants)}
+    best = {0: 0.0}
+    for role in ROLES:
+        following = dict(best)
+        for used, total in best.items():
+            if bin(used).count("1") >= capacity:
+                continue
+            for (participant_id, scored_role), score in fitness_matrix.items():
+                bit = 1 << index[participant_id]
+                if scored_role != role or used & bit:
+                    continue
+                if total + score > following.get(used | bit, -1.0):
+                    following[used | bit] = total + score
+        best = following
+    return max(best.values())
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_search_finds_the_optimal_matching(seed):
+    rng = random.Random(seed)
+    participants = _profiles(rng, rng.randint(3, 12))
+    history = _history(rng, participants)
+    capacity = rng.randint(1, 9)
+
+    recommendation = recommend_participants(participants, "brainstorm", MEETING_TIME, history, capacity)
+    fitness_matrix = build_fitness_matrix(participants, "brainstorm", MEETING_TIME, history)
+
+    assert recommendation.optimal
+    assert recommendation.search_fitness == pytest.approx(_optimum(fitness_matrix, participants, capacity))
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_reported_assignment_is_what_assign_roles_produces_for_the_invite_list(seed):
+    rng = random.Random(seed)
+    participants = _profiles(rng, rng.randint(3, 12))
+    history = _history(rng, participants)
+    capacity = rng.randint(1, 9)
+
+    recommendation = recommend_participants(participants, "review", MEETING_TIME, history, capacity)
+
+    assigned = [assignment["participant_id"] for assignment in recommendation.assignments]
+    invited = set(assigned) | set(recommendation.reserves)
+    assert len(invited) == len(assigned) + len(recommendation.reserves) <= capacity
+    invitees = [participant for participant in participants if participant.id in invited]
+    expected = greedy_assignment(
+        build_fitness_matrix(invitees, "review", MEETING_TIME, history), invitees, ROLES
+    )
+    assert sorted((a["role"], a["participant_id"]) for a in recommendation.assignments) == sorted(
+        (a["role"], a["participant_id"]) for a in expected
+    )
+    assert recommendation.total_fitness == pytest.approx(sum(a["score"] for a in expected))
+
+
+def test_exhausted_budget_keeps_the_greedy_incumbent():
+    participants = _profiles(random.Random(11), 14)
+    fitness_matrix = build_fitness_matrix(participants, "planning", MEETING_TIME, {})
+    greedy_total = sum(a["score"] for a in greedy_assignment(fitness_matrix, participants, ROLES))
+
+    recommendation = recommend_participants(participants, "planning", MEETING_TIME, {}, 7, node_budget=3)
+
+    assert not recommendation.optimal
+    assert recommendation.search_fitness >= greedy_total - 1e-9
+
+
+def test_capacity_above_the_role_count_is_filled_with_reserves():
+    participants = _profiles(random.Random(5), 10)
+
+    recommendation = recommend_participants(participants, "status_update", MEETING_TIME, {}, 9)
+
+    assert len(recommendation.assignments) == len(ROLES)
+    assert len(recommendation.reserves) == 2
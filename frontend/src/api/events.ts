@@ -0,0 +1,60 @@
+export type TeamEventType =
+  | 'assignment-changed'
+  | 'meeting-changed'
+  | 'participant-changed'
+  | 'settings-changed'
+  | 'job-progress';
+
+export interface AssignmentChangedEvent {
+  meeting_ids: number[];
+  at: string;
+}
+
+export interface MeetingChangedEvent {
+  meeting_ids: number[];
+  action: 'created' | 'updated' | 'deleted' | 'participants';
+  at: string;
+}
+
+export interface ParticipantChangedEvent {
+  participant_ids?: number[];
+  action: 'created' | 'updated' | 'deleted' | 'imported';
+  at: string;
+}
+
+export interface SettingsChangedEvent {
+  version: number;
+  at: string;
+}
+
+export interface JobProgressEvent {
+  job_id: number;
+  status: string;
+  progress: number;
+  total: number | null;
+  at: string;
+}
+
+export interface TeamEventHandlers {
+  'assignment-changed'?: (event: AssignmentChangedEvent) => void;
+  'meeting-changed'?: (event: MeetingChangedEvent) => void;
+  'participant-changed'?: (event: ParticipantChangedEvent) => void;
+  'settings-changed'?: (event: SettingsChangedEvent) => void;
+  'job-progress'?: (event: JobProgressEvent) => void;
+}
+
+// Subscribe to the current team's server-sent events; returns a function that closes the stream.
+// EventSource cannot send headers, so the access token goes in the query string.
+export function subscribeToTeamEvents(handlers: TeamEventHandlers): () => void {
+  const token = localStorage.getItem('access_token') ?? '';
+  const source = new EventSource(`/api/events/stream?token=${encodeURIComponent(token)}`);
+
+  (Object.keys(handlers) as TeamEventType[]).forEach((type) => {
+    const handler = handlers[type] as ((data: any) => void) | undefined;
+    if (handler) {
+      source.addEventListener(type, (message) => handler(JSON.parse((message as MessageEvent).data)));
+    }
+  });
+
+  return () => source.close();
+}
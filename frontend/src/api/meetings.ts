@@ -1,5 +1,5 @@
 import client from './client';
-import { Meeting, MeetingCreate, RoleAssignment, RoleAssignmentResult } from './types';
+import { Meeting, MeetingCreate, MeetingDetail, RoleAssignment, RoleAssignmentResult } from './types';
 
 export const meetingsApi = {
   getAll: async (): Promise<Meeting[]> => {
@@ -7,6 +7,22 @@ export const meetingsApi = {
     return response.data;
   },
 
+  getBatch: async (ids: number[]): Promise<Record<number, Meeting>> => {
+    const response = await client.get('/meetings/batch', {
+      params: { ids },
+      paramsSerializer: { indexes: null },
+    });
+    return response.data;
+  },
+
+  getAssignmentsBatch: async (meetingIds: number[]): Promise<Record<number, RoleAssignment[]>> => {
+    const response = await client.get('/meetings/assignments', {
+      params: { meeting_ids: meetingIds },
+      paramsSerializer: { indexes: null },
+    });
+    return response.data;
+  },
+
   create: async (data: MeetingCreate): Promise<Meeting> => {
     const response = await client.post('/meetings/', data);
     return response.data;
@@ -17,6 +33,11 @@ export const meetingsApi = {
     return response.data;
   },
 
+  getDetail: async (id: number): Promise<MeetingDetail> => {
+    const response = await client.get(`/meetings/${id}/detail`);
+    return response.data;
+  },
+
   update: async (id: number, data: Partial<MeetingCreate>): Promise<Meeting> => {
     const response = await client.put(`/meetings/${id}`, data);
     return response.data;
@@ -7,6 +7,14 @@ export const participantsApi = {
     return response.data;
   },
 
+  getBatch: async (ids: number[]): Promise<Record<number, Participant>> => {
+    const response = await client.get('/participants/batch', {
+      params: { ids },
+      paramsSerializer: { indexes: null },
+    });
+    return response.data;
+  },
+
   create: async (data: ParticipantCreate): Promise<Participant> => {
     const response = await client.post('/participants/', data);
     return response.data;
@@ -19,7 +19,31 @@ export interface MeetingMultipliers {
   };
 }
 
+export interface AlgorithmSettings {
+  version: number;
+  role_requirements: RoleRequirements;
+  meeting_multipliers: MeetingMultipliers;
+  history_penalties: number[];
+}
+
+export interface SettingsUpdate {
+  role_requirements?: Partial<RoleRequirements>;
+  meeting_multipliers?: Partial<MeetingMultipliers>;
+  history_penalties?: number[];
+}
+
 export const settingsApi = {
+  getSettings: async (): Promise<AlgorithmSettings> => {
+    const response = await api.get('/settings');
+    return response.data;
+  },
+
+  updateSettings: async (update: SettingsUpdate, version?: number): Promise<AlgorithmSettings> => {
+    const headers = version === undefined ? {} : { 'If-Match': `"settings-${version}"` };
+    const response = await api.put('/settings', update, { headers });
+    return response.data;
+  },
+
   getRoleRequirements: async (): Promise<RoleRequirements> => {
     const response = await api.get('/settings/role-requirements');
     return response.data;
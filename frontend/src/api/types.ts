@@ -53,6 +53,27 @@ export interface RoleAssignmentResult {
   total_assigned: number;
 }
 
+export interface RoleStreak {
+  role: string | null;
+  length: number;
+}
+
+export interface MeetingDetailParticipant extends Participant {
+  energy: number;
+  recent_roles: string[];
+  streak: RoleStreak;
+}
+
+export interface MeetingDetail {
+  id: number;
+  title: string;
+  meeting_type: 'brainstorm' | 'review' | 'planning' | 'status_update';
+  scheduled_time: string;
+  created_at: string;
+  participants: MeetingDetailParticipant[];
+  assignments: RoleAssignment[];
+}
+
 export interface DailyRoleBreakdown {
   date: string;
   roles: Record<string, number>;